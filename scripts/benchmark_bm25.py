@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark SparseBM25 against rank_bm25.BM25Okapi.
+
+Measures index build time and per-query search latency (score + top-k) at the
+current corpus size and at synthetic 10x / 100x scales, and checks that both
+implementations return identical scores.
+
+Usage:
+    python scripts/benchmark_bm25.py                 # Synthetic corpus (1,500 chunks)
+    python scripts/benchmark_bm25.py --from-db       # Real chunks from ChromaDB
+    python scripts/benchmark_bm25.py --scales 1 10   # Only 1x and 10x
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lib.constants import BM25_B, BM25_K1  # noqa: E402
+from src.services.rag.bm25_retriever import BM25Retriever  # noqa: E402
+from src.services.rag.sparse_bm25 import SparseBM25  # noqa: E402
+
+QUERIES = [
+    "can I shoot while concealed",
+    "how does obscured work with bounty hunter",
+    "what happens when a unit is engaged and counteracts",
+    "tempest of war secondary objectives scoring",
+    "coherency after pile in",
+    "aura abilities affecting enemy units",
+    "overwatch against vehicles",
+    "hidden supplies deployment zone",
+]
+
+
+def load_db_corpus() -> list[str]:
+    """Load chunk texts from ChromaDB."""
+    from src.services.rag.vector_db import VectorDBService
+
+    results = VectorDBService().collection.get(include=["documents"])
+    return [text for text in results["documents"] if text]
+
+
+def synthetic_corpus(n_docs: int, seed: int = 42) -> list[str]:
+    """Generate a Zipf-distributed corpus resembling rules chunks."""
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(20000)] + " ".join(QUERIES).split()
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    rng.shuffle(weights)
+    return [
+        " ".join(rng.choices(vocab, weights=weights, k=rng.randint(80, 400)))
+        for _ in range(n_docs)
+    ]
+
+
+def scale_corpus(base: list[str], factor: int) -> list[str]:
+    """Grow a corpus by shuffled copies of the base documents."""
+    rng = random.Random(factor)
+    corpus = list(base)
+    for _ in range(factor - 1):
+        copy = list(base)
+        rng.shuffle(copy)
+        corpus.extend(copy)
+    return corpus
+
+
+def time_queries(search, queries: list[list[str]], repeats: int) -> float:
+    """Return mean latency in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            search(query)
+    return (time.perf_counter() - start) * 1000 / (repeats * len(queries))
+
+
+def okapi_top_k(bm25: BM25Okapi, query: list[str], k: int) -> list[int]:
+    """Top-k the way BM25Retriever did before SparseBM25."""
+    scores = bm25.get_scores(query)
+    top = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+    return [i for i in top if scores[i] > 0]
+
+
+def benchmark(texts: list[str], top_k: int, repeats: int) -> dict[str, float]:
+    """Benchmark both implementations on one corpus."""
+    # Reuse the retriever's tokenizer so numbers reflect production behaviour
+    tokenizer = BM25Retriever()
+    corpus = [tokenizer._tokenize(text) for text in texts]
+    queries = [tokenizer._tokenize(query) for query in QUERIES]
+
+    start = time.perf_counter()
+    okapi = BM25Okapi(corpus, k1=BM25_K1, b=BM25_B)
+    okapi_build = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    sparse = SparseBM25(corpus, k1=BM25_K1, b=BM25_B)
+    sparse_build = (time.perf_counter() - start) * 1000
+
+    for query in queries:
+        if not np.array_equal(okapi.get_scores(query), sparse.get_scores(query)):
+            raise AssertionError(f"Score mismatch for query {query}")
+        if okapi_top_k(okapi, query, top_k) != sparse.top_k(query, top_k)[0].tolist():
+            raise AssertionError(f"Top-k mismatch for query {query}")
+
+    okapi_ms = time_queries(lambda q: okapi_top_k(okapi, q, top_k), queries, repeats)
+    sparse_ms = time_queries(lambda q: sparse.top_k(q, top_k), queries, repeats)
+
+    return {
+        "docs": len(corpus),
+        "okapi_build_ms": okapi_build,
+        "sparse_build_ms": sparse_build,
+        "okapi_query_ms": okapi_ms,
+        "sparse_query_ms": sparse_ms,
+    }
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark SparseBM25 vs BM25Okapi")
+    parser.add_argument("--from-db", action="store_true", help="Use chunks from ChromaDB")
+    parser.add_argument("--base-docs", type=int, default=1500, help="Synthetic corpus size")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--top-k", type=int, default=15)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    base = load_db_corpus() if args.from_db else synthetic_corpus(args.base_docs)
+    if not base:
+        print("No chunks found in database")
+        return
+
+    print(
+        f"{'docs':>8}  {'okapi build':>12}  {'sparse build':>12}  "
+        f"{'okapi query':>12}  {'sparse query':>12}  {'speedup':>8}"
+    )
+    for factor in args.scales:
+        r = benchmark(scale_corpus(base, factor), args.top_k, args.repeats)
+        print(
+            f"{r['docs']:>8}  {r['okapi_build_ms']:>10.1f}ms  {r['sparse_build_ms']:>10.1f}ms  "
+            f"{r['okapi_query_ms']:>10.2f}ms  {r['sparse_query_ms']:>10.2f}ms  "
+            f"{r['okapi_query_ms'] / r['sparse_query_ms']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
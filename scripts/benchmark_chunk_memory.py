@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark memory per chunk of the slotted chunk dataclasses.
+
+Compares DocumentChunk, MarkdownChunk and BM25Result against the previous
+__dict__-based dataclasses, and a fused retrieval result (scores in typed
+fields) against the previous one (scores added to a copy of its metadata).
+Sizes are measured with tracemalloc over a synthetic corpus, excluding the
+chunk text and the shared metadata dicts, which both layouts hold alike.
+
+Usage:
+    python scripts/benchmark_chunk_memory.py                # 1500 chunks
+    python scripts/benchmark_chunk_memory.py --chunks 10000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.rag_context import DocumentChunk  # noqa: E402
+from src.services.rag.bm25_retriever import BM25Result  # noqa: E402
+from src.services.rag.chunker import MarkdownChunk  # noqa: E402
+
+
+@dataclass
+class DictDocumentChunk:
+    """The previous DocumentChunk layout."""
+
+    chunk_id: UUID
+    document_id: UUID
+    text: str
+    header: str
+    header_level: int
+    metadata: dict[str, Any]
+    relevance_score: float
+    position_in_doc: int
+
+
+@dataclass
+class DictMarkdownChunk:
+    """The previous MarkdownChunk layout."""
+
+    chunk_id: UUID
+    text: str
+    header: str
+    header_level: int
+    position: int
+    token_count: int
+    summary: str = ""
+
+
+@dataclass
+class DictBM25Result:
+    """The previous BM25Result layout."""
+
+    chunk: Any
+    score: float
+
+
+def bytes_per_item(build: Callable[[int], object], count: int) -> float:
+    """Allocated bytes per item while building count items."""
+    gc.collect()
+    tracemalloc.start()
+    items = [build(i) for i in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return allocated / count
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark chunk dataclass memory")
+    parser.add_argument("--chunks", type=int, default=1500)
+    args = parser.parse_args()
+
+    n = args.chunks
+    chunk_ids = [uuid4() for _ in range(n)]
+    document_id = uuid4()
+    texts = [f"Rule text {i} " * 50 for i in range(n)]
+    metadatas = [
+        {"document_id": str(document_id), "header": f"Rule {i}", "header_level": 2, "position": i}
+        for i in range(n)
+    ]
+
+    def document_chunk(cls: type) -> Callable[[int], object]:
+        return lambda i: cls(
+            chunk_id=chunk_ids[i], document_id=document_id, text=texts[i], header="Rule",
+            header_level=2, metadata=metadatas[i], relevance_score=1.0, position_in_doc=i,
+        )
+
+    def markdown_chunk(cls: type) -> Callable[[int], object]:
+        return lambda i: cls(
+            chunk_id=chunk_ids[i], text=texts[i], header="Rule", header_level=2, position=i,
+            token_count=120,
+        )
+
+    old_chunks = [document_chunk(DictDocumentChunk)(i) for i in range(n)]
+    new_chunks = [document_chunk(DocumentChunk)(i) for i in range(n)]
+
+    def old_fused(i: int) -> object:
+        metadata = old_chunks[i].metadata.copy()
+        metadata.update(vector_similarity=0.8, bm25_score=7.5, rrf_score=0.016, rrf_normalized=0.9)
+        return replace(old_chunks[i], relevance_score=0.9, metadata=metadata)
+
+    def new_fused(i: int) -> object:
+        return replace(
+            new_chunks[i], relevance_score=0.9, vector_similarity=0.8, bm25_score=7.5,
+            rrf_score=0.016,
+        )
+
+    rows = [
+        ("DocumentChunk", document_chunk(DictDocumentChunk), document_chunk(DocumentChunk)),
+        ("fused DocumentChunk", old_fused, new_fused),
+        ("MarkdownChunk", markdown_chunk(DictMarkdownChunk), markdown_chunk(MarkdownChunk)),
+        (
+            "BM25Result",
+            lambda i: DictBM25Result(chunk=old_chunks[i], score=1.0),
+            lambda i: BM25Result(chunk=new_chunks[i], score=1.0),
+        ),
+    ]
+
+    print(f"{n} chunks, bytes per object (text and shared metadata excluded)")
+    print(f"{'object':<20}  {'before':>8}  {'after':>8}  {'saved':>8}")
+    for name, old_build, new_build in rows:
+        before = bytes_per_item(old_build, n)
+        after = bytes_per_item(new_build, n)
+        print(f"{name:<20}  {before:>8.0f}  {after:>8.0f}  {1 - after / before:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Benchmark per-hop assembly of the hop evaluation prompt.
+
+Compares the previous assembly (yaml.dump of the rules structure and of the
+filtered teams, then format() over the whole template) against
+HopPromptBuilder (pre-serialized fragments joined per hop), for both the
+Claude cache-control blocks and the plain-string prompt, and checks that both
+produce the same prompt.
+
+Uses the extracted rules/teams structure files when present, otherwise
+synthetic structures of the given size.
+
+Usage:
+    python scripts/benchmark_hop_prompt.py
+    python scripts/benchmark_hop_prompt.py --teams 80 --repeats 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lib.constants import (  # noqa: E402
+    RAG_HOP_EVALUATION_PROMPT_PATH,
+    RULES_STRUCTURE_PATH,
+    TEAMS_STRUCTURE_PATH,
+)
+from src.services.llm.prompt_builder import split_user_prompt_for_cache, strip_cache_markers  # noqa: E402
+from src.services.rag.hop_prompt import HopPromptBuilder  # noqa: E402
+
+WORDS = [
+    "action", "operative", "shoot", "fight", "charge", "conceal", "engage", "obscured", "cover",
+    "terrain", "order", "counteract", "ploy", "equipment", "weapon", "damage", "wound", "heal",
+    "ability", "ranged", "melee", "critical", "control", "marker",
+]
+
+
+def synthetic_rules(sections: int, rng: random.Random) -> dict[str, Any]:
+    """Rules structure of nested sections with rule names and summaries."""
+    return {
+        f"Section {i} {rng.choice(WORDS).title()}": {
+            f"{rng.choice(WORDS).title()} {j}": " ".join(rng.choices(WORDS, k=12))
+            for j in range(15)
+        }
+        for i in range(sections)
+    }
+
+
+def synthetic_teams(teams: int, rng: random.Random) -> dict[str, Any]:
+    """Teams structure with operatives, abilities and ploys per team."""
+    return {
+        f"Team {i} {rng.choice(WORDS).title()}": {
+            "operatives": [f"{rng.choice(WORDS).title()} {j}" for j in range(10)],
+            "abilities": [" ".join(rng.choices(WORDS, k=3)).title() for _ in range(6)],
+            "ploys": {
+                "strategy": [" ".join(rng.choices(WORDS, k=2)).title() for _ in range(4)],
+                "firefight": [" ".join(rng.choices(WORDS, k=2)).title() for _ in range(4)],
+            },
+        }
+        for i in range(teams)
+    }
+
+
+def load_structure(path: str, fallback: dict[str, Any]) -> tuple[dict[str, Any], str]:
+    """Structure file contents, or the synthetic fallback."""
+    if Path(path).exists():
+        with open(path) as f:
+            return yaml.safe_load(f) or {}, path
+    return fallback, "synthetic"
+
+
+def previous_prompt(
+    template: str, rules: dict, filtered_teams: dict, values: dict, claude: bool
+) -> str | list[dict]:
+    """The previous per-hop assembly in MultiHopRetriever._evaluate_context."""
+    rules_text = yaml.dump(rules, default_flow_style=False, allow_unicode=True, width=120, indent=2)
+    teams_text = yaml.dump(
+        filtered_teams, default_flow_style=False, allow_unicode=True, width=120, indent=2
+    )
+    filled = template.format(rule_structure=rules_text, team_structure=teams_text, **values)
+    return split_user_prompt_for_cache(filled) if claude else strip_cache_markers(filled)
+
+
+def prebuilt_prompt(
+    builder: HopPromptBuilder, relevant_teams: list[str], values: dict, claude: bool
+) -> str | list[dict]:
+    """Per-hop assembly with HopPromptBuilder."""
+    team_structure = builder.team_structure_text(relevant_teams)
+    if claude:
+        return builder.build_for_claude(team_structure=team_structure, **values)
+    return strip_cache_markers(builder.fill(team_structure=team_structure, **values))
+
+
+def time_calls(call, repeats: int) -> float:
+    """Return mean latency in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark hop evaluation prompt assembly")
+    parser.add_argument("--rule-sections", type=int, default=40)
+    parser.add_argument("--teams", type=int, default=50)
+    parser.add_argument("--relevant-teams", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    template = Path(RAG_HOP_EVALUATION_PROMPT_PATH).read_text()
+    rules, rules_source = load_structure(
+        RULES_STRUCTURE_PATH, synthetic_rules(args.rule_sections, rng)
+    )
+    teams, teams_source = load_structure(TEAMS_STRUCTURE_PATH, synthetic_teams(args.teams, rng))
+    relevant_teams = sorted(rng.sample(sorted(teams), min(args.relevant_teams, len(teams))))
+    filtered_teams = {team: teams[team] for team in relevant_teams}
+    values = {
+        "user_query": "Can a concealed operative shoot after it was charged?",
+        "retrieved_chunks": "\n".join(
+            f"{i}. ## Rule {i}\n" + " ".join(rng.choices(WORDS, k=60)) for i in range(1, 11)
+        ),
+    }
+
+    build_start = time.perf_counter()
+    builder = HopPromptBuilder(template, rules, teams)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    print(f"template: {RAG_HOP_EVALUATION_PROMPT_PATH}")
+    print(f"rules: {rules_source} ({len(builder.rules_structure_text)} chars)")
+    print(f"teams: {teams_source} ({len(teams)} teams, {len(relevant_teams)} relevant)")
+    print(f"one-time build: {build_ms:.2f}ms")
+    print(f"{'prompt':<8}  {'previous':>10}  {'prebuilt':>10}  {'speedup':>8}")
+    for label, claude in (("claude", True), ("plain", False)):
+        before = previous_prompt(template, rules, filtered_teams, values, claude)
+        after = prebuilt_prompt(builder, relevant_teams, values, claude)
+        if before != after:
+            raise AssertionError(f"Prompt mismatch ({label})")
+
+        previous_ms = time_calls(
+            lambda c=claude: previous_prompt(template, rules, filtered_teams, values, c),
+            args.repeats,
+        )
+        prebuilt_ms = time_calls(
+            lambda c=claude: prebuilt_prompt(builder, relevant_teams, values, c), args.repeats
+        )
+        print(
+            f"{label:<8}  {previous_ms:>8.3f}ms  {prebuilt_ms:>8.3f}ms  "
+            f"{previous_ms / prebuilt_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark the shared keep-alive HTTP client against a client per request.
+
+GrokAdapter and MistralAdapter used to open an httpx.AsyncClient per request
+(`async with httpx.AsyncClient() as client`), paying DNS, TCP and TLS setup on
+every call. This sends N small POSTs first that way, then through
+get_shared_http_client(), and reports p50 / p95 / mean latency per mode.
+
+By default it targets a local keep-alive stub server (plain HTTP, so only the
+TCP setup and client construction show up). Pass --url to measure against a
+real HTTPS endpoint, where the saved TLS handshake dominates; an unauthenticated
+request is enough since only the round trip is timed.
+
+Usage:
+    python scripts/benchmark_http_clients.py
+    python scripts/benchmark_http_clients.py --requests 200
+    python scripts/benchmark_http_clients.py --url https://api.x.ai/v1/chat/completions
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lib.logging import setup_logging  # noqa: E402
+from src.services.llm.http_clients import (  # noqa: E402
+    HTTP2_AVAILABLE,
+    close_shared_http_clients,
+    get_shared_http_client,
+)
+
+PAYLOAD = {"model": "benchmark", "messages": [{"role": "user", "content": "ping"}]}
+STUB_RESPONSE = b'{"choices": [{"message": {"content": "pong"}}]}'
+
+
+async def handle_stub_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Answer every HTTP/1.1 request on a connection until the client closes it."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(STUB_RESPONSE)).encode() + b"\r\n\r\n" + STUB_RESPONSE
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def timed_post(url: str, shared: bool) -> float:
+    """Latency of one POST in milliseconds."""
+    start = time.perf_counter()
+    if shared:
+        client = get_shared_http_client(url)
+        await client.post(url, json=PAYLOAD, timeout=30)
+    else:
+        async with httpx.AsyncClient(timeout=30) as client:
+            await client.post(url, json=PAYLOAD)
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run both modes and print the comparison."""
+    server = None
+    url = args.url
+    if url is None:
+        server = await asyncio.start_server(handle_stub_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        url = f"http://127.0.0.1:{port}/v1/chat/completions"
+
+    print(f"target: {url} (h2 installed: {HTTP2_AVAILABLE})")
+    results: dict[str, list[float]] = {}
+    for label, shared in (("fresh", False), ("shared", True)):
+        await timed_post(url, shared)  # Warm up (imports, DNS cache, first handshake)
+        results[label] = [await timed_post(url, shared) for _ in range(args.requests)]
+    await close_shared_http_clients()
+
+    print(f"{'mode':<8}  {'p50':>9}  {'p95':>9}  {'mean':>9}")
+    for label, latencies in results.items():
+        print(
+            f"{label:<8}  {percentile(latencies, 50):>7.2f}ms  {percentile(latencies, 95):>7.2f}ms"
+            f"  {statistics.mean(latencies):>7.2f}ms"
+        )
+    saved = statistics.mean(results["fresh"]) - statistics.mean(results["shared"])
+    print(f"per-request overhead saved: {saved:.2f}ms")
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark shared keep-alive HTTP clients")
+    parser.add_argument("--url", default=None, help="Endpoint to POST to (default: local stub)")
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    setup_logging("WARNING")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
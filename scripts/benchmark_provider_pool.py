@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark pooled LLM providers against a new provider per request.
+
+Sends the same small hop-evaluation request N times to one model, first with
+a freshly created adapter per request (the previous per-message behaviour of
+the Discord bot: new SDK client, new TCP + TLS handshake), then through the
+provider pool (one adapter, keep-alive connections reused), and reports p50 /
+p95 latency per mode plus the pool's reuse statistics.
+
+Responses are not streamed, so the connection setup saved by the pool shows
+up as a shift of the whole request latency (it happens before the first
+token). Needs the model's API key in .env; --offline only measures adapter
+construction.
+
+Usage:
+    python scripts/benchmark_provider_pool.py --model gpt-4.1-nano
+    python scripts/benchmark_provider_pool.py --model claude-4.5-haiku --requests 20
+    python scripts/benchmark_provider_pool.py --offline
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lib.logging import setup_logging  # noqa: E402
+from src.services.llm.base import GenerationConfig, GenerationRequest  # noqa: E402
+from src.services.llm.factory import LLMProviderFactory  # noqa: E402
+from src.services.llm.provider_pool import get_llm_provider_pool  # noqa: E402
+
+REQUEST = GenerationRequest(
+    prompt=(
+        'Reply with JSON: {"can_answer": true, "reasoning": "ok", "missing_query": null}'
+    ),
+    context=[],
+    config=GenerationConfig(max_tokens=100, structured_output_schema="hop_evaluation"),
+    chunk_ids=[],
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def timed_request(model: str, pooled: bool) -> float:
+    """Latency of one request in milliseconds."""
+    provider = LLMProviderFactory.create(model, pooled=pooled)
+    if provider is None:
+        raise SystemExit(f"No API key configured for {model}")
+
+    start = time.perf_counter()
+    await provider.generate(REQUEST)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if not pooled:
+        await provider.aclose()
+    return elapsed_ms
+
+
+def construction_ms(model: str, pooled: bool, repeats: int) -> float:
+    """Mean time to obtain a provider in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        LLMProviderFactory.create(model, pooled=pooled)
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run both modes and print the comparison."""
+    fresh_build = construction_ms(args.model, pooled=False, repeats=args.construct_repeats)
+    pooled_build = construction_ms(args.model, pooled=True, repeats=args.construct_repeats)
+    print(f"model: {args.model}")
+    print(f"provider construction: fresh {fresh_build:.2f}ms, pooled {pooled_build:.3f}ms")
+    if args.offline:
+        return
+
+    results: dict[str, list[float]] = {}
+    for label, pooled in (("fresh", False), ("pooled", True)):
+        results[label] = [await timed_request(args.model, pooled) for _ in range(args.requests)]
+
+    print(f"{'mode':<8}  {'p50':>9}  {'p95':>9}  {'mean':>9}")
+    for label, latencies in results.items():
+        print(
+            f"{label:<8}  {percentile(latencies, 50):>7.0f}ms  {percentile(latencies, 95):>7.0f}ms"
+            f"  {statistics.mean(latencies):>7.0f}ms"
+        )
+    p50_saved = percentile(results["fresh"], 50) - percentile(results["pooled"], 50)
+    print(f"p50 improvement: {p50_saved:.0f}ms")
+
+    pool = get_llm_provider_pool()
+    print(f"pool: {pool.get_stats()}")
+    await pool.aclose()
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark pooled LLM providers")
+    parser.add_argument("--model", default="gpt-4.1-nano")
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--construct-repeats", type=int, default=20)
+    parser.add_argument("--offline", action="store_true", help="Only measure construction")
+    args = parser.parse_args()
+
+    setup_logging("WARNING")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark QueryExpander's compiled synonym trie against per-synonym regex scans.
+
+Measures per-query expansion latency with the real synonym dictionary and with
+synthetic dictionaries 10x / 100x its size, and checks that both strategies
+expand every query identically.
+
+Usage:
+    python scripts/benchmark_query_expander.py                # 1x, 10x, 100x
+    python scripts/benchmark_query_expander.py --scales 1 10  # Only 1x and 10x
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lib.constants import RAG_SYNONYM_DICT_PATH  # noqa: E402
+from src.lib.logging import setup_logging  # noqa: E402
+from src.services.rag.query_expander import QueryExpander  # noqa: E402
+
+QUERIES = [
+    "Can I heal my operative after it was killed in melee range?",
+    "How does obscured work with bounty hunter when shooting?",
+    "What happens when a unit is engaged and counteracts?",
+    "Does my model get cover from light terrain within 1 inch?",
+    "coherency after pile in",
+    "Can a concealed miniature fire overwatch against vehicles?",
+]
+
+
+def regex_expand(expander: QueryExpander, query: str) -> str:
+    """The previous expand_query: sort all synonyms, one regex search each."""
+    query_lower = query.lower()
+    matched: set[str] = set()
+    for synonym, official_term in sorted(
+        expander.synonym_to_official.items(), key=lambda x: len(x[0]), reverse=True
+    ):
+        if re.search(r"\b" + re.escape(synonym) + r"\b", query_lower):
+            matched.add(official_term)
+    return query + " " + " ".join(sorted(matched)) if matched else query
+
+
+def scaled_synonyms(base: dict[str, list[str]], factor: int) -> dict[str, list[str]]:
+    """Grow a synonym dictionary with synthetic terms of realistic length."""
+    rng = random.Random(factor)
+    words = sorted({word for synonyms in base.values() for s in synonyms for word in s.split()})
+    scaled = {term: list(synonyms) for term, synonyms in base.items()}
+    target = sum(len(synonyms) for synonyms in base.values()) * factor
+    count = sum(len(synonyms) for synonyms in scaled.values())
+    term_index = 0
+    while count < target:
+        synonyms = [
+            " ".join(rng.choices(words, k=rng.randint(1, 3))) + f" x{term_index}{i}"
+            for i in range(5)
+        ]
+        scaled[f"official term {term_index}"] = synonyms
+        count += len(synonyms)
+        term_index += 1
+    return scaled
+
+
+def time_expansions(expand, repeats: int) -> float:
+    """Return mean latency in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in QUERIES:
+            expand(query)
+    return (time.perf_counter() - start) * 1000 / (repeats * len(QUERIES))
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark QueryExpander synonym matching")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_logging("WARNING")  # Keep per-query debug logs out of the timings
+    base = json.loads(Path(RAG_SYNONYM_DICT_PATH).read_text(encoding="utf-8"))
+
+    print(f"{'synonyms':>9}  {'regex':>10}  {'compiled':>10}  {'speedup':>8}")
+    for factor in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "synonyms.json"
+            path.write_text(json.dumps(scaled_synonyms(base, factor)), encoding="utf-8")
+            expander = QueryExpander(str(path))
+
+        for query in QUERIES:
+            if expander.expand_query(query) != regex_expand(expander, query):
+                raise AssertionError(f"Expansion mismatch for query {query!r}")
+
+        regex_ms = time_expansions(lambda q, e=expander: regex_expand(e, q), args.repeats)
+        compiled_ms = time_expansions(expander.expand_query, args.repeats)
+        print(
+            f"{len(expander.synonym_to_official):>9}  {regex_ms:>8.3f}ms  "
+            f"{compiled_ms:>8.3f}ms  {regex_ms / compiled_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
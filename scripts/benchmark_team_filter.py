@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Benchmark TeamFilter.extract_relevant_teams over a scaled teams structure.
+
+Compares the previous matching (every operative/ability entry evaluated per
+query, per-pair fuzz.ratio for aliases, one process.extractOne per query word
+for team names) against the current TeamFilter (inverted word index and
+batched rapidfuzz scoring), and checks that both return the same teams for
+every query.
+
+The teams structure is the extracted teams-structure.yml when present,
+otherwise a synthetic one, scaled by copying every team --scale times under
+new names (new Kill Team releases add teams with similar operative names).
+
+Usage:
+    python scripts/benchmark_team_filter.py
+    python scripts/benchmark_team_filter.py --scale 10 --queries 500
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+from rapidfuzz import fuzz, process
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lib.constants import TEAMS_STRUCTURE_PATH  # noqa: E402
+from src.lib.logging import setup_logging  # noqa: E402
+from src.services.rag.team_filtering import TeamFilter  # noqa: E402
+from src.services.rag.team_filtering.config import (  # noqa: E402
+    MIN_WORD_LENGTH,
+    TEAM_ALIASES,
+    TEAM_MATCH_THRESHOLD,
+)
+from src.services.rag.team_filtering.strategies import (  # noqa: E402
+    AbilityMatchingStrategy,
+    OperativeMatchingStrategy,
+)
+from src.services.rag.team_filtering.utils import filter_stop_words  # noqa: E402
+
+SYLLABLES = ["kor", "va", "thar", "ith", "dra", "gul", "mek", "sha", "ron", "zel", "ka", "tor"]
+ROLES = ["Warrior", "Gunner", "Fighter", "Leader", "Sniper", "Medic", "Heavy", "Scout"]
+WORDS = [
+    "Blade", "Fury", "Shadow", "Strike", "Hunt", "Wrath", "Storm", "Veil", "Oath", "Bastion",
+    "Fire", "Iron", "Blood", "Vengeance", "Cunning", "Swift", "Grenade", "Rifle", "Ward", "Rite",
+]
+SCALE_SUFFIXES = ["Prime", "Secundus", "Tertius", "Quartus", "Quintus", "Sextus", "Septimus"]
+QUERY_TEMPLATES = [
+    "Can the {} shoot after moving?",
+    "How does {} work with obscured targets?",
+    "Does {} stack with cover saves?",
+    "what does the {} do in the firefight phase",
+    "Can I use {} twice per turning point?",
+]
+
+
+def synthetic_name(rng: random.Random, syllables: int) -> str:
+    """Pronounceable made-up name."""
+    return "".join(rng.choices(SYLLABLES, k=syllables)).title()
+
+
+def synthetic_teams(teams: int, rng: random.Random) -> dict[str, Any]:
+    """Teams structure shaped like teams-structure.yml."""
+
+    def phrases(count: int) -> list[str]:
+        return [" ".join(rng.sample(WORDS, k=rng.randint(1, 3))) for _ in range(count)]
+
+    structure: dict[str, Any] = {}
+    for _ in range(teams):
+        faction = synthetic_name(rng, 2)
+        structure[f"{faction} {synthetic_name(rng, 2)}"] = {
+            "Operatives": [f"{faction} {rng.choice(ROLES)}" for _ in range(8)]
+            + [{synthetic_name(rng, 3): phrases(2)}],
+            "Faction Rules": phrases(3),
+            "Strategy Ploys": phrases(4),
+            "Firefight Ploys": phrases(4),
+            "Faction Equipment": phrases(4),
+        }
+    return structure
+
+
+def load_teams(teams: int, rng: random.Random) -> tuple[dict[str, Any], str]:
+    """Extracted teams structure, or a synthetic one."""
+    if Path(TEAMS_STRUCTURE_PATH).exists():
+        with open(TEAMS_STRUCTURE_PATH) as f:
+            return yaml.safe_load(f) or {}, TEAMS_STRUCTURE_PATH
+    return synthetic_teams(teams, rng), "synthetic"
+
+
+def scale_teams(structure: dict[str, Any], scale: int) -> dict[str, Any]:
+    """Copy every team scale times under new names."""
+    scaled = dict(structure)
+    for copy in range(1, scale):
+        suffix = SCALE_SUFFIXES[(copy - 1) % len(SCALE_SUFFIXES)]
+        for team, data in structure.items():
+            scaled[f"{team} {suffix} {copy}"] = data
+    return scaled
+
+
+def make_queries(structure: dict[str, Any], count: int, rng: random.Random) -> list[str]:
+    """Queries naming operatives, abilities, (misspelled) teams, aliases or nothing."""
+    team_filter = TeamFilter(structure)
+    names = (
+        list(team_filter._operative_cache)
+        + list(team_filter._ability_cache)
+        + [team.lower() for team in structure]
+        + list(TEAM_ALIASES)
+    )
+
+    def misspell(name: str) -> str:
+        if len(name) < 6:
+            return name
+        i = rng.randrange(1, len(name) - 1)
+        return name[:i] + name[i + 1 :]
+
+    queries = []
+    for _ in range(count):
+        template = rng.choice(QUERY_TEMPLATES)
+        kind = rng.random()
+        if kind < 0.2:
+            queries.append(template.format("operative"))  # No team named
+        elif kind < 0.35:
+            queries.append(template.format(misspell(rng.choice(names))))
+        else:
+            queries.append(template.format(rng.choice(names)))
+    return queries
+
+
+def previous_extract(
+    team_filter: TeamFilter,
+    operative_strategy: OperativeMatchingStrategy,
+    ability_strategy: AbilityMatchingStrategy,
+    query: str,
+) -> list[str]:
+    """The previous TeamFilter.extract_relevant_teams."""
+    query_lower = query.lower()
+    query_words = filter_stop_words(query_lower)
+    relevant_teams = operative_strategy.match(query_lower, query_words)
+    relevant_teams |= ability_strategy.match(query_lower, query_words)
+
+    for alias, teams in TEAM_ALIASES.items():
+        if alias in query_lower or any(
+            fuzz.ratio(alias_word, query_word) >= TEAM_MATCH_THRESHOLD
+            for alias_word in alias.split()
+            if len(alias_word) >= MIN_WORD_LENGTH
+            for query_word in query_words
+            if len(query_word) >= MIN_WORD_LENGTH
+        ):
+            relevant_teams.update(teams)
+
+    for word in query_words:
+        if len(word) < MIN_WORD_LENGTH:
+            continue
+        match = process.extractOne(
+            word, team_filter._team_names, scorer=fuzz.ratio, score_cutoff=TEAM_MATCH_THRESHOLD
+        )
+        if match:
+            relevant_teams.add(match[0])
+
+    return sorted(relevant_teams)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark team filter matching")
+    parser.add_argument("--teams", type=int, default=45, help="Synthetic base team count")
+    parser.add_argument("--scale", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=300)
+    args = parser.parse_args()
+
+    setup_logging("WARNING")  # Keep per-query logs out of the timings
+    rng = random.Random(0)
+    base, source = load_teams(args.teams, rng)
+    structure = scale_teams(base, args.scale)
+    queries = make_queries(structure, args.queries, rng)
+
+    build_start = time.perf_counter()
+    team_filter = TeamFilter(structure)
+    build_ms = (time.perf_counter() - build_start) * 1000
+    # Unindexed strategies evaluate every entry, as before the word index
+    operative_strategy = OperativeMatchingStrategy(team_filter._operative_cache)
+    ability_strategy = AbilityMatchingStrategy(team_filter._ability_cache)
+
+    def run_previous() -> list[list[str]]:
+        return [
+            previous_extract(team_filter, operative_strategy, ability_strategy, query)
+            for query in queries
+        ]
+
+    def run_current() -> list[list[str]]:
+        return [team_filter.extract_relevant_teams(query) for query in queries]
+
+    start = time.perf_counter()
+    previous = run_previous()
+    previous_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    start = time.perf_counter()
+    current = run_current()
+    current_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    mismatches = [q for q, a, b in zip(queries, previous, current, strict=True) if a != b]
+    if mismatches:
+        raise AssertionError(f"{len(mismatches)} queries matched different teams: {mismatches[:5]}")
+
+    print(f"teams: {source} x{args.scale} = {len(structure)} teams")
+    print(
+        f"entries: {len(team_filter._operative_cache)} operatives, "
+        f"{len(team_filter._ability_cache)} abilities"
+    )
+    print(f"index build (TeamFilter init): {build_ms:.1f}ms")
+    print(f"queries: {len(queries)} ({sum(bool(teams) for teams in current)} matched a team)")
+    print(f"previous: {previous_ms:.3f}ms/query")
+    print(f"indexed:  {current_ms:.3f}ms/query ({previous_ms / current_ms:.1f}x)")
+    print("matched team sets identical for every query")
+
+
+if __name__ == "__main__":
+    main()
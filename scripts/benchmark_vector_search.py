@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Benchmark MatrixVectorDBService (exact, in-process) against Chroma.
+
+Builds throwaway Chroma collections of synthetic unit vectors at the current
+corpus size (~1.5k chunks) and at 10x / 100x, then measures per-query latency
+of `query()` for both backends and Chroma's recall@k against the exact result.
+
+Synthetic vectors are clustered (like real embeddings of related rules) so
+HNSW recall is not trivially perfect. With --from-db, the live collection is
+used instead (1x only).
+
+Usage:
+    python3 scripts/benchmark_vector_search.py
+    python3 scripts/benchmark_vector_search.py --scales 1 10 --dim 1536
+    python3 scripts/benchmark_vector_search.py --from-db
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.lib.constants import RAG_MAX_CHUNKS  # noqa: E402
+from src.services.rag.matrix_vector_db import MatrixVectorDBService  # noqa: E402
+from src.services.rag.vector_db import VectorDBService  # noqa: E402
+
+BASE_CHUNKS = 1500
+INSERT_BATCH_SIZE = 5000
+
+
+def synthetic_vectors(n: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """Clustered unit vectors."""
+    centers = rng.normal(size=(max(1, n // 50), dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), size=n)]
+    vectors = vectors + 0.5 * rng.normal(size=(n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def nearby_queries(vectors: np.ndarray, n: int, rng: np.random.Generator) -> np.ndarray:
+    """Unit vectors close to random corpus vectors (queries resemble some chunks)."""
+    picks = vectors[rng.integers(0, len(vectors), size=n)]
+    queries = picks + 0.05 * rng.normal(size=picks.shape).astype(np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def build_collection(db_path: str, vectors: np.ndarray) -> VectorDBService:
+    """Create a Chroma collection holding the vectors."""
+    service = VectorDBService(collection_name="benchmark", db_path=db_path)
+    for start in range(0, len(vectors), INSERT_BATCH_SIZE):
+        batch = vectors[start : start + INSERT_BATCH_SIZE]
+        service.collection.add(
+            ids=[str(uuid4()) for _ in batch],
+            embeddings=batch.tolist(),
+            documents=[f"chunk {start + i}" for i in range(len(batch))],
+            metadatas=[{"document_id": str(uuid4()), "position": i} for i in range(len(batch))],
+        )
+    return service
+
+
+def benchmark(chroma: VectorDBService, queries: np.ndarray, k: int) -> dict[str, float]:
+    """Time both backends on the same queries and compute Chroma recall@k."""
+    start = time.perf_counter()
+    matrix = MatrixVectorDBService(chroma=chroma, bundle_path=None)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    # Warm up both paths (HNSW index load, BLAS threads)
+    chroma.query(query_embeddings=[queries[0].tolist()], n_results=k)
+    matrix.query(query_embeddings=[queries[0].tolist()], n_results=k)
+
+    chroma_ids, matrix_ids = [], []
+    start = time.perf_counter()
+    for query in queries:
+        chroma_ids.append(chroma.query(query_embeddings=[query.tolist()], n_results=k)["ids"][0])
+    chroma_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    start = time.perf_counter()
+    for query in queries:
+        matrix_ids.append(matrix.query(query_embeddings=[query.tolist()], n_results=k)["ids"][0])
+    matrix_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    recall = np.mean(
+        [len(set(c) & set(m)) / len(m) for c, m in zip(chroma_ids, matrix_ids, strict=True)]
+    )
+    return {
+        "docs": matrix.get_count(),
+        "load_ms": load_ms,
+        "chroma_ms": chroma_ms,
+        "matrix_ms": matrix_ms,
+        "recall": float(recall),
+    }
+
+
+def print_row(result: dict[str, float]) -> None:
+    print(
+        f"{result['docs']:>8}  {result['load_ms']:>9.0f}ms  {result['chroma_ms']:>9.2f}ms  "
+        f"{result['matrix_ms']:>9.2f}ms  {result['chroma_ms'] / result['matrix_ms']:>7.1f}x  "
+        f"{result['recall']:>13.3f}"
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark exact matrix search vs Chroma")
+    parser.add_argument("--from-db", action="store_true", help="Use the live collection")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--dim", type=int, default=1536, help="Embedding dimensions")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=RAG_MAX_CHUNKS)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(
+        f"{'docs':>8}  {'matrix load':>11}  {'chroma':>11}  {'matrix':>11}  "
+        f"{'speedup':>8}  {'chroma recall':>13}"
+    )
+
+    if args.from_db:
+        chroma = VectorDBService()
+        stored = chroma.collection.get(include=["embeddings"])["embeddings"]
+        queries = nearby_queries(np.asarray(stored, dtype=np.float32), args.queries, rng)
+        print_row(benchmark(chroma, queries, args.top_k))
+        return
+
+    for factor in args.scales:
+        n = BASE_CHUNKS * factor
+        vectors = synthetic_vectors(n, args.dim, rng)
+        queries = nearby_queries(vectors, args.queries, rng)
+        with tempfile.TemporaryDirectory() as db_path:
+            chroma = build_collection(db_path, vectors)
+            print_row(benchmark(chroma, queries, args.top_k))
+
+
+if __name__ == "__main__":
+    main()
@@ -68,6 +68,12 @@ def migrate_analytics_db(db_path: str) -> None:
             ("queries", "hop_evaluation_cache_savings", "REAL DEFAULT 0.0"),
             # Error flag for RAG test runs (added 2026-07-08)
             ("rag_test_runs", "was_error", "INTEGER DEFAULT 0"),
+            # Hop evaluation cache hits and savings (added 2026-10-17)
+            ("hop_evaluations", "from_cache", "INTEGER DEFAULT 0"),
+            ("hop_evaluations", "saved_cost_usd", "REAL DEFAULT 0.0"),
+            ("hop_evaluations", "saved_time_s", "REAL DEFAULT 0.0"),
+            # Time to first visible (streamed) answer content (added 2026-10-17)
+            ("queries", "time_to_first_content_ms", "INTEGER DEFAULT NULL"),
         ]
 
         applied_count = 0
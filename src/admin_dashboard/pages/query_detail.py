@@ -175,6 +175,9 @@ def _render_metadata(query: dict) -> None:
     # Use measured total if available, otherwise fall back to component sum
     total_s = total_measured_s if total_measured_s > 0 else component_sum_s
     st.write(f"**Total Latency:** {total_s:.2f}s")
+    time_to_first_content_ms = query.get("time_to_first_content_ms")
+    if time_to_first_content_ms is not None:
+        st.write(f"  - Time to First Content: {time_to_first_content_ms / 1000:.2f}s")
     st.write(f"  - Retrieval: {retrieval_s:.2f}s")
     st.write(f"  - Hop Evaluation: {hop_eval_s:.2f}s")
     st.write(f"  - Main LLM: {main_llm_s:.2f}s")
@@ -283,6 +286,11 @@ def _render_hop_evaluations(query_id: str, query: dict, db: AnalyticsDatabase) -
                 st.write(f"**Missing Query:** {hop_eval['missing_query']}")
             if hop_eval.get("evaluation_model"):
                 st.write(f"**Model:** {hop_eval['evaluation_model']}")
+            if hop_eval.get("from_cache"):
+                st.write(
+                    f"**Cached verdict:** saved ${hop_eval.get('saved_cost_usd') or 0.0:.6f}, "
+                    f"{hop_eval.get('saved_time_s') or 0.0:.2f}s"
+                )
             if hop_eval.get("timestamp"):
                 st.write(f"**Timestamp:** {hop_eval['timestamp']}")
 
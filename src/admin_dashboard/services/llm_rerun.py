@@ -9,7 +9,7 @@ import asyncio
 import contextlib
 import time
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
 
 from src.lib.constants import LLM_GENERATION_TIMEOUT, QUALITY_TEST_PROVIDERS, RAG_MAX_CHUNKS
 from src.lib.logging import get_logger
@@ -17,6 +17,8 @@ from src.lib.pricing import calculate_llm_cost
 from src.models.rag_context import DocumentChunk, RAGContext
 from src.models.structured_response import StructuredLLMResponse
 from src.services.llm.factory import LLMProviderFactory
+from src.services.llm.http_clients import run_closing_http_clients
+from src.services.llm.response_store import get_llm_response_store
 from src.services.llm.retry import retry_on_content_filter
 
 logger = get_logger(__name__)
@@ -61,7 +63,12 @@ def _build_rag_context_from_db_chunks(chunks: list[dict], query_id: UUID) -> RAG
     doc_chunks = []
     for chunk in chunks:
         doc_chunk = DocumentChunk(
-            chunk_id=uuid4(),  # Generate new ID (original not stored in analytics DB)
+            # Original ID is not stored in the analytics DB. Derived from the
+            # content, so reruns render the same prompt (LLM response store)
+            chunk_id=uuid5(
+                NAMESPACE_URL,
+                f"{chunk.get('rank', 0)}\n{chunk.get('chunk_header', '')}\n{chunk.get('chunk_text', '')}",
+            ),
             document_id=uuid4(),  # Not stored in analytics DB
             text=chunk.get("chunk_text", ""),
             header=chunk.get("chunk_header", ""),
@@ -73,6 +80,9 @@ def _build_rag_context_from_db_chunks(chunks: list[dict], query_id: UUID) -> RAG
             },
             relevance_score=chunk.get("final_score", 0.0),
             position_in_doc=chunk.get("rank", 0),
+            vector_similarity=chunk.get("vector_similarity"),
+            bm25_score=chunk.get("bm25_score"),
+            rrf_score=chunk.get("rrf_score"),
         )
         doc_chunks.append(doc_chunk)
 
@@ -94,9 +104,9 @@ def _initialize_orchestrator():
     from src.services.orchestrator import QueryOrchestrator
     from src.services.rag.embeddings import EmbeddingService
     from src.services.rag.retriever import RAGRetriever
-    from src.services.rag.vector_db import VectorDBService
+    from src.services.rag.vector_db import create_vector_db_service
 
-    vector_db = VectorDBService(collection_name="kill_team_rules")
+    vector_db = create_vector_db_service(collection_name="kill_team_rules")
     embedding_service = EmbeddingService()
     rag_retriever = RAGRetriever(
         vector_db_service=vector_db,
@@ -183,10 +193,13 @@ async def _rerun_query_async(
                 use_cache=False,
             )
 
-        llm_response, _chunk_ids = await retry_on_content_filter(
-            generate,
-            timeout_seconds=LLM_GENERATION_TIMEOUT,
-        )
+        # Each rerun replays the first recording, whatever other reruns do meanwhile
+        response_store = get_llm_response_store()
+        with response_store.begin_run() if response_store else contextlib.nullcontext():
+            llm_response, _chunk_ids = await retry_on_content_filter(
+                generate,
+                timeout_seconds=LLM_GENERATION_TIMEOUT,
+            )
 
         elapsed_ms = int((time.time() - start_time) * 1000)
 
@@ -251,6 +264,6 @@ def rerun_query(
     except RuntimeError:
         pass
 
-    return asyncio.run(
+    return run_closing_http_clients(
         _rerun_query_async(query_text, chunks_from_db, model_name, reuse_rag_context)
     )
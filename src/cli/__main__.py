@@ -1,7 +1,6 @@
 """CLI main entry point - routes commands to appropriate handlers."""
 
 import argparse
-import asyncio
 import sys
 
 from src.cli.download_all_teams import download_all_teams
@@ -17,6 +16,7 @@ from src.cli.rag_test_sweep import rag_test_sweep
 from src.cli.run_bot import run_bot
 from src.cli.test_query import test_query
 from src.lib.constants import (
+    LLM_RESPONSE_STORE_PATH,
     PDF_EXTRACTION_PROVIDERS,
     QUALITY_TEST_JUDGE_MODEL,
     RAG_MAX_CHUNKS,
@@ -24,6 +24,12 @@ from src.lib.constants import (
     RAG_MIN_RELEVANCE,
 )
 from src.lib.model_name import validate_model_arg
+from src.services.llm.http_clients import run_closing_http_clients
+from src.services.llm.response_store import (
+    RESPONSE_STORE_MODES,
+    configure_llm_response_store,
+    get_llm_response_store,
+)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -44,6 +50,23 @@ def create_parser() -> argparse.ArgumentParser:
     # Create subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands", required=True)
 
+    # Shared options of the commands that call LLMs for evaluation
+    llm_store_parent = argparse.ArgumentParser(add_help=False)
+    llm_store_parent.add_argument(
+        "--llm-store",
+        choices=RESPONSE_STORE_MODES,
+        default=None,
+        help="Record/replay LLM responses: record (call and store), replay (stored "
+        "responses only, fail on a miss; no API keys needed), record-missing "
+        "(replay, call and store the rest). Default: $LLM_RESPONSE_STORE_MODE, else off",
+    )
+    llm_store_parent.add_argument(
+        "--llm-store-path",
+        metavar="DIR",
+        default=None,
+        help=f"Response store directory (default: {LLM_RESPONSE_STORE_PATH})",
+    )
+
     # Command: run
     run_parser = subparsers.add_parser(
         "run",
@@ -88,6 +111,7 @@ def create_parser() -> argparse.ArgumentParser:
     # Command: query
     query_parser = subparsers.add_parser(
         "query",
+        parents=[llm_store_parent],
         help="Test RAG + LLM pipeline locally",
         description="Test query processing locally without Discord",
     )
@@ -175,6 +199,7 @@ def create_parser() -> argparse.ArgumentParser:
     # Command: quality-test
     quality_parser = subparsers.add_parser(
         "quality-test",
+        parents=[llm_store_parent],
         help="Run response quality tests",
         description="Run quality tests for RAG + LLM pipeline",
     )
@@ -240,6 +265,7 @@ def create_parser() -> argparse.ArgumentParser:
     # Command: rag-test
     rag_parser = subparsers.add_parser(
         "rag-test",
+        parents=[llm_store_parent],
         help="Test RAG chunk retrieval quality",
         description="Test RAG retrieval quality using IR metrics (MAP, Recall@k, Precision@k)",
     )
@@ -263,6 +289,7 @@ def create_parser() -> argparse.ArgumentParser:
     # Command: rag-test-sweep
     rag_sweep_parser = subparsers.add_parser(
         "rag-test-sweep",
+        parents=[llm_store_parent],
         help="Run RAG parameter sweep for optimization",
         description="Test multiple parameter values and generate comparison charts",
     )
@@ -370,6 +397,11 @@ def main() -> None:
     args = parser.parse_args()
 
     try:
+        if getattr(args, "llm_store", None) is not None:
+            configure_llm_response_store(args.llm_store, args.llm_store_path)
+        elif getattr(args, "llm_store_path", None) is not None:
+            parser.error("--llm-store-path requires --llm-store")
+
         # Route to appropriate command handler
         if args.command == "run":
             run_bot()
@@ -383,7 +415,7 @@ def main() -> None:
             )
 
         elif args.command == "query":
-            asyncio.run(
+            run_closing_http_clients(
                 test_query(
                     query=args.query,
                     model=args.model,
@@ -463,6 +495,10 @@ def main() -> None:
             parser.print_help()
             sys.exit(1)
 
+        response_store = get_llm_response_store() if hasattr(args, "llm_store") else None
+        if response_store is not None:
+            print(f"\n{response_store.summary()}")
+
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
         sys.exit(130)
@@ -5,7 +5,6 @@ Usage:
 """
 
 import argparse
-import asyncio
 import re
 import sys
 import tempfile
@@ -21,6 +20,7 @@ from src.lib.logging import get_logger
 from src.lib.pricing import LLMCostBreakdown, calculate_llm_cost
 from src.services.llm.base import ExtractionConfig, ExtractionRequest
 from src.services.llm.factory import LLMProviderFactory
+from src.services.llm.http_clients import run_closing_http_clients
 
 logger = get_logger(__name__)
 
@@ -350,7 +350,7 @@ def download_team_internal(
             )
 
             # Extract (synchronous wrapper for async method)
-            response = asyncio.run(llm_provider.extract_pdf(request))
+            response = run_closing_http_clients(llm_provider.extract_pdf(request))
 
         # Clean up temp file
         Path(temp_pdf_path).unlink(missing_ok=True)
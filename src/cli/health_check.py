@@ -1,12 +1,12 @@
 """CLI command to check system health."""
 
-import asyncio
 import sys
 
 from src.lib.config import Config, get_config
 from src.lib.logging import get_logger
 from src.services.discord.health import HealthStatus, check_health
 from src.services.llm.factory import LLMProviderFactory
+from src.services.llm.http_clients import run_closing_http_clients
 from src.services.rag.retriever import RAGRetriever
 
 logger = get_logger(__name__)
@@ -154,7 +154,7 @@ def health_check(verbose: bool = False, wait_for_discord: bool = False) -> None:
     checker = HealthChecker(config)
 
     try:
-        is_healthy = asyncio.run(checker.run(verbose=verbose, wait_for_discord=wait_for_discord))
+        is_healthy = run_closing_http_clients(checker.run(verbose=verbose, wait_for_discord=wait_for_discord))
 
         # Exit with appropriate code
         sys.exit(0 if is_healthy else 1)
@@ -20,6 +20,11 @@ from src.lib.logging import get_logger
 from src.models.rule_document import RuleDocument
 from src.services.rag.chunker import MarkdownChunk
 from src.services.rag.embeddings import EmbeddingService
+from src.services.rag.index_bundle import (
+    build_index_bundle,
+    current_bundle_key,
+    verify_index_bundle,
+)
 from src.services.rag.ingestion_state import IngestionState, current_fingerprint
 from src.services.rag.ingestor import IngestionResult, RAGIngestor
 from src.services.rag.summarizer_batch import BatchCosts, BatchSummarizer
@@ -164,6 +169,7 @@ def ingest_rules(
 
     if not changes.to_ingest:
         print("\n✅ Nothing to ingest — all files unchanged")
+        _refresh_index_bundle(state, ingestor)
         _print_summary(
             processed=0,
             unchanged=len(changes.unchanged),
@@ -214,6 +220,8 @@ def ingest_rules(
         state.batch = None
         state.save()
 
+    _refresh_index_bundle(state, ingestor)
+
     # Batched summaries are paid for by BatchSummarizer, live ones by the ingestor;
     # a run can contain both (batch items that failed fall back to live).
     _print_summary(
@@ -230,6 +238,31 @@ def ingest_rules(
     )
 
 
+def _refresh_index_bundle(state: IngestionState, ingestor: RAGIngestor) -> None:
+    """Rewrite the retrieval index bundle if it does not match the ingested corpus.
+
+    A bundle with the right key is still rewritten when its checksums fail, since
+    retrievers only check file sizes on load.
+
+    Non-fatal: without a bundle, retrievers rebuild their indexes from Chroma at
+    startup, which is slower but correct.
+    """
+    index_key = state.index_key()
+    if current_bundle_key() == index_key:
+        problems = verify_index_bundle()
+        if not problems:
+            return
+        logger.warning(f"Index bundle failed verification, rewriting: {problems}")
+    try:
+        if build_index_bundle(
+            ingestor.vector_db, index_key, ingestor.keyword_extractor.get_keywords()
+        ):
+            print("📦 Retrieval index bundle updated")
+    except Exception as e:
+        logger.warning(f"Failed to write index bundle: {e}", exc_info=True)
+        print(f"⚠️  Index bundle not written ({e}); retrievers will rebuild indexes at startup")
+
+
 def _stale_reason(state: IngestionState) -> str:
     """Human-readable explanation of why the fingerprint mismatched."""
     if not state.fingerprint:
@@ -381,6 +414,8 @@ def _resume_batch(
         state.batch = None
         state.save()
 
+    _refresh_index_bundle(state, ingestor)
+
     _print_summary(
         processed=result.documents_processed,
         unchanged=0,
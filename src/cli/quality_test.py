@@ -1,7 +1,6 @@
 """CLI command for running quality tests."""
 # ruff: noqa: E402
 
-import asyncio
 import sys
 import time
 from datetime import UTC, datetime
@@ -11,6 +10,7 @@ import src.lib.constants as constants
 from src.lib.config import get_config
 from src.lib.constants import QUALITY_TEST_JUDGE_MODEL, QUALITY_TEST_PROVIDERS
 from src.lib.logging import get_logger
+from src.services.llm.http_clients import run_closing_http_clients
 from tests.quality.reporting.aggregator import aggregate_results
 from tests.quality.reporting.report_generator import ReportGenerator
 from tests.quality.reporting.report_models import QualityReport
@@ -141,7 +141,7 @@ def quality_test(
 
         try:
             # Run replay
-            results, replay_dir = asyncio.run(
+            results, replay_dir = run_closing_http_clients(
                 runner.replay_tests_from_outputs(
                     output_dir=output_dir,
                     models=models_to_run,
@@ -229,7 +229,7 @@ def quality_test(
 
     try:
         # Run all tests in parallel
-        results = asyncio.run(
+        results = run_closing_http_clients(
             runner.run_tests_in_parallel(
                 runs=runs,
                 report_dir=report_dir,
@@ -310,7 +310,7 @@ def _batch_submit(test_id, model, all_models, judge_model, skip_confirm, runs, f
     report_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        manifest = asyncio.run(
+        manifest = run_closing_http_clients(
             runner.submit_batch_run(
                 report_dir=report_dir,
                 test_id=test_id,
@@ -344,7 +344,7 @@ def _batch_collect(results_dir: str, judge_model: str) -> None:
 
     runner = QualityTestRunner(judge_model=judge_model)
     try:
-        phase = asyncio.run(runner.collect_batch_run(report_dir))
+        phase = run_closing_http_clients(runner.collect_batch_run(report_dir))
     except Exception as e:
         logger.error(f"Batch collect failed: {e}", exc_info=True)
         print(f"\n❌ Batch collect failed: {e}")
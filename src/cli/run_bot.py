@@ -5,6 +5,7 @@ import signal
 import sys
 
 from src.lib.config import Config, get_config
+from src.lib.constants import RAG_INDEX_HOT_RELOAD_ENABLED, RAG_RETRIEVAL_CACHE_ENABLED
 from src.lib.database import AnalyticsDatabase
 from src.lib.logging import get_logger
 from src.services.discord.bot import KillTeamBotOrchestrator
@@ -12,8 +13,12 @@ from src.services.discord.client import KillTeamBot
 from src.services.discord.context_manager import ConversationContextManager
 from src.services.discord.feedback_logger import FeedbackLogger
 from src.services.llm.factory import LLMProviderFactory
+from src.services.llm.http_clients import close_shared_http_clients
+from src.services.llm.provider_pool import get_llm_provider_pool
 from src.services.llm.rate_limiter import RateLimiter
 from src.services.llm.validator import ResponseValidator
+from src.services.rag.index_reloader import IndexReloadWatcher
+from src.services.rag.retrieval_cache import get_retrieval_cache
 from src.services.rag.retriever import RAGRetriever
 
 logger = get_logger(__name__)
@@ -30,6 +35,7 @@ class BotRunner:
         """
         self.config = config
         self.bot: KillTeamBot | None = None
+        self.index_watcher: IndexReloadWatcher | None = None
         self.shutdown_event = asyncio.Event()
 
     def _setup_signal_handlers(self) -> None:
@@ -54,8 +60,10 @@ class BotRunner:
         logger.info("Initializing services...")
 
         try:
-            # Initialize RAG retriever
-            rag_retriever = RAGRetriever()
+            # Initialize RAG retriever (repeat questions reuse cached retrievals)
+            rag_retriever = RAGRetriever(
+                retrieval_cache=get_retrieval_cache() if RAG_RETRIEVAL_CACHE_ENABLED else None
+            )
             logger.info("✓ RAG retriever initialized")
 
             # Initialize LLM provider factory
@@ -164,8 +172,24 @@ class BotRunner:
 
             logger.info(f"Starting bot in {mode} mode...")
 
+            # Swap in new retrieval indexes after `ingest`, without a restart
+            if RAG_INDEX_HOT_RELOAD_ENABLED:
+                self.index_watcher = IndexReloadWatcher(orchestrator.rag)
+                self.index_watcher.start()
+
             # Run bot with graceful shutdown
-            await self._run_bot_with_shutdown(token)
+            try:
+                await self._run_bot_with_shutdown(token)
+            finally:
+                if self.index_watcher:
+                    await self.index_watcher.stop()
+                if orchestrator.rag.retrieval_cache:
+                    logger.info(
+                        "retrieval_cache_stats", **orchestrator.rag.retrieval_cache.get_stats()
+                    )
+                # Close pooled LLM clients (logs reuse stats) and shared HTTP clients
+                await get_llm_provider_pool().aclose()
+                await close_shared_http_clients()
 
             logger.info("Bot shutdown complete")
 
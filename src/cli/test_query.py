@@ -5,7 +5,6 @@ Usage:
 """
 
 import argparse
-import asyncio
 import json
 import sys
 from datetime import UTC, datetime
@@ -22,12 +21,13 @@ from src.lib.tokens import estimate_embedding_cost
 from src.models.rag_context_serializer import save_rag_context
 from src.models.rag_request import RetrieveRequest
 from src.services.llm.factory import LLMProviderFactory
+from src.services.llm.http_clients import run_closing_http_clients
 from src.services.llm.retry import retry_on_content_filter
 from src.services.llm.validator import ResponseValidator
 from src.services.orchestrator import QueryOrchestrator
 from src.services.rag.embeddings import EmbeddingService
 from src.services.rag.retriever import RAGRetriever
-from src.services.rag.vector_db import VectorDBService
+from src.services.rag.vector_db import create_vector_db_service
 
 logger = get_logger(__name__)
 
@@ -94,7 +94,7 @@ def _initialize_services(model: str | None, rag_only: bool) -> TestQueryServices
     """
     try:
         # Initialize RAG services
-        vector_db = VectorDBService(collection_name="kill_team_rules")
+        vector_db = create_vector_db_service(collection_name="kill_team_rules")
         embedding_service = EmbeddingService()
         rag_retriever = RAGRetriever(
             vector_db_service=vector_db,
@@ -154,7 +154,7 @@ async def _perform_rag_retrieval(
     # Note: verbose parameter is not supported by orchestrator, so we call RAG service directly
     if verbose:
         # For verbose mode, call RAG service directly to capture detailed prompts
-        rag_context, hop_evaluations, chunk_hop_map = services.rag_retriever.retrieve(
+        rag_context, hop_evaluations, chunk_hop_map = await services.rag_retriever.retrieve_async(
             RetrieveRequest(
                 query=query,
                 context_key="cli:test",
@@ -585,7 +585,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        asyncio.run(
+        run_closing_http_clients(
             test_query(
                 args.query,
                 model=args.model,
@@ -0,0 +1,280 @@
+"""Reusable in-memory cache core.
+
+Bounded key-value store shared by the service caches:
+- O(1) LRU: an OrderedDict in recency order; hits move to the end, eviction
+  pops from the front.
+- TTL: expiry times go into a min-heap, so purging expired entries costs
+  O(expired * log n) instead of a scan over every entry. Removed or replaced
+  entries leave stale heap items behind; they are skipped when popped and the
+  heap is rebuilt once they outnumber the live entries.
+- Budgets: an entry count and/or a byte budget (sizes come from a caller
+  supplied sizeof function).
+- Tags: a reverse tag -> keys index (e.g. document_id -> cached queries), so
+  invalidating a tag touches only the affected entries.
+"""
+
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(slots=True)
+class _Entry(Generic[V]):
+    """Stored value with its bookkeeping."""
+
+    value: V
+    size: int
+    expires_at: float | None
+    tags: tuple[Hashable, ...]
+    version: int  # Matches the heap item that may expire this entry
+
+
+class LRUTTLCache(Generic[K, V]):
+    """Thread-safe LRU cache with TTL expiry, byte budget and tag invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        sizeof: Callable[[V], int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of entries (None = unbounded)
+            max_bytes: Maximum total size of entries as reported by sizeof (None = unbounded)
+            ttl_seconds: Default time-to-live (None = entries never expire)
+            sizeof: Size of a value in bytes (default: every entry counts as 1)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof or (lambda _value: 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()  # Least recently used first
+        self._expiry_heap: list[tuple[float, int, K]] = []  # (expires_at, version, key)
+        self._tag_index: dict[Hashable, set[K]] = {}
+        self._version = 0
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: K) -> V | None:
+        """Get a value and mark it most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: K,
+        value: V,
+        tags: Iterable[Hashable] = (),
+        ttl_seconds: float | None = None,
+    ) -> bool:
+        """Store a value, evicting least recently used entries to stay within budget.
+
+        Args:
+            key: Cache key (an existing entry is replaced)
+            value: Value to cache
+            tags: Tags to invalidate the entry by (see invalidate_tag)
+            ttl_seconds: Time-to-live for this entry (default: the cache's ttl_seconds)
+
+        Returns:
+            False if the value alone exceeds max_bytes and was not stored
+        """
+        size = self._sizeof(value)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug("cache_entry_too_large", size=size, max_bytes=self.max_bytes)
+                return False
+
+            self._purge_expired()
+
+            self._version += 1
+            expires_at = self._clock() + ttl if ttl is not None else None
+            entry = _Entry(value, size, expires_at, tuple(tags), self._version)
+            self._entries[key] = entry
+            self.total_bytes += size
+            for tag in entry.tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, entry.version, key))
+
+            while (self.max_entries is not None and len(self._entries) > self.max_entries) or (
+                self.max_bytes is not None and self.total_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+            return True
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Removed value, or None if not cached
+        """
+        with self._lock:
+            entry = self._remove(key)
+            return entry.value if entry else None
+
+    def invalidate_tag(self, tag: Hashable) -> int:
+        """Remove every entry stored with a tag.
+
+        Args:
+            tag: Tag given to put()
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = list(self._tag_index.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> int:
+        """Remove every entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._tag_index.clear()
+            self.total_bytes = 0
+            self.invalidations += count
+            return count
+
+    def purge_expired(self) -> int:
+        """Remove expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._purge_expired()
+
+    def __len__(self) -> int:
+        """Number of stored entries (expired ones count until purged or looked up)."""
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, object]:
+        """Get cache statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    def _purge_expired(self) -> int:
+        """Pop due heap items and remove their entries (caller holds the lock).
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._clock()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, version, key = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._remove(key)
+                removed += 1
+        self.expirations += removed
+
+        # Stale items of replaced/removed entries would otherwise pile up
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, entry.version, key)
+                for key, entry in self._entries.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        return removed
+
+    def _remove(self, key: K) -> _Entry[V] | None:
+        """Remove an entry and its tag index references (caller holds the lock).
+
+        Its heap item, if any, goes stale and is skipped when popped.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Removed entry, or None if not cached
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        self.total_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+        return entry
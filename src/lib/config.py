@@ -37,6 +37,7 @@ class Config:
 
     # RAG Configuration
     vector_db_path: str = "./data/chroma_db"
+    vector_db_backend: str = "chroma"  # "chroma" or "matrix" (exact in-process search)
     embedding_model: str = EMBEDDING_MODEL
     rag_hop_evaluation_model: LLM_PROVIDERS_LITERAL | None = (
         None  # Model for multi-hop RAG evaluation (defaults to constant)
@@ -81,6 +82,10 @@ class Config:
         if self.log_level.upper() not in valid_levels:
             raise ValueError(f"log_level must be one of: {', '.join(valid_levels)}")
 
+        # Validate vector DB backend
+        if self.vector_db_backend not in {"chroma", "matrix"}:
+            raise ValueError("vector_db_backend must be one of: chroma, matrix")
+
         # Validate retention days
         if self.retention_days < 1 or self.retention_days > 30:
             raise ValueError("retention_days must be between 1 and 30")
@@ -155,6 +160,7 @@ class Config:
             default_llm_provider=os.getenv("DEFAULT_LLM_PROVIDER", DEFAULT_LLM_PROVIDER),  # type: ignore
             # RAG
             vector_db_path=os.getenv("VECTOR_DB_PATH", "./data/chroma_db"),
+            vector_db_backend=os.getenv("VECTOR_DB_BACKEND", "chroma").lower(),
             embedding_model=os.getenv("EMBEDDING_MODEL", EMBEDDING_MODEL),
             rag_hop_evaluation_model=os.getenv("RAG_HOP_EVALUATION_MODEL"),  # type: ignore
             # Logging
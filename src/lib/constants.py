@@ -150,6 +150,37 @@ LLM_DEFAULT_TEMPERATURE = 0.1  # Lower = more deterministic (0.0-1.0)
 # multiplier already applied in the ChatGPT and Gemini adapters.
 LLM_REASONING_TOKEN_MULTIPLIER = 3
 
+# Pooled LLM providers: the Discord bot reuses one long-lived adapter (and its
+# HTTP client, TLS sessions and keep-alive connections) per
+# (model id, API key, reasoning effort) instead of building one per message
+LLM_PROVIDER_POOL_ENABLED = True
+LLM_PROVIDER_POOL_MAX_SIZE = 32  # Least recently used adapters beyond this are closed
+# A replaced adapter (rotated servers.yaml key, LRU eviction) is closed after
+# this grace period so requests already in flight on it can finish
+LLM_PROVIDER_RETIRE_GRACE_S = LLM_GENERATION_TIMEOUT
+
+# Connection pool bounds of each provider HTTP client
+LLM_HTTP_MAX_CONNECTIONS = 20
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+LLM_HTTP_KEEPALIVE_EXPIRY_S = 120  # Idle keep-alive connections are dropped after this
+LLM_HTTP_CONNECT_TIMEOUT_S = 10  # TCP + TLS connect timeout of shared clients
+# Negotiate HTTP/2 on the shared raw-httpx clients (Grok, Mistral) when the h2
+# package is installed; HTTP/1.1 keep-alive otherwise
+LLM_HTTP2_ENABLED = True
+
+# Streamed answers: adapters with supports_streaming progressively edit the
+# Discord acknowledgement message while the structured JSON answer arrives
+DISCORD_STREAMING_ENABLED = True
+# Minimum gap between two edits of the same message (Discord allows 5 edits / 5s)
+DISCORD_STREAM_EDIT_INTERVAL_S = 1.5
+DISCORD_STREAM_PREVIEW_MAX_CHARS = 2000  # Discord message content limit
+
+# Record/replay LLM response store (see src/services/llm/response_store.py):
+# "off", "record", "replay" or "record-missing". Selected per command with
+# --llm-store, or with the LLM_RESPONSE_STORE_MODE environment variable
+LLM_RESPONSE_STORE_MODE = "off"
+LLM_RESPONSE_STORE_PATH = "data/llm_response_store"  # One JSON file per request hash
+
 
 # PDF extraction parameters
 LLM_EXTRACTION_MAX_TOKENS = 16000  # Large output for full rulebook sections
@@ -251,6 +282,30 @@ RRF_K = 60
 # Options: text-embedding-3-small, text-embedding-3-large, text-embedding-ada-002
 EMBEDDING_MODEL = "text-embedding-ada-002"
 
+# Query embedding cache (in-memory LRU + on-disk SQLite, keyed by model + text)
+# Repeat queries skip the OpenAI round trip entirely
+EMBEDDING_CACHE_ENABLED = True
+EMBEDDING_CACHE_PATH = "data/embedding_cache.db"
+EMBEDDING_CACHE_MEMORY_SIZE = 1024  # Vectors kept in memory
+EMBEDDING_CACHE_MAX_ENTRIES = 50000  # Vectors kept on disk (LRU pruned)
+
+# RAGCache (exact query + context_key result cache) memory budget; least
+# recently used results are evicted beyond it
+RAG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Semantic retrieval cache (bot only): a query whose embedding is within
+# RAG_RETRIEVAL_CACHE_MAX_DISTANCE (cosine distance) of a cached query reuses
+# its retrieval result, skipping vector search, BM25 and hop evaluation LLM calls.
+# ada-002 distances are compressed (questions differing by one rules term or a
+# negation can be closer than 0.05), so only near-verbatim repeats may hit.
+# Off until the threshold has been measured: run
+# tests/integration/test_retrieval_cache_threshold.py and record its distances
+# here before enabling.
+RAG_RETRIEVAL_CACHE_ENABLED = False
+RAG_RETRIEVAL_CACHE_MAX_DISTANCE = 0.01
+RAG_RETRIEVAL_CACHE_MAX_ENTRIES = 512
+RAG_RETRIEVAL_CACHE_TTL_SECONDS = 3600  # Also invalidated per document on re-ingest
+
 # Markdown chunking configuration
 MARKDOWN_CHUNK_HEADER_LEVEL = 2  # Max header level to chunk at: chunks at ## up to this level
 
@@ -295,6 +350,15 @@ INGEST_ID_NAMESPACE = UUID("6f0d4a1e-6c3b-5f7a-9c2d-1b8e4a7f0c93")
 # Per-file hashes + config fingerprint, so a re-run only processes changed files
 INGEST_STATE_PATH = "data/ingestion_state.json"
 
+# Prebuilt BM25/header/chunk-table bundle written after each ingest, so retrievers
+# start without pulling the whole collection out of Chroma and re-tokenizing it
+RAG_INDEX_BUNDLE_PATH = "data/index_bundle"
+
+# Hot reload: the running bot polls the ingestion state and swaps in new indexes
+# after an `ingest`, without a restart
+RAG_INDEX_HOT_RELOAD_ENABLED = True
+RAG_INDEX_RELOAD_INTERVAL_SECONDS = 30.0
+
 # Batch summarization: how often to check a submitted batch, and how long to wait
 # before giving up. Providers promise <=24h turnaround; in practice ingestion
 # batches complete in minutes.
@@ -317,6 +381,9 @@ RAG_ENABLE_QUERY_NORMALIZATION = True
 # Path to cached keyword library (auto-extracted from rules during ingestion)
 RAG_KEYWORD_CACHE_PATH = "data/rag_keywords.json"
 
+# Longest multi-word header (e.g. "Seek Light") kept as a keyword phrase
+RAG_KEYWORD_MAX_PHRASE_WORDS = 4
+
 # ============================================================================
 # RAG Query Expansion Constants
 # ============================================================================
@@ -356,6 +423,12 @@ RAG_HOP_EVALUATION_TIMEOUT = 30
 # Hop evaluation retry delay on rate limit (seconds)
 RAG_HOP_RATE_LIMIT_DELAY = 5.0
 
+# Max multi-hop evaluations in flight at once during RAGRetriever.retrieve_many
+RAG_BATCH_MULTI_HOP_CONCURRENCY = 4
+
+# Worker threads that score BM25 while the query embedding request is in flight
+RAG_PARALLEL_STAGE_WORKERS = 4
+
 # Hop evaluation prompt file path
 #RAG_HOP_EVALUATION_PROMPT_PATH = "prompts/hop-evaluation-prompt.md"
 RAG_HOP_EVALUATION_PROMPT_PATH = "prompts/hop-evaluation-prompt-with-rule-reference.md"
@@ -370,6 +443,29 @@ MAX_CHUNK_LENGTH_FOR_EVALUATION = 500
 # Max tokens for hop evaluation LLM response
 RAG_HOP_EVALUATION_MAX_TOKENS = 300
 
+# Semantic fallback for hop titles without a header match:
+# "batched" = each title embedded separately in one embeddings request, one
+#   multi-vector search, BM25/RRF per title, titles merged with RRF
+# "joined" = titles joined into one comma-separated query through retrieve()
+RAG_HOP_FALLBACK_MODE = "batched"
+
+# Speculative hop prefetch: while the hop evaluation LLM call is in flight, rule
+# names mentioned in the retrieved chunks are resolved against the header index
+RAG_HOP_PREFETCH_ENABLED = True
+
+# Max rule name candidates the hop prefetch resolves per query
+RAG_HOP_PREFETCH_MAX_CANDIDATES = 256
+
+# Hop evaluation result cache: the judge runs at temperature 0, so a repeat of
+# (query, chunks shown, prompt, model) reuses the stored verdict instead of an
+# LLM call. Entries expire after the TTL and with every new ingestion generation
+RAG_HOP_EVAL_CACHE_ENABLED = True
+RAG_HOP_EVAL_CACHE_PATH = "data/hop_evaluation_cache.db"
+RAG_HOP_EVAL_CACHE_MEMORY_SIZE = 512  # Verdicts kept in memory
+RAG_HOP_EVAL_CACHE_MAX_ENTRIES = 20000  # Verdicts kept on disk (LRU pruned)
+RAG_HOP_EVAL_CACHE_TTL_SECONDS = 7 * 24 * 3600
+RAG_HOP_EVAL_CACHE_TOUCH_BATCH = 64  # Disk hits whose last_used update is committed together
+
 # ============================================================================
 # Maintenance Mode Constants
 # ============================================================================
@@ -52,6 +52,7 @@ CREATE TABLE IF NOT EXISTS queries (
     retrieval_latency_ms INTEGER DEFAULT 0,
     hop_evaluation_latency_ms INTEGER DEFAULT 0,
     total_latency_ms INTEGER DEFAULT 0,
+    time_to_first_content_ms INTEGER DEFAULT NULL,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL
 );
@@ -94,6 +95,9 @@ CREATE TABLE IF NOT EXISTS hop_evaluations (
     reasoning TEXT NOT NULL,
     missing_query TEXT,
     evaluation_model TEXT NOT NULL,
+    from_cache INTEGER DEFAULT 0,
+    saved_cost_usd REAL DEFAULT 0.0,
+    saved_time_s REAL DEFAULT 0.0,
     created_at TEXT NOT NULL,
     FOREIGN KEY (query_id) REFERENCES queries(query_id) ON DELETE CASCADE
 );
@@ -220,8 +224,8 @@ class AnalyticsDatabase:
                         hop_evaluation_cost, main_llm_cost,
                         main_llm_cache_savings, hop_evaluation_cache_savings,
                         retrieval_latency_ms, hop_evaluation_latency_ms, total_latency_ms,
-                        created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        time_to_first_content_ms, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         query_data["query_id"],
@@ -256,6 +260,7 @@ class AnalyticsDatabase:
                         query_data.get("retrieval_latency_ms", 0),
                         query_data.get("hop_evaluation_latency_ms", 0),
                         query_data.get("total_latency_ms", 0),
+                        query_data.get("time_to_first_content_ms"),
                         now,
                         now,
                     ),
@@ -381,8 +386,9 @@ class AnalyticsDatabase:
                         """
                         INSERT INTO hop_evaluations (
                             query_id, hop_number, can_answer, reasoning,
-                            missing_query, evaluation_model, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                            missing_query, evaluation_model,
+                            from_cache, saved_cost_usd, saved_time_s, created_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                         (
                             query_id,
@@ -391,6 +397,9 @@ class AnalyticsDatabase:
                             evaluation["reasoning"],
                             evaluation.get("missing_query"),
                             evaluation.get("served_model") or evaluation_model,
+                            1 if evaluation.get("from_cache") else 0,
+                            evaluation.get("saved_cost_usd", 0.0),
+                            evaluation.get("saved_time_s", 0.0),
                             now,
                         ),
                     )
@@ -422,7 +431,7 @@ class AnalyticsDatabase:
                     """
                     SELECT
                         hop_number, can_answer, reasoning, missing_query,
-                        evaluation_model, created_at
+                        evaluation_model, from_cache, saved_cost_usd, saved_time_s, created_at
                     FROM hop_evaluations
                     WHERE query_id = ?
                     ORDER BY hop_number ASC
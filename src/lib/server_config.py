@@ -64,17 +64,53 @@ class MultiServerConfig:
             config_path: Path to servers.yaml file
         """
         self.config_path = Path(config_path)
-        self.servers: dict[str, ServerConfig] = {}
-        self._load_config()
+        self._mtime = self._file_mtime()
+        self.servers: dict[str, ServerConfig] = self._load_config() or {}
 
-    def _load_config(self) -> None:
+    def _file_mtime(self) -> float | None:
+        """Modification time of servers.yaml (None if missing)."""
+        try:
+            return self.config_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        """Reload servers.yaml if it changed since it was last loaded.
+
+        The new configuration is parsed completely before it replaces the
+        current one, so concurrent lookups never see a half-loaded config, and
+        a file that fails to parse (e.g. saved mid-edit) keeps the current one.
+
+        Returns:
+            True if the configuration was reloaded
+        """
+        mtime = self._file_mtime()
+        if mtime == self._mtime:
+            return False
+
+        self._mtime = mtime
+        servers = self._load_config()
+        if servers is None:
+            logger.warning(f"Keeping previous server config, {self.config_path} failed to load")
+            return False
+
+        self.servers = servers
+        logger.info(f"Reloaded server config from {self.config_path}")
+        return True
+
+    def _load_config(self) -> dict[str, ServerConfig] | None:
         """Load server configurations from YAML file.
 
-        If file doesn't exist or is invalid, logs warning and continues with empty config.
+        A missing file or 'servers' section gives an empty config (.env only);
+        invalid server entries are skipped.
+
+        Returns:
+            Server configs by guild id, or None if the file could not be read or parsed
         """
+        servers: dict[str, ServerConfig] = {}
         if not self.config_path.exists():
             logger.info(f"Server config not found at {self.config_path}, using .env only")
-            return
+            return servers
 
         logger.info(f"Loading server config from {self.config_path}")
 
@@ -84,7 +120,7 @@ class MultiServerConfig:
 
             if not data or "servers" not in data:
                 logger.warning(f"No 'servers' section in {self.config_path}")
-                return
+                return servers
 
             for guild_id, server_data in data["servers"].items():
                 if not isinstance(server_data, dict):
@@ -122,7 +158,7 @@ class MultiServerConfig:
                     # Validate the config
                     server_config.validate()
 
-                    self.servers[guild_id_str] = server_config
+                    servers[guild_id_str] = server_config
                     logger.info(
                         f"Loaded server config for guild {guild_id_str} "
                         f"({server_config.name if server_config.name else 'unnamed'}): "
@@ -134,8 +170,12 @@ class MultiServerConfig:
 
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse {self.config_path}: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error loading server config: {e}")
+            return None
+
+        return servers
 
     def get_server_config(self, guild_id: str | None) -> ServerConfig | None:
         """Get configuration for a specific Discord server.
@@ -11,9 +11,13 @@ from uuid import UUID, uuid4
 from src.lib.constants import RAG_MIN_RELEVANCE
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocumentChunk:
-    """A text segment from a rule document."""
+    """A text segment from a rule document.
+
+    Immutable: index chunks are shared by every query, per-query scores are set
+    on a copy (dataclasses.replace).
+    """
 
     chunk_id: UUID
     document_id: UUID  # FK to RuleDocument
@@ -23,6 +27,25 @@ class DocumentChunk:
     metadata: dict[str, Any]  # source, doc_type, last_update_date, section
     relevance_score: float  # 0-1 cosine similarity
     position_in_doc: int  # Section number for citation
+    vector_similarity: float | None = None  # Cosine similarity (None = BM25-only hit)
+    bm25_score: float | None = None  # Raw BM25 score (None = not a BM25 hit)
+    rrf_score: float | None = None  # Raw RRF fusion score (None = no hybrid fusion)
+
+    def score_breakdown(self) -> dict[str, float]:
+        """Retrieval scores that are set, keyed by field name.
+
+        Returns:
+            Dict with vector_similarity, bm25_score and rrf_score where not None
+        """
+        return {
+            name: value
+            for name, value in (
+                ("vector_similarity", self.vector_similarity),
+                ("bm25_score", self.bm25_score),
+                ("rrf_score", self.rrf_score),
+            )
+            if value is not None
+        }
 
     def validate(self) -> None:
         """Validate DocumentChunk fields.
@@ -101,6 +101,7 @@ class AnalyticsRecorder:
                     "retrieval_latency_ms": latency_breakdown["retrieval_latency_ms"],
                     "hop_evaluation_latency_ms": latency_breakdown["hop_evaluation_latency_ms"],
                     "total_latency_ms": latency_breakdown["total_latency_ms"],
+                    "time_to_first_content_ms": latency_breakdown.get("time_to_first_content_ms"),
                     "quote_validation_score": (
                         quote_validation_result.validation_score if quote_validation_result else None
                     ),
@@ -170,9 +171,9 @@ class AnalyticsRecorder:
                 "chunk_text": chunk.text[:500],
                 "document_name": chunk.metadata.get("source", "Unknown"),
                 "document_type": chunk.metadata.get("doc_type", "core-rules"),
-                "vector_similarity": chunk.metadata.get("vector_similarity"),
-                "bm25_score": chunk.metadata.get("bm25_score"),
-                "rrf_score": chunk.metadata.get("rrf_score"),
+                "vector_similarity": chunk.vector_similarity,
+                "bm25_score": chunk.bm25_score,
+                "rrf_score": chunk.rrf_score,
                 "final_score": chunk.relevance_score,
                 "hop_number": chunk_hop_map.get(chunk.chunk_id, 0),
             }
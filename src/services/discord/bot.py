@@ -5,7 +5,12 @@ import time
 
 import discord
 
-from src.lib.constants import LLM_GENERATION_TIMEOUT, RAG_MAX_HOPS
+from src.lib.constants import (
+    DISCORD_STREAMING_ENABLED,
+    LLM_GENERATION_TIMEOUT,
+    LLM_PROVIDER_POOL_ENABLED,
+    RAG_MAX_HOPS,
+)
 from src.lib.database import AnalyticsDatabase
 from src.lib.discord_utils import get_random_acknowledgement
 from src.lib.logging import get_logger
@@ -18,6 +23,7 @@ from src.services.discord.error_message_builder import ErrorMessageBuilder
 from src.services.discord.llm_provider_manager import LLMProviderManager
 from src.services.discord.query_cost_calculator import QueryCostCalculator
 from src.services.discord.response_builder import ResponseBuilder
+from src.services.discord.stream_editor import StreamingResponseEditor
 from src.services.llm.factory import LLMProviderFactory
 from src.services.llm.quote_validator import QuoteValidator
 from src.services.llm.rate_limiter import RateLimiter
@@ -58,7 +64,7 @@ class KillTeamBotOrchestrator:
 
         # Try to create default LLM provider for rate limiting
         try:
-            self.llm = self.llm_factory.create()
+            self.llm = self.llm_factory.create(pooled=LLM_PROVIDER_POOL_ENABLED)
         except KeyError:
             logger.warning(
                 "No global LLM API key found in .env, will use per-server keys only. "
@@ -91,6 +97,9 @@ class KillTeamBotOrchestrator:
 
         Flow: rate limit → acknowledgement → RAG → LLM → validate → format → send → feedback
 
+        With a streaming provider the acknowledgement is edited with the answer
+        while it is generated, then replaced by the final response.
+
         Args:
             message: Discord message object
             user_query: Parsed user query
@@ -107,6 +116,7 @@ class KillTeamBotOrchestrator:
             },
         )
 
+        stream_editor = None
         try:
             # Step 1: Create LLM provider for this guild
             llm, error_message = self.llm_provider_manager.create_provider(
@@ -121,7 +131,7 @@ class KillTeamBotOrchestrator:
                 return
 
             # Step 3: Send acknowledgement
-            await message.channel.send(get_random_acknowledgement())
+            ack_message = await message.channel.send(get_random_acknowledgement())
 
             # Start timing for total latency (after acknowledgement)
             start_time = time.time()
@@ -129,9 +139,11 @@ class KillTeamBotOrchestrator:
             # Step 4: RAG retrieval
             rag_context, hop_evaluations, chunk_hop_map, embedding_cost, retrieval_latency_ms = await self._perform_rag_retrieval(user_query)
 
-            # Step 5: LLM generation
+            # Step 5: LLM generation (streamed into the acknowledgement if supported)
+            if DISCORD_STREAMING_ENABLED and getattr(type(llm), "supports_streaming", False):
+                stream_editor = StreamingResponseEditor(ack_message)
             llm_response, chunk_ids = await self._perform_llm_generation(
-                user_query, rag_context, llm
+                user_query, rag_context, llm, stream_editor
             )
 
             # Step 6: Parse and validate structured response
@@ -156,14 +168,23 @@ class KillTeamBotOrchestrator:
             )
 
             # Step 10: Send response to Discord
-            await self._send_response(message, bot_response, validation_result, user_query)
+            await self._send_response(message, bot_response, validation_result, user_query, stream_editor)
+
+            # Without a streamed preview, the response itself is the first visible content
+            time_to_first_content_ms = total_latency_ms
+            if stream_editor and stream_editor.first_content_at is not None:
+                time_to_first_content_ms = int((stream_editor.first_content_at - start_time) * 1000)
 
             # Step 11: Calculate and log costs and latency breakdowns
             costs = self.cost_calculator.calculate_total_cost(
                 user_query.sanitized_text, llm_response, hop_evaluations
             )
             latency_breakdown = QueryCostCalculator.calculate_latency_breakdown(
-                retrieval_latency_ms, hop_evaluations, llm_response.latency_ms, total_latency_ms
+                retrieval_latency_ms,
+                hop_evaluations,
+                llm_response.latency_ms,
+                total_latency_ms,
+                time_to_first_content_ms,
             )
             self._log_costs(costs, correlation_id)
 
@@ -193,10 +214,13 @@ class KillTeamBotOrchestrator:
                     "rag_score": rag_context.avg_relevance,
                     "latency_ms": total_latency_ms,
                     "llm_latency_ms": llm_response.latency_ms,
+                    "time_to_first_content_ms": time_to_first_content_ms,
                 },
             )
 
         except Exception as e:
+            if stream_editor:
+                await stream_editor.abandon()
             await self._handle_error(message, e, correlation_id)
 
     async def _check_rate_limit(
@@ -240,7 +264,9 @@ class KillTeamBotOrchestrator:
 
         return rag_context, hop_evaluations, chunk_hop_map, embedding_cost, retrieval_latency_ms
 
-    async def _perform_llm_generation(self, user_query: UserQuery, rag_context, llm_provider) -> tuple:
+    async def _perform_llm_generation(
+        self, user_query: UserQuery, rag_context, llm_provider, stream_editor=None
+    ) -> tuple:
         """Perform LLM generation with retry logic.
 
         Uses shared orchestrator with Discord-specific retry wrapper.
@@ -249,12 +275,15 @@ class KillTeamBotOrchestrator:
             user_query: User query object
             rag_context: Pre-retrieved RAG context
             llm_provider: LLM provider instance (guild-specific)
+            stream_editor: StreamingResponseEditor to stream the answer into (optional)
 
         Returns:
             Tuple of (llm_response, chunk_ids)
         """
         # Wrap orchestrator call with Discord-specific retry logic
         async def generate_with_retry():
+            if stream_editor:
+                stream_editor.reset()
             return await self.orchestrator.generate_with_context(
                 query=user_query.sanitized_text,
                 query_id=user_query.query_id,
@@ -263,6 +292,7 @@ class KillTeamBotOrchestrator:
                 llm_provider=llm_provider,
                 generation_timeout=LLM_GENERATION_TIMEOUT,
                 use_cache=False,
+                on_text=stream_editor.on_text if stream_editor else None,
             )
 
         llm_response, chunk_ids = await retry_on_content_filter(
@@ -365,8 +395,10 @@ class KillTeamBotOrchestrator:
             },
         )
 
-    async def _send_response(self, message, bot_response, validation_result, user_query):
-        """Format and send response to Discord."""
+    async def _send_response(
+        self, message, bot_response, validation_result, user_query, stream_editor=None
+    ):
+        """Format and send response to Discord (replacing the streamed preview, if any)."""
         # Detect smalltalk
         smalltalk = (
             bot_response.structured_data.smalltalk
@@ -387,6 +419,8 @@ class KillTeamBotOrchestrator:
             )
 
         # Send to Discord
+        if stream_editor and await stream_editor.finish(embeds, feedback_view):
+            return
         await message.channel.send(embeds=embeds, view=feedback_view)
 
     def _log_costs(self, costs: dict, correlation_id: str):
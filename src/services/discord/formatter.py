@@ -5,9 +5,11 @@ from datetime import UTC, datetime
 
 import discord
 
+from src.lib.constants import DISCORD_STREAM_PREVIEW_MAX_CHARS
 from src.lib.discord_utils import get_random_disclaimer
 from src.models.bot_response import BotResponse
 from src.services.discord.feedback_buttons import FeedbackView
+from src.services.llm.structured_stream import PartialStructuredResponse
 from src.services.llm.validator import ValidationResult
 
 
@@ -230,6 +232,53 @@ def _format_structured(bot_response: BotResponse, smalltalk: bool = False) -> li
     return [embed]
 
 
+def format_stream_preview(
+    partial: PartialStructuredResponse, max_chars: int = DISCORD_STREAM_PREVIEW_MAX_CHARS
+) -> str:
+    """Format a partially streamed answer as plain message content.
+
+    Sections appear in answer order (short answer, quotes, explanation,
+    afterword) as soon as they start arriving. The final embeds replace this
+    preview once the answer is complete and validated.
+
+    Args:
+        partial: Fields received so far
+        max_chars: Message content limit; longer previews are cut
+
+    Returns:
+        Message content ("" while nothing visible has arrived)
+    """
+    parts = []
+
+    short_answer = " ".join(
+        text
+        for text in (
+            f"**{partial.short_answer}**" if partial.short_answer else "",
+            f"*{partial.persona_short_answer}*" if partial.persona_short_answer else "",
+        )
+        if text
+    )
+    if short_answer:
+        parts.append(short_answer)
+
+    for quote in partial.quotes:
+        quote_block = f"**{quote.quote_title}**"
+        if quote.quote_text:
+            quote_block += "\n" + _format_quote_text(quote.quote_text)
+        parts.append(quote_block)
+
+    if partial.explanation:
+        parts.append(f"**Explanation**\n{partial.explanation}")
+
+    if partial.persona_afterword:
+        parts.append(f"*{partial.persona_afterword}*")
+
+    preview = _format_discord_text("\n\n".join(parts))
+    if len(preview) > max_chars:
+        preview = preview[: max_chars - 1] + "…"
+    return preview
+
+
 def _format_llm_model_name(model_name: str) -> str:
     return re.sub(r"-\d{8}$", "", model_name)
 
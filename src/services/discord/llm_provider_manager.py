@@ -1,5 +1,6 @@
 """LLM provider management for per-server configuration."""
 
+from src.lib.constants import LLM_PROVIDER_POOL_ENABLED
 from src.lib.logging import get_logger
 from src.lib.server_config import get_multi_server_config
 from src.services.llm.factory import LLMProviderFactory
@@ -43,7 +44,7 @@ class LLMProviderManager:
             If failed: (None, error_message)
         """
         try:
-            llm = self.llm_factory.create(guild_id=guild_id)
+            llm = self.llm_factory.create(guild_id=guild_id, pooled=LLM_PROVIDER_POOL_ENABLED)
 
             if llm is None:
                 error_message = self._get_missing_key_error(guild_id)
@@ -81,6 +81,7 @@ class QueryCostCalculator:
         hop_evaluations: list | None,
         main_llm_latency_ms: int,
         total_latency_ms: int | None = None,
+        time_to_first_content_ms: int | None = None,
     ) -> dict[str, int]:
         """Calculate latency breakdown for a query.
 
@@ -89,6 +90,8 @@ class QueryCostCalculator:
             hop_evaluations: Optional list of hop evaluations
             main_llm_latency_ms: Main LLM generation latency
             total_latency_ms: Actual measured total latency (optional, calculated if not provided)
+            time_to_first_content_ms: Time until the user saw the first answer text
+                (optional, defaults to the total latency when nothing was streamed)
 
         Returns:
             Dict with latency breakdown: {
@@ -96,6 +99,7 @@ class QueryCostCalculator:
                 'hop_evaluation_latency_ms': int (hop LLM evaluation time),
                 'main_llm_latency_ms': int (main LLM generation time),
                 'total_latency_ms': int (actual measured total latency),
+                'time_to_first_content_ms': int (first visible answer text),
             }
         """
         # Calculate hop evaluation latency (sum of evaluation time for all hops)
@@ -117,4 +121,7 @@ class QueryCostCalculator:
             "hop_evaluation_latency_ms": hop_eval_latency_ms,
             "main_llm_latency_ms": main_llm_latency_ms,
             "total_latency_ms": actual_total_ms,
+            "time_to_first_content_ms": (
+                time_to_first_content_ms if time_to_first_content_ms is not None else actual_total_ms
+            ),
         }
@@ -0,0 +1,115 @@
+"""Progressive Discord message updates while an answer streams."""
+
+import asyncio
+import time
+
+import discord
+
+from src.lib.constants import DISCORD_STREAM_EDIT_INTERVAL_S
+from src.lib.logging import get_logger
+from src.services.discord import formatter
+from src.services.llm.structured_stream import StructuredResponseStreamParser
+
+logger = get_logger(__name__)
+
+
+class StreamingResponseEditor:
+    """Edits the acknowledgement message with the answer as it is generated.
+
+    on_text() is the adapter's streaming callback. Edits are rate limited to
+    one per DISCORD_STREAM_EDIT_INTERVAL_S and run in the background, one at a
+    time, so a slow Discord API call never stalls the provider stream; text
+    that arrives meanwhile is shown by the next edit. finish() replaces the
+    preview with the final embeds.
+    """
+
+    def __init__(
+        self,
+        message: discord.Message,
+        min_interval_s: float = DISCORD_STREAM_EDIT_INTERVAL_S,
+    ):
+        """Initialize editor for an already sent acknowledgement message.
+
+        Args:
+            message: Acknowledgement message to edit
+            min_interval_s: Minimum seconds between two edits
+        """
+        self.message = message
+        self.min_interval_s = min_interval_s
+        self.parser = StructuredResponseStreamParser()
+        self.first_content_at: float | None = None  # time.time() of the first visible edit
+        self.edit_count = 0
+        self._original_content = message.content
+        self._last_edit_at: float | None = None
+        self._last_preview = ""
+        self._edit_task: asyncio.Task | None = None
+
+    async def on_text(self, delta: str) -> None:
+        """Feed a chunk of the streamed answer; schedules an edit when one is due.
+
+        Args:
+            delta: Next chunk of answer JSON
+        """
+        self.parser.feed(delta)
+
+        if self._edit_task is not None and not self._edit_task.done():
+            return
+        now = time.monotonic()
+        if self._last_edit_at is not None and now - self._last_edit_at < self.min_interval_s:
+            return
+
+        preview = formatter.format_stream_preview(self.parser.snapshot())
+        if not preview or preview == self._last_preview:
+            return
+
+        self._last_edit_at = now
+        self._last_preview = preview
+        self._edit_task = asyncio.create_task(self._edit_preview(preview))
+
+    def reset(self) -> None:
+        """Start over for a retried request (the shown preview stays until replaced)."""
+        self.parser.reset()
+
+    async def finish(self, embeds: list[discord.Embed], view: discord.ui.View | None) -> bool:
+        """Replace the preview with the final response.
+
+        Args:
+            embeds: Formatted final response
+            view: Feedback buttons (or None)
+
+        Returns:
+            True if the message now shows the final response; False if the
+            edit failed and the caller should send the response instead
+        """
+        await self._wait_for_pending_edit()
+        try:
+            await self.message.edit(content=None, embeds=embeds, view=view)
+            return True
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to replace streamed preview with final response: {e}")
+            return False
+
+    async def abandon(self) -> None:
+        """Restore the acknowledgement after a failed query, removing any partial answer."""
+        await self._wait_for_pending_edit()
+        if self.edit_count == 0:
+            return
+        try:
+            await self.message.edit(content=self._original_content)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to remove streamed preview: {e}")
+
+    async def _edit_preview(self, preview: str) -> None:
+        try:
+            await self.message.edit(content=preview)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to update streamed preview: {e}")
+            return
+        self.edit_count += 1
+        if self.first_content_at is None:
+            self.first_content_at = time.time()
+
+    async def _wait_for_pending_edit(self) -> None:
+        # A preview edit landing after the final edit would overwrite it
+        if self._edit_task is not None:
+            await self._edit_task
@@ -4,11 +4,15 @@ Abstract base class for LLM integrations ensuring provider independence.
 Based on specs/001-we-are-building/contracts/llm-adapter.md
 """
 
+import inspect
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING, Any, BinaryIO
 from uuid import UUID
 
+import httpx
+
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
@@ -19,12 +23,28 @@ from src.lib.constants import (
     LLM_EXTRACTION_TEMPERATURE,
     LLM_EXTRACTION_TIMEOUT,
     LLM_GENERATION_TIMEOUT,
+    LLM_HTTP_KEEPALIVE_EXPIRY_S,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
 )
 from src.lib.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def http_client_limits() -> httpx.Limits:
+    """Connection pool bounds for a provider HTTP client.
+
+    Returns:
+        httpx.Limits shared by every adapter's client
+    """
+    return httpx.Limits(
+        max_connections=LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY_S,
+    )
+
+
 def _default_system_prompt() -> str:
     """Load default system prompt for GenerationConfig.
 
@@ -366,6 +386,10 @@ class LLMResponse:
     structured_output: dict | None = None  # Parsed Pydantic model as dict (for structured schemas)
 
 
+# Receives each chunk of answer text as a streaming adapter produces it
+TextDeltaCallback = Callable[[str], Awaitable[None]]
+
+
 # Data classes for extraction
 @dataclass
 class ExtractionConfig:
@@ -414,6 +438,11 @@ class LLMProvider(ABC):
     # provider-specific batch knowledge inside src/services/llm/.
     supports_batch: bool = False
 
+    # Streaming support. Adapters that can stream the answer JSON override this
+    # to True and implement generate_stream(); the Discord bot only streams
+    # through those (the default generate_stream() delivers the answer at once).
+    supports_streaming: bool = False
+
     @classmethod
     def batch_supports_model(cls, model_id: str) -> bool:  # noqa: ARG003 - base default; overrides use model_id
         """Whether this provider's Batch API accepts `model_id`.
@@ -485,6 +514,21 @@ class LLMProvider(ABC):
         """
         raise NotImplementedError(f"{cls.__name__} does not support batch")
 
+    async def aclose(self) -> None:
+        """Close the provider's HTTP client.
+
+        Pooled providers are long-lived (see provider_pool); the pool calls
+        this when it retires one and on shutdown. The default closes
+        ``self.client`` (AsyncAnthropic / AsyncOpenAI); adapters whose client
+        closes differently override it.
+        """
+        close = getattr(getattr(self, "client", None), "close", None)
+        if close is None:
+            return
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+
     @abstractmethod
     async def generate(self, request: GenerationRequest) -> LLMResponse:
         """Generate answer to user query using RAG context.
@@ -503,6 +547,26 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def generate_stream(
+        self, request: GenerationRequest, on_text: TextDeltaCallback
+    ) -> LLMResponse:
+        """Generate an answer, passing the answer text to on_text as it arrives.
+
+        The chunks concatenate to the raw answer JSON as the model writes it;
+        LLMResponse.answer_text is the final, validated answer. The default
+        implementation calls generate() and delivers the answer in one chunk.
+
+        Args:
+            request: Generation request with prompt, context, config
+            on_text: Awaited with each chunk of answer text
+
+        Returns:
+            LLMResponse for the complete answer (same as generate())
+        """
+        response = await self.generate(request)
+        await on_text(response.answer_text)
+        return response
+
     @abstractmethod
     async def extract_pdf(self, request: ExtractionRequest) -> ExtractionResponse:
         """Extract structured markdown from PDF rulebook.
@@ -540,6 +604,25 @@ class LLMProvider(ABC):
 
         return build_user_prompt(user_query, context, chunk_ids)
 
+    def _rendered_prompt_for_key(self, request: GenerationRequest) -> Any:
+        """System and user prompt as this adapter sends them (LLM response store key).
+
+        Adapters that render prompts differently (own system prompt, context
+        preprocessing) override this so template changes invalidate recordings.
+
+        Args:
+            request: Generation request
+
+        Returns:
+            JSON-serializable rendering of the prompt
+        """
+        if isinstance(request.prompt, str):
+            user_prompt: Any = self._build_prompt(request.prompt, request.context, request.chunk_ids)
+        else:
+            # Pre-built cache-control blocks already embed the context
+            user_prompt = {"blocks": request.prompt, "context": request.context, "chunk_ids": request.chunk_ids}
+        return [request.config.system_prompt, user_prompt]
+
     @staticmethod
     def _create_extraction_prompt() -> str:
         """Create standard extraction prompt for PDF processing.
@@ -9,7 +9,7 @@ import time
 from math import exp
 from uuid import uuid4
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from openai.lib._pydantic import to_strict_json_schema
 
 from src.lib.constants import LLM_REASONING_TOKEN_MULTIPLIER
@@ -24,8 +24,10 @@ from src.services.llm.base import (
     LLMResponse,
     PDFParseError,
     RateLimitError,
+    TextDeltaCallback,
     TokenLimitError,
     get_pydantic_model,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 
@@ -36,6 +38,7 @@ class ChatGPTAdapter(LLMProvider):
     """OpenAI ChatGPT API integration."""
 
     supports_batch = True
+    supports_streaming = True
 
     @classmethod
     def batch_supports_model(cls, model_id: str) -> bool:
@@ -127,7 +130,10 @@ class ChatGPTAdapter(LLMProvider):
         if AsyncOpenAI is None:
             raise ImportError("openai package not installed. Run: pip install openai")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(limits=http_client_limits()),
+        )
 
         # Non-reasoning models support full parameter set; all others (new GPT-5/O-series
         # models included by default) use reasoning tokens with limited parameter support
@@ -157,6 +163,26 @@ class ChatGPTAdapter(LLMProvider):
             LLMTimeoutError: Response timeout
             ContentFilterError: Content blocked
         """
+        return await self._generate(request)
+
+    async def generate_stream(
+        self, request: GenerationRequest, on_text: TextDeltaCallback
+    ) -> LLMResponse:
+        """Generate answer using ChatGPT API, streaming the answer JSON to on_text.
+
+        Args:
+            request: Generation request
+            on_text: Awaited with each content delta
+
+        Returns:
+            LLMResponse with answer and metadata (same as generate())
+        """
+        return await self._generate(request, on_text)
+
+    async def _generate(
+        self, request: GenerationRequest, on_text: TextDeltaCallback | None = None
+    ) -> LLMResponse:
+        """Run one generation, streamed when on_text is given."""
         start_time = time.time()
 
         # Build prompt with context and optional chunk IDs
@@ -202,10 +228,11 @@ class ChatGPTAdapter(LLMProvider):
                 api_params["reasoning_effort"] = effort
 
             # Call OpenAI API with timeout using parse method for Pydantic structured outputs
-            response = await asyncio.wait_for(
-                self.client.beta.chat.completions.parse(**api_params),
-                timeout=request.config.timeout_seconds,
-            )
+            if on_text is None:
+                completion = self.client.beta.chat.completions.parse(**api_params)
+            else:
+                completion = self._stream_completion(api_params, on_text)
+            response = await asyncio.wait_for(completion, timeout=request.config.timeout_seconds)
 
             latency_ms = int((time.time() - start_time) * 1000)
 
@@ -303,6 +330,20 @@ class ChatGPTAdapter(LLMProvider):
             logger.error(f"ChatGPT generation error: {e}")
             raise
 
+    async def _stream_completion(self, api_params: dict, on_text: TextDeltaCallback):
+        """Stream a structured completion, passing content deltas to on_text.
+
+        Returns:
+            ParsedChatCompletion, as beta.chat.completions.parse() would
+        """
+        async with self.client.chat.completions.stream(
+            **api_params, stream_options={"include_usage": True}
+        ) as stream:
+            async for event in stream:
+                if event.type == "content.delta":
+                    await on_text(event.delta)
+            return await stream.get_final_completion()
+
     async def extract_pdf(self, request: ExtractionRequest) -> ExtractionResponse:
         """Extract markdown from PDF using ChatGPT vision.
 
@@ -9,7 +9,7 @@ import json
 import time
 from uuid import uuid4
 
-from anthropic import Anthropic, AsyncAnthropic
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient
 
 from src.lib.constants import LLM_REASONING_TOKEN_MULTIPLIER
 from src.lib.logging import get_logger
@@ -24,7 +24,9 @@ from src.services.llm.base import (
     LLMResponse,
     PDFParseError,
     RateLimitError,
+    TextDeltaCallback,
     get_schema_info,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 
@@ -86,6 +88,7 @@ class ClaudeAdapter(LLMProvider):
     """Anthropic Claude API integration."""
 
     supports_batch = True
+    supports_streaming = True
 
     def build_batch_request(self, request: GenerationRequest, custom_id: str) -> dict:
         """Build an Anthropic Messages Batch line for this request.
@@ -174,6 +177,7 @@ class ClaudeAdapter(LLMProvider):
             default_headers={
                 "anthropic-beta": "pdfs-2024-09-25,files-api-2025-04-14,structured-outputs-2025-11-13"
             },
+            http_client=DefaultAsyncHttpxClient(limits=http_client_limits()),
         )
         logger.info(f"Initialized Claude adapter with model {model}")
 
@@ -192,6 +196,29 @@ class ClaudeAdapter(LLMProvider):
             LLMTimeoutError: Response timeout
             ContentFilterError: Content blocked
         """
+        return await self._generate(request)
+
+    async def generate_stream(
+        self, request: GenerationRequest, on_text: TextDeltaCallback
+    ) -> LLMResponse:
+        """Generate answer using Claude API, streaming the answer JSON to on_text.
+
+        Models with structured outputs stream text deltas; the tool-use
+        fallback delivers the answer in one chunk when it is complete.
+
+        Args:
+            request: Generation request
+            on_text: Awaited with each text delta
+
+        Returns:
+            LLMResponse with answer and metadata (same as generate())
+        """
+        return await self._generate(request, on_text)
+
+    async def _generate(
+        self, request: GenerationRequest, on_text: TextDeltaCallback | None = None
+    ) -> LLMResponse:
+        """Run one generation, streamed when on_text is given."""
         start_time = time.time()
 
         # list[dict] prompt = pre-built cache-control blocks; str = normal path via _build_prompt
@@ -234,10 +261,11 @@ class ClaudeAdapter(LLMProvider):
                     # (anthropic 0.74.1), so pass it through extra_body.
                     parse_kwargs["extra_body"] = {"output_config": {"effort": effort}}
                     parse_kwargs["max_tokens"] = _effort_max_tokens(request.config.max_tokens)
-                response = await asyncio.wait_for(
-                    self.client.beta.messages.parse(**parse_kwargs),
-                    timeout=request.config.timeout_seconds,
-                )
+                if on_text is None:
+                    message = self.client.beta.messages.parse(**parse_kwargs)
+                else:
+                    message = self._stream_message(parse_kwargs, on_text)
+                response = await asyncio.wait_for(message, timeout=request.config.timeout_seconds)
 
                 # Extract structured output from parsed response
                 parsed_output = response.parsed_output
@@ -299,6 +327,8 @@ class ClaudeAdapter(LLMProvider):
 
                 tool_input = tool_use_block.input
                 answer_text = json.dumps(tool_input)
+                if on_text is not None:
+                    await on_text(answer_text)
                 logger.debug(
                     f"Extracted structured JSON from Claude (tool use): {len(answer_text)} chars"
                 )
@@ -379,6 +409,17 @@ class ClaudeAdapter(LLMProvider):
             logger.error(f"Claude generation error: {e}")
             raise
 
+    async def _stream_message(self, parse_kwargs: dict, on_text: TextDeltaCallback):
+        """Stream a structured-output message, passing text deltas to on_text.
+
+        Returns:
+            ParsedBetaMessage, as beta.messages.parse() would
+        """
+        async with self.client.beta.messages.stream(**parse_kwargs) as stream:
+            async for text in stream.text_stream:
+                await on_text(text)
+            return await stream.get_final_message()
+
     async def extract_pdf(self, request: ExtractionRequest) -> ExtractionResponse:
         """Extract markdown from PDF using Claude Files API.
 
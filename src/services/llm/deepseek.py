@@ -12,7 +12,7 @@ import json
 import time
 from uuid import uuid4
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.lib.logging import get_logger
 from src.services.llm.base import (
@@ -27,6 +27,7 @@ from src.services.llm.base import (
     TokenLimitError,
     get_pydantic_model,
     get_schema_info,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 
@@ -57,7 +58,11 @@ class DeepSeekAdapter(LLMProvider):
             raise ImportError("openai package not installed. Run: pip install openai")
 
         # DeepSeek API is OpenAI-compatible, use custom base URL
-        self.client = AsyncOpenAI(api_key=api_key, base_url=self.DEEPSEEK_BASE_URL)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.DEEPSEEK_BASE_URL,
+            http_client=DefaultAsyncHttpxClient(limits=http_client_limits()),
+        )
 
         self.is_reasoning_model = model in THINKING_MODELS
 
@@ -19,7 +19,9 @@ from src.services.llm.grok import GrokAdapter
 from src.services.llm.kimi import KimiAdapter
 from src.services.llm.minimax import MiniMaxAdapter
 from src.services.llm.mistral import MistralAdapter
+from src.services.llm.provider_pool import get_llm_provider_pool
 from src.services.llm.qwen import QwenAdapter
+from src.services.llm.response_store import REPLAY_PLACEHOLDER_API_KEY, get_llm_response_store
 
 logger = get_logger(__name__)
 
@@ -105,7 +107,10 @@ class LLMProviderFactory:
 
     @classmethod
     def create(
-        cls, provider_name: LLM_PROVIDERS_LITERAL = None, guild_id: str | None = None
+        cls,
+        provider_name: LLM_PROVIDERS_LITERAL = None,
+        guild_id: str | None = None,
+        pooled: bool = False,
     ) -> LLMProvider:
         """Create LLM provider instance.
 
@@ -114,6 +119,9 @@ class LLMProviderFactory:
                           If None, uses DEFAULT_LLM_PROVIDER from config.
             guild_id: Discord guild (server) ID for per-server API key resolution.
                      If None, uses global .env config only.
+            pooled: Return the shared long-lived adapter for this model and key
+                   (see provider_pool) instead of a new one. For a long-running
+                   event loop (Discord bot); also picks up servers.yaml changes.
 
         Returns:
             LLMProvider instance
@@ -124,6 +132,9 @@ class LLMProviderFactory:
         """
         config = get_config()
         multi_server_config = get_multi_server_config()
+        if pooled:
+            # Pooled adapters outlive messages, so rotated keys must be noticed
+            multi_server_config.reload_if_changed()
 
         # Get server-specific config if guild_id provided
         server_config = multi_server_config.get_server_config(guild_id) if guild_id else None
@@ -209,6 +220,14 @@ class LLMProviderFactory:
             }
             api_key = global_api_key_map.get(api_key_type)
 
+        # Non-pooled providers go through the record/replay store while it is on
+        # (pooled ones serve the Discord bot, which always answers live)
+        response_store = None if pooled else get_llm_response_store()
+
+        # Replay never reaches the provider, so it runs without API keys (CI)
+        if not api_key and response_store is not None and response_store.mode == "replay":
+            api_key = REPLAY_PLACEHOLDER_API_KEY
+
         # If API key is missing, return None instead of throwing
         # The bot will handle this gracefully and send a Discord message
         if not api_key:
@@ -233,15 +252,25 @@ class LLMProviderFactory:
             # Return None - let the bot handle this gracefully
             return None
 
-        # Create provider instance
-        provider = adapter_class(api_key=api_key, model=model_id)
-        provider.reasoning_effort = reasoning_effort
+        # Create provider instance (or reuse the pooled one)
+        if pooled:
+            provider = get_llm_provider_pool().acquire(
+                adapter_class, model_id, api_key, reasoning_effort, slot=(guild_id, base_name)
+            )
+        else:
+            provider = adapter_class(api_key=api_key, model=model_id)
+            provider.reasoning_effort = reasoning_effort
+            if response_store is not None:
+                response_store.attach(provider)
 
-        log_msg = f"Created {provider_name} with model {model_id}"
+        log_msg = f"{'Acquired pooled' if pooled else 'Created'} {provider_name} with model {model_id}"
         if guild_id:
             guild_name = f" ({server_config.name})" if server_config and server_config.name else ""
             log_msg += f" for guild {guild_id}{guild_name}"
-        logger.info(log_msg)
+        if pooled:
+            logger.debug(log_msg)
+        else:
+            logger.info(log_msg)
 
         return provider
 
@@ -7,6 +7,7 @@ Based on specs/001-we-are-building/contracts/llm-adapter.md
 import asyncio
 import json
 import time
+from typing import Any
 from uuid import uuid4
 
 from google import genai
@@ -25,6 +26,7 @@ from src.services.llm.base import (
     PDFParseError,
     RateLimitError,
     get_pydantic_model,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 from src.services.llm.gemini_quote_extractor import (
@@ -64,6 +66,13 @@ class GeminiAdapter(LLMProvider):
             synthetic_chunk_ids.append(chunk_id)
         return numbered_chunks, synthetic_chunk_ids, chunk_id_to_sentences
 
+    def _rendered_prompt_for_key(self, request: GenerationRequest) -> Any:
+        """Gemini ignores config.system_prompt: key on the prompt generate() sends."""
+        if not isinstance(request.prompt, str):
+            return super()._rendered_prompt_for_key(request)
+        numbered, synthetic_ids, _ = self._number_context(request.context, request.chunk_ids)
+        return f"{build_system_prompt('gemini')}\n\n{self._build_prompt(request.prompt, numbered, synthetic_ids)}"
+
     def _thinking_config_kwargs(self) -> dict | None:
         """Map the resolved reasoning effort to google-genai ThinkingConfig kwargs.
 
@@ -190,7 +199,8 @@ class GeminiAdapter(LLMProvider):
             raise ImportError("google-genai package not installed. Run: pip install google-genai")
 
         self.client = genai.Client(
-            api_key=api_key
+            api_key=api_key,
+            http_options=types.HttpOptions(async_client_args={"limits": http_client_limits()}),
         )
 
         # Non-reasoning models don't use thinking tokens; all others (new Gemini models
@@ -200,6 +210,11 @@ class GeminiAdapter(LLMProvider):
 
         logger.info(f"Initialized Gemini adapter with model {model}")
 
+    async def aclose(self) -> None:
+        """Close the async and sync HTTP clients of the genai client."""
+        await self.client.aio.aclose()
+        self.client.close()
+
     async def generate(self, request: GenerationRequest) -> LLMResponse:
         """Generate answer using Gemini API.
 
@@ -11,7 +11,7 @@ import json
 import time
 from uuid import uuid4
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.lib.logging import get_logger
 from src.services.llm.base import (
@@ -25,6 +25,7 @@ from src.services.llm.base import (
     RateLimitError,
     TokenLimitError,
     get_pydantic_model,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 
@@ -49,7 +50,11 @@ class GLMAdapter(LLMProvider):
             raise ImportError("openai package not installed. Run: pip install openai")
 
         # GLM API is OpenAI-compatible, use custom base URL
-        self.client = AsyncOpenAI(api_key=api_key, base_url=self.GLM_BASE_URL)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.GLM_BASE_URL,
+            http_client=DefaultAsyncHttpxClient(limits=http_client_limits()),
+        )
 
         logger.info(f"Initialized GLM adapter with model {model}")
 
@@ -0,0 +1,116 @@
+"""Shared keep-alive HTTP clients for the raw-httpx adapters.
+
+GrokAdapter and MistralAdapter call their REST APIs with httpx directly.
+Opening an httpx.AsyncClient per request paid DNS, TCP and TLS setup on every
+call; they now share one client per base URL, with bounded connection pools
+and HTTP/2 when the h2 package is installed.
+
+httpx connections belong to the event loop that opened them, and the CLI
+(ingestion, quality tests) may run several event loops one after another, so
+clients are kept per event loop. A loop's clients must be closed before the
+loop ends: open connections reference the loop, so nothing is freed on its
+own. Entry points therefore run their coroutines with
+run_closing_http_clients() (or await close_shared_http_clients() on
+shutdown); clients of a loop that was closed regardless are dropped on the
+next lookup.
+"""
+
+import asyncio
+import importlib.util
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import httpx
+
+from src.lib.constants import LLM_GENERATION_TIMEOUT, LLM_HTTP2_ENABLED, LLM_HTTP_CONNECT_TIMEOUT_S
+from src.lib.logging import get_logger
+from src.services.llm.base import http_client_limits
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_clients: dict[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = {}
+
+
+def get_shared_http_client(base_url: str) -> httpx.AsyncClient:
+    """Get the running event loop's shared client for an API base URL.
+
+    Args:
+        base_url: API base URL (e.g. "https://api.x.ai/v1")
+
+    Returns:
+        Long-lived httpx.AsyncClient (pass request_timeout() to its calls)
+    """
+    _drop_closed_loops()
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(base_url)
+    if client is None or client.is_closed:
+        http2 = LLM_HTTP2_ENABLED and HTTP2_AVAILABLE
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=http_client_limits(),
+            timeout=request_timeout(LLM_GENERATION_TIMEOUT),
+        )
+        loop_clients[base_url] = client
+        logger.debug(f"Opened shared HTTP client for {base_url} (http2={http2})")
+    return client
+
+
+def request_timeout(seconds: float) -> httpx.Timeout:
+    """Per-request timeout for calls through a shared client.
+
+    A bare number passed as timeout= replaces the client's whole
+    httpx.Timeout, connect timeout included; this keeps
+    LLM_HTTP_CONNECT_TIMEOUT_S.
+
+    Args:
+        seconds: Read/write/pool timeout of the request
+
+    Returns:
+        httpx.Timeout
+    """
+    return httpx.Timeout(seconds, connect=LLM_HTTP_CONNECT_TIMEOUT_S)
+
+
+async def close_shared_http_clients() -> None:
+    """Close the running event loop's shared clients (shutdown hook)."""
+    loop_clients = _clients.pop(asyncio.get_running_loop(), {})
+    for base_url, client in loop_clients.items():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close shared HTTP client for {base_url}: {e}")
+
+
+def run_closing_http_clients(main: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run() that closes the loop's shared HTTP clients before it ends.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        Result of main
+    """
+
+    async def _run() -> T:
+        try:
+            return await main
+        finally:
+            await close_shared_http_clients()
+
+    return asyncio.run(_run())
+
+
+def _drop_closed_loops() -> None:
+    """Forget clients of loops closed without close_shared_http_clients().
+
+    Their connections cannot be closed gracefully any more; dropping the
+    references at least lets them be garbage collected.
+    """
+    for loop in [loop for loop in _clients if loop.is_closed()]:
+        logger.debug(f"Dropping {len(_clients[loop])} shared HTTP client(s) of a closed event loop")
+        del _clients[loop]
@@ -12,7 +12,7 @@ import json
 import time
 from uuid import uuid4
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.lib.logging import get_logger
 from src.services.llm.base import (
@@ -26,6 +26,7 @@ from src.services.llm.base import (
     RateLimitError,
     TokenLimitError,
     get_pydantic_model,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 
@@ -127,7 +128,11 @@ class KimiAdapter(LLMProvider):
             raise ImportError("openai package not installed. Run: pip install openai")
 
         # Kimi API is OpenAI-compatible, use custom base URL
-        self.client = AsyncOpenAI(api_key=api_key, base_url=self.KIMI_BASE_URL)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.KIMI_BASE_URL,
+            http_client=DefaultAsyncHttpxClient(limits=http_client_limits()),
+        )
 
         logger.info(f"Initialized Kimi adapter with model {model}")
 
@@ -10,7 +10,7 @@ import asyncio
 import time
 from uuid import uuid4
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.lib.logging import get_logger
 from src.services.llm.base import (
@@ -24,6 +24,7 @@ from src.services.llm.base import (
     RateLimitError,
     TokenLimitError,
     get_schema_info,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 
@@ -48,7 +49,11 @@ class MiniMaxAdapter(LLMProvider):
             raise ImportError("openai package not installed. Run: pip install openai")
 
         # MiniMax API is OpenAI-compatible, use custom base URL
-        self.client = AsyncOpenAI(api_key=api_key, base_url=self.MINIMAX_BASE_URL)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.MINIMAX_BASE_URL,
+            http_client=DefaultAsyncHttpxClient(limits=http_client_limits()),
+        )
 
         logger.info(f"Initialized MiniMax adapter with model {model}")
 
@@ -26,6 +26,7 @@ from src.services.llm.base import (
     get_pydantic_model,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
+from src.services.llm.http_clients import get_shared_http_client, request_timeout
 
 logger = get_logger(__name__)
 
@@ -158,10 +159,13 @@ class MistralAdapter(LLMProvider):
             }
 
             # Call Mistral API with timeout
-            async with httpx.AsyncClient(timeout=request.config.timeout_seconds) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions", headers=self.headers, json=payload
-                )
+            client = get_shared_http_client(self.base_url)
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=payload,
+                timeout=request_timeout(request.config.timeout_seconds),
+            )
 
             latency_ms = int((time.time() - start_time) * 1000)
 
@@ -0,0 +1,195 @@
+"""Pool of long-lived LLM provider adapters.
+
+LLMProviderFactory.create() builds a new adapter, and with it a new SDK
+client, on every call. The Discord bot calls it for every message, so every
+message paid for fresh TLS handshakes and never reused a keep-alive
+connection. The pool hands out one shared adapter per (model id, API key,
+reasoning effort); adapters keep no per-request state, so concurrent
+messages can share one.
+
+Each caller slot (guild, model name) remembers the key it last resolved.
+When servers.yaml gives a slot another API key, the adapter of the old key
+is retired once no other slot uses it. Retired and least-recently-used
+adapters are closed after a grace period so requests already in flight on
+them can finish; aclose() closes everything on shutdown.
+"""
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from src.lib.constants import LLM_PROVIDER_POOL_MAX_SIZE, LLM_PROVIDER_RETIRE_GRACE_S
+from src.lib.logging import get_logger
+from src.services.llm.base import LLMProvider
+
+logger = get_logger(__name__)
+
+# (adapter class, model id, API key fingerprint, reasoning effort)
+PoolKey = tuple[type[LLMProvider], str, str, str | None]
+
+
+def _key_fingerprint(api_key: str) -> str:
+    """Short hash of an API key (pool keys and logs never hold the key itself)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class LLMProviderPool:
+    """Shared, long-lived provider adapters keyed by model, API key and effort."""
+
+    def __init__(
+        self,
+        max_size: int = LLM_PROVIDER_POOL_MAX_SIZE,
+        retire_grace_s: float = LLM_PROVIDER_RETIRE_GRACE_S,
+    ):
+        """Initialize provider pool.
+
+        Args:
+            max_size: Maximum pooled adapters (least recently used are retired)
+            retire_grace_s: Delay before a retired adapter's client is closed
+        """
+        self.max_size = max_size
+        self.retire_grace_s = retire_grace_s
+        self._providers: OrderedDict[PoolKey, LLMProvider] = OrderedDict()
+        self._slots: dict[Hashable, PoolKey] = {}
+        # Pending delayed closes of retired adapters
+        self._retiring: dict[asyncio.Task, LLMProvider] = {}
+        self._lock = threading.Lock()
+
+        self.created = 0
+        self.reused = 0
+        self.rotated = 0
+        self.evicted = 0
+        self.closed = 0
+
+    def acquire(
+        self,
+        adapter_class: type[LLMProvider],
+        model_id: str,
+        api_key: str,
+        reasoning_effort: str | None,
+        slot: Hashable,
+    ) -> LLMProvider:
+        """Get the shared adapter for a model and API key, creating it if needed.
+
+        Args:
+            adapter_class: Adapter class from the factory registry
+            model_id: Provider model id
+            api_key: Resolved API key
+            reasoning_effort: Reasoning-effort level (None = provider default)
+            slot: Caller identity whose key can rotate (e.g. (guild_id, model name))
+
+        Returns:
+            Pooled LLMProvider instance
+        """
+        key: PoolKey = (adapter_class, model_id, _key_fingerprint(api_key), reasoning_effort)
+        retired: list[LLMProvider] = []
+
+        with self._lock:
+            previous = self._slots.get(slot)
+            self._slots[slot] = key
+
+            provider = self._providers.get(key)
+            if provider is not None:
+                self._providers.move_to_end(key)
+                self.reused += 1
+            else:
+                provider = adapter_class(api_key=api_key, model=model_id)
+                provider.reasoning_effort = reasoning_effort
+                self._providers[key] = provider
+                self.created += 1
+
+            # Key rotation: the slot's old adapter goes once no slot uses it
+            if previous is not None and previous != key and previous not in self._slots.values():
+                old = self._providers.pop(previous, None)
+                if old is not None:
+                    retired.append(old)
+                    self.rotated += 1
+                    logger.info("llm_provider_rotated", model=model_id, slot=str(slot))
+
+            while len(self._providers) > self.max_size:
+                old_key, old = self._providers.popitem(last=False)
+                self._slots = {s: k for s, k in self._slots.items() if k != old_key}
+                retired.append(old)
+                self.evicted += 1
+
+        for old in retired:
+            self._retire(old)
+        return provider
+
+    async def aclose(self) -> None:
+        """Close every pooled and retiring adapter (bot shutdown)."""
+        with self._lock:
+            providers = list(self._providers.values())
+            self._providers.clear()
+            self._slots.clear()
+            retiring, self._retiring = self._retiring, {}
+
+        for task, provider in retiring.items():
+            task.cancel()
+            providers.append(provider)
+        for provider in providers:
+            await self._close(provider)
+
+        logger.info("llm_provider_pool_closed", **self.get_stats())
+
+    def get_stats(self) -> dict[str, object]:
+        """Get pool statistics.
+
+        Returns:
+            Statistics dictionary (reuse_rate = share of acquisitions served
+            by an already-connected adapter)
+        """
+        acquisitions = self.created + self.reused
+        return {
+            "pooled": len(self._providers),
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_rate": self.reused / acquisitions if acquisitions else 0.0,
+            "rotated": self.rotated,
+            "evicted": self.evicted,
+            "closed": self.closed,
+        }
+
+    def _retire(self, provider: LLMProvider) -> None:
+        """Close a replaced adapter after the grace period."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to close on; the client is released with the adapter
+            logger.debug("llm_provider_retired_without_loop", model=provider.model)
+            return
+
+        task = loop.create_task(self._close_later(provider))
+        self._retiring[task] = provider
+        task.add_done_callback(lambda done: self._retiring.pop(done, None))
+
+    async def _close_later(self, provider: LLMProvider) -> None:
+        """Wait out in-flight requests, then close the adapter."""
+        await asyncio.sleep(self.retire_grace_s)
+        await self._close(provider)
+
+    async def _close(self, provider: LLMProvider) -> None:
+        """Close an adapter's HTTP client, logging (not raising) failures."""
+        try:
+            await provider.aclose()
+            self.closed += 1
+        except Exception as e:
+            logger.warning("llm_provider_close_failed", model=provider.model, error=str(e))
+
+
+# Global pool instance
+_llm_provider_pool: LLMProviderPool | None = None
+
+
+def get_llm_provider_pool() -> LLMProviderPool:
+    """Get global LLM provider pool instance.
+
+    Returns:
+        LLMProviderPool instance
+    """
+    global _llm_provider_pool
+    if _llm_provider_pool is None:
+        _llm_provider_pool = LLMProviderPool()
+    return _llm_provider_pool
@@ -12,7 +12,7 @@ import os
 import time
 from uuid import uuid4
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.lib.logging import get_logger
 from src.services.llm.base import (
@@ -26,6 +26,7 @@ from src.services.llm.base import (
     RateLimitError,
     TokenLimitError,
     get_pydantic_model,
+    http_client_limits,
 )
 from src.services.llm.base import TimeoutError as LLMTimeoutError
 
@@ -144,7 +145,11 @@ class QwenAdapter(LLMProvider):
         # Qwen API is OpenAI-compatible, use custom base URL
         # Use Coding Plan base URL for sk-sp-* keys, otherwise use general base URL
         base_url = qwen_base_url(api_key)
-        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=DefaultAsyncHttpxClient(limits=http_client_limits()),
+        )
 
         logger.info(f"Initialized Qwen adapter with model {model}, base_url={base_url}")
 
@@ -0,0 +1,389 @@
+"""Record/replay store for LLM responses.
+
+Quality tests, RAG tests with multi-hop and admin dashboard reruns send the
+same prompts to paid providers every time a report is re-run or a judge is
+tweaked. The response store keeps each LLMResponse (answer, structured
+output, token usage, latency) on disk, content-addressed by a hash of
+everything that determines the answer: model id, reasoning effort, the fully
+rendered system and user prompt, output schema, temperature and max tokens.
+
+Modes:
+- "off": providers are called as usual (default)
+- "record": every call goes to the provider and its response is stored
+- "replay": responses come from the store only; a miss raises
+  ResponseStoreMissError, so a run that would need a paid call fails fast
+  (and needs no API keys: the offline stand-in for deterministic CI runs)
+- "record-missing": replay what is stored, call and record the rest
+
+The store attaches to adapter instances (LLMProviderFactory.create() does it
+for non-pooled providers while a mode is active) by overriding their
+generate()/generate_stream(), so isinstance() checks on the adapter classes
+keep working.
+
+Identical requests within one run (quality tests with runs > 1) are separate
+"takes" of the same key: the n-th identical request of a run replays the n-th
+recorded response, which keeps run-to-run variance in replayed reports.
+Requests count takes process-wide unless made inside a run scope
+(`with store.begin_run():`, e.g. per admin dashboard rerun), which counts its
+own takes from 0 without affecting concurrent runs.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, get_args
+from uuid import UUID, uuid4
+
+from src.lib.constants import LLM_RESPONSE_STORE_MODE, LLM_RESPONSE_STORE_PATH
+from src.lib.logging import get_logger
+from src.services.llm.base import (
+    GenerationRequest,
+    LLMError,
+    LLMProvider,
+    LLMResponse,
+    TextDeltaCallback,
+)
+
+logger = get_logger(__name__)
+
+ResponseStoreMode = Literal["off", "record", "replay", "record-missing"]
+RESPONSE_STORE_MODES: tuple[str, ...] = get_args(ResponseStoreMode)
+
+# Environment overrides for processes not started through the CLI options
+# (admin dashboard, CI jobs)
+MODE_ENV_VAR = "LLM_RESPONSE_STORE_MODE"
+PATH_ENV_VAR = "LLM_RESPONSE_STORE_PATH"
+
+# Stands in for a missing API key in replay mode; never sent anywhere, since
+# a replay miss raises before the provider is called
+REPLAY_PLACEHOLDER_API_KEY = "llm-response-store-replay"
+
+# Bump when the key derivation changes (old recordings become misses)
+_KEY_VERSION = 2
+
+
+class ResponseStoreMissError(LLMError):
+    """Replay mode has no recorded response for a request."""
+
+    pass
+
+
+class ResponseStoreRun:
+    """Take counting scope of one run; active inside its `with` block.
+
+    The scope follows the context: tasks created inside the block count
+    their takes in this run too.
+    """
+
+    def __init__(self, store: "LLMResponseStore"):
+        """Initialize run.
+
+        Args:
+            store: Store whose requests this run counts
+        """
+        self.store = store
+        self.takes: Counter[str] = Counter()
+        self._token: Token | None = None
+
+    def __enter__(self) -> "ResponseStoreRun":
+        self._token = _active_run.set(self)
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        if self._token is not None:
+            _active_run.reset(self._token)
+            self._token = None
+
+
+# Run scope of the current context (None: takes are counted process-wide)
+_active_run: ContextVar[ResponseStoreRun | None] = ContextVar("llm_response_store_run", default=None)
+
+
+def make_response_key(provider: LLMProvider, request: GenerationRequest) -> tuple[str, dict]:
+    """Content address of a generation request.
+
+    Args:
+        provider: Adapter the request is sent to (model id, effort, prompt rendering)
+        request: Generation request
+
+    Returns:
+        (sha256 hex key, readable summary of the key fields)
+    """
+    config = request.config
+    # Render as the adapter would, so template changes invalidate recordings
+    prompt = provider._rendered_prompt_for_key(request)
+    prompt_sha256 = hashlib.sha256(
+        json.dumps(prompt, sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()
+    fields = {
+        "version": _KEY_VERSION,
+        "model": provider.model,
+        "effort": provider.reasoning_effort,
+        "schema": config.structured_output_schema,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+        "prompt_sha256": prompt_sha256,
+    }
+    key = hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+    return key, fields
+
+
+def _response_to_dict(response: LLMResponse) -> dict:
+    data = dataclasses.asdict(response)
+    data["response_id"] = str(response.response_id)
+    return data
+
+
+def _response_from_dict(data: dict) -> LLMResponse:
+    known = {f.name for f in dataclasses.fields(LLMResponse)}
+    values = {k: v for k, v in data.items() if k in known}
+    # Replayed responses are new responses (callers may store them by id)
+    values["response_id"] = uuid4()
+    return LLMResponse(**values)
+
+
+class LLMResponseStore:
+    """Content-addressed JSON files of recorded LLM responses.
+
+    Each key is one file, <path>/<key[:2]>/<key>.json, holding the key
+    fields and the recorded takes. Files are written atomically, so an
+    interrupted run never leaves a corrupt recording.
+    """
+
+    def __init__(self, mode: ResponseStoreMode, path: str | Path = LLM_RESPONSE_STORE_PATH):
+        """Initialize store.
+
+        Args:
+            mode: "record", "replay" or "record-missing"
+            path: Directory holding the recordings
+
+        Raises:
+            ValueError: If mode is unknown or "off"
+        """
+        if mode not in RESPONSE_STORE_MODES or mode == "off":
+            raise ValueError(
+                f"Invalid response store mode: {mode}. "
+                f"Must be one of: {', '.join(m for m in RESPONSE_STORE_MODES if m != 'off')}"
+            )
+        self.mode = mode
+        self.path = Path(path)
+        self.stats: Counter[str] = Counter()  # "replayed", "recorded", "missed"
+        self._takes: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def begin_run(self) -> ResponseStoreRun:
+        """Start a run scope: inside it, the first request of each key replays take 0.
+
+        Returns:
+            ResponseStoreRun to use as a context manager
+        """
+        return ResponseStoreRun(self)
+
+    def attach(self, provider: LLMProvider) -> LLMProvider:
+        """Route a provider's generate()/generate_stream() through the store.
+
+        Args:
+            provider: Adapter instance (modified in place)
+
+        Returns:
+            The same provider
+        """
+        inner_generate = provider.generate
+        inner_generate_stream = provider.generate_stream
+
+        async def generate(request: GenerationRequest) -> LLMResponse:
+            response, _replayed = await self._serve(provider, request, inner_generate)
+            return response
+
+        async def generate_stream(
+            request: GenerationRequest, on_text: TextDeltaCallback
+        ) -> LLMResponse:
+            async def call(req: GenerationRequest) -> LLMResponse:
+                if provider.supports_streaming:
+                    return await inner_generate_stream(req, on_text)
+                # The default generate_stream() calls self.generate(), which
+                # would pass through the store a second time
+                response = await inner_generate(req)
+                await on_text(response.answer_text)
+                return response
+
+            response, replayed = await self._serve(provider, request, call)
+            if replayed:
+                await on_text(response.answer_text)
+            return response
+
+        provider.generate = generate  # type: ignore[method-assign]
+        provider.generate_stream = generate_stream  # type: ignore[method-assign]
+        return provider
+
+    async def _serve(
+        self,
+        provider: LLMProvider,
+        request: GenerationRequest,
+        call: Callable[[GenerationRequest], Awaitable[LLMResponse]],
+    ) -> tuple[LLMResponse, bool]:
+        """Serve a request from the store or from the provider, per mode.
+
+        Args:
+            provider: Adapter the request is for
+            request: Generation request
+            call: Sends the request to the provider
+
+        Returns:
+            (recorded or fresh LLMResponse, whether it was replayed)
+
+        Raises:
+            ResponseStoreMissError: Replay mode and nothing recorded for the request
+        """
+        key, fields = make_response_key(provider, request)
+        take = self._next_take(key)
+
+        if self.mode != "record":
+            recorded = self._load_take(key, take)
+            if recorded is not None:
+                self.stats["replayed"] += 1
+                logger.debug(f"Replaying {fields['model']} response {key[:12]} (take {take})")
+                return _response_from_dict(recorded), True
+            if self.mode == "replay":
+                self.stats["missed"] += 1
+                raise ResponseStoreMissError(
+                    f"No recorded {fields['model']} response for request {key[:12]} "
+                    f"(schema={fields['schema']}) in {self.path}; "
+                    "run with record-missing to record it"
+                )
+
+        response = await call(request)
+        self._save_take(key, take, fields, response)
+        self.stats["recorded"] += 1
+        return response, False
+
+    def _next_take(self, key: str) -> int:
+        """Take number of a request in the active run (or process-wide).
+
+        Taken before any await, under the lock: identical concurrent requests
+        (also from worker threads) get distinct takes.
+        """
+        run = _active_run.get()
+        takes = run.takes if run is not None and run.store is self else self._takes
+        with self._lock:
+            take = takes[key]
+            takes[key] += 1
+        return take
+
+    def summary(self) -> str:
+        """One-line summary of this run's store activity."""
+        return (
+            f"LLM response store ({self.mode}, {self.path}): "
+            f"{self.stats['replayed']} replayed, {self.stats['recorded']} recorded, "
+            f"{self.stats['missed']} missed"
+        )
+
+    def _file_for(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> dict | None:
+        try:
+            return json.loads(self._file_for(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response store entry {key[:12]}: {e}")
+            return None
+
+    def _load_take(self, key: str, take: int) -> dict | None:
+        with self._lock:
+            entry = self._read(key)
+        takes = entry.get("responses", []) if entry else []
+        if not takes:
+            return None
+        if take < len(takes):
+            return takes[take]
+        # More identical requests than were recorded: record-missing records
+        # another take, replay cycles through the recorded ones
+        return None if self.mode == "record-missing" else takes[take % len(takes)]
+
+    def _save_take(self, key: str, take: int, fields: dict, response: LLMResponse) -> None:
+        data = _response_to_dict(response)
+        data["recorded_at"] = datetime.now(UTC).isoformat()
+        with self._lock:
+            entry = self._read(key) or {"key": key, "request": fields, "responses": []}
+            takes = entry["responses"]
+            if take < len(takes):
+                takes[take] = data
+            else:
+                takes.append(data)
+            self._write(key, entry)
+
+    def _write(self, key: str, entry: dict) -> None:
+        target = self._file_for(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, indent=2, ensure_ascii=False, default=_json_default)
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Process-wide store; False until resolved from the environment
+_store: LLMResponseStore | None | bool = False
+
+
+def configure_llm_response_store(
+    mode: ResponseStoreMode, path: str | Path | None = None
+) -> LLMResponseStore | None:
+    """Select the response store mode for this process (CLI --llm-store).
+
+    Args:
+        mode: Store mode; "off" disables the store
+        path: Recordings directory (default: LLM_RESPONSE_STORE_PATH)
+
+    Returns:
+        The active store, or None for "off"
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    global _store
+    if mode not in RESPONSE_STORE_MODES:
+        raise ValueError(
+            f"Invalid response store mode: {mode}. Must be one of: {', '.join(RESPONSE_STORE_MODES)}"
+        )
+    _store = None if mode == "off" else LLMResponseStore(mode, path or LLM_RESPONSE_STORE_PATH)
+    if _store is not None:
+        logger.info(f"LLM response store enabled: mode={mode}, path={_store.path}")
+    return _store
+
+
+def get_llm_response_store() -> LLMResponseStore | None:
+    """Get the active response store.
+
+    Unless configured explicitly, the mode and path come from the
+    LLM_RESPONSE_STORE_MODE / LLM_RESPONSE_STORE_PATH environment variables,
+    falling back to the constants of the same name.
+
+    Returns:
+        LLMResponseStore, or None when the store is off
+    """
+    if _store is False:
+        return configure_llm_response_store(
+            os.getenv(MODE_ENV_VAR, LLM_RESPONSE_STORE_MODE),  # type: ignore[arg-type]
+            os.getenv(PATH_ENV_VAR),
+        )
+    return _store  # type: ignore[return-value]
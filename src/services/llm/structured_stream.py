@@ -0,0 +1,264 @@
+"""Incremental parser for streamed structured answers.
+
+Streaming adapters deliver the StructuredLLMResponse JSON in arbitrary chunks.
+StructuredResponseStreamParser accumulates them and, on demand, parses the
+incomplete JSON into a PartialStructuredResponse: every field that has started
+so far, with the string being written cut at the last received character.
+The Discord bot renders these snapshots while the answer is still being
+generated; the final answer is still parsed and validated by
+StructuredLLMResponse.from_json.
+
+Parsing is lazy (snapshot() re-parses only when new text arrived), so feeding
+every delta is cheap and the cost is paid once per rendered preview.
+"""
+
+import re
+from dataclasses import dataclass, field
+from json import JSONDecodeError
+from json.decoder import scanstring
+from typing import Any
+
+from src.models.structured_response import StructuredQuote
+
+# Placeholder for a value that has not arrived yet (or cannot be known yet,
+# like a number that may still get more digits)
+_MISSING = object()
+
+_WHITESPACE = " \t\n\r"
+_SCALAR_PATTERN = re.compile(r"-?[0-9][0-9.eE+-]*|-|true|false|null|[tfn][a-z]*")
+# Backslashes (and a \u escape's hex digits) at the end of a partial string
+_TRAILING_BACKSLASHES = re.compile(r"(\\+)(u[0-9a-fA-F]{0,3})?$")
+
+
+@dataclass
+class PartialStructuredResponse:
+    """Fields of a structured answer received so far.
+
+    Strings may be cut mid-sentence; the last quote may lack its text.
+    """
+
+    smalltalk: bool | None = None
+    short_answer: str = ""
+    persona_short_answer: str = ""
+    quotes: list[StructuredQuote] = field(default_factory=list)
+    explanation: str = ""
+    persona_afterword: str = ""
+
+    @property
+    def has_content(self) -> bool:
+        """Whether any user-visible text has arrived."""
+        return bool(
+            self.short_answer or self.persona_short_answer or self.quotes or self.explanation
+        )
+
+    @classmethod
+    def from_partial_dict(cls, data: Any) -> "PartialStructuredResponse":
+        """Build from a partially parsed answer object, ignoring ill-typed fields.
+
+        Args:
+            data: Result of parse_partial_json() on the answer text
+
+        Returns:
+            PartialStructuredResponse (empty if data is not an object)
+        """
+        if not isinstance(data, dict):
+            return cls()
+
+        def text(source: dict, key: str) -> str:
+            value = source.get(key, "")
+            return value if isinstance(value, str) else ""
+
+        quotes = []
+        raw_quotes = data.get("quotes")
+        for quote in raw_quotes if isinstance(raw_quotes, list) else []:
+            if isinstance(quote, dict) and text(quote, "quote_title"):
+                quotes.append(
+                    StructuredQuote(
+                        quote_title=text(quote, "quote_title"),
+                        quote_text=text(quote, "quote_text"),
+                        chunk_id=text(quote, "chunk_id"),
+                    )
+                )
+
+        smalltalk = data.get("smalltalk")
+        return cls(
+            smalltalk=smalltalk if isinstance(smalltalk, bool) else None,
+            short_answer=text(data, "short_answer"),
+            persona_short_answer=text(data, "persona_short_answer"),
+            quotes=quotes,
+            explanation=text(data, "explanation"),
+            persona_afterword=text(data, "persona_afterword"),
+        )
+
+
+class StructuredResponseStreamParser:
+    """Accumulates streamed answer chunks and parses them on demand."""
+
+    def __init__(self):
+        """Initialize an empty parser."""
+        self._chunks: list[str] = []
+        self._snapshot = PartialStructuredResponse()
+        self._parsed_chunks = 0
+
+    @property
+    def text(self) -> str:
+        """The answer text received so far."""
+        return "".join(self._chunks)
+
+    def feed(self, delta: str) -> None:
+        """Append a chunk of answer text.
+
+        Args:
+            delta: Next chunk as delivered by the provider stream
+        """
+        if delta:
+            self._chunks.append(delta)
+
+    def reset(self) -> None:
+        """Drop everything received (the request is being retried)."""
+        self._chunks = []
+        self._snapshot = PartialStructuredResponse()
+        self._parsed_chunks = 0
+
+    def snapshot(self) -> PartialStructuredResponse:
+        """Parse the text received so far.
+
+        Returns:
+            PartialStructuredResponse with every field that has started
+        """
+        if self._parsed_chunks != len(self._chunks):
+            self._parsed_chunks = len(self._chunks)
+            self._snapshot = PartialStructuredResponse.from_partial_dict(
+                parse_partial_json(self.text)
+            )
+        return self._snapshot
+
+
+def parse_partial_json(text: str) -> Any:
+    """Parse the complete prefix of a JSON document that is still being written.
+
+    Unterminated strings yield the characters received so far; objects and
+    arrays yield the members received so far. A member whose value cannot be
+    known yet (an unfinished number or literal, a key without its value) is
+    left out. Leading non-JSON text (e.g. a Markdown code fence) is skipped.
+
+    Args:
+        text: Beginning of a JSON document
+
+    Returns:
+        Partially parsed value, or None if nothing can be parsed yet
+    """
+    start = min((i for i in (text.find("{"), text.find("[")) if i >= 0), default=-1)
+    if start < 0:
+        return None
+    try:
+        value = _PartialJSONScanner(text, start).value()
+    except ValueError:
+        return None
+    return None if value is _MISSING else value
+
+
+def _drop_partial_escape(raw: str) -> str:
+    """Remove an escape sequence cut off at the end of a partial string."""
+    match = _TRAILING_BACKSLASHES.search(raw)
+    if match is None or len(match.group(1)) % 2 == 0:
+        return raw  # Even run: escaped backslashes, nothing pending
+    return raw[: match.start()] + match.group(1)[:-1]
+
+
+class _PartialJSONScanner:
+    """Recursive-descent scanner that stops gracefully at the end of the text."""
+
+    def __init__(self, text: str, pos: int = 0):
+        self.text = text
+        self.pos = pos
+
+    def value(self) -> Any:
+        self._skip_whitespace()
+        if self.pos >= len(self.text):
+            return _MISSING
+        char = self.text[self.pos]
+        if char == "{":
+            return self._object()
+        if char == "[":
+            return self._array()
+        if char == '"':
+            return self._string()[0]
+        return self._scalar()
+
+    def _object(self) -> dict:
+        result: dict = {}
+        self.pos += 1
+        while True:
+            self._skip_whitespace()
+            if self.pos >= len(self.text):
+                return result
+            char = self.text[self.pos]
+            if char == "}":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.pos += 1
+                continue
+            if char != '"':
+                raise ValueError(f"Expected object key at {self.pos}")
+            key, complete = self._string()
+            self._skip_whitespace()
+            if not complete or self.pos >= len(self.text):
+                return result
+            if self.text[self.pos] != ":":
+                raise ValueError(f"Expected ':' at {self.pos}")
+            self.pos += 1
+            member = self.value()
+            if member is not _MISSING:
+                result[key] = member
+
+    def _array(self) -> list:
+        result: list = []
+        self.pos += 1
+        while True:
+            self._skip_whitespace()
+            if self.pos >= len(self.text):
+                return result
+            char = self.text[self.pos]
+            if char == "]":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.pos += 1
+                continue
+            item = self.value()
+            if item is not _MISSING:
+                result.append(item)
+
+    def _string(self) -> tuple[str, bool]:
+        """Scan a string; returns (value, whether its closing quote arrived)."""
+        try:
+            value, self.pos = scanstring(self.text, self.pos + 1, False)
+            return value, True
+        except JSONDecodeError:
+            partial = _drop_partial_escape(self.text[self.pos + 1 :])
+            self.pos = len(self.text)
+            try:
+                return scanstring(partial + '"', 0, False)[0], False
+            except JSONDecodeError:
+                return partial, False
+
+    def _scalar(self) -> Any:
+        match = _SCALAR_PATTERN.match(self.text, self.pos)
+        if match is None:
+            raise ValueError(f"Unexpected character at {self.pos}")
+        self.pos = match.end()
+        if self.pos >= len(self.text):
+            return _MISSING  # May still grow ("tr" -> "true", "1" -> "12")
+        token = match.group()
+        if token in ("true", "false", "null"):
+            return {"true": True, "false": False, "null": None}[token]
+        try:
+            return float(token) if any(c in token for c in ".eE") else int(token)
+        except ValueError as e:
+            raise ValueError(f"Invalid literal {token!r}") from e
+
+    def _skip_whitespace(self) -> None:
+        while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+            self.pos += 1
@@ -18,7 +18,7 @@ from src.lib.logging import get_logger
 from src.lib.tokens import estimate_embedding_cost
 from src.models.rag_context import RAGContext
 from src.models.rag_request import RetrieveRequest
-from src.services.llm.base import GenerationConfig, GenerationRequest
+from src.services.llm.base import GenerationConfig, GenerationRequest, TextDeltaCallback
 from src.services.llm.factory import LLMProviderFactory
 from src.services.llm.quote_validator import QuoteValidator
 from src.services.rag.retriever import RAGRetriever
@@ -94,7 +94,8 @@ class QueryOrchestrator:
         start_time = time.time()
 
         # Delegate to RAG service (all features enabled via config)
-        rag_context, hop_evaluations, chunk_hop_map = self.rag.retrieve(
+        # Async path keeps the event loop free during embedding, Chroma and BM25
+        rag_context, hop_evaluations, chunk_hop_map = await self.rag.retrieve_async(
             RetrieveRequest(
                 query=query,
                 context_key=context_key,
@@ -131,6 +132,7 @@ class QueryOrchestrator:
         llm_provider=None,
         generation_timeout: int = LLM_GENERATION_TIMEOUT,
         use_cache: bool = True,
+        on_text: TextDeltaCallback | None = None,
     ) -> tuple[object, list[str]]:
         """Step 2: LLM generation with pre-retrieved RAG context.
 
@@ -153,6 +155,9 @@ class QueryOrchestrator:
             rag_context: Pre-retrieved RAG context
             llm_provider: LLM provider instance (if None, creates from factory)
             generation_timeout: Timeout in seconds
+            use_cache: Enable provider prompt caching (Claude only)
+            on_text: If given, the answer is streamed (generate_stream) and
+                each chunk of answer text is passed to it
 
         Returns:
             Tuple of:
@@ -172,14 +177,16 @@ class QueryOrchestrator:
 
         # Generate response
         # Note: Retry logic is applied by the entry point before calling this method
-        llm_response = await llm_provider.generate(
-            GenerationRequest(
-                prompt=query,
-                context=[chunk.text for chunk in rag_context.document_chunks],
-                config=GenerationConfig(timeout_seconds=generation_timeout, use_cache=use_cache),
-                chunk_ids=chunk_ids,
-            )
+        request = GenerationRequest(
+            prompt=query,
+            context=[chunk.text for chunk in rag_context.document_chunks],
+            config=GenerationConfig(timeout_seconds=generation_timeout, use_cache=use_cache),
+            chunk_ids=chunk_ids,
         )
+        if on_text is None:
+            llm_response = await llm_provider.generate(request)
+        else:
+            llm_response = await llm_provider.generate_stream(request, on_text)
 
         generation_time_ms = int((time.time() - start_time) * 1000)
 
@@ -6,17 +6,17 @@ Complements vector semantic search with exact term matching.
 
 import re
 from dataclasses import dataclass
-
-from rank_bm25 import BM25Okapi
+from uuid import UUID
 
 from src.lib.constants import BM25_B, BM25_K1
 from src.lib.logging import get_logger
 from src.models.rag_context import DocumentChunk
+from src.services.rag.sparse_bm25 import SparseBM25
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BM25Result:
     """BM25 search result with score."""
 
@@ -38,17 +38,21 @@ class BM25Retriever:
         """
         self.k1 = k1
         self.b = b
-        self.bm25: BM25Okapi | None = None
+        self.bm25: SparseBM25 | None = None
         self.chunks: list[DocumentChunk] = []
         self.tokenized_corpus: list[list[str]] = []
 
         logger.info("bm25_retriever_initialized", k1=k1, b=b)
 
-    def index_chunks(self, chunks: list[DocumentChunk]) -> None:
+    def index_chunks(
+        self, chunks: list[DocumentChunk], known_tokens: dict[UUID, list[str]] | None = None
+    ) -> None:
         """Index document chunks for BM25 search.
 
         Args:
             chunks: List of DocumentChunk objects to index
+            known_tokens: Tokens of chunks that are unchanged since a previous
+                index (see tokens_by_chunk); only the other chunks are tokenized
         """
         if not chunks:
             logger.warning("bm25_index_empty", message="No chunks to index")
@@ -57,19 +61,13 @@ class BM25Retriever:
         self.chunks = chunks
 
         # Tokenize corpus (lowercase, split on whitespace/punctuation)
-        # Include summary from metadata if available for better keyword matching
+        known_tokens = known_tokens or {}
         self.tokenized_corpus = [
-            self._tokenize(
-                chunk.text
-                + " "
-                + chunk.header
-                + (" " + chunk.metadata.get("summary", "") if chunk.metadata.get("summary") else "")
-            )
-            for chunk in chunks
+            known_tokens.get(chunk.chunk_id) or self._tokenize_chunk(chunk) for chunk in chunks
         ]
 
-        # Build BM25 index with custom parameters
-        self.bm25 = BM25Okapi(self.tokenized_corpus, k1=self.k1, b=self.b)
+        # Build BM25 index with custom parameters (sparse, scores match BM25Okapi)
+        self.bm25 = SparseBM25(self.tokenized_corpus, k1=self.k1, b=self.b)
 
         logger.info(
             "bm25_index_built",
@@ -79,6 +77,33 @@ class BM25Retriever:
             b=self.b,
         )
 
+    def load_index(self, chunks: list[DocumentChunk], bm25: SparseBM25) -> None:
+        """Use a prebuilt index (e.g. from the on-disk index bundle) instead of tokenizing.
+
+        Args:
+            chunks: Chunks in the row order the index was built from
+            bm25: Prebuilt SparseBM25 index over those chunks
+        """
+        self.chunks = chunks
+        self.bm25 = bm25
+        self.tokenized_corpus = []
+
+        logger.info("bm25_index_loaded", chunk_count=len(chunks), k1=bm25.k1, b=bm25.b)
+
+    def tokens_by_chunk(self) -> dict[UUID, list[str]]:
+        """Tokens of every indexed chunk, for reuse by a rebuilt index.
+
+        Returns:
+            Mapping of chunk_id to tokens (empty when the index was loaded
+            prebuilt, since the bundle does not keep token lists)
+        """
+        if not self.tokenized_corpus:
+            return {}
+        return {
+            chunk.chunk_id: tokens
+            for chunk, tokens in zip(self.chunks, self.tokenized_corpus, strict=True)
+        }
+
     def search(self, query: str, top_k: int = 15) -> list[BM25Result]:
         """Search for relevant chunks using BM25.
 
@@ -96,16 +121,12 @@ class BM25Retriever:
         # Tokenize query
         tokenized_query = self._tokenize(query)
 
-        # Get BM25 scores
-        scores = self.bm25.get_scores(tokenized_query)
-
-        # Get top-k results
-        top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:top_k]
+        # Score as a sparse dot product and select top-k positive scores
+        top_indices, top_scores = self.bm25.top_k(tokenized_query, top_k)
 
         results = [
-            BM25Result(chunk=self.chunks[idx], score=float(scores[idx]))
-            for idx in top_indices
-            if scores[idx] > 0  # Filter zero scores
+            BM25Result(chunk=self.chunks[idx], score=float(score))
+            for idx, score in zip(top_indices.tolist(), top_scores.tolist(), strict=True)
         ]
 
         logger.debug(
@@ -117,6 +138,24 @@ class BM25Retriever:
 
         return results
 
+    def _tokenize_chunk(self, chunk: DocumentChunk) -> list[str]:
+        """Tokenize a chunk for indexing.
+
+        Includes summary from metadata if available for better keyword matching.
+
+        Args:
+            chunk: Chunk to tokenize
+
+        Returns:
+            List of tokens
+        """
+        return self._tokenize(
+            chunk.text
+            + " "
+            + chunk.header
+            + (" " + chunk.metadata.get("summary", "") if chunk.metadata.get("summary") else "")
+        )
+
     def _tokenize(self, text: str) -> list[str]:
         """Tokenize text for BM25 indexing.
 
@@ -148,11 +187,8 @@ class BM25Retriever:
         return {
             "indexed": True,
             "chunk_count": len(self.chunks),
-            "avg_doc_length": sum(len(t) for t in self.tokenized_corpus)
-            / len(self.tokenized_corpus)
-            if self.tokenized_corpus
-            else 0,
-            "vocabulary_size": len({token for doc in self.tokenized_corpus for token in doc}),
+            "avg_doc_length": self.bm25.avgdl,
+            "vocabulary_size": self.bm25.vocabulary_size,
             "k1": self.k1,
             "b": self.b,
         }
@@ -9,11 +9,16 @@ from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from src.lib.cache_engine import LRUTTLCache
+from src.lib.constants import RAG_CACHE_MAX_BYTES
 from src.lib.logging import get_logger
 from src.models.rag_context import RAGContext
 
 logger = get_logger(__name__)
 
+# Rough per-chunk overhead (UUIDs, metadata dict, dataclass) on top of its text
+CHUNK_OVERHEAD_BYTES = 512
+
 
 @dataclass
 class CacheEntry:
@@ -39,18 +44,33 @@ class CacheEntry:
 class RAGCache:
     """In-memory cache for RAG query results."""
 
-    def __init__(self, ttl_seconds: int = 300, max_entries: int = 1000):
+    def __init__(
+        self, ttl_seconds: int = 300, max_entries: int = 1000, max_bytes: int = RAG_CACHE_MAX_BYTES
+    ):
         """Initialize cache.
 
         Args:
             ttl_seconds: Time-to-live in seconds (default: 300 = 5 minutes)
             max_entries: Maximum number of cache entries (LRU eviction)
+            max_bytes: Approximate memory budget for cached results (LRU eviction)
         """
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
-        self._cache: dict[str, CacheEntry] = {}
+        self.max_bytes = max_bytes
+        # Entries are tagged with the document ids of their chunks for invalidate()
+        self._cache: LRUTTLCache[str, CacheEntry] = LRUTTLCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds,
+            sizeof=lambda entry: _estimate_context_bytes(entry.result),
+        )
 
-        logger.info("rag_cache_initialized", ttl_seconds=ttl_seconds, max_entries=max_entries)
+        logger.info(
+            "rag_cache_initialized",
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
 
     def get(self, query: str, context_key: str) -> RAGContext | None:
         """Get cached RAG result.
@@ -69,12 +89,6 @@ class RAGCache:
             logger.debug("cache_miss", query_hash=cache_key[:16])
             return None
 
-        # Check if expired
-        if entry.is_expired():
-            del self._cache[cache_key]
-            logger.debug("cache_expired", query_hash=cache_key[:16])
-            return None
-
         logger.debug(
             "cache_hit",
             query_hash=cache_key[:16],
@@ -93,10 +107,6 @@ class RAGCache:
         """
         cache_key = self._make_cache_key(query, context_key)
 
-        # Evict oldest entry if at max capacity
-        if len(self._cache) >= self.max_entries and cache_key not in self._cache:
-            self._evict_oldest()
-
         entry = CacheEntry(
             query_hash=cache_key,
             context_key=context_key,
@@ -105,7 +115,11 @@ class RAGCache:
             ttl_seconds=self.ttl_seconds,
         )
 
-        self._cache[cache_key] = entry
+        self._cache.put(
+            cache_key,
+            entry,
+            tags={str(chunk.document_id) for chunk in result.document_chunks},
+        )
 
         logger.debug("cache_set", query_hash=cache_key[:16], context_key=context_key)
 
@@ -123,31 +137,18 @@ class RAGCache:
         """
         if document_id is None:
             # Invalidate all
-            count = len(self._cache)
-            self._cache.clear()
+            count = self._cache.clear()
             logger.info("cache_invalidated_all", count=count)
             return count
 
-        # Invalidate entries referencing this document
-        to_remove = []
+        # Invalidate entries referencing this document (reverse index lookup)
         doc_id_str = str(document_id)
+        count = self._cache.invalidate_tag(doc_id_str)
 
-        for cache_key, entry in self._cache.items():
-            # Check if any chunk references this document
-            for chunk in entry.result.document_chunks:
-                if str(chunk.document_id) == doc_id_str:
-                    to_remove.append(cache_key)
-                    break
+        if count:
+            logger.info("cache_invalidated_by_document", document_id=doc_id_str, count=count)
 
-        for cache_key in to_remove:
-            del self._cache[cache_key]
-
-        if to_remove:
-            logger.info(
-                "cache_invalidated_by_document", document_id=doc_id_str, count=len(to_remove)
-            )
-
-        return len(to_remove)
+        return count
 
     def cleanup_expired(self) -> int:
         """Remove expired entries from cache.
@@ -155,15 +156,12 @@ class RAGCache:
         Returns:
             Number of entries removed
         """
-        to_remove = [cache_key for cache_key, entry in self._cache.items() if entry.is_expired()]
-
-        for cache_key in to_remove:
-            del self._cache[cache_key]
+        removed = self._cache.purge_expired()
 
-        if to_remove:
-            logger.debug("cache_cleanup", removed=len(to_remove))
+        if removed:
+            logger.debug("cache_cleanup", removed=removed)
 
-        return len(to_remove)
+        return removed
 
     def get_stats(self) -> dict[str, object]:
         """Get cache statistics.
@@ -171,13 +169,14 @@ class RAGCache:
         Returns:
             Statistics dictionary
         """
-        expired_count = sum(1 for entry in self._cache.values() if entry.is_expired())
+        total_entries = len(self._cache)
+        expired_count = self._cache.purge_expired()
 
         return {
-            "total_entries": len(self._cache),
+            **self._cache.get_stats(),
+            "total_entries": total_entries,
             "expired_entries": expired_count,
-            "active_entries": len(self._cache) - expired_count,
-            "max_entries": self.max_entries,
+            "active_entries": total_entries - expired_count,
             "ttl_seconds": self.ttl_seconds,
         }
 
@@ -195,16 +194,20 @@ class RAGCache:
         key_string = f"{query.lower().strip()}:{context_key}"
         return hashlib.sha256(key_string.encode()).hexdigest()
 
-    def _evict_oldest(self) -> None:
-        """Evict oldest cache entry (LRU)."""
-        if not self._cache:
-            return
 
-        # Find oldest entry
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].timestamp)
+def _estimate_context_bytes(context: RAGContext) -> int:
+    """Approximate memory held by a cached RAGContext.
 
-        del self._cache[oldest_key]
-        logger.debug("cache_evicted", query_hash=oldest_key[:16])
+    Args:
+        context: Cached context
+
+    Returns:
+        Estimated size in bytes
+    """
+    return sum(
+        len(chunk.text) + len(chunk.header) + CHUNK_OVERHEAD_BYTES
+        for chunk in context.document_chunks
+    ) + CHUNK_OVERHEAD_BYTES
 
 
 # Global cache instance
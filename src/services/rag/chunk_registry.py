@@ -0,0 +1,73 @@
+"""Chunk registry shared by the retrieval indexes.
+
+The corpus is loaded once per ingestion generation (from the index bundle or
+the vector DB) and the same DocumentChunk objects back the BM25 index, the
+header index and this registry. Vector search then only needs chunk ids and
+distances: hits are resolved against the registry instead of re-building
+DocumentChunks from the vector DB's documents and metadatas on every query.
+
+Retrieval and fusion pass ScoredChunk records (registry chunk + scores) and
+only the chunks that leave retrieval are materialized into DocumentChunks
+carrying their scores.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+
+from src.models.rag_context import DocumentChunk
+
+
+@dataclass(slots=True)
+class ScoredChunk:
+    """A registry chunk with the scores one query gave it."""
+
+    chunk: DocumentChunk  # Shared registry entry, never modified
+    score: float  # Current relevance score (vector similarity, then RRF fusion)
+    vector_similarity: float | None = None
+    bm25_score: float | None = None
+    rrf_score: float | None = None
+
+    def materialize(self) -> DocumentChunk:
+        """Copy of the chunk with this query's scores.
+
+        Returns:
+            DocumentChunk with relevance_score set to score and the score
+            breakdown fields set (metadata is shared with the registry chunk)
+        """
+        return replace(
+            self.chunk,
+            relevance_score=self.score,
+            vector_similarity=self.vector_similarity,
+            bm25_score=self.bm25_score,
+            rrf_score=self.rrf_score,
+        )
+
+
+class ChunkRegistry:
+    """Read-only chunk id -> DocumentChunk table for one ingestion generation."""
+
+    def __init__(self, chunks: Iterable[DocumentChunk] = ()):
+        """Initialize registry.
+
+        Args:
+            chunks: Chunks of the loaded corpus (kept by reference)
+        """
+        self._chunks = MappingProxyType({str(chunk.chunk_id): chunk for chunk in chunks})
+
+    def get(self, chunk_id: str) -> DocumentChunk | None:
+        """Look up a chunk.
+
+        Args:
+            chunk_id: Chunk id as stored in the vector DB
+
+        Returns:
+            Registry chunk, or None if it is not part of this generation
+        """
+        return self._chunks.get(chunk_id)
+
+    def __contains__(self, chunk_id: object) -> bool:
+        return chunk_id in self._chunks
+
+    def __len__(self) -> int:
+        return len(self._chunks)
@@ -12,7 +12,7 @@ from src.lib.constants import MARKDOWN_CHUNK_HEADER_LEVEL
 from src.lib.tokens import count_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkdownChunk:
     """A chunk of markdown text."""
 
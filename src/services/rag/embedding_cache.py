@@ -0,0 +1,319 @@
+"""Two-tier cache for query embeddings.
+
+Users, RAG tests and quality tests embed the same query strings over and over.
+Each miss is a blocking OpenAI round trip, so vectors are kept in an in-memory
+LRU backed by a small SQLite store that survives restarts. Entries are keyed by
+(embedding model, normalized text), so vectors from different models never mix.
+
+Async callers must not touch SQLite on the event loop: they check the memory
+tier with get_from_memory(), read the disk tier in a worker thread, and store
+with put_deferred(), which hands the disk write to a single writer thread.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.lib.constants import (
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    EMBEDDING_CACHE_MEMORY_SIZE,
+    EMBEDDING_CACHE_PATH,
+)
+from src.lib.logging import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, text_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keying.
+
+    Only whitespace is collapsed. Case is preserved because embeddings are
+    case-sensitive and keyword normalization already fixes casing upstream.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(text.split())
+
+
+class EmbeddingCache:
+    """In-memory LRU plus on-disk SQLite store for embedding vectors."""
+
+    def __init__(
+        self,
+        db_path: str | None = EMBEDDING_CACHE_PATH,
+        memory_size: int = EMBEDDING_CACHE_MEMORY_SIZE,
+        max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize embedding cache.
+
+        Args:
+            db_path: SQLite file path (None = memory tier only)
+            memory_size: Maximum vectors held in the in-memory LRU
+            max_entries: Maximum vectors kept on disk (least recently used are pruned)
+        """
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self._memory: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writer: ThreadPoolExecutor | None = None  # Started by the first put_deferred()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._conn: sqlite3.Connection | None = None
+        self._disk_count = 0
+        if db_path:
+            try:
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                # Retrieval runs in worker threads, access is serialized by self._lock
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.executescript(SCHEMA_SQL)
+                self._disk_count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.error("embedding_cache_open_failed", path=db_path, error=str(e))
+                self._conn = None
+
+        logger.info(
+            "embedding_cache_initialized",
+            path=db_path if self._conn else None,
+            memory_size=memory_size,
+            max_entries=max_entries,
+            disk_entries=self._disk_count,
+        )
+
+    def get(self, model: str, text: str) -> list[float] | None:
+        """Look up a cached embedding.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+
+        Returns:
+            Embedding vector or None on miss
+        """
+        key = self._make_key(model, text)
+
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return vector
+
+            vector = self._disk_get(key)
+            if vector is not None:
+                self.disk_hits += 1
+                self._memory_put(key, vector)
+                return vector
+
+            self.misses += 1
+            return None
+
+    def get_from_memory(self, model: str, text: str) -> list[float] | None:
+        """Look up the memory tier only (safe on an event loop).
+
+        A miss is not counted: the caller goes on to get() in a worker thread.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+
+        Returns:
+            Embedding vector or None if not in memory
+        """
+        key = self._make_key(model, text)
+
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+            return vector
+
+    def put_deferred(self, model: str, text: str, embedding: list[float]) -> None:
+        """Store in memory now and on disk from the writer thread (safe on an event loop).
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+            embedding: Embedding vector
+        """
+        key = self._make_key(model, text)
+
+        with self._lock:
+            self._memory_put(key, embedding)
+            if not self._conn:
+                return
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="embedding-cache-writer"
+                )
+            writer = self._writer
+
+        writer.submit(self._locked_disk_put, key, embedding)
+
+    def flush(self) -> None:
+        """Wait until deferred disk writes are done."""
+        with self._lock:
+            writer = self._writer
+        if writer is not None:
+            writer.submit(lambda: None).result()
+
+    def put(self, model: str, text: str, embedding: list[float]) -> None:
+        """Store an embedding in both tiers.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+            embedding: Embedding vector
+        """
+        key = self._make_key(model, text)
+
+        with self._lock:
+            self._memory_put(key, embedding)
+            self._disk_put(key, embedding)
+
+    def clear(self) -> None:
+        """Drop every cached embedding from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+                self._disk_count = 0
+
+        logger.info("embedding_cache_cleared")
+
+    def get_stats(self) -> dict[str, object]:
+        """Get cache statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "disk_entries": self._disk_count,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "persistent": self._conn is not None,
+        }
+
+    def _make_key(self, model: str, text: str) -> tuple[str, str]:
+        """Create cache key from model and text.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+
+        Returns:
+            (model, sha256 of normalized text)
+        """
+        text_hash = hashlib.sha256(normalize_text(text).encode()).hexdigest()
+        return model, text_hash
+
+    def _memory_put(self, key: tuple[str, str], embedding: list[float]) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _locked_disk_put(self, key: tuple[str, str], embedding: list[float]) -> None:
+        """_disk_put under the cache lock (writer thread)."""
+        with self._lock:
+            self._disk_put(key, embedding)
+
+    def _disk_get(self, key: tuple[str, str]) -> list[float] | None:
+        """Read a vector from SQLite and refresh its last_used timestamp."""
+        if not self._conn:
+            return None
+
+        try:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE model = ? AND text_hash = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                (time.time(), *key),
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_read_failed", error=str(e))
+            return None
+
+        return array("f", row[0]).tolist()
+
+    def _disk_put(self, key: tuple[str, str], embedding: list[float]) -> None:
+        """Write a vector to SQLite as float32 and prune if over max_entries."""
+        if not self._conn:
+            return
+
+        try:
+            exists = self._conn.execute(
+                "SELECT 1 FROM embeddings WHERE model = ? AND text_hash = ?", key
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dimensions, vector, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*key, len(embedding), array("f", embedding).tobytes(), time.time()),
+            )
+            if not exists:
+                self._disk_count += 1
+
+            if self._disk_count > self.max_entries:
+                excess = self._disk_count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE rowid IN "
+                    "(SELECT rowid FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                self._disk_count -= excess
+
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_write_failed", error=str(e))
+
+
+# Global cache instance
+_embedding_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get global embedding cache instance.
+
+    Returns:
+        EmbeddingCache instance
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache()
+    return _embedding_cache
@@ -4,13 +4,16 @@ Uses OpenAI text-embedding-3-small for document embedding.
 Based on specs/001-we-are-building/contracts/rag-pipeline.md
 """
 
+import asyncio
+
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.lib.config import get_config
-from src.lib.constants import EMBEDDING_MODEL
+from src.lib.constants import EMBEDDING_CACHE_ENABLED, EMBEDDING_MODEL
 from src.lib.logging import get_logger
 from src.lib.tokens import get_embedding_dimensions, get_embedding_token_limit
+from src.services.rag.embedding_cache import EmbeddingCache, get_embedding_cache
 
 logger = get_logger(__name__)
 
@@ -18,13 +21,21 @@ logger = get_logger(__name__)
 class EmbeddingService:
     """Service for generating embeddings using OpenAI API."""
 
-    def __init__(self, model: str = EMBEDDING_MODEL):
+    def __init__(
+        self,
+        model: str = EMBEDDING_MODEL,
+        use_cache: bool = EMBEDDING_CACHE_ENABLED,
+        cache: EmbeddingCache | None = None,
+    ):
         """Initialize embedding service.
 
         Args:
             model: Embedding model name (default: text-embedding-3-small)
+            use_cache: Cache single-text (query) embeddings (default: EMBEDDING_CACHE_ENABLED)
+            cache: Embedding cache to use (default: shared process-wide cache)
         """
         self.model = model
+        self.cache = (cache or get_embedding_cache()) if use_cache else None
         self.dimensions = get_embedding_dimensions(model)  # Model dimensions
         self.max_tokens = get_embedding_token_limit(model)  # Model token limit
 
@@ -35,11 +46,17 @@ class EmbeddingService:
 
         self.client = OpenAI(api_key=config.openai_api_key)
 
+        # Async client is created lazily per event loop (see _get_async_client)
+        self._api_key = config.openai_api_key
+        self._async_client: AsyncOpenAI | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+
         logger.info(
             "embedding_service_initialized",
             model=self.model,
             dimensions=self.dimensions,
             max_tokens=self.max_tokens,
+            cache_enabled=self.cache is not None,
         )
 
     def embed_text(self, text: str) -> list[float]:
@@ -58,6 +75,10 @@ class EmbeddingService:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
+        cached = self._get_cached(text)
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.embeddings.create(model=self.model, input=text)
 
@@ -67,12 +88,152 @@ class EmbeddingService:
                 "embedding_generated", text_length=len(text), embedding_dimensions=len(embedding)
             )
 
+            if self.cache:
+                self.cache.put(self.model, text, embedding)
+
+            return embedding
+
+        except openai.OpenAIError as e:
+            logger.error("embedding_generation_failed", error=str(e), model=self.model)
+            raise
+
+    async def embed_text_async(self, text: str) -> list[float]:
+        """Generate embedding for a single text without blocking the event loop.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            ValueError: If text is empty
+            openai.OpenAIError: If API call fails
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        cached = await self._get_cached_async(text)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._get_async_client().embeddings.create(
+                model=self.model, input=text
+            )
+
+            embedding = response.data[0].embedding
+
+            logger.debug(
+                "embedding_generated", text_length=len(text), embedding_dimensions=len(embedding)
+            )
+
+            if self.cache:
+                # SQLite write goes to the cache's writer thread, off the loop
+                self.cache.put_deferred(self.model, text, embedding)
+
             return embedding
 
         except openai.OpenAIError as e:
             logger.error("embedding_generation_failed", error=str(e), model=self.model)
             raise
 
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Generate query embeddings for several texts with at most one API call.
+
+        Cache-aware counterpart of embed_batch() for query workloads: cached
+        texts are served from the cache, and the distinct misses are embedded
+        in a single request and cached.
+
+        Args:
+            texts: Texts to embed (duplicates allowed)
+
+        Returns:
+            Embedding vectors, one per input text, in input order
+
+        Raises:
+            ValueError: If any text is empty
+            openai.OpenAIError: If API call fails
+        """
+        if any(not text or not text.strip() for text in texts):
+            raise ValueError("Text cannot be empty")
+
+        embeddings = {text: self._get_cached(text) for text in texts}
+        missing = [text for text, embedding in embeddings.items() if embedding is None]
+
+        if missing:
+            try:
+                response = self.client.embeddings.create(model=self.model, input=missing)
+            except openai.OpenAIError as e:
+                logger.error(
+                    "batch_embedding_failed", error=str(e), model=self.model, text_count=len(missing)
+                )
+                raise
+
+            for text, item in zip(missing, response.data, strict=True):
+                embeddings[text] = item.embedding
+                if self.cache:
+                    self.cache.put(self.model, text, item.embedding)
+
+        logger.debug(
+            "query_embeddings_generated", count=len(texts), api_inputs=len(missing), model=self.model
+        )
+
+        return [embeddings[text] for text in texts]
+
+    def _get_cached(self, text: str) -> list[float] | None:
+        """Look up a cached embedding for this service's model.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Cached embedding vector or None
+        """
+        if not self.cache:
+            return None
+
+        embedding = self.cache.get(self.model, text)
+        if embedding is not None:
+            logger.debug("embedding_cache_hit", text_length=len(text), model=self.model)
+        return embedding
+
+    async def _get_cached_async(self, text: str) -> list[float] | None:
+        """_get_cached for async callers: only the memory tier runs on the loop.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Cached embedding vector or None
+        """
+        if not self.cache:
+            return None
+
+        embedding = self.cache.get_from_memory(self.model, text)
+        if embedding is not None:
+            logger.debug("embedding_cache_hit", text_length=len(text), model=self.model)
+            return embedding
+
+        # SQLite lookup (and its last_used update) in a worker thread
+        return await asyncio.to_thread(self._get_cached, text)
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Get an async OpenAI client bound to the running event loop.
+
+        httpx connection pools cannot be shared between event loops, and some
+        entry points (admin rerun, CLI) call asyncio.run() more than once per
+        process, so the client is recreated whenever the loop changes.
+
+        Returns:
+            AsyncOpenAI client for the current loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+            self._async_client_loop = loop
+        return self._async_client
+
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts in a batch.
 
@@ -122,4 +283,5 @@ class EmbeddingService:
             "dimensions": self.dimensions,
             "max_tokens": self.max_tokens,
             "provider": "openai",
+            "cache": self.cache.get_stats() if self.cache else None,
         }
@@ -3,8 +3,14 @@
 Provides fast header-matching for multi-hop retrieval when the hop judge
 explicitly names rules. Instead of semantic search (which dilutes relevance
 for compound queries), this enables direct header lookup.
+
+Titles are resolved in batches (resolve_many): a title the hop judge copied
+verbatim is an O(1) dict hit; the rest are scored against all headers in one
+vectorized rapidfuzz.process.cdist call. A character-count bound prunes headers
+that cannot reach the threshold before scoring, without changing results.
 """
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
 from src.lib.constants import HEADER_FUZZY_THRESHOLD
@@ -20,6 +26,9 @@ class HeaderIndex:
     def __init__(self):
         self._header_to_chunk: dict[str, DocumentChunk] = {}  # normalized_header → chunk
         self._all_headers: list[str] = []  # For fuzzy search iteration
+        self._header_lengths = np.zeros(0, dtype=np.int32)  # len() per header
+        self._char_columns: dict[str, int] = {}  # character → column in _char_counts
+        self._char_counts = np.zeros((0, 0), dtype=np.int32)  # header x character counts
         self._built = False
 
     def build_from_chunks(self, chunks: list[DocumentChunk]) -> None:
@@ -40,6 +49,7 @@ class HeaderIndex:
                     self._header_to_chunk[normalized] = chunk
                     self._all_headers.append(normalized)
 
+        self._compile()
         self._built = True
         logger.info(
             "header_index_built",
@@ -47,6 +57,140 @@ class HeaderIndex:
             unique_headers=len(self._header_to_chunk),
         )
 
+    def build_from_entries(self, entries: list[tuple[str, DocumentChunk]]) -> None:
+        """Build index from precomputed (normalized header, chunk) pairs.
+
+        Used when loading the on-disk index bundle; entries come from a previous
+        build_from_chunks() via the entries property.
+
+        Args:
+            entries: (normalized header, chunk) pairs in index order
+        """
+        self._header_to_chunk = dict(entries)
+        self._all_headers = [header for header, _ in entries]
+        self._compile()
+        self._built = True
+        logger.info("header_index_loaded", total_headers=len(self._all_headers))
+
+    @property
+    def entries(self) -> list[tuple[str, DocumentChunk]]:
+        """(normalized header, chunk) pairs in index order."""
+        return [(header, self._header_to_chunk[header]) for header in self._all_headers]
+
+    def _compile(self) -> None:
+        """Precompute header lengths and character counts for candidate pruning."""
+        self._char_columns = {}
+        for header in self._all_headers:
+            for char in header:
+                self._char_columns.setdefault(char, len(self._char_columns))
+
+        self._header_lengths = np.array([len(h) for h in self._all_headers], dtype=np.int32)
+        self._char_counts = np.zeros(
+            (len(self._all_headers), len(self._char_columns)), dtype=np.int32
+        )
+        for row, header in enumerate(self._all_headers):
+            for char in header:
+                self._char_counts[row, self._char_columns[char]] += 1
+
+    def _candidate_mask(self, query: str, score_cutoff: float) -> np.ndarray:
+        """Mark headers whose fuzz.ratio with the query can reach score_cutoff.
+
+        fuzz.ratio is 200 * LCS / (len(a) + len(b)), and the longest common
+        subsequence cannot be longer than the number of characters the two
+        strings share (counted with multiplicity), so this upper bound never
+        drops a header that would have matched.
+
+        Args:
+            query: Normalized query
+            score_cutoff: Minimum fuzz.ratio score (0-100)
+
+        Returns:
+            Boolean array, one entry per header
+        """
+        query_counts = np.zeros(len(self._char_columns), dtype=np.int32)
+        for char in query:
+            column = self._char_columns.get(char)
+            if column is not None:
+                query_counts[column] += 1
+
+        shared = np.minimum(self._char_counts, query_counts).sum(axis=1)
+        upper_bound = 200.0 * shared / (self._header_lengths + len(query))
+        # Slack for float rounding: the exact score is computed by cdist anyway
+        return upper_bound >= score_cutoff - 1e-6
+
+    def resolve_many(
+        self, queries: list[str], threshold: float = HEADER_FUZZY_THRESHOLD
+    ) -> list[tuple[DocumentChunk | None, float]]:
+        """Resolve several header queries at once.
+
+        Gives the same match and score per query as fuzzy_search() did with
+        rapidfuzz.process.extractOne (fuzz.ratio, first header wins ties).
+
+        Args:
+            queries: Header texts to search for
+            threshold: Minimum similarity (0.0-1.0), default from constants
+
+        Returns:
+            (best matching chunk or None, match score 0.0-1.0) per query, in query order
+        """
+        if not self._built:
+            logger.warning("header_index_not_built")
+            return [(None, 0.0)] * len(queries)
+
+        score_cutoff = threshold * 100
+        matches: dict[str, tuple[str, float] | None] = {}
+        fuzzy_queries: list[str] = []
+
+        for query in queries:
+            normalized = query.strip().lower()
+            if not normalized or normalized in matches:
+                continue
+            if normalized in self._header_to_chunk:
+                # Verbatim header: fuzz.ratio of identical strings is 100
+                matches[normalized] = (normalized, 1.0) if score_cutoff <= 100 else None
+            else:
+                matches[normalized] = None
+                fuzzy_queries.append(normalized)
+
+        if fuzzy_queries and self._all_headers:
+            masks = np.array([self._candidate_mask(q, score_cutoff) for q in fuzzy_queries])
+            # Ascending header order keeps extractOne's first-wins tie-breaking
+            candidates = np.flatnonzero(masks.any(axis=0))
+            if candidates.size:
+                scores = process.cdist(
+                    fuzzy_queries,
+                    [self._all_headers[i] for i in candidates],
+                    scorer=fuzz.ratio,
+                    score_cutoff=score_cutoff,
+                    dtype=np.float64,
+                )
+                for query, row in zip(fuzzy_queries, scores, strict=True):
+                    best = int(np.argmax(row))
+                    if row[best] > 0 or score_cutoff <= 0:
+                        header = self._all_headers[candidates[best]]
+                        matches[query] = (header, float(row[best]) / 100.0)
+
+        results: list[tuple[DocumentChunk | None, float]] = []
+        for query in queries:
+            match = matches.get(query.strip().lower())
+            if match:
+                header, score = match
+                logger.debug(
+                    "header_fuzzy_match_found", query=query, matched_header=header, score=score
+                )
+                results.append((self._header_to_chunk[header], score))
+            else:
+                logger.debug("header_fuzzy_match_not_found", query=query, threshold=threshold)
+                results.append((None, 0.0))
+
+        logger.debug(
+            "headers_resolved",
+            queries=len(queries),
+            fuzzy_queries=len(fuzzy_queries),
+            matched=sum(1 for chunk, _ in results if chunk is not None),
+        )
+        return results
+
     def fuzzy_search(
         self, query: str, threshold: float = HEADER_FUZZY_THRESHOLD
     ) -> tuple[DocumentChunk | None, float]:
@@ -59,43 +203,7 @@ class HeaderIndex:
         Returns:
             Tuple of (best matching chunk or None, match score 0.0-1.0)
         """
-        if not self._built:
-            logger.warning("header_index_not_built")
-            return None, 0.0
-
-        query_normalized = query.strip().lower()
-        if not query_normalized:
-            return None, 0.0
-
-        result = process.extractOne(
-            query_normalized,
-            self._all_headers,
-            scorer=fuzz.ratio,
-            score_cutoff=threshold * 100,
-        )
-        if result:
-            best_match_header, raw_score, _ = result
-            best_score = raw_score / 100.0
-        else:
-            best_match_header = None
-            best_score = 0.0
-
-        if best_match_header:
-            chunk = self._header_to_chunk[best_match_header]
-            logger.debug(
-                "header_fuzzy_match_found",
-                query=query,
-                matched_header=best_match_header,
-                score=best_score,
-            )
-            return chunk, best_score
-
-        logger.debug(
-            "header_fuzzy_match_not_found",
-            query=query,
-            threshold=threshold,
-        )
-        return None, 0.0
+        return self.resolve_many([query], threshold)[0]
 
     @property
     def header_count(self) -> int:
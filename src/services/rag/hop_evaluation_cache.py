@@ -0,0 +1,348 @@
+"""Persistent cache of hop evaluation verdicts.
+
+The hop judge is called at temperature 0, yet the same evaluation is paid for
+again on every repeated question, every RAG test run with runs > 1 and every
+sweep configuration that leaves the hop-0 chunks unchanged. Verdicts are kept
+in an in-memory LRU backed by a SQLite store that survives restarts, keyed by
+(normalized query, ordered chunk ids shown to the judge, prompt fingerprint,
+evaluation model).
+
+Entries expire after a TTL and belong to one ingestion generation
+(IngestionState.index_key()): a verdict recorded against another generation
+is a miss and is deleted, since re-ingested chunks may read differently.
+
+Disk hits do not commit: their last_used refresh is buffered and written with
+the next put (or every RAG_HOP_EVAL_CACHE_TOUCH_BATCH hits). The SQLite file is
+only opened by the first get()/put(), so constructing the cache (e.g. a
+MultiHopRetriever in tests) touches no file. The cache is blocking; async
+callers run get()/put() in a worker thread.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from src.lib.cache_engine import LRUTTLCache
+from src.lib.constants import (
+    RAG_HOP_EVAL_CACHE_MAX_ENTRIES,
+    RAG_HOP_EVAL_CACHE_MEMORY_SIZE,
+    RAG_HOP_EVAL_CACHE_PATH,
+    RAG_HOP_EVAL_CACHE_TOUCH_BATCH,
+    RAG_HOP_EVAL_CACHE_TTL_SECONDS,
+)
+from src.lib.logging import get_logger
+from src.services.rag.embedding_cache import normalize_text
+
+logger = get_logger(__name__)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS hop_evaluations (
+    key_hash TEXT PRIMARY KEY,
+    generation TEXT NOT NULL,
+    evaluation TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_hop_evaluations_last_used ON hop_evaluations(last_used);
+CREATE INDEX IF NOT EXISTS idx_hop_evaluations_generation ON hop_evaluations(generation);
+"""
+
+
+def make_evaluation_key(
+    query: str, chunk_ids: Iterable[UUID], prompt_fingerprint: str, model: str
+) -> str:
+    """Cache key of one hop evaluation.
+
+    Args:
+        query: User query
+        chunk_ids: Ids of the chunks shown to the judge, in prompt order
+        prompt_fingerprint: Hash of the prompt template and structures
+        model: Evaluation model name
+
+    Returns:
+        sha256 hex digest
+    """
+    payload = json.dumps(
+        [normalize_text(query), [str(chunk_id) for chunk_id in chunk_ids], prompt_fingerprint, model]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class HopEvaluationCache:
+    """In-memory LRU plus on-disk SQLite store for hop evaluation verdicts."""
+
+    def __init__(
+        self,
+        db_path: str | None = RAG_HOP_EVAL_CACHE_PATH,
+        memory_size: int = RAG_HOP_EVAL_CACHE_MEMORY_SIZE,
+        max_entries: int = RAG_HOP_EVAL_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RAG_HOP_EVAL_CACHE_TTL_SECONDS,
+    ):
+        """Initialize hop evaluation cache.
+
+        Args:
+            db_path: SQLite file path (None = memory tier only)
+            memory_size: Maximum verdicts held in the in-memory LRU
+            max_entries: Maximum verdicts kept on disk (least recently used are pruned)
+            ttl_seconds: Time-to-live of a verdict
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Values are (generation, created_at, evaluation)
+        self._memory: LRUTTLCache[str, tuple[str, float, dict[str, Any]]] = LRUTTLCache(
+            max_entries=memory_size, ttl_seconds=ttl_seconds
+        )
+        self._lock = threading.Lock()
+        self._generation: str | None = None
+        # key -> last_used of disk hits not yet written back
+        self._pending_touches: dict[str, float] = {}
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.saved_cost_usd = 0.0
+        self.saved_time_s = 0.0
+
+        # Opened lazily by _connect(); reset to None once an open was attempted
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._disk_count = 0
+
+        logger.info(
+            "hop_evaluation_cache_initialized",
+            path=db_path,
+            memory_size=memory_size,
+            max_entries=max_entries,
+        )
+
+    def get(self, key: str, generation: str) -> dict[str, Any] | None:
+        """Look up a cached verdict.
+
+        Args:
+            key: make_evaluation_key() of the evaluation
+            generation: Current ingestion generation
+
+        Returns:
+            Evaluation dict (HopEvaluation.to_dict() of the original call) or None on miss
+        """
+        with self._lock:
+            self._switch_generation(generation)
+
+            cached = self._memory.get(key)
+            if cached is not None:
+                self.memory_hits += 1
+                return self._record_hit(cached[2])
+
+            cached = self._disk_get(key, generation)
+            if cached is not None:
+                self.disk_hits += 1
+                created_at, evaluation = cached
+                remaining = self.ttl_seconds - (time.time() - created_at)
+                self._memory.put(key, (generation, created_at, evaluation), ttl_seconds=remaining)
+                return self._record_hit(evaluation)
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, generation: str, evaluation: dict[str, Any]) -> None:
+        """Store a verdict in both tiers.
+
+        Args:
+            key: make_evaluation_key() of the evaluation
+            generation: Ingestion generation the judged chunks belong to
+            evaluation: HopEvaluation.to_dict() of the LLM call
+        """
+        now = time.time()
+        with self._lock:
+            self._switch_generation(generation)
+            self._memory.put(key, (generation, now, evaluation))
+            self._disk_put(key, generation, evaluation, now)
+
+    def clear(self) -> None:
+        """Drop every cached verdict from both tiers."""
+        with self._lock:
+            self._connect()
+            self._memory.clear()
+            self._pending_touches.clear()
+            if self._conn:
+                self._conn.execute("DELETE FROM hop_evaluations")
+                self._conn.commit()
+                self._disk_count = 0
+
+        logger.info("hop_evaluation_cache_cleared")
+
+    def get_stats(self) -> dict[str, object]:
+        """Get cache statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "disk_entries": self._disk_count,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "saved_cost_usd": self.saved_cost_usd,
+            "saved_time_s": self.saved_time_s,
+            "persistent": self._conn is not None or self._db_path is not None,
+        }
+
+    def _record_hit(self, evaluation: dict[str, Any]) -> dict[str, Any]:
+        """Add a hit's avoided LLM cost and latency to the totals."""
+        self.saved_cost_usd += evaluation.get("cost_usd", 0.0)
+        self.saved_time_s += evaluation.get("evaluation_time_s", 0.0)
+        return evaluation
+
+    def _connect(self) -> None:
+        """Open the SQLite tier on first use (the caller holds the lock)."""
+        if not self._db_path:
+            return
+
+        db_path, self._db_path = self._db_path, None  # One attempt, even if it fails
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            # Evaluations of concurrent queries may run in worker threads
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.executescript(SCHEMA_SQL)
+            self._disk_count = self._conn.execute(
+                "SELECT COUNT(*) FROM hop_evaluations"
+            ).fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error("hop_evaluation_cache_open_failed", path=db_path, error=str(e))
+            self._conn = None
+            return
+
+        logger.info("hop_evaluation_cache_opened", path=db_path, disk_entries=self._disk_count)
+
+    def _switch_generation(self, generation: str) -> None:
+        """Drop verdicts of other ingestion generations when a new one is first seen."""
+        self._connect()
+        if generation == self._generation:
+            return
+
+        self._generation = generation
+        self._memory.clear()
+        if not self._conn:
+            return
+
+        try:
+            deleted = self._conn.execute(
+                "DELETE FROM hop_evaluations WHERE generation != ? OR created_at < ?",
+                (generation, time.time() - self.ttl_seconds),
+            ).rowcount
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("hop_evaluation_cache_purge_failed", error=str(e))
+            return
+
+        self._disk_count -= deleted
+        if deleted:
+            logger.info("hop_evaluation_cache_purged", generation=generation[:16], deleted=deleted)
+
+    def _disk_get(self, key: str, generation: str) -> tuple[float, dict[str, Any]] | None:
+        """Read a verdict from SQLite and refresh its last_used timestamp.
+
+        Expired verdicts and verdicts of another generation are deleted.
+        """
+        if not self._conn:
+            return None
+
+        try:
+            row = self._conn.execute(
+                "SELECT generation, evaluation, created_at FROM hop_evaluations WHERE key_hash = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            now = time.time()
+            if row[0] != generation or now - row[2] >= self.ttl_seconds:
+                self._conn.execute("DELETE FROM hop_evaluations WHERE key_hash = ?", (key,))
+                self._conn.commit()
+                self._disk_count -= 1
+                return None
+
+        except sqlite3.Error as e:
+            logger.warning("hop_evaluation_cache_read_failed", error=str(e))
+            return None
+
+        self._pending_touches[key] = now
+        if len(self._pending_touches) >= RAG_HOP_EVAL_CACHE_TOUCH_BATCH:
+            try:
+                self._flush_touches()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("hop_evaluation_cache_touch_failed", error=str(e))
+
+        return row[2], json.loads(row[1])
+
+    def _flush_touches(self) -> None:
+        """Write buffered last_used refreshes (the caller commits)."""
+        if not self._pending_touches:
+            return
+
+        touches = [(last_used, key) for key, last_used in self._pending_touches.items()]
+        self._pending_touches.clear()
+        self._conn.executemany(  # type: ignore[union-attr]
+            "UPDATE hop_evaluations SET last_used = ? WHERE key_hash = ?", touches
+        )
+
+    def _disk_put(
+        self, key: str, generation: str, evaluation: dict[str, Any], now: float
+    ) -> None:
+        """Write a verdict to SQLite and prune if over max_entries."""
+        if not self._conn:
+            return
+
+        try:
+            # Pruning goes by last_used, so recent hits must be on disk first
+            self._flush_touches()
+            exists = self._conn.execute(
+                "SELECT 1 FROM hop_evaluations WHERE key_hash = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hop_evaluations "
+                "(key_hash, generation, evaluation, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, generation, json.dumps(evaluation), now, now),
+            )
+            if not exists:
+                self._disk_count += 1
+
+            if self._disk_count > self.max_entries:
+                excess = self._disk_count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM hop_evaluations WHERE rowid IN "
+                    "(SELECT rowid FROM hop_evaluations ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                self._disk_count -= excess
+
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("hop_evaluation_cache_write_failed", error=str(e))
+
+
+# Global cache instance
+_hop_evaluation_cache: HopEvaluationCache | None = None
+
+
+def get_hop_evaluation_cache() -> HopEvaluationCache:
+    """Get global hop evaluation cache instance.
+
+    Returns:
+        HopEvaluationCache instance
+    """
+    global _hop_evaluation_cache
+    if _hop_evaluation_cache is None:
+        _hop_evaluation_cache = HopEvaluationCache()
+    return _hop_evaluation_cache
@@ -0,0 +1,185 @@
+"""Speculative prefetch of hop titles.
+
+The hop judge usually asks for rules that are named verbatim in the chunks it
+was shown ("...while it has a Conceal order"). While the hop evaluation LLM
+call is in flight, HopPrefetcher pulls candidate rule names out of those
+chunks and resolves them against the header index on a worker thread. When
+the judge's missing_query arrives, titles resolved that way are answered
+immediately and only the rest are looked up.
+
+Header resolution depends only on the normalized title (see
+HeaderIndex.resolve_many), so a prefetched title resolves to exactly the
+chunk and score an on-demand lookup would give.
+"""
+
+import asyncio
+import re
+from collections.abc import Callable, Iterable
+from uuid import UUID
+
+from src.lib.constants import MAX_CHUNK_LENGTH_FOR_EVALUATION, RAG_HOP_PREFETCH_MAX_CANDIDATES
+from src.lib.logging import get_logger
+from src.models.rag_context import DocumentChunk
+
+logger = get_logger(__name__)
+
+HeaderResolver = Callable[[list[str]], list[tuple[DocumentChunk | None, float]]]
+
+# Runs of capitalized words ("Conceal", "Seek Light", "FIREFIGHT PHASE")
+_CAPITALIZED_RUN = re.compile(r"[A-Z][A-Za-z0-9'+]*(?: [A-Z][A-Za-z0-9'+]*)*")
+# Longest sub-run of a capitalized run tried as a rule name
+_MAX_CANDIDATE_WORDS = 5
+# Capitalized words that start sentences rather than name rules
+_STOPWORDS = frozenset({
+    "a", "an", "and", "any", "each", "for", "if", "in", "it", "its", "on", "or", "that",
+    "the", "then", "this", "when", "while", "with", "you", "your",
+})
+
+
+def extract_rule_candidates(chunks: Iterable[DocumentChunk]) -> list[str]:
+    """Rule names possibly mentioned in chunks, as the hop judge sees them.
+
+    Reads the chunk summary when there is one, otherwise the (truncated)
+    chunk text, and returns every run of up to five consecutive capitalized
+    words in it.
+
+    Args:
+        chunks: Chunks shown to the hop judge
+
+    Returns:
+        Unique candidates in order of first mention
+    """
+    candidates: dict[str, str] = {}
+    for chunk in chunks:
+        text = chunk.metadata.get("summary") or chunk.text[:MAX_CHUNK_LENGTH_FOR_EVALUATION]
+        for run in _CAPITALIZED_RUN.findall(text):
+            words = run.split()
+            for start in range(len(words)):
+                for end in range(start + 1, min(start + _MAX_CANDIDATE_WORDS, len(words)) + 1):
+                    phrase = words[start:end]
+                    if len(phrase) == 1 and (len(phrase[0]) < 4 or phrase[0].lower() in _STOPWORDS):
+                        continue
+                    candidate = " ".join(phrase)
+                    candidates.setdefault(_normalize(candidate), candidate)
+    return list(candidates.values())
+
+
+class HopPrefetcher:
+    """Per-query speculative resolver of hop titles."""
+
+    def __init__(
+        self, resolve: HeaderResolver, max_candidates: int = RAG_HOP_PREFETCH_MAX_CANDIDATES
+    ):
+        """Initialize prefetcher.
+
+        Args:
+            resolve: Batch header resolver (RAGRetriever.retrieve_by_headers)
+            max_candidates: Max candidates resolved over the whole query
+        """
+        self._resolve = resolve
+        self.max_candidates = max_candidates
+        self._resolved: dict[str, tuple[DocumentChunk, float]] = {}
+        self._attempted: set[str] = set()
+        self._scanned: set[UUID] = set()
+        self._tasks: list[asyncio.Task] = []
+
+        self.candidates = 0
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, chunks: Iterable[DocumentChunk]) -> None:
+        """Start resolving rule names mentioned in chunks not scanned before.
+
+        Returns immediately; resolution runs on a worker thread.
+
+        Args:
+            chunks: Chunks about to be shown to the hop judge
+        """
+        new_chunks = [chunk for chunk in chunks if chunk.chunk_id not in self._scanned]
+        self._scanned.update(chunk.chunk_id for chunk in new_chunks)
+
+        budget = self.max_candidates - self.candidates
+        candidates = [
+            candidate
+            for candidate in extract_rule_candidates(new_chunks)
+            if _normalize(candidate) not in self._attempted
+        ][: max(budget, 0)]
+        if not candidates:
+            return
+
+        self._attempted.update(_normalize(candidate) for candidate in candidates)
+        self.candidates += len(candidates)
+        self._tasks.append(asyncio.create_task(asyncio.to_thread(self._prefetch, candidates)))
+
+    async def resolve(self, titles: list[str]) -> list[tuple[DocumentChunk | None, float]]:
+        """Resolve hop titles, answering prefetched ones without a lookup.
+
+        Args:
+            titles: Titles from the judge's missing_query
+
+        Returns:
+            (chunk or None, match score) per title, as retrieve_by_headers returns
+        """
+        await self._settle()
+
+        matches: list[tuple[DocumentChunk | None, float]] = [(None, 0.0)] * len(titles)
+        pending: list[int] = []
+        for i, title in enumerate(titles):
+            hit = self._resolved.get(_normalize(title))
+            if hit is None:
+                pending.append(i)
+            else:
+                matches[i] = hit
+
+        if pending:
+            looked_up = self._resolve([titles[i] for i in pending])
+            for i, match in zip(pending, looked_up, strict=True):
+                matches[i] = match
+
+        self.hits += len(titles) - len(pending)
+        self.misses += len(pending)
+        logger.info(
+            "hop_prefetch_lookup",
+            titles=len(titles),
+            prefetch_hits=len(titles) - len(pending),
+            looked_up=len(pending),
+        )
+        return matches
+
+    def close(self) -> None:
+        """Cancel unfinished prefetches and log the query's prefetch hit rate."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+        lookups = self.hits + self.misses
+        logger.info(
+            "hop_prefetch_stats",
+            candidates=self.candidates,
+            resolved=len(self._resolved),
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=round(self.hits / lookups, 3) if lookups else None,
+        )
+
+    def _prefetch(self, candidates: list[str]) -> None:
+        """Resolve candidates against the header index (worker thread).
+
+        Args:
+            candidates: Candidate rule names
+        """
+        for candidate, (chunk, score) in zip(candidates, self._resolve(candidates), strict=True):
+            if chunk is not None:
+                self._resolved[_normalize(candidate)] = (chunk, score)
+
+    async def _settle(self) -> None:
+        """Wait for started prefetches; a failed prefetch only costs its hits."""
+        tasks, self._tasks = self._tasks, []
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                logger.warning("hop_prefetch_failed", error=str(result))
+
+
+def _normalize(title: str) -> str:
+    """Normalize a title the way the header index does."""
+    return title.strip().lower()
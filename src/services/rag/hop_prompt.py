@@ -0,0 +1,156 @@
+"""Pre-built hop evaluation prompt.
+
+The hop evaluation prompt embeds the rules structure and the query's teams
+as YAML. Both only change with an ingest, so they are serialized once:
+- the rules structure is dumped once and substituted into the template;
+- each team is dumped as its own top-level YAML fragment, so a filtered team
+  section is a join of cached fragments (block-style top-level mappings
+  concatenate to the same text yaml.dump gives for the filtered dict);
+- the template is parsed once into literal and placeholder segments, and the
+  literal text before the first per-hop placeholder (instructions and rules
+  structure) is kept as a pre-built prefix, already split into Claude
+  cache-control blocks.
+
+Every hop then only joins strings, and the result is identical to the
+previous format() over yaml.dump output.
+"""
+
+import hashlib
+from string import Formatter
+from typing import Any
+
+import yaml
+
+from src.services.llm.prompt_builder import CACHE_BREAK_MARKER
+
+
+def dump_structure(structure: dict[str, Any]) -> str:
+    """Serialize a structure dict the way the hop evaluation prompt shows it.
+
+    Args:
+        structure: Rules or teams structure (or part of it)
+
+    Returns:
+        YAML text
+    """
+    return yaml.dump(structure, default_flow_style=False, allow_unicode=True, width=120, indent=2)
+
+
+class HopPromptBuilder:
+    """Hop evaluation prompt with its static parts serialized once."""
+
+    def __init__(
+        self, template: str, rules_structure: dict[str, Any], teams_structure: dict[str, Any]
+    ):
+        """Initialize builder.
+
+        Args:
+            template: Prompt template with {rule_structure}, {team_structure},
+                {user_query} and {retrieved_chunks} placeholders
+            rules_structure: Rules structure dict
+            teams_structure: Teams structure dict (team name -> team data)
+        """
+        self.rules_structure_text = dump_structure(rules_structure)
+        self.all_teams_text = dump_structure(teams_structure)
+        self._empty_teams_text = dump_structure({})
+        self._team_fragments = {
+            team: dump_structure({team: data}) for team, data in teams_structure.items()
+        }
+        # Changes whenever the template or a structure does (hop evaluation cache key)
+        self.fingerprint = hashlib.sha256(
+            "\0".join((template, self.rules_structure_text, self.all_teams_text)).encode()
+        ).hexdigest()
+
+        # (literal text, placeholder that follows it); rule_structure is filled in now
+        segments: list[tuple[str, str]] = []
+        literal = ""
+        for text, field, _spec, _conversion in Formatter().parse(template):
+            literal += text
+            if field == "rule_structure":
+                literal += self.rules_structure_text
+            elif field is not None:
+                segments.append((literal, field))
+                literal = ""
+        self._segments = segments
+        self._tail = literal
+
+        # Pre-built prefix: everything before the first per-hop placeholder
+        self.static_prefix = segments[0][0] if segments else literal
+        head, sep, self._prefix_rest = self.static_prefix.rpartition(CACHE_BREAK_MARKER)
+        self._prefix_blocks = (
+            _cache_blocks(head.split(CACHE_BREAK_MARKER), last_open=False) if sep else []
+        )
+
+    def team_structure_text(self, teams: list[str] | None) -> str:
+        """YAML of the given teams.
+
+        Args:
+            teams: Team names (None = every team)
+
+        Returns:
+            Same text as dump_structure({team: data for the known teams})
+        """
+        if teams is None:
+            return self.all_teams_text
+        fragments = [
+            self._team_fragments[team] for team in sorted(set(teams)) if team in self._team_fragments
+        ]
+        return "".join(fragments) if fragments else self._empty_teams_text
+
+    def fill(self, **values: str) -> str:
+        """Fill the template.
+
+        Args:
+            **values: Text per placeholder (user_query, retrieved_chunks, team_structure)
+
+        Returns:
+            Same text as template.format(rule_structure=..., **values)
+        """
+        parts = []
+        for literal, field in self._segments:
+            parts.append(literal)
+            parts.append(values[field])
+        parts.append(self._tail)
+        return "".join(parts)
+
+    def build_for_claude(self, **values: str) -> str | list[dict]:
+        """Fill the template and split it into Anthropic cache-control blocks.
+
+        Args:
+            **values: Text per placeholder (see fill)
+
+        Returns:
+            Same result as split_user_prompt_for_cache(fill(**values))
+        """
+        filled = self.fill(**values)
+        if not self._prefix_blocks:
+            if CACHE_BREAK_MARKER not in filled:
+                return filled
+            return _cache_blocks(filled.split(CACHE_BREAK_MARKER), last_open=True) or filled
+
+        # The prefix blocks are fixed; only the text after its last marker is split
+        rest = filled[len(self.static_prefix) - len(self._prefix_rest):]
+        blocks = self._prefix_blocks + _cache_blocks(rest.split(CACHE_BREAK_MARKER), last_open=True)
+        return blocks or filled
+
+
+def _cache_blocks(parts: list[str], last_open: bool) -> list[dict]:
+    """Text blocks for the parts between cache break markers.
+
+    Args:
+        parts: Prompt text split on CACHE_BREAK_MARKER
+        last_open: Whether the last part ends the prompt (no cache_control)
+
+    Returns:
+        Blocks for the non-blank parts
+    """
+    blocks: list[dict] = []
+    for i, part in enumerate(parts):
+        stripped = part.strip()
+        if not stripped:
+            continue
+        block: dict = {"type": "text", "text": stripped}
+        if not last_open or i < len(parts) - 1:
+            block["cache_control"] = {"type": "ephemeral"}
+        blocks.append(block)
+    return blocks
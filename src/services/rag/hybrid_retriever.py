@@ -5,12 +5,14 @@ Based on best practices from 2025 RAG research.
 """
 
 from collections import defaultdict
-from dataclasses import replace
+from uuid import UUID
 
 from src.lib.constants import BM25_B, BM25_K1, BM25_WEIGHT, RRF_K
 from src.lib.logging import get_logger
 from src.models.rag_context import DocumentChunk
 from src.services.rag.bm25_retriever import BM25Result, BM25Retriever
+from src.services.rag.chunk_registry import ScoredChunk
+from src.services.rag.sparse_bm25 import SparseBM25
 
 logger = get_logger(__name__)
 
@@ -47,44 +49,59 @@ class HybridRetriever:
             vector_weight=self.vector_weight,
         )
 
-    def index_chunks(self, chunks: list[DocumentChunk]) -> None:
+    def index_chunks(
+        self, chunks: list[DocumentChunk], known_tokens: dict[UUID, list[str]] | None = None
+    ) -> None:
         """Index chunks for BM25 search.
 
         Args:
             chunks: List of DocumentChunk objects
+            known_tokens: Tokens of unchanged chunks from a previous index (skips re-tokenizing)
         """
-        self.bm25_retriever.index_chunks(chunks)
+        self.bm25_retriever.index_chunks(chunks, known_tokens)
+
+    def load_index(self, chunks: list[DocumentChunk], bm25: SparseBM25) -> None:
+        """Use a prebuilt BM25 index instead of indexing chunks.
+
+        Args:
+            chunks: Chunks in the row order the index was built from
+            bm25: Prebuilt SparseBM25 index over those chunks
+        """
+        self.bm25_retriever.load_index(chunks, bm25)
 
     def fuse_results(
-        self, vector_chunks: list[DocumentChunk], bm25_results: list[BM25Result], top_k: int = 15
-    ) -> list[DocumentChunk]:
+        self, vector_hits: list[ScoredChunk], bm25_results: list[BM25Result], top_k: int = 15
+    ) -> list[ScoredChunk]:
         """Fuse vector and BM25 results using Reciprocal Rank Fusion.
 
         RRF formula: score(doc) = Σ (1 / (k + rank_i))
         where k is a constant (typically 60) and rank_i is the rank in each list.
 
         Args:
-            vector_chunks: Results from vector semantic search (ordered by relevance)
+            vector_hits: Results from vector semantic search (ordered by relevance)
             bm25_results: Results from BM25 keyword search
             top_k: Number of results to return
 
         Returns:
-            Fused and ranked list of DocumentChunk objects
+            Fused and ranked results; score is the normalized RRF score and the
+            vector/BM25/RRF scores are kept as the score breakdown
         """
         # Calculate RRF scores for each document
-        rrf_scores: dict[str, float] = defaultdict(float)
-        chunk_map: dict[str, DocumentChunk] = {}
-        bm25_score_map: dict[str, float] = {}  # Store BM25 scores
-
-        # Process vector search results (ranked by relevance_score DESC)
-        for rank, chunk in enumerate(vector_chunks, start=1):
-            chunk_id = str(chunk.chunk_id)
+        rrf_scores: dict[UUID, float] = defaultdict(float)
+        chunk_map: dict[UUID, DocumentChunk] = {}
+        vector_score_map: dict[UUID, float | None] = {}
+        bm25_score_map: dict[UUID, float] = {}  # Store BM25 scores
+
+        # Process vector search results (ranked by relevance DESC)
+        for rank, hit in enumerate(vector_hits, start=1):
+            chunk_id = hit.chunk.chunk_id
             rrf_scores[chunk_id] += self.vector_weight * (1.0 / (self.k + rank))
-            chunk_map[chunk_id] = chunk
+            chunk_map[chunk_id] = hit.chunk
+            vector_score_map[chunk_id] = hit.vector_similarity
 
         # Process BM25 results (ranked by BM25 score DESC)
         for rank, result in enumerate(bm25_results, start=1):
-            chunk_id = str(result.chunk.chunk_id)
+            chunk_id = result.chunk.chunk_id
             rrf_scores[chunk_id] += self.bm25_weight * (1.0 / (self.k + rank))
             bm25_score_map[chunk_id] = result.score  # Store BM25 score
             if chunk_id not in chunk_map:
@@ -96,86 +113,91 @@ class HybridRetriever:
         ]
 
         # Normalize RRF scores to 0-1 range and assign as relevance scores
+        fused_hits: list[ScoredChunk] = []
         if sorted_ids:
             max_rrf = rrf_scores[sorted_ids[0]]
             min_rrf = rrf_scores[sorted_ids[-1]]
             rrf_range = max_rrf - min_rrf if max_rrf > min_rrf else 1.0
 
-            # Create new chunks with normalized RRF fusion scores
-            fused_chunks = []
             for cid in sorted_ids:
-                chunk = chunk_map[cid]
-
-                # Store original vector similarity score
-                original_vector_score = chunk.relevance_score
-
-                # Get raw RRF score
                 raw_rrf_score = rrf_scores[cid]
 
-                # Get BM25 score if available
-                bm25_score = bm25_score_map.get(cid)
-
                 # Normalize RRF score to 0.45-1.0 range (matching min threshold)
                 normalized_score = 0.45 + (raw_rrf_score - min_rrf) / rrf_range * 0.55
 
-                # Store scoring details in metadata for debugging/analysis
-                updated_metadata = chunk.metadata.copy()
-                # Only store vector_similarity if it's not the 1.0 placeholder
-                if original_vector_score < 1.0:
-                    updated_metadata["vector_similarity"] = original_vector_score
-                if bm25_score is not None:
-                    updated_metadata["bm25_score"] = bm25_score
-                updated_metadata["rrf_score"] = raw_rrf_score
-                updated_metadata["rrf_normalized"] = normalized_score
-
-                # Always update relevance_score to show the RRF fusion score
-                # This ensures the displayed score matches the ranking order
-                chunk = replace(chunk, relevance_score=normalized_score, metadata=updated_metadata)
-
-                fused_chunks.append(chunk)
-        else:
-            fused_chunks = []
+                # The RRF fusion score becomes the relevance score, so the
+                # displayed score matches the ranking order
+                fused_hits.append(
+                    ScoredChunk(
+                        chunk=chunk_map[cid],
+                        score=normalized_score,
+                        vector_similarity=vector_score_map.get(cid),
+                        bm25_score=bm25_score_map.get(cid),
+                        rrf_score=raw_rrf_score,
+                    )
+                )
 
         logger.debug(
             "rrf_fusion_completed",
-            vector_count=len(vector_chunks),
+            vector_count=len(vector_hits),
             bm25_count=len(bm25_results),
-            fused_count=len(fused_chunks),
+            fused_count=len(fused_hits),
             top_score=rrf_scores[sorted_ids[0]] if sorted_ids else 0.0,
         )
 
-        return fused_chunks
+        return fused_hits
+
+    def search_bm25(self, query: str, top_k: int = 15) -> list[BM25Result]:
+        """Run the BM25 half of hybrid retrieval on its own.
+
+        Lets callers score BM25 before the vector results exist (e.g. while the
+        query embedding is being generated) and pass them to retrieve_hybrid().
+
+        Args:
+            query: User query
+            top_k: Number of final results the BM25 results will be fused into
+
+        Returns:
+            BM25 results (2x top_k candidates for fusion)
+        """
+        return self.bm25_retriever.search(query, top_k=top_k * 2)
 
     def retrieve_hybrid(
-        self, query: str, vector_chunks: list[DocumentChunk], top_k: int = 15
-    ) -> list[DocumentChunk]:
+        self,
+        query: str,
+        vector_hits: list[ScoredChunk],
+        top_k: int = 15,
+        bm25_results: list[BM25Result] | None = None,
+    ) -> list[ScoredChunk]:
         """Perform hybrid retrieval combining vector and BM25 search.
 
         Args:
             query: User query
-            vector_chunks: Pre-retrieved chunks from vector search
+            vector_hits: Pre-retrieved results from vector search
             top_k: Number of final results
+            bm25_results: Precomputed search_bm25(query, top_k) results (None = search now)
 
         Returns:
-            Fused list of chunks
+            Fused results (see fuse_results)
         """
         # Get BM25 results
-        bm25_results = self.bm25_retriever.search(query, top_k=top_k * 2)
+        if bm25_results is None:
+            bm25_results = self.search_bm25(query, top_k=top_k)
 
         # Fuse results using RRF
-        fused_chunks = self.fuse_results(
-            vector_chunks=vector_chunks, bm25_results=bm25_results, top_k=top_k
+        fused_hits = self.fuse_results(
+            vector_hits=vector_hits, bm25_results=bm25_results, top_k=top_k
         )
 
         logger.info(
             "hybrid_retrieval_completed",
             query_length=len(query),
-            vector_results=len(vector_chunks),
+            vector_results=len(vector_hits),
             bm25_results=len(bm25_results),
-            fused_results=len(fused_chunks),
+            fused_results=len(fused_hits),
         )
 
-        return fused_chunks
+        return fused_hits
 
     def get_stats(self) -> dict[str, object]:
         """Get hybrid retriever statistics.
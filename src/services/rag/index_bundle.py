@@ -0,0 +1,497 @@
+"""Versioned on-disk bundle of the retrieval indexes derived from the vector store.
+
+Every RAGRetriever (bot, CLI `query`, admin rerun, each sweep configuration)
+used to pull every chunk out of Chroma with `collection.get`, rebuild
+DocumentChunk objects, re-tokenize the corpus for BM25 and rebuild the header
+index. Ingestion now writes all of that once, and retrievers load it instead.
+
+The bundle is keyed to `IngestionState.index_key()`, which changes whenever the
+config fingerprint changes or any file is (re-)ingested or removed. A retriever
+only uses a bundle whose key, BM25 parameters, format version, file sizes and
+chunk count all match; anything else falls back to a rebuild from Chroma.
+SHA-256 checksums are computed once at write time and checked only by an
+explicit `verify_index_bundle` (run by `ingest` before it keeps a bundle), so
+loads and reload checks don't read every file end to end.
+
+Layout (data/index_bundle/):
+
+    CURRENT                   # name of the active bundle directory
+    v1-<key prefix>/
+      manifest.json           # version, index key, BM25 params, size + sha256 per file
+      chunks.json             # chunk table: ids, texts, metadatas (Chroma layout)
+      headers.json            # header index: [normalized header, chunk row]
+      keywords.json           # keyword library used for query normalization
+      bm25_terms.json         # BM25 vocabulary in row order
+      bm25_<array>.npy        # CSR weights, memory-mapped on load
+      embeddings.npy          # float32 matrix parallel to the chunk table
+                              # (MatrixVectorDBService), memory-mapped on load
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import numpy as np
+
+from src.lib.constants import BM25_B, BM25_K1, RAG_INDEX_BUNDLE_PATH
+from src.lib.logging import get_logger
+from src.models.rag_context import DocumentChunk
+from src.services.rag.bm25_retriever import BM25Retriever
+from src.services.rag.header_index import HeaderIndex
+from src.services.rag.sparse_bm25 import SparseBM25
+
+logger = get_logger(__name__)
+
+BUNDLE_VERSION = 2
+BM25_ARRAYS = ("indptr", "indices", "data", "doc_len", "idf")
+
+
+@dataclass
+class IndexBundle:
+    """Retrieval indexes loaded from disk."""
+
+    index_key: str
+    chunks: list[DocumentChunk]
+    bm25: SparseBM25
+    header_entries: list[tuple[str, DocumentChunk]]
+    keywords: set[str]
+    created_at: str
+
+
+@dataclass
+class BundleVectors:
+    """Embedding matrix and its parallel chunk table loaded from disk."""
+
+    ids: list[str]
+    documents: list[str]
+    metadatas: list[dict]
+    embeddings: np.ndarray
+
+
+def chunks_from_records(
+    ids: list[str], documents: list[str], metadatas: list[dict]
+) -> list[DocumentChunk]:
+    """Build DocumentChunk objects from Chroma-style parallel lists.
+
+    Args:
+        ids: Chunk ids
+        documents: Chunk texts
+        metadatas: Chunk metadata dicts
+
+    Returns:
+        List of DocumentChunk objects in input order
+    """
+    chunks: list[DocumentChunk] = []
+    for chunk_id_str, text, metadata in zip(ids, documents, metadatas, strict=True):
+        chunks.append(
+            DocumentChunk(
+                chunk_id=UUID(chunk_id_str),
+                document_id=UUID(metadata.get("document_id", str(uuid4()))),
+                text=text,
+                header=metadata.get("header", ""),
+                header_level=metadata.get("header_level", 0),
+                metadata=metadata,
+                relevance_score=1.0,  # Placeholder for indexing
+                position_in_doc=metadata.get("position", 0),
+            )
+        )
+    return chunks
+
+
+def load_collection_chunks(
+    vector_db, document_ids: list[str] | None = None
+) -> list[DocumentChunk]:
+    """Pull chunks out of the vector store.
+
+    Args:
+        vector_db: VectorDBService
+        document_ids: Only pull chunks of these documents (None = every chunk)
+
+    Returns:
+        List of DocumentChunk objects (empty if nothing matches)
+    """
+    if document_ids is not None:
+        if not document_ids:
+            return []
+        all_results = vector_db.collection.get(
+            where={"document_id": {"$in": document_ids}}, include=["documents", "metadatas"]
+        )
+    else:
+        all_results = vector_db.collection.get(include=["documents", "metadatas"])
+    if not all_results["ids"]:
+        return []
+    return chunks_from_records(
+        all_results["ids"], all_results["documents"], all_results["metadatas"]
+    )
+
+
+def build_index_bundle(
+    vector_db,
+    index_key: str,
+    keywords: set[str],
+    k1: float = BM25_K1,
+    b: float = BM25_B,
+    path: str | Path = RAG_INDEX_BUNDLE_PATH,
+) -> Path | None:
+    """Build the retrieval indexes from the vector store and write them as a bundle.
+
+    Args:
+        vector_db: VectorDBService to read chunks from
+        index_key: IngestionState.index_key() of the ingested corpus
+        keywords: Keyword library to store alongside
+        k1: BM25 term frequency saturation parameter
+        b: BM25 document length normalization parameter
+        path: Bundle root directory
+
+    Returns:
+        Path of the written bundle directory, or None if the collection is empty
+    """
+    all_results = vector_db.collection.get(include=["documents", "metadatas", "embeddings"])
+    if not all_results["ids"]:
+        logger.warning("index_bundle_skipped", reason="empty collection")
+        return None
+    chunks = chunks_from_records(
+        all_results["ids"], all_results["documents"], all_results["metadatas"]
+    )
+    embeddings = all_results.get("embeddings")
+
+    bm25_retriever = BM25Retriever(k1=k1, b=b)
+    bm25_retriever.index_chunks(chunks)
+    header_index = HeaderIndex()
+    header_index.build_from_chunks(chunks)
+
+    return write_index_bundle(
+        index_key=index_key,
+        chunks=chunks,
+        bm25=bm25_retriever.bm25,
+        header_entries=header_index.entries,
+        keywords=keywords,
+        embeddings=None if embeddings is None else np.asarray(embeddings, dtype=np.float32),
+        path=path,
+    )
+
+
+def write_index_bundle(
+    index_key: str,
+    chunks: list[DocumentChunk],
+    bm25: SparseBM25,
+    header_entries: list[tuple[str, DocumentChunk]],
+    keywords: set[str],
+    embeddings: np.ndarray | None = None,
+    path: str | Path = RAG_INDEX_BUNDLE_PATH,
+) -> Path:
+    """Write a bundle and make it the current one.
+
+    Files go to a temporary directory that is renamed into place, then CURRENT
+    is switched atomically, so a reader never sees a half-written bundle.
+    Older bundle directories are removed afterwards.
+
+    Args:
+        index_key: IngestionState.index_key() of the ingested corpus
+        chunks: Chunks in BM25 row order
+        bm25: BM25 index over chunks
+        header_entries: HeaderIndex.entries
+        keywords: Keyword library
+        embeddings: Embedding matrix, one row per chunk (None = not stored)
+        path: Bundle root directory
+
+    Returns:
+        Path of the written bundle directory
+    """
+    root = Path(path)
+    root.mkdir(parents=True, exist_ok=True)
+    name = f"v{BUNDLE_VERSION}-{index_key[:16]}"
+    tmp_dir = root / f".tmp-{name}-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir()
+
+    row_of = {chunk.chunk_id: row for row, chunk in enumerate(chunks)}
+    terms, arrays = bm25.to_arrays()
+
+    _write_json(
+        tmp_dir / "chunks.json",
+        {
+            "ids": [str(chunk.chunk_id) for chunk in chunks],
+            "texts": [chunk.text for chunk in chunks],
+            "metadatas": [chunk.metadata for chunk in chunks],
+        },
+    )
+    _write_json(
+        tmp_dir / "headers.json",
+        [[header, row_of[chunk.chunk_id]] for header, chunk in header_entries],
+    )
+    _write_json(tmp_dir / "keywords.json", sorted(keywords))
+    _write_json(tmp_dir / "bm25_terms.json", terms)
+    for array_name in BM25_ARRAYS:
+        np.save(tmp_dir / f"bm25_{array_name}.npy", arrays[array_name])
+    if embeddings is not None:
+        np.save(tmp_dir / "embeddings.npy", np.ascontiguousarray(embeddings, dtype=np.float32))
+
+    manifest = {
+        "bundle_version": BUNDLE_VERSION,
+        "index_key": index_key,
+        "created_at": datetime.now(UTC).isoformat(),
+        "chunk_count": len(chunks),
+        "bm25": {"k1": bm25.k1, "b": bm25.b, "epsilon": bm25.epsilon},
+        "files": {
+            f.name: {"size": f.stat().st_size, "sha256": _sha256(f)}
+            for f in sorted(tmp_dir.iterdir())
+        },
+    }
+    _write_json(tmp_dir / "manifest.json", manifest)
+
+    bundle_dir = root / name
+    shutil.rmtree(bundle_dir, ignore_errors=True)
+    tmp_dir.rename(bundle_dir)
+
+    current_tmp = root / f"CURRENT.tmp-{os.getpid()}"
+    current_tmp.write_text(name, encoding="utf-8")
+    current_tmp.replace(root / "CURRENT")
+
+    # Readers that already memory-mapped an older bundle keep their mapping
+    for old in root.glob("v*-*"):
+        if old.name != name:
+            shutil.rmtree(old, ignore_errors=True)
+
+    logger.info(
+        "index_bundle_written",
+        path=str(bundle_dir),
+        chunk_count=len(chunks),
+        headers=len(header_entries),
+        keywords=len(keywords),
+        vocabulary_size=len(terms),
+    )
+    return bundle_dir
+
+
+def load_index_bundle(
+    index_key: str,
+    k1: float = BM25_K1,
+    b: float = BM25_B,
+    expected_chunk_count: int | None = None,
+    path: str | Path = RAG_INDEX_BUNDLE_PATH,
+) -> IndexBundle | None:
+    """Load the current bundle if it matches the expected corpus and parameters.
+
+    Args:
+        index_key: IngestionState.index_key() the bundle must have been built for
+        k1: BM25 k1 the retriever uses
+        b: BM25 b the retriever uses
+        expected_chunk_count: Vector store size, guards against ingests that
+            bypassed the ingestion state (None = don't check)
+        path: Bundle root directory
+
+    Returns:
+        IndexBundle, or None if there is no usable bundle (caller rebuilds)
+    """
+    root = Path(path)
+    try:
+        bundle_dir, manifest = _open_bundle(
+            root,
+            index_key,
+            expected_chunk_count,
+            ["chunks.json", "headers.json", "keywords.json", "bm25_terms.json"]
+            + [f"bm25_{array_name}.npy" for array_name in BM25_ARRAYS],
+        )
+        bm25_params = manifest.get("bm25", {})
+        if bm25_params.get("k1") != k1 or bm25_params.get("b") != b:
+            raise _BundleUnusable("bm25 parameters mismatch")
+
+        table = _read_json(bundle_dir / "chunks.json")
+        chunks = chunks_from_records(table["ids"], table["texts"], table["metadatas"])
+        bm25 = SparseBM25.from_arrays(
+            _read_json(bundle_dir / "bm25_terms.json"),
+            {
+                array_name: np.load(bundle_dir / f"bm25_{array_name}.npy", mmap_mode="r")
+                for array_name in BM25_ARRAYS
+            },
+            k1=bm25_params["k1"],
+            b=bm25_params["b"],
+            epsilon=bm25_params.get("epsilon", 0.25),
+        )
+        header_entries = [
+            (header, chunks[row]) for header, row in _read_json(bundle_dir / "headers.json")
+        ]
+        keywords = set(_read_json(bundle_dir / "keywords.json"))
+    except _BundleUnusable as e:
+        return _unusable(root, str(e))
+    except (OSError, ValueError, KeyError, IndexError) as e:
+        return _unusable(root, f"unreadable: {e}")
+
+    logger.info(
+        "index_bundle_loaded",
+        path=str(bundle_dir),
+        chunk_count=len(chunks),
+        created_at=manifest.get("created_at"),
+    )
+    return IndexBundle(
+        index_key=index_key,
+        chunks=chunks,
+        bm25=bm25,
+        header_entries=header_entries,
+        keywords=keywords,
+        created_at=manifest.get("created_at", ""),
+    )
+
+
+def load_bundle_vectors(
+    index_key: str,
+    expected_chunk_count: int | None = None,
+    path: str | Path = RAG_INDEX_BUNDLE_PATH,
+) -> BundleVectors | None:
+    """Load the embedding matrix and chunk table from the current bundle.
+
+    Args:
+        index_key: IngestionState.index_key() the bundle must have been built for
+        expected_chunk_count: Vector store size (None = don't check)
+        path: Bundle root directory
+
+    Returns:
+        BundleVectors with a memory-mapped matrix, or None if unusable
+    """
+    root = Path(path)
+    try:
+        bundle_dir, _ = _open_bundle(
+            root, index_key, expected_chunk_count, ["chunks.json", "embeddings.npy"]
+        )
+        table = _read_json(bundle_dir / "chunks.json")
+        embeddings = np.load(bundle_dir / "embeddings.npy", mmap_mode="r")
+        if embeddings.ndim != 2 or len(embeddings) != len(table["ids"]):
+            raise _BundleUnusable("embedding matrix does not match chunk table")
+    except _BundleUnusable as e:
+        return _unusable(root, str(e))
+    except (OSError, ValueError, KeyError) as e:
+        return _unusable(root, f"unreadable: {e}")
+
+    logger.info(
+        "bundle_vectors_loaded", path=str(bundle_dir), shape=list(embeddings.shape)
+    )
+    return BundleVectors(
+        ids=table["ids"],
+        documents=table["texts"],
+        metadatas=table["metadatas"],
+        embeddings=embeddings,
+    )
+
+
+def current_bundle_key(path: str | Path = RAG_INDEX_BUNDLE_PATH) -> str | None:
+    """Index key of the current bundle, without loading it.
+
+    Args:
+        path: Bundle root directory
+
+    Returns:
+        Index key, or None if there is no readable bundle
+    """
+    root = Path(path)
+    try:
+        name = (root / "CURRENT").read_text(encoding="utf-8").strip()
+        manifest = json.loads((root / name / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest.get("index_key")
+
+
+def verify_index_bundle(path: str | Path = RAG_INDEX_BUNDLE_PATH) -> list[str]:
+    """Check every file of the current bundle against its manifest checksum.
+
+    Loads only compare file sizes; this reads each file in full, so it is meant
+    for explicit checks (e.g. before `ingest` decides to keep a bundle).
+
+    Args:
+        path: Bundle root directory
+
+    Returns:
+        Problems found (empty if the bundle is intact)
+    """
+    root = Path(path)
+    try:
+        bundle_dir = root / (root / "CURRENT").read_text(encoding="utf-8").strip()
+        files = _read_json(bundle_dir / "manifest.json").get("files", {})
+    except (OSError, ValueError, AttributeError) as e:
+        return [f"unreadable manifest: {e}"]
+
+    problems = []
+    for file_name, expected in files.items():
+        try:
+            if _sha256(bundle_dir / file_name) != expected["sha256"]:
+                problems.append(f"checksum mismatch: {file_name}")
+        except OSError:
+            problems.append(f"missing file: {file_name}")
+    return problems
+
+
+class _BundleUnusable(Exception):
+    """The current bundle exists but can't be used (reason in message)."""
+
+
+def _open_bundle(
+    root: Path, index_key: str, expected_chunk_count: int | None, files: list[str]
+) -> tuple[Path, dict]:
+    """Locate the current bundle and validate it for the expected corpus.
+
+    Args:
+        root: Bundle root directory
+        index_key: Required index key
+        expected_chunk_count: Required chunk count (None = don't check)
+        files: Files the caller will read; each must be listed and match its size
+
+    Returns:
+        Tuple of (bundle directory, manifest)
+
+    Raises:
+        _BundleUnusable: If the bundle is missing, stale or corrupt
+    """
+    current = root / "CURRENT"
+    if not current.exists():
+        raise _BundleUnusable("no bundle")
+    bundle_dir = root / current.read_text(encoding="utf-8").strip()
+    manifest = _read_json(bundle_dir / "manifest.json")
+
+    if manifest.get("bundle_version") != BUNDLE_VERSION:
+        raise _BundleUnusable("bundle version mismatch")
+    if manifest.get("index_key") != index_key:
+        raise _BundleUnusable("index key mismatch")
+    if expected_chunk_count is not None and manifest.get("chunk_count") != expected_chunk_count:
+        raise _BundleUnusable("chunk count mismatch")
+
+    # Sizes catch truncated or rewritten files without hashing on every load;
+    # checksums are left to verify_index_bundle
+    listed = manifest.get("files", {})
+    for file_name in files:
+        if file_name not in listed:
+            raise _BundleUnusable(f"missing file: {file_name}")
+        if (bundle_dir / file_name).stat().st_size != listed[file_name]["size"]:
+            raise _BundleUnusable(f"size mismatch: {file_name}")
+
+    return bundle_dir, manifest
+
+
+def _unusable(root: Path, reason: str) -> None:
+    """Log why the bundle can't be used; callers fall back to a rebuild."""
+    logger.info("index_bundle_unusable", path=str(root), reason=reason)
+    return None
+
+
+def _sha256(path: Path) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_json(path: Path, payload: object) -> None:
+    """Write compact UTF-8 JSON."""
+    path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+
+def _read_json(path: Path) -> object:
+    """Read UTF-8 JSON."""
+    return json.loads(path.read_text(encoding="utf-8"))
@@ -0,0 +1,101 @@
+"""Hot reload of retrieval indexes in a long-running process (the Discord bot).
+
+`python -m src.cli ingest` runs as a separate process. Without this, the bot
+keeps serving the BM25 corpus, header index and keyword library it loaded at
+startup until it is restarted. The watcher polls the ingestion state and, once
+a new generation has settled, has the retriever build and swap in new indexes
+(RAGRetriever.reload_indexes) on a worker thread.
+
+A generation counts as settled when the ingest wrote its index bundle (the
+last step of every ingest) or when the state was unchanged for one poll, so a
+reload does not start halfway through an ingest run.
+"""
+
+import asyncio
+import contextlib
+
+from src.lib.constants import RAG_INDEX_RELOAD_INTERVAL_SECONDS
+from src.lib.logging import get_logger
+from src.services.rag.index_bundle import current_bundle_key
+from src.services.rag.ingestion_state import IngestionState
+from src.services.rag.retriever import RAGRetriever
+
+logger = get_logger(__name__)
+
+
+class IndexReloadWatcher:
+    """Background task that hot-reloads a retriever's indexes after an ingest."""
+
+    def __init__(
+        self,
+        retriever: RAGRetriever,
+        interval_s: float = RAG_INDEX_RELOAD_INTERVAL_SECONDS,
+    ):
+        """Initialize watcher.
+
+        Args:
+            retriever: Retriever whose indexes are reloaded
+            interval_s: Seconds between ingestion state checks
+        """
+        self.retriever = retriever
+        self.interval_s = interval_s
+        self.reloads = 0
+        self._pending_key: str | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start polling on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="index-reload-watcher")
+            logger.info("index_reload_watcher_started", interval_s=self.interval_s)
+
+    async def stop(self) -> None:
+        """Stop polling (an in-progress reload finishes on its worker thread)."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def check(self) -> bool:
+        """Reload the retriever's indexes if a new ingestion generation has settled.
+
+        Returns:
+            True if new indexes were swapped in
+        """
+        try:
+            index_key = IngestionState.load().index_key()
+        except Exception as e:
+            logger.warning("index_reload_check_failed", error=str(e))
+            return False
+
+        if index_key == self.retriever.index_key:
+            self._pending_key = None
+            return False
+
+        # The retriever's bundle being stamped with the new key marks a finished ingest
+        bundle_path = self.retriever.index_bundle_path
+        settled = index_key == self._pending_key or (
+            bundle_path is not None and current_bundle_key(bundle_path) == index_key
+        )
+        if not settled:
+            # Ingest may still be running; reload once the state stops changing
+            self._pending_key = index_key
+            logger.info("index_reload_pending", index_key=index_key[:16])
+            return False
+
+        self._pending_key = None
+        reloaded = await asyncio.to_thread(self.retriever.reload_indexes)
+        if reloaded:
+            self.reloads += 1
+        return reloaded
+
+    async def _run(self) -> None:
+        """Poll until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval_s)
+            try:
+                await self.check()
+            except Exception as e:
+                # Never let a failed reload take the watcher down
+                logger.error("index_reload_watcher_error", error=str(e))
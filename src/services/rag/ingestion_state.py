@@ -151,6 +151,22 @@ class IngestionState:
         tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
         tmp.replace(self.path)
 
+    def index_key(self) -> str:
+        """Key identifying the indexed corpus: fingerprint plus every file's content.
+
+        Changes whenever the config fingerprint changes or any file is ingested,
+        re-ingested or removed, so a derived artifact (the index bundle) stamped
+        with it is valid exactly as long as the vector store it was built from.
+        """
+        files = {
+            rel: [entry.get("hash"), entry.get("document_id"), entry.get("chunks")]
+            for rel, entry in self.files.items()
+        }
+        payload = json.dumps(
+            {"fingerprint": self.fingerprint, "files": files}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def is_stale(self) -> bool:
         """True when stored per-file hashes cannot be trusted (config changed / no state)."""
         return self.fingerprint != current_fingerprint()
@@ -3,7 +3,6 @@
 Implements ingest() method from specs/001-we-are-building/contracts/rag-pipeline.md
 """
 
-import asyncio
 import time
 from dataclasses import dataclass, field
 from uuid import UUID, uuid4, uuid5
@@ -12,9 +11,11 @@ from src.lib.constants import SUMMARY_ENABLED
 from src.lib.logging import get_logger
 from src.lib.pricing import calculate_llm_cost
 from src.models.rule_document import RuleDocument
+from src.services.llm.http_clients import run_closing_http_clients
 from src.services.rag.chunker import MarkdownChunk, MarkdownChunker
 from src.services.rag.embeddings import EmbeddingService
 from src.services.rag.keyword_extractor import KeywordExtractor
+from src.services.rag.retrieval_cache import SemanticRetrievalCache
 from src.services.rag.summarizer import ChunkSummarizer, summaries_complete
 from src.services.rag.vector_db import VectorDBService
 
@@ -72,6 +73,7 @@ class RAGIngestor:
         keyword_extractor: KeywordExtractor | None = None,
         summarizer: ChunkSummarizer | None = None,
         db_path: str | None = None,
+        retrieval_cache: SemanticRetrievalCache | None = None,
     ):
         """Initialize RAG ingestor.
 
@@ -82,12 +84,17 @@ class RAGIngestor:
             keyword_extractor: Keyword extractor (creates if None)
             summarizer: Chunk summarizer (creates if None and SUMMARY_ENABLED)
             db_path: Optional database path (only used if vector_db_service is None)
+            retrieval_cache: Retrieval cache to invalidate per re-ingested document,
+                for callers that retrieve in the same process (default: none; the
+                bot's cache lives in another process and is invalidated by its
+                index reload)
         """
         self.chunker = chunker or MarkdownChunker()
         self.embedding_service = embedding_service or EmbeddingService()
         self.vector_db = vector_db_service or VectorDBService(db_path=db_path)
         self.keyword_extractor = keyword_extractor or KeywordExtractor()
         self.summarizer = summarizer or (ChunkSummarizer() if SUMMARY_ENABLED else None)
+        self.retrieval_cache = retrieval_cache
 
         logger.info(
             "rag_ingestor_initialized", summary_generation_enabled=SUMMARY_ENABLED
@@ -151,6 +158,9 @@ class RAGIngestor:
                 # Check if document already exists (upsert logic)
                 # Delete existing embeddings for this document
                 deleted_count = self.vector_db.delete_by_document_id(document.document_id)
+                # Cached retrievals citing the old content must not be replayed
+                if self.retrieval_cache:
+                    self.retrieval_cache.invalidate(document.document_id)
                 if deleted_count > 0:
                     logger.info(
                         "document_updated",
@@ -185,7 +195,7 @@ class RAGIngestor:
                         cache_read_tokens,
                         cache_creation_tokens,
                         model,
-                    ) = asyncio.run(self.summarizer.generate_summaries(chunks))
+                    ) = run_closing_http_clients(self.summarizer.generate_summaries(chunks))
                     if prompt_tokens > 0:  # Only calculate cost if summary was generated
                         breakdown = calculate_llm_cost(
                             prompt_tokens,
@@ -344,7 +354,10 @@ class RAGIngestor:
             Number of embeddings deleted.
         """
         doc_uuid = document_id if isinstance(document_id, UUID) else UUID(str(document_id))
-        return self.vector_db.delete_by_document_id(doc_uuid)
+        deleted_count = self.vector_db.delete_by_document_id(doc_uuid)
+        if self.retrieval_cache:
+            self.retrieval_cache.invalidate(doc_uuid)
+        return deleted_count
 
     @staticmethod
     def assign_chunk_ids(document: RuleDocument, chunks: list[MarkdownChunk]) -> None:
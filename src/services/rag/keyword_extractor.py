@@ -2,37 +2,55 @@
 
 Automatically extracts game-specific keywords from rule documents during ingestion
 to enable case-insensitive query matching.
+
+The library is compiled into a token trie whenever it changes, so normalizing a
+query is one greedy longest-match pass over its words regardless of library
+size, and multi-word keywords ("Seek Light") are matched as phrases.
 """
 
 import json
 import re
 from pathlib import Path
+from typing import Any
 
-from src.lib.constants import RAG_KEYWORD_CACHE_PATH
+from src.lib.constants import RAG_KEYWORD_CACHE_PATH, RAG_KEYWORD_MAX_PHRASE_WORDS
 from src.lib.logging import get_logger
 from src.services.rag.chunker import MarkdownChunk
 
 logger = get_logger(__name__)
 
+# Punctuation stripped from query words before keyword lookup (kept in the output)
+_WORD_PUNCTUATION = ".,!?;:()[]{}\"'-"
+_TERMINAL = None  # Trie key holding the canonical keyword of a phrase ending at that node
+
 
 class KeywordExtractor:
     """Extracts and manages game-specific keywords for query normalization."""
 
-    def __init__(self, cache_path: str = RAG_KEYWORD_CACHE_PATH):
+    def __init__(
+        self, cache_path: str = RAG_KEYWORD_CACHE_PATH, keywords: set[str] | None = None
+    ):
         """Initialize keyword extractor.
 
         Args:
             cache_path: Path to keyword cache file
+            keywords: Preloaded keyword library (e.g. from the index bundle);
+                skips reading cache_path when given
         """
         self.cache_path = Path(cache_path)
         self.keywords: set[str] = set()
+        self._keyword_trie: dict[Any, Any] = {}
 
         # Load existing keywords if cache exists
-        if self.cache_path.exists():
+        if keywords is not None:
+            self.keywords = set(keywords)
+        elif self.cache_path.exists():
             self._load_keywords()
         else:
             logger.info("keyword_cache_not_found", path=str(self.cache_path))
 
+        self._compile_keywords()
+
     def extract_from_chunks(self, chunks: list[MarkdownChunk]) -> set[str]:
         """Extract keywords from document chunks.
 
@@ -70,6 +88,7 @@ class KeywordExtractor:
         - "Balanced" -> ["Balanced"]
         - "Lethal 5+" -> ["Lethal"]
         - "VESPID STINGWINGS - FLY" -> ["VESPID", "STINGWINGS"] (FLY filtered out)
+        - "Seek Light" -> ["Seek Light", "Seek", "Light"]
 
         Args:
             header: Header text (without ## prefix)
@@ -101,6 +120,13 @@ class KeywordExtractor:
 
         # Pattern 3: Single capitalized word
         words = header.split()
+
+        # Multi-word rule names ("Seek Light", "Shoot Twice") are kept as phrases too
+        if 2 <= len(words) <= RAG_KEYWORD_MAX_PHRASE_WORDS and all(
+            word[0].isupper() and word.isalpha() for word in words
+        ):
+            keywords.add(" ".join(words))
+
         for word in words:
             # Only add words that start with uppercase and are at least 4 chars
             # This filters out articles, prepositions, short words, etc.
@@ -123,6 +149,7 @@ class KeywordExtractor:
         added_count = len(self.keywords) - initial_count
 
         if added_count > 0:
+            self._compile_keywords()
             logger.info("keywords_added", count=added_count, total=len(self.keywords))
 
         return added_count
@@ -136,6 +163,7 @@ class KeywordExtractor:
         """
         logger.info("keywords_cleared", previous_count=len(self.keywords))
         self.keywords = set()
+        self._compile_keywords()
         self.save_keywords()
 
     def save_keywords(self) -> None:
@@ -178,10 +206,27 @@ class KeywordExtractor:
         """
         return self.keywords.copy()
 
+    def _compile_keywords(self) -> None:
+        """Compile the library into a trie of lowercased words (on every change)."""
+        trie: dict[Any, Any] = {}
+        # Sorted so that keywords differing only in case resolve deterministically
+        for keyword in sorted(self.keywords):
+            words = keyword.lower().split()
+            if not words:
+                continue
+            node = trie
+            for word in words:
+                node = node.setdefault(word, {})
+            node[_TERMINAL] = keyword
+        self._keyword_trie = trie
+
     def normalize_query(self, query: str) -> str:
         """Normalize query by capitalizing known keywords.
 
-        Case-insensitive matching against keyword library.
+        Case-insensitive, greedy longest match against the compiled keyword
+        trie, so multi-word keywords win over their single words. Punctuation
+        around a matched word or phrase is preserved; a phrase cannot span
+        punctuation between its words.
 
         Args:
             query: User query string
@@ -189,29 +234,44 @@ class KeywordExtractor:
         Returns:
             Normalized query with capitalized keywords
         """
-        if not self.keywords:
+        if not self._keyword_trie:
             return query
 
-        # Create lowercase lookup map
-        keyword_map = {kw.lower(): kw for kw in self.keywords}
-
         # Split query into words (preserve punctuation structure)
         words = query.split()
+        lowered = [word.strip(_WORD_PUNCTUATION).lower() for word in words]
+        leading_len = [len(word) - len(word.lstrip(_WORD_PUNCTUATION)) for word in words]
+        trailing_len = [len(word) - len(word.rstrip(_WORD_PUNCTUATION)) for word in words]
         normalized_words = []
 
-        for word in words:
-            # Extract the actual word (strip punctuation)
-            clean_word = word.strip(".,!?;:()[]{}\"'-")
-            word_lower = clean_word.lower()
-
-            # Check if word matches a keyword
-            if word_lower in keyword_map:
-                # Replace with capitalized version, preserving surrounding punctuation
-                original_keyword = keyword_map[word_lower]
-                normalized_word = word.replace(clean_word, original_keyword)
-                normalized_words.append(normalized_word)
-            else:
-                normalized_words.append(word)
+        i = 0
+        while i < len(words):
+            # Longest keyword phrase starting at word i
+            node = self._keyword_trie
+            match_end, keyword = 0, None
+            j = i
+            while j < len(words):
+                # Inner phrase boundaries must not carry punctuation
+                if j > i and (trailing_len[j - 1] or leading_len[j]):
+                    break
+                node = node.get(lowered[j])
+                if node is None:
+                    break
+                j += 1
+                if _TERMINAL in node:
+                    match_end, keyword = j, node[_TERMINAL]
+
+            if keyword is None:
+                normalized_words.append(words[i])
+                i += 1
+                continue
+
+            # Replace with canonical version, preserving surrounding punctuation
+            last = words[match_end - 1]
+            leading = words[i][: leading_len[i]]
+            trailing = last[len(last) - trailing_len[match_end - 1]:]
+            normalized_words.append(leading + keyword + trailing)
+            i = match_end
 
         normalized_query = " ".join(normalized_words)
 
@@ -0,0 +1,373 @@
+"""Exact in-process vector search over a contiguous embedding matrix.
+
+The rules corpus is ~1.5k chunks. At that size one float32 matrix multiply is
+faster than Chroma's HNSW query plus its SQLite metadata fetch, and it is exact
+rather than approximate. MatrixVectorDBService is a drop-in replacement for
+VectorDBService (select with VECTOR_DB_BACKEND=matrix):
+
+- Reads (`query`, `get_count`) are answered from an in-memory matrix and a
+  parallel chunk table (ids, documents, metadatas).
+- Writes go to the wrapped Chroma collection, which stays the source of truth,
+  and are applied to the matrix so it stays in sync.
+- At startup the matrix is memory-mapped from the index bundle written by
+  ingestion when the bundle matches the ingested corpus, otherwise it is
+  loaded from Chroma in one `collection.get`.
+
+Results use Chroma's result layout and distance (squared L2), so
+RAGRetriever._results_to_hits works unchanged.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+from src.lib.constants import RAG_INDEX_BUNDLE_PATH
+from src.lib.logging import get_logger
+from src.services.rag.index_bundle import load_bundle_vectors
+from src.services.rag.ingestion_state import IngestionState
+from src.services.rag.vector_db import VectorDBService
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class _VectorTable:
+    """Immutable snapshot: writes build a new table, so queries never see a partial update."""
+
+    ids: list[str]
+    documents: list[str]
+    metadatas: list[dict[str, Any]]
+    matrix: np.ndarray  # (n, dim) float32, possibly a read-only memory map
+    sq_norms: np.ndarray  # (n,) squared row norms
+
+    @classmethod
+    def build(
+        cls,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+        matrix: np.ndarray,
+    ) -> "_VectorTable":
+        matrix = np.asanyarray(matrix, dtype=np.float32)  # Keeps a memory map mapped
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(len(ids), -1)
+        return cls(
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas,
+            matrix=matrix,
+            sq_norms=np.einsum("ij,ij->i", matrix, matrix),
+        )
+
+
+class MatrixVectorDBService:
+    """VectorDBService-compatible backend with exact top-k over a NumPy matrix."""
+
+    def __init__(
+        self,
+        collection_name: str = "kill_team_rules",
+        db_path: str | None = None,
+        chroma: VectorDBService | None = None,
+        bundle_path: str | None = RAG_INDEX_BUNDLE_PATH,
+    ):
+        """Initialize matrix vector DB service.
+
+        Args:
+            collection_name: Name of the Chroma collection (source of truth)
+            db_path: Optional path to Chroma database (defaults to config path)
+            chroma: Existing Chroma service to wrap (creates if None)
+            bundle_path: Index bundle to memory-map the matrix from (None = always
+                load from Chroma)
+        """
+        self.chroma = chroma or VectorDBService(collection_name=collection_name, db_path=db_path)
+        self.bundle_path = bundle_path
+        self._table = self._load_table()
+
+        logger.info(
+            "matrix_vector_db_initialized",
+            count=len(self._table.ids),
+            dimensions=self._table.matrix.shape[1] if len(self._table.ids) else 0,
+            memory_mapped=isinstance(self._table.matrix, np.memmap),
+        )
+
+    @property
+    def collection(self):
+        """Underlying Chroma collection (for callers that read it directly)."""
+        return self.chroma.collection
+
+    def add_embeddings(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Add embeddings to Chroma and the matrix.
+
+        Args:
+            ids: List of unique IDs (typically chunk UUIDs as strings)
+            embeddings: List of embedding vectors
+            documents: List of document texts
+            metadatas: List of metadata dictionaries
+
+        Raises:
+            ValueError: If input lists have different lengths
+        """
+        self.chroma.add_embeddings(ids, embeddings, documents, metadatas)
+        self._apply_upsert(ids, embeddings, documents, metadatas)
+
+    def upsert_embeddings(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Upsert embeddings in Chroma and the matrix.
+
+        Args:
+            ids: List of unique IDs
+            embeddings: List of embedding vectors
+            documents: List of document texts
+            metadatas: List of metadata dictionaries
+        """
+        self.chroma.upsert_embeddings(ids, embeddings, documents, metadatas)
+        self._apply_upsert(ids, embeddings, documents, metadatas)
+
+    def query(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Exact nearest-neighbour search.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            n_results: Number of results to return per query
+            where: Metadata filter (Chroma syntax: equality, $eq/$ne/$in/$nin,
+                $and/$or)
+            include: Result fields to return besides ids (default: documents,
+                metadatas and distances)
+
+        Returns:
+            Query results dictionary with ids, documents, metadatas, distances
+            (squared L2, nearest first; fields not included are None)
+        """
+        table = self._table
+        fields = set(include) if include is not None else {"documents", "metadatas", "distances"}
+        result: dict[str, Any] = {
+            key: [] if key == "ids" or key in fields else None
+            for key in ("ids", "documents", "metadatas", "distances")
+        }
+
+        rows = np.arange(len(table.ids))
+        if where:
+            rows = np.array(
+                [row for row in rows if _matches(table.metadatas[row], where)], dtype=np.int64
+            )
+
+        if not len(rows) or n_results <= 0:
+            for key, value in result.items():
+                if value is not None:
+                    result[key] = [[] for _ in query_embeddings]
+            return result
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        matrix = table.matrix if len(rows) == len(table.ids) else table.matrix[rows]
+        sq_norms = table.sq_norms if len(rows) == len(table.ids) else table.sq_norms[rows]
+
+        # ||q - x||^2 = ||q||^2 + ||x||^2 - 2 q.x, one matmul for every query
+        distances = (
+            np.einsum("ij,ij->i", queries, queries)[:, None] + sq_norms[None, :]
+            - 2.0 * (queries @ matrix.T)
+        )
+        np.maximum(distances, 0.0, out=distances)
+
+        k = min(n_results, len(rows))
+        for query_distances in distances:
+            if k < len(rows):
+                candidates = np.argpartition(query_distances, k - 1)[:k]
+            else:
+                candidates = np.arange(len(rows))
+            order = candidates[np.lexsort((candidates, query_distances[candidates]))]
+            top_rows = rows[order]
+            result["ids"].append([table.ids[row] for row in top_rows])
+            if "documents" in fields:
+                result["documents"].append([table.documents[row] for row in top_rows])
+            if "metadatas" in fields:
+                result["metadatas"].append([table.metadatas[row] for row in top_rows])
+            if "distances" in fields:
+                result["distances"].append(query_distances[order].astype(float).tolist())
+
+        logger.debug(
+            "vector_db_queried",
+            n_queries=len(query_embeddings),
+            n_results=n_results,
+            has_filter=where is not None,
+            backend="matrix",
+        )
+
+        return result
+
+    def delete_by_document_id(self, document_id: UUID) -> int:
+        """Delete all embeddings for a document from Chroma and the matrix.
+
+        Args:
+            document_id: Document UUID
+
+        Returns:
+            Number of embeddings deleted
+        """
+        count = self.chroma.delete_by_document_id(document_id)
+
+        doc_id_str = str(document_id)
+        table = self._table
+        keep = [
+            row for row, metadata in enumerate(table.metadatas)
+            if metadata.get("document_id") != doc_id_str
+        ]
+        if len(keep) != len(table.ids):
+            self._table = _VectorTable.build(
+                [table.ids[row] for row in keep],
+                [table.documents[row] for row in keep],
+                [table.metadatas[row] for row in keep],
+                table.matrix[keep],
+            )
+
+        return count
+
+    def get_count(self) -> int:
+        """Get total number of embeddings.
+
+        Returns:
+            Number of embeddings
+        """
+        return len(self._table.ids)
+
+    def reset(self) -> None:
+        """Reset the collection (delete all data).
+
+        Warning: This is destructive and cannot be undone.
+        """
+        self.chroma.reset()
+        self._table = _VectorTable.build([], [], [], np.empty((0, 0), dtype=np.float32))
+
+    def reloaded(self) -> "MatrixVectorDBService":
+        """New service over the matrix another process (e.g. `ingest`) wrote to Chroma.
+
+        The new table is built on a separate service instance, so queries
+        holding this one finish on the old matrix.
+        """
+        service = MatrixVectorDBService(chroma=self.chroma, bundle_path=self.bundle_path)
+        logger.info("matrix_vector_db_reloaded", count=len(service._table.ids))
+        return service
+
+    def _load_table(self) -> _VectorTable:
+        """Memory-map the matrix from the index bundle, or load it from Chroma."""
+        if self.bundle_path:
+            try:
+                vectors = load_bundle_vectors(
+                    IngestionState.load().index_key(),
+                    expected_chunk_count=self.chroma.get_count(),
+                    path=self.bundle_path,
+                )
+            except Exception as e:
+                logger.warning("bundle_vectors_check_failed", error=str(e))
+                vectors = None
+            if vectors:
+                return _VectorTable.build(
+                    vectors.ids, vectors.documents, vectors.metadatas, vectors.embeddings
+                )
+
+        results = self.chroma.collection.get(include=["embeddings", "documents", "metadatas"])
+        if not results["ids"]:
+            return _VectorTable.build([], [], [], np.empty((0, 0), dtype=np.float32))
+        return _VectorTable.build(
+            list(results["ids"]),
+            list(results["documents"]),
+            list(results["metadatas"]),
+            np.asarray(results["embeddings"], dtype=np.float32),
+        )
+
+    def _apply_upsert(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Mirror a Chroma upsert into a new table (replace existing rows, append new)."""
+        table = self._table
+        new_vectors = np.asarray(embeddings, dtype=np.float32)
+        row_of = {chunk_id: row for row, chunk_id in enumerate(table.ids)}
+
+        out_ids = list(table.ids)
+        out_documents = list(table.documents)
+        out_metadatas = list(table.metadatas)
+        if len(table.ids):
+            matrix = np.array(table.matrix)  # Writable copy (the original may be memory-mapped)
+        else:
+            matrix = np.empty((0, new_vectors.shape[1]), dtype=np.float32)
+
+        appended: list[int] = []
+        for i, chunk_id in enumerate(ids):
+            row = row_of.get(chunk_id)
+            if row is None:
+                row_of[chunk_id] = len(out_ids)
+                out_ids.append(chunk_id)
+                out_documents.append(documents[i])
+                out_metadatas.append(metadatas[i])
+                appended.append(i)
+            else:
+                out_documents[row] = documents[i]
+                out_metadatas[row] = metadatas[i]
+                matrix[row] = new_vectors[i]
+
+        if appended:
+            matrix = np.vstack([matrix, new_vectors[appended]])
+
+        self._table = _VectorTable.build(out_ids, out_documents, out_metadatas, matrix)
+
+
+def _matches(metadata: dict[str, Any], where: dict[str, Any]) -> bool:
+    """Evaluate a Chroma `where` filter against one metadata dict.
+
+    Args:
+        metadata: Chunk metadata
+        where: Filter in Chroma syntax
+
+    Returns:
+        True if the metadata satisfies the filter
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator
+    """
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(_matches(metadata, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(metadata, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for op, operand in condition.items():
+                if op == "$eq":
+                    ok = value == operand
+                elif op == "$ne":
+                    ok = value != operand
+                elif op == "$in":
+                    ok = value in operand
+                elif op == "$nin":
+                    ok = value not in operand
+                else:
+                    raise ValueError(f"Unsupported where operator: {op}")
+                if not ok:
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
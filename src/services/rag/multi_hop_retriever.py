@@ -17,12 +17,16 @@ from src.lib.constants import (
     LLM_MAX_RETRIES,
     MAX_CHUNK_LENGTH_FOR_EVALUATION,
     RAG_HOP_CHUNK_LIMIT,
+    RAG_HOP_EVAL_CACHE_ENABLED,
     RAG_HOP_EVALUATION_MAX_TOKENS,
     RAG_HOP_EVALUATION_MODEL,
     RAG_HOP_EVALUATION_PROMPT_PATH,
     RAG_HOP_EVALUATION_TIMEOUT,
+    RAG_HOP_FALLBACK_MODE,
+    RAG_HOP_PREFETCH_ENABLED,
     RAG_HOP_RATE_LIMIT_DELAY,
     RAG_MAX_HOPS,
+    RRF_K,
     RULES_STRUCTURE_PATH,
     TEAMS_STRUCTURE_PATH,
 )
@@ -32,6 +36,13 @@ from src.models.rag_request import RetrieveRequest
 from src.services.llm.base import GenerationConfig, GenerationRequest, RateLimitError
 from src.services.llm.factory import LLMProviderFactory
 from src.services.rag.hop_cost_calculator import calculate_hop_evaluation_cost
+from src.services.rag.hop_evaluation_cache import (
+    HopEvaluationCache,
+    get_hop_evaluation_cache,
+    make_evaluation_key,
+)
+from src.services.rag.hop_prefetch import HopPrefetcher
+from src.services.rag.hop_prompt import HopPromptBuilder
 from src.services.rag.team_filtering import TeamFilter
 
 logger = get_logger(__name__)
@@ -52,6 +63,10 @@ class HopEvaluation:
         filled_prompt: str | list[dict[str, Any]] | None = None,
         filtered_teams_count: int = 0,
         served_model: str | None = None,
+        from_cache: bool = False,
+        saved_cost_usd: float = 0.0,
+        saved_time_s: float = 0.0,
+        title_chunk_ids: dict[str, list[str]] | None = None,
     ):
         self.can_answer = can_answer
         self.reasoning = reasoning
@@ -63,6 +78,11 @@ class HopEvaluation:
         self.filled_prompt = filled_prompt  # Optional: filled prompt for verbose output
         self.filtered_teams_count = filtered_teams_count  # Number of teams after filtering
         self.served_model = served_model  # Model provider actually served (alias may redirect)
+        self.from_cache = from_cache  # Verdict reused from the hop evaluation cache
+        self.saved_cost_usd = saved_cost_usd  # LLM cost the cache hit avoided
+        self.saved_time_s = saved_time_s  # LLM latency the cache hit avoided
+        # Hop title -> ids of the chunks retrieved for it (header match or semantic)
+        self.title_chunk_ids = title_chunk_ids or {}
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for database storage."""
@@ -76,6 +96,10 @@ class HopEvaluation:
             "evaluation_time_s": self.evaluation_time_s,
             "filtered_teams_count": self.filtered_teams_count,
             "served_model": self.served_model,
+            "from_cache": self.from_cache,
+            "saved_cost_usd": self.saved_cost_usd,
+            "saved_time_s": self.saved_time_s,
+            "title_chunk_ids": self.title_chunk_ids,
         }
 
 
@@ -89,6 +113,10 @@ class MultiHopRetriever:
         chunks_per_hop: int = RAG_HOP_CHUNK_LIMIT,
         evaluation_model: str = RAG_HOP_EVALUATION_MODEL,
         evaluation_timeout: int = RAG_HOP_EVALUATION_TIMEOUT,
+        enable_prefetch: bool = RAG_HOP_PREFETCH_ENABLED,
+        evaluation_cache: HopEvaluationCache | None = None,
+        use_evaluation_cache: bool = RAG_HOP_EVAL_CACHE_ENABLED,
+        fallback_mode: str = RAG_HOP_FALLBACK_MODE,
     ):
         """Initialize multi-hop retriever.
 
@@ -98,11 +126,22 @@ class MultiHopRetriever:
             chunks_per_hop: Maximum chunks to retrieve per hop
             evaluation_model: LLM model for context evaluation
             evaluation_timeout: Timeout for evaluation LLM call (seconds)
+            enable_prefetch: Resolve rule names mentioned in the retrieved chunks
+                while the evaluation LLM call is in flight
+            evaluation_cache: Cache of hop evaluation verdicts (default: global cache)
+            use_evaluation_cache: Reuse verdicts of identical evaluations
+            fallback_mode: Semantic fallback for unmatched hop titles ("batched" or "joined")
         """
         self.base_retriever = base_retriever
         self.max_hops = max_hops
         self.chunks_per_hop = chunks_per_hop
         self.evaluation_timeout = evaluation_timeout
+        self.enable_prefetch = enable_prefetch
+        self.evaluation_model = evaluation_model
+        self.fallback_mode = fallback_mode
+        self.evaluation_cache = (
+            (evaluation_cache or get_hop_evaluation_cache()) if use_evaluation_cache else None
+        )
 
         # Initialize evaluation LLM
         self.evaluation_llm = LLMProviderFactory.create(evaluation_model)
@@ -117,7 +156,13 @@ class MultiHopRetriever:
             TeamFilter(self.teams_structure_dict) if self.teams_structure_dict else None
         )
 
-        # Collects non-fatal errors from last retrieve_multi_hop call (test observability)
+        # Structures serialized once; each hop only joins pre-built fragments
+        self.prompt_builder = HopPromptBuilder(
+            self.evaluation_prompt_template, self.rules_structure_dict, self.teams_structure_dict
+        )
+
+        # Non-fatal errors of the last finished retrieve_multi_hop call (test
+        # observability; concurrent callers pass their own hop_errors list)
         self.last_hop_errors: list[str] = []
 
         logger.info(
@@ -159,6 +204,7 @@ class MultiHopRetriever:
         query_id: UUID,
         initial_chunks: list[DocumentChunk] | None = None,
         verbose: bool = False,
+        hop_errors: list[str] | None = None,
     ) -> tuple[RAGContext, list[HopEvaluation], dict[UUID, int]]:
         """Perform multi-hop retrieval with LLM-guided context evaluation.
 
@@ -168,6 +214,9 @@ class MultiHopRetriever:
             query_id: Query UUID
             initial_chunks: Optional initial chunks from Hop 0 (if already retrieved)
             verbose: If True, capture filled prompts in HopEvaluation objects
+            hop_errors: Caller-owned list that receives this call's non-fatal
+                hop errors. Concurrent callers must use this rather than
+                last_hop_errors, which another call may overwrite meanwhile.
 
         Returns:
             Tuple of:
@@ -178,7 +227,8 @@ class MultiHopRetriever:
         accumulated_chunks: list[DocumentChunk] = []
         hop_evaluations: list[HopEvaluation] = []
         chunk_hop_map: dict[UUID, int] = {}
-        self.last_hop_errors = []
+        if hop_errors is None:
+            hop_errors = []
 
         logger.info("multi_hop_started", query=query, max_hops=self.max_hops)
 
@@ -204,7 +254,10 @@ class MultiHopRetriever:
                 use_multi_hop=False,  # Prevent infinite recursion
             )
 
-            initial_context, _, _ = self.base_retriever.retrieve(initial_request, query_id)
+            # Sync retrieval runs in a worker thread so the caller's event loop stays free
+            initial_context, _, _ = await asyncio.to_thread(
+                self.base_retriever.retrieve, initial_request, query_id
+            )
             accumulated_chunks.extend(initial_context.document_chunks)
 
             # Track hop 0 chunks
@@ -217,76 +270,89 @@ class MultiHopRetriever:
                 avg_relevance=initial_context.avg_relevance,
             )
 
-        # Iterative hops (1 to max_hops)
-        for hop_num in range(1, self.max_hops + 1):
-            # Evaluate context: can we answer?
-            try:
-                evaluation = await self._evaluate_context(
-                    user_query=query, retrieved_chunks=accumulated_chunks, verbose=verbose
-                )
+        # Speculatively resolves titles the judge is likely to ask for
+        prefetcher = (
+            HopPrefetcher(self.base_retriever.retrieve_by_headers) if self.enable_prefetch else None
+        )
+
+        # Cancellation (retrieval timeout) must not leave prefetch tasks running
+        try:
+            # Iterative hops (1 to max_hops)
+            for hop_num in range(1, self.max_hops + 1):
+                # Evaluate context: can we answer?
+                try:
+                    if prefetcher:
+                        prefetcher.start(accumulated_chunks)
 
-                hop_evaluations.append(evaluation)
+                    evaluation = await self._evaluate_context(
+                        user_query=query, retrieved_chunks=accumulated_chunks, verbose=verbose
+                    )
 
-                logger.info(
-                    "multi_hop_evaluation",
-                    hop=hop_num,
-                    can_answer=evaluation.can_answer,
-                    reasoning=evaluation.reasoning,
-                )
+                    hop_evaluations.append(evaluation)
 
-                # If LLM says "ready to answer", stop hopping
-                if evaluation.can_answer:
                     logger.info(
-                        "multi_hop_complete",
-                        total_hops=hop_num - 1,
-                        total_chunks=len(accumulated_chunks),
-                        reason="sufficient_context",
+                        "multi_hop_evaluation",
+                        hop=hop_num,
+                        can_answer=evaluation.can_answer,
+                        reasoning=evaluation.reasoning,
                     )
-                    break
 
-                # Retrieve additional context with focused query
-                if not evaluation.missing_query:
-                    logger.warning(
-                        "multi_hop_missing_query_null", hop=hop_num, evaluation=evaluation.reasoning
+                    # If LLM says "ready to answer", stop hopping
+                    if evaluation.can_answer:
+                        logger.info(
+                            "multi_hop_complete",
+                            total_hops=hop_num - 1,
+                            total_chunks=len(accumulated_chunks),
+                            reason="sufficient_context",
+                        )
+                        break
+
+                    # Retrieve additional context with focused query
+                    if not evaluation.missing_query:
+                        logger.warning(
+                            "multi_hop_missing_query_null", hop=hop_num, evaluation=evaluation.reasoning
+                        )
+                        break
+
+                    # Use header-based lookup with semantic fallback
+                    retrieval_start = time.time()
+                    new_chunks, evaluation.title_chunk_ids = await self._retrieve_for_hop(
+                        evaluation.missing_query, context_key, query_id, prefetcher=prefetcher
                     )
-                    break
+                    evaluation.retrieval_time_s = time.time() - retrieval_start
 
-                # Use header-based lookup with semantic fallback
-                retrieval_start = time.time()
-                new_chunks = await self._retrieve_for_hop(
-                    evaluation.missing_query, context_key, query_id
-                )
-                evaluation.retrieval_time_s = time.time() - retrieval_start
-
-                # Deduplicate against accumulated chunks
-                existing_ids = {c.chunk_id for c in accumulated_chunks}
-                new_unique_chunks = [c for c in new_chunks if c.chunk_id not in existing_ids]
+                    # Deduplicate against accumulated chunks
+                    existing_ids = {c.chunk_id for c in accumulated_chunks}
+                    new_unique_chunks = [c for c in new_chunks if c.chunk_id not in existing_ids]
 
-                # Track hop number for new chunks
-                for chunk in new_unique_chunks:
-                    chunk_hop_map[chunk.chunk_id] = hop_num
+                    # Track hop number for new chunks
+                    for chunk in new_unique_chunks:
+                        chunk_hop_map[chunk.chunk_id] = hop_num
 
-                accumulated_chunks.extend(new_unique_chunks)
+                    accumulated_chunks.extend(new_unique_chunks)
 
-                logger.info(
-                    "multi_hop_retrieval",
-                    hop=hop_num,
-                    query=evaluation.missing_query,
-                    chunks_retrieved=len(new_chunks),
-                    new_unique_chunks=len(new_unique_chunks),
-                    total_chunks=len(accumulated_chunks),
-                )
+                    logger.info(
+                        "multi_hop_retrieval",
+                        hop=hop_num,
+                        query=evaluation.missing_query,
+                        chunks_retrieved=len(new_chunks),
+                        new_unique_chunks=len(new_unique_chunks),
+                        total_chunks=len(accumulated_chunks),
+                    )
 
-            except Exception as e:
-                logger.error(
-                    "multi_hop_evaluation_failed",
-                    hop=hop_num,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                self.last_hop_errors.append(f"hop {hop_num}: {type(e).__name__}: {e}")
-                # Proceed with what we have
-                break
+                except Exception as e:
+                    logger.error(
+                        "multi_hop_evaluation_failed",
+                        hop=hop_num,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                    hop_errors.append(f"hop {hop_num}: {type(e).__name__}: {e}")
+                    # Proceed with what we have
+                    break
+        finally:
+            if prefetcher:
+                prefetcher.close()
 
         # If MAX_HOPS reached but can't answer, proceed anyway (Option A)
         if hop_evaluations and not hop_evaluations[-1].can_answer:
@@ -307,6 +373,8 @@ class MultiHopRetriever:
             avg_relevance=final_context.avg_relevance,
         )
 
+        # Published for sequential callers (RAG test runner)
+        self.last_hop_errors = list(hop_errors)
         return final_context, hop_evaluations, chunk_hop_map
 
     async def _evaluate_context(
@@ -327,15 +395,26 @@ class MultiHopRetriever:
             TimeoutError: If evaluation exceeds timeout
             RateLimitError: If rate limit is hit after all retries
         """
+        # Identical evaluations (same query, chunks, prompt, model) reuse the verdict
+        cache_key, generation = self._evaluation_cache_key(user_query, retrieved_chunks)
+        if cache_key and not verbose:
+            lookup_start = time.time()
+            # SQLite tier: keep it off the event loop
+            cached = await asyncio.to_thread(self.evaluation_cache.get, cache_key, generation)
+            if cached is not None:
+                return self._evaluation_from_cache(cached, time.time() - lookup_start)
+
         # Format chunks for prompt
         chunks_text = self._format_chunks_for_prompt(retrieved_chunks)
 
         # Filter teams structure based on query
         filtered_teams = self.teams_structure_dict
         relevant_teams = []
+        teams_structure_text = self.prompt_builder.team_structure_text(None)
         if self.team_filter:
             relevant_teams = self.team_filter.extract_relevant_teams(user_query)
             filtered_teams = self.team_filter.filter_structure(relevant_teams)
+            teams_structure_text = self.prompt_builder.team_structure_text(list(filtered_teams))
 
             # Log team filtering results
             logger.info(
@@ -351,35 +430,22 @@ class MultiHopRetriever:
                 else 0,
             )
 
-        # Convert structures to YAML text
-        rules_structure_text = yaml.dump(
-            self.rules_structure_dict,
-            default_flow_style=False,
-            allow_unicode=True,
-            width=120,
-            indent=2,
-        )
-        teams_structure_text = yaml.dump(
-            filtered_teams, default_flow_style=False, allow_unicode=True, width=120, indent=2
-        )
-
-        # Fill prompt template with structures
-        filled = self.evaluation_prompt_template.format(
-            user_query=user_query,
-            retrieved_chunks=chunks_text,
-            rule_structure=rules_structure_text,
-            team_structure=teams_structure_text,
-        )
+        # Fill prompt template (rules structure is already part of the static prefix)
+        prompt_values = {
+            "user_query": user_query,
+            "retrieved_chunks": chunks_text,
+            "team_structure": teams_structure_text,
+        }
 
         # For Claude: split on CACHE_BREAK_MARKER → cache-control blocks.
         # For all other providers: strip the marker and use plain string.
         from src.services.llm.claude import ClaudeAdapter
-        from src.services.llm.prompt_builder import split_user_prompt_for_cache, strip_cache_markers
+        from src.services.llm.prompt_builder import strip_cache_markers
 
         if isinstance(self.evaluation_llm, ClaudeAdapter):
-            prompt = split_user_prompt_for_cache(filled)
+            prompt = self.prompt_builder.build_for_claude(**prompt_values)
         else:
-            prompt = strip_cache_markers(filled)
+            prompt = strip_cache_markers(self.prompt_builder.fill(**prompt_values))
 
         # Call evaluation LLM with hop evaluation schema
         request = GenerationRequest(
@@ -437,7 +503,7 @@ class MultiHopRetriever:
                 # Calculate evaluation time (only the successful attempt)
                 evaluation_time_s = time.time() - eval_start
 
-                return HopEvaluation(
+                evaluation = HopEvaluation(
                     can_answer=data["can_answer"],
                     reasoning=data["reasoning"],
                     missing_query=data.get("missing_query"),
@@ -448,6 +514,11 @@ class MultiHopRetriever:
                     filtered_teams_count=len(relevant_teams),
                     served_model=response.model_version or RAG_HOP_EVALUATION_MODEL,
                 )
+                if cache_key:
+                    await asyncio.to_thread(
+                        self.evaluation_cache.put, cache_key, generation, evaluation.to_dict()
+                    )
+                return evaluation
 
             except RateLimitError as e:
                 last_error = e
@@ -488,6 +559,59 @@ class MultiHopRetriever:
             raise last_error
         raise RuntimeError("Unexpected error in hop evaluation retry loop")
 
+    def _evaluation_cache_key(
+        self, user_query: str, retrieved_chunks: list[DocumentChunk]
+    ) -> tuple[str | None, str | None]:
+        """Hop evaluation cache key and ingestion generation of an evaluation.
+
+        Args:
+            user_query: Original user question
+            retrieved_chunks: Chunks shown to the judge
+
+        Returns:
+            (key, generation), or (None, None) if the verdict must not be cached
+            (cache disabled, or the corpus generation is unknown)
+        """
+        generation = getattr(self.base_retriever, "index_key", None)
+        if not self.evaluation_cache or not isinstance(generation, str):
+            return None, None
+
+        key = make_evaluation_key(
+            user_query,
+            (chunk.chunk_id for chunk in retrieved_chunks),
+            self.prompt_builder.fingerprint,
+            self.evaluation_model,
+        )
+        return key, generation
+
+    def _evaluation_from_cache(self, cached: dict[str, Any], lookup_time_s: float) -> HopEvaluation:
+        """Build the HopEvaluation of a cache hit.
+
+        Args:
+            cached: to_dict() of the evaluation that was cached
+            lookup_time_s: Time spent on the cache lookup
+
+        Returns:
+            HopEvaluation with no LLM cost and the avoided cost/latency as savings
+        """
+        logger.info(
+            "hop_evaluation_cache_hit",
+            can_answer=cached["can_answer"],
+            saved_cost_usd=cached.get("cost_usd", 0.0),
+            saved_time_s=cached.get("evaluation_time_s", 0.0),
+        )
+        return HopEvaluation(
+            can_answer=cached["can_answer"],
+            reasoning=cached["reasoning"],
+            missing_query=cached.get("missing_query"),
+            evaluation_time_s=lookup_time_s,
+            filtered_teams_count=cached.get("filtered_teams_count", 0),
+            served_model=cached.get("served_model"),
+            from_cache=True,
+            saved_cost_usd=cached.get("cost_usd", 0.0),
+            saved_time_s=cached.get("evaluation_time_s", 0.0),
+        )
+
     def _format_chunks_for_prompt(self, chunks: list[DocumentChunk]) -> str:
         """Format chunks as numbered list for prompt.
 
@@ -555,14 +679,19 @@ class MultiHopRetriever:
         Returns:
             List of cleaned individual titles
         """
-        # Split by comma first, then strip wrapping quotes per title
-        titles = [t.strip().strip("'\"") for t in missing_query.split(',') if t.strip()]
+        # Split by comma first, then strip wrapping quotes per title; drop
+        # titles that were only quotes ("'', B")
+        titles = [t.strip().strip("'\"").strip() for t in missing_query.split(',')]
 
-        return titles
+        return [title for title in titles if title]
 
     async def _retrieve_for_hop(
-        self, missing_query: str, context_key: str, query_id: UUID
-    ) -> list[DocumentChunk]:
+        self,
+        missing_query: str,
+        context_key: str,
+        query_id: UUID,
+        prefetcher: HopPrefetcher | None = None,
+    ) -> tuple[list[DocumentChunk], dict[str, list[str]]]:
         """Retrieve chunks for hop using header lookup + semantic fallback.
 
         For each title in missing_query:
@@ -570,28 +699,40 @@ class MultiHopRetriever:
         2. If matched, use fuzzy score - 0.01 as relevance
         3. Collect unmatched titles for semantic fallback
 
+        The fallback ("batched" mode) retrieves for every unmatched title in
+        one round trip and merges the per-title rankings with RRF; "joined"
+        mode sends the titles through retrieve() as one comma-separated query.
+
         Args:
             missing_query: Comma-separated titles from hop evaluation
             context_key: Context key for tracking
             query_id: Query UUID
+            prefetcher: Speculative resolver started before the evaluation (optional)
 
         Returns:
-            List of retrieved chunks (header-matched first, then semantic)
+            Tuple of:
+            - List of retrieved chunks (header-matched first, then semantic)
+            - Title -> ids of the chunks retrieved for it
         """
         # Step 1: Parse into individual titles
         titles = self._clean_missing_query(missing_query)
 
         header_matched_chunks: list[DocumentChunk] = []
         unmatched_titles: list[str] = []
+        title_chunk_ids: dict[str, list[str]] = {}
 
-        # Step 2: Fuzzy header search for each title (85% threshold)
-        for title in titles:
-            chunk, score = self.base_retriever.retrieve_by_header(title)
+        # Step 2: Fuzzy header search for all titles at once (85% threshold)
+        if prefetcher:
+            header_matches = await prefetcher.resolve(titles)
+        else:
+            header_matches = self.base_retriever.retrieve_by_headers(titles)
+        for title, (chunk, score) in zip(titles, header_matches, strict=True):
             if chunk:
                 # Use fuzzy match score - 0.01 as relevance score
                 adjusted_score = score - 0.01
                 boosted_chunk = replace(chunk, relevance_score=adjusted_score)
                 header_matched_chunks.append(boosted_chunk)
+                title_chunk_ids[title] = [str(chunk.chunk_id)]
 
                 logger.info(
                     "hop_header_match",
@@ -609,7 +750,28 @@ class MultiHopRetriever:
 
         # Step 3: Semantic fallback for unmatched titles
         semantic_chunks: list[DocumentChunk] = []
-        if unmatched_titles:
+        if unmatched_titles and self.fallback_mode == "batched":
+            per_title = await asyncio.to_thread(
+                self.base_retriever.retrieve_titles,
+                unmatched_titles,
+                context_key,
+                self.chunks_per_hop,
+            )
+            semantic_chunks = _merge_title_rankings(per_title, self.chunks_per_hop)
+            kept_ids = {chunk.chunk_id for chunk in semantic_chunks}
+            for title, chunks in zip(unmatched_titles, per_title, strict=True):
+                title_chunk_ids.setdefault(title, []).extend(
+                    str(chunk.chunk_id) for chunk in chunks if chunk.chunk_id in kept_ids
+                )
+
+            logger.info(
+                "hop_semantic_fallback",
+                mode="batched",
+                unmatched_titles=unmatched_titles,
+                chunks_per_title=[len(chunks) for chunks in per_title],
+                chunks_retrieved=len(semantic_chunks),
+            )
+        elif unmatched_titles:
             fallback_query = ", ".join(unmatched_titles)
             hop_request = RetrieveRequest(
                 query=fallback_query,
@@ -617,11 +779,18 @@ class MultiHopRetriever:
                 max_chunks=self.chunks_per_hop,
                 use_multi_hop=False,
             )
-            hop_context, _, _ = self.base_retriever.retrieve(hop_request, query_id)
+            hop_context, _, _ = await asyncio.to_thread(
+                self.base_retriever.retrieve, hop_request, query_id
+            )
             semantic_chunks = hop_context.document_chunks
+            for title in unmatched_titles:
+                title_chunk_ids.setdefault(title, []).extend(
+                    str(chunk.chunk_id) for chunk in semantic_chunks
+                )
 
             logger.info(
                 "hop_semantic_fallback",
+                mode="joined",
                 unmatched_titles=unmatched_titles,
                 fallback_query=fallback_query,
                 chunks_retrieved=len(semantic_chunks),
@@ -643,4 +812,36 @@ class MultiHopRetriever:
             final_unique=len(final_chunks),
         )
 
-        return final_chunks
+        return final_chunks, title_chunk_ids
+
+
+def _merge_title_rankings(
+    per_title: list[list[DocumentChunk]], top_k: int
+) -> list[DocumentChunk]:
+    """Merge per-title retrieval rankings with Reciprocal Rank Fusion.
+
+    A chunk's fused score is Σ 1 / (RRF_K + rank) over the titles that
+    retrieved it, so chunks relevant to several titles rank first and every
+    title's best chunks outrank any title's tail.
+
+    Args:
+        per_title: Retrieved chunks per title (ordered by relevance)
+        top_k: Number of chunks to keep
+
+    Returns:
+        Top chunks by fused score (first-seen order on ties); each keeps the
+        highest relevance score any title gave it
+    """
+    rrf_scores: dict[UUID, float] = {}
+    best: dict[UUID, DocumentChunk] = {}
+    for chunks in per_title:
+        for rank, chunk in enumerate(chunks, start=1):
+            rrf_scores[chunk.chunk_id] = rrf_scores.get(chunk.chunk_id, 0.0) + 1.0 / (RRF_K + rank)
+            if (
+                chunk.chunk_id not in best
+                or chunk.relevance_score > best[chunk.chunk_id].relevance_score
+            ):
+                best[chunk.chunk_id] = chunk
+
+    ranked = sorted(rrf_scores, key=rrf_scores.__getitem__, reverse=True)[:top_k]
+    return [best[chunk_id] for chunk_id in ranked]
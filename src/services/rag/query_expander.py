@@ -3,16 +3,27 @@
 Expands user queries with official Kill Team terminology to improve BM25 retrieval.
 Handles cases where users use informal terms (e.g., "heal") instead of official
 game terminology (e.g., "regain wounds").
+
+Synonyms are compiled once into a character trie. A query is matched by walking
+the trie from each word-boundary position, so the cost per query no longer grows
+with the size of the synonym dictionary.
 """
 
 import json
-import re
 from pathlib import Path
+from typing import Any
 
 from src.lib.logging import get_logger
 
 logger = get_logger(__name__)
 
+_TERMINAL = None  # Trie key holding the official term of a synonym ending at that node
+
+
+def _is_word_char(char: str) -> bool:
+    """Same test as the regex `\\w` class for str patterns."""
+    return char.isalnum() or char == "_"
+
 
 class QueryExpander:
     """Expands queries with official terminology synonyms for better keyword matching."""
@@ -26,6 +37,7 @@ class QueryExpander:
         self.synonym_dict_path = Path(synonym_dict_path)
         self.official_to_synonyms: dict[str, list[str]] = {}
         self.synonym_to_official: dict[str, str] = {}
+        self._synonym_trie: dict[Any, Any] = {}
 
         # Load synonyms if file exists
         if self.synonym_dict_path.exists():
@@ -57,6 +69,8 @@ class QueryExpander:
                     # Store lowercase for case-insensitive matching
                     self.synonym_to_official[synonym.lower()] = official_term
 
+            self._compile_synonyms()
+
             logger.info(
                 "synonyms_loaded",
                 path=str(self.synonym_dict_path),
@@ -68,6 +82,56 @@ class QueryExpander:
             logger.error("synonym_load_failed", error=str(e), path=str(self.synonym_dict_path))
             self.official_to_synonyms = {}
             self.synonym_to_official = {}
+            self._synonym_trie = {}
+
+    def _compile_synonyms(self) -> None:
+        """Compile synonym_to_official into a character trie (once, at load)."""
+        trie: dict[Any, Any] = {}
+        for synonym, official_term in self.synonym_to_official.items():
+            node = trie
+            for char in synonym:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = official_term
+        self._synonym_trie = trie
+
+    def _match_official_terms(self, query_lower: str) -> set[str]:
+        """Find the official terms of every synonym in the query.
+
+        A synonym matches where `\\b<synonym>\\b` would: it must start and end on
+        a word boundary. Overlapping synonyms all match (e.g. both "heal" and
+        "heal up" in "heal up"), as they did with one regex search per synonym.
+
+        Args:
+            query_lower: Lowercased query
+
+        Returns:
+            Set of matched official terms
+        """
+        trie = self._synonym_trie
+        is_word = [_is_word_char(char) for char in query_lower]
+        length = len(query_lower)
+        matched: set[str] = set()
+
+        # An empty synonym is r"\b\b": matches any text with a word character
+        if _TERMINAL in trie and any(is_word):
+            matched.add(trie[_TERMINAL])
+
+        for start in range(length):
+            # Word boundary before the first character
+            if is_word[start] == (start > 0 and is_word[start - 1]):
+                continue
+            node = trie
+            end = start
+            while end < length:
+                node = node.get(query_lower[end])
+                if node is None:
+                    break
+                end += 1
+                # Word boundary after the last character
+                if _TERMINAL in node and is_word[end - 1] != (end < length and is_word[end]):
+                    matched.add(node[_TERMINAL])
+
+        return matched
 
     def expand_query(self, query: str) -> str:
         """Expand query with official terminology synonyms.
@@ -89,24 +153,8 @@ class QueryExpander:
         if not self.synonym_to_official:
             return query
 
-        query_lower = query.lower()
-        matched_official_terms: set[str] = set()
-
-        # Check for multi-word phrase matches first (longer matches = more specific)
-        for synonym, official_term in sorted(
-            self.synonym_to_official.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            # Use word boundaries for multi-word phrases
-            if len(synonym.split()) > 1:
-                # Multi-word phrase: match as substring with word boundaries
-                pattern = r"\b" + re.escape(synonym) + r"\b"
-                if re.search(pattern, query_lower):
-                    matched_official_terms.add(official_term)
-            else:
-                # Single word: match as whole word
-                pattern = r"\b" + re.escape(synonym) + r"\b"
-                if re.search(pattern, query_lower):
-                    matched_official_terms.add(official_term)
+        # Single pass over the query against the compiled synonym trie
+        matched_official_terms = self._match_official_terms(query.lower())
 
         # If we found synonyms, append official terms
         if matched_official_terms:
@@ -0,0 +1,278 @@
+"""Semantic near-duplicate cache for retrieval results.
+
+Repeat questions rarely match byte for byte ("What does Obscured do?" /
+"what does obscured do"), so an exact query hash misses them. Entries are keyed on the
+query embedding instead: a query within RAG_RETRIEVAL_CACHE_MAX_DISTANCE
+(cosine distance) of a cached query with the same retrieval parameters reuses
+its result, skipping the vector DB, BM25 and the hop evaluation LLM calls.
+The bot only uses it when RAG_RETRIEVAL_CACHE_ENABLED is set, which waits on
+the threshold being measured by tests/integration/test_retrieval_cache_threshold.py.
+
+Entries expire after a TTL and are dropped per document when that document is
+re-ingested. The bot's cache is invalidated by its own RAGRetriever.reload_indexes
+(ingestion runs in another process); RAGIngestor only invalidates a cache it is
+given explicitly.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+from src.lib.constants import (
+    RAG_RETRIEVAL_CACHE_MAX_DISTANCE,
+    RAG_RETRIEVAL_CACHE_MAX_ENTRIES,
+    RAG_RETRIEVAL_CACHE_TTL_SECONDS,
+)
+from src.lib.logging import get_logger
+from src.models.rag_context import RAGContext
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedRetrieval:
+    """Retrieval result stored for one query."""
+
+    query: str
+    params: tuple  # Retrieval parameters the result depends on (must match to reuse)
+    context: RAGContext
+    hop_evaluations: list[Any]
+    chunk_hop_map: dict[UUID, int]
+    document_ids: frozenset[UUID]  # Documents of the final chunks (for invalidation)
+    latency_s: float  # Time the retrieval took (saved by every hit)
+    created_at: float  # time.monotonic()
+
+
+class SemanticRetrievalCache:
+    """Bounded LRU + TTL cache of retrieval results matched by embedding similarity."""
+
+    def __init__(
+        self,
+        max_entries: int = RAG_RETRIEVAL_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RAG_RETRIEVAL_CACHE_TTL_SECONDS,
+        max_distance: float = RAG_RETRIEVAL_CACHE_MAX_DISTANCE,
+    ):
+        """Initialize retrieval cache.
+
+        Args:
+            max_entries: Maximum cached results (least recently used are evicted)
+            ttl_seconds: Seconds a result stays valid
+            max_distance: Maximum cosine distance between query embeddings to reuse a result
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+
+        # Slot-based storage: one unit-length embedding row per slot, free rows are
+        # zero so a single matrix-vector product scores every entry
+        self._vectors: np.ndarray | None = None  # Allocated on first put (dimensions known)
+        self._entries: list[CachedRetrieval | None] = [None] * max_entries
+        self._free_slots = list(range(max_entries - 1, -1, -1))
+        self._lru: OrderedDict[int, None] = OrderedDict()  # Least recently used first
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.saved_latency_s = 0.0
+
+        logger.info(
+            "retrieval_cache_initialized",
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_distance=max_distance,
+        )
+
+    def get(self, query_embedding: list[float], params: tuple) -> CachedRetrieval | None:
+        """Find a cached result for a near-duplicate query.
+
+        Args:
+            query_embedding: Embedding of the (normalized) query
+            params: Retrieval parameters of the request
+
+        Returns:
+            Closest unexpired entry within max_distance with the same params, or None
+        """
+        query_vector = _unit_vector(query_embedding)
+        now = time.monotonic()
+
+        with self._lock:
+            if self._vectors is not None and self._lru and len(query_vector) == self._vectors.shape[1]:
+                similarities = self._vectors @ query_vector
+                candidates = np.flatnonzero(similarities >= 1.0 - self.max_distance)
+                for slot in candidates[np.argsort(-similarities[candidates], kind="stable")]:
+                    entry = self._entries[slot]
+                    if entry is None:
+                        continue
+                    if now - entry.created_at > self.ttl_seconds:
+                        self._remove(slot)
+                        continue
+                    if entry.params != params:
+                        continue
+
+                    self._lru.move_to_end(slot)
+                    self.hits += 1
+                    self.saved_latency_s += entry.latency_s
+                    logger.info(
+                        "retrieval_cache_hit",
+                        cached_query=entry.query,
+                        distance=round(1.0 - float(similarities[slot]), 4),
+                        saved_ms=round(entry.latency_s * 1000, 1),
+                    )
+                    return entry
+
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        query: str,
+        query_embedding: list[float],
+        params: tuple,
+        result: tuple[RAGContext, list[Any], dict[UUID, int]],
+        latency_s: float,
+    ) -> None:
+        """Cache a retrieval result.
+
+        Args:
+            query: Original query (for logging)
+            query_embedding: Embedding of the (normalized) query
+            params: Retrieval parameters of the request
+            result: (RAGContext, hop_evaluations, chunk_hop_map) returned for the query
+            latency_s: Time the retrieval took
+        """
+        if self.max_entries <= 0:
+            return
+
+        context, hop_evaluations, chunk_hop_map = result
+        entry = CachedRetrieval(
+            query=query,
+            params=params,
+            context=context,
+            hop_evaluations=list(hop_evaluations),
+            chunk_hop_map=dict(chunk_hop_map),
+            document_ids=frozenset(chunk.document_id for chunk in context.document_chunks),
+            latency_s=latency_s,
+            created_at=time.monotonic(),
+        )
+        query_vector = _unit_vector(query_embedding)
+
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != len(query_vector):
+                # First entry, or the embedding model changed: start over
+                self._clear()
+                self._vectors = np.zeros((self.max_entries, len(query_vector)), dtype=np.float32)
+
+            if not self._free_slots:
+                oldest_slot = next(iter(self._lru))
+                self._remove(oldest_slot)
+                self.evictions += 1
+
+            slot = self._free_slots.pop()
+            self._vectors[slot] = query_vector
+            self._entries[slot] = entry
+            self._lru[slot] = None
+
+    def invalidate(self, document_id: UUID | None = None) -> int:
+        """Invalidate cache entries.
+
+        If document_id is provided, only invalidate entries whose result contains
+        a chunk of that document. Otherwise, invalidate all entries.
+
+        Args:
+            document_id: Document UUID to invalidate (optional)
+
+        Returns:
+            Number of entries invalidated
+        """
+        with self._lock:
+            if document_id is None:
+                count = len(self._lru)
+                self._clear()
+            else:
+                document_uuid = UUID(str(document_id))
+                slots = [
+                    slot for slot in self._lru if document_uuid in self._entries[slot].document_ids
+                ]
+                for slot in slots:
+                    self._remove(slot)
+                count = len(slots)
+            self.invalidations += count
+
+        if count:
+            logger.info(
+                "retrieval_cache_invalidated",
+                document_id=str(document_id) if document_id else None,
+                count=count,
+            )
+        return count
+
+    def get_stats(self) -> dict[str, object]:
+        """Get cache statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._lru),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_latency_s": round(self.saved_latency_s, 3),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, slot: int) -> None:
+        """Free a slot (caller holds the lock).
+
+        Args:
+            slot: Slot to free
+        """
+        self._entries[slot] = None
+        self._vectors[slot] = 0.0
+        del self._lru[slot]
+        self._free_slots.append(slot)
+
+    def _clear(self) -> None:
+        """Drop every entry (caller holds the lock)."""
+        for slot in list(self._lru):
+            self._remove(slot)
+
+
+def _unit_vector(embedding: list[float]) -> np.ndarray:
+    """Embedding scaled to unit length (cosine similarity becomes a dot product).
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        float32 unit vector (zero vector stays zero)
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+# Global cache instance
+_retrieval_cache: SemanticRetrievalCache | None = None
+
+
+def get_retrieval_cache() -> SemanticRetrievalCache:
+    """Get global retrieval cache instance.
+
+    Returns:
+        SemanticRetrievalCache instance
+    """
+    global _retrieval_cache
+    if _retrieval_cache is None:
+        _retrieval_cache = SemanticRetrievalCache()
+    return _retrieval_cache
@@ -4,7 +4,11 @@ Implements retrieve() method from specs/001-we-are-building/contracts/rag-pipeli
 """
 
 import asyncio
-import threading
+import copy
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -14,23 +18,37 @@ from src.lib.constants import (
     BM25_WEIGHT,
     HEADER_FUZZY_THRESHOLD,
     MAXIMUM_FINAL_CHUNK_COUNT,
+    RAG_BATCH_MULTI_HOP_CONCURRENCY,
     RAG_ENABLE_QUERY_EXPANSION,
     RAG_ENABLE_QUERY_NORMALIZATION,
     RAG_HOP_EVALUATION_TIMEOUT,
+    RAG_INDEX_BUNDLE_PATH,
     RAG_MAX_HOPS,
+    RAG_PARALLEL_STAGE_WORKERS,
     RAG_SYNONYM_DICT_PATH,
     RRF_K,
 )
 from src.lib.logging import get_logger
 from src.models.rag_context import DocumentChunk, RAGContext
 from src.models.rag_request import RetrieveRequest
+from src.services.rag.bm25_retriever import BM25Result
+from src.services.rag.chunk_registry import ChunkRegistry, ScoredChunk
 from src.services.rag.embeddings import EmbeddingService
 from src.services.rag.header_index import HeaderIndex
+from src.services.rag.hop_executor import get_hop_executor
 from src.services.rag.hybrid_retriever import HybridRetriever
+from src.services.rag.index_bundle import (
+    IndexBundle,
+    chunks_from_records,
+    load_collection_chunks,
+    load_index_bundle,
+)
+from src.services.rag.ingestion_state import IngestionState
 from src.services.rag.keyword_extractor import KeywordExtractor
 from src.services.rag.multi_hop_retriever import MultiHopRetriever
 from src.services.rag.query_expander import QueryExpander
-from src.services.rag.vector_db import VectorDBService
+from src.services.rag.retrieval_cache import CachedRetrieval, SemanticRetrievalCache
+from src.services.rag.vector_db import VectorDBService, create_vector_db_service
 
 logger = get_logger(__name__)
 
@@ -47,6 +65,81 @@ class VectorDBUnavailableError(Exception):
     pass
 
 
+@dataclass
+class RetrievalStageTimings:
+    """Wall-clock milliseconds spent in each initial retrieval stage.
+
+    BM25 is scored on a worker thread while the query is embedded and searched
+    in the vector DB, so the stages add up to more than total_ms; the
+    difference is the time the overlap saved.
+    """
+
+    normalize_ms: float = 0.0
+    embed_ms: float = 0.0
+    vector_search_ms: float = 0.0
+    bm25_ms: float = 0.0
+    fusion_ms: float = 0.0  # Vector result conversion + RRF fusion
+    total_ms: float = 0.0
+
+    @property
+    def overlap_saved_ms(self) -> float:
+        """Sequential stage time minus wall time."""
+        sequential = (
+            self.normalize_ms + self.embed_ms + self.vector_search_ms + self.bm25_ms + self.fusion_ms
+        )
+        return max(0.0, sequential - self.total_ms)
+
+    def to_dict(self) -> dict[str, float]:
+        """Rounded stage timings plus overlap_saved_ms (for logs and reports)."""
+        timings = {name: round(value, 2) for name, value in asdict(self).items()}
+        timings["overlap_saved_ms"] = round(self.overlap_saved_ms, 2)
+        return timings
+
+
+@dataclass
+class BatchRetrievalDetail:
+    """Per-query observability for one retrieve_many() call."""
+
+    retrieval_time_s: float = 0.0  # Share of the batched initial retrieval + own multi-hop time
+    hop_errors: list[str] = field(default_factory=list)  # Non-fatal multi-hop errors
+    stage_timings: RetrievalStageTimings | None = None  # Of the whole batched initial retrieval
+
+
+@dataclass
+class _CacheLookup:
+    """Semantic retrieval cache lookup, run by initial retrieval once the query is embedded."""
+
+    cache: SemanticRetrievalCache
+    params: tuple  # _cache_params() of the request
+    query_embedding: list[float] | None = None
+    hit: CachedRetrieval | None = None
+
+    def __call__(self, query_embedding: list[float]) -> bool:
+        """Look up the embedded query; True on a hit (retrieval stops early)."""
+        self.query_embedding = query_embedding
+        self.hit = self.cache.get(query_embedding, self.params)
+        return self.hit is not None
+
+
+@dataclass(frozen=True)
+class IndexGeneration:
+    """Retrieval indexes built from one ingestion generation.
+
+    reload_indexes() builds a new generation aside and swaps it in with one
+    assignment; initial retrieval reads it once per query, so a query's vector
+    search, BM25, chunk registry lookups and fusion always belong together.
+    """
+
+    vector_db: VectorDBService
+    keyword_extractor: KeywordExtractor
+    hybrid_retriever: HybridRetriever | None
+    chunks: list[DocumentChunk]  # Loaded chunks (header index and chunk registry source)
+    chunk_registry: ChunkRegistry  # Vector search hits are resolved against it by id
+    header_index: HeaderIndex  # Fuzzy header lookup (used by multi-hop)
+    ingestion_state: IngestionState | None
+    index_key: str | None  # ingestion_state.index_key()
+
+
 class RAGRetriever:
     """Service for retrieving relevant documents using RAG."""
 
@@ -63,6 +156,8 @@ class RAGRetriever:
         bm25_b: float = BM25_B,
         bm25_weight: float = BM25_WEIGHT,
         db_path: str | None = None,
+        index_bundle_path: str | None = RAG_INDEX_BUNDLE_PATH,
+        retrieval_cache: SemanticRetrievalCache | None = None,
     ):
         """Initialize RAG retriever.
 
@@ -78,28 +173,66 @@ class RAGRetriever:
             bm25_b: BM25 document length normalization parameter (default: 0.75)
             bm25_weight: Weight for BM25 in fusion (default: 0.5, vector gets 1-bm25_weight)
             db_path: Optional database path (only used if vector_db_service is None)
+            index_bundle_path: Prebuilt index bundle directory written by ingestion
+                (None = always rebuild indexes from the vector DB)
+            retrieval_cache: Semantic near-duplicate cache for retrieve() and
+                retrieve_async() results (None = no caching)
         """
         self.embedding_service = embedding_service or EmbeddingService()
-        self.vector_db = vector_db_service or VectorDBService(db_path=db_path)
-        self.keyword_extractor = keyword_extractor or KeywordExtractor()
+        self.retrieval_cache = retrieval_cache
+        vector_db = vector_db_service or create_vector_db_service(db_path=db_path)
+        self.index_bundle_path = index_bundle_path
+        self._hybrid_params = {
+            "k": rrf_k, "bm25_k1": bm25_k1, "bm25_b": bm25_b, "bm25_weight": bm25_weight
+        }
+
+        # Ingestion generation the indexes below are built from (see reload_indexes)
+        ingestion_state = self._load_ingestion_state()
+        index_key = ingestion_state.index_key() if ingestion_state else None
+
+        # Prebuilt indexes from the last ingest, if they match the current corpus
+        index_bundle = (
+            self._load_index_bundle(vector_db, index_key, bm25_k1, bm25_b)
+            if enable_hybrid
+            else None
+        )
+
+        if keyword_extractor is None and index_bundle:
+            keyword_extractor = KeywordExtractor(keywords=index_bundle.keywords)
         self.query_expander = query_expander or QueryExpander(RAG_SYNONYM_DICT_PATH)
         self.enable_hybrid = enable_hybrid
         self.enable_multi_hop = enable_multi_hop
 
         # Initialize hybrid retriever if enabled
-        self.hybrid_retriever: HybridRetriever | None = None
-        self._all_chunks: list[DocumentChunk] = []  # Cached for header index
+        hybrid_retriever: HybridRetriever | None = None
+        chunks: list[DocumentChunk] = []
         if enable_hybrid:
-            self.hybrid_retriever = HybridRetriever(
+            hybrid_retriever = HybridRetriever(
                 k=rrf_k, bm25_k1=bm25_k1, bm25_b=bm25_b, bm25_weight=bm25_weight
             )
-            # Index all chunks from vector DB
-            self._build_hybrid_index()
-
-        # Initialize header index for fuzzy header lookup (used by multi-hop)
-        self.header_index = HeaderIndex()
-        if self._all_chunks:
-            self.header_index.build_from_chunks(self._all_chunks)
+            if index_bundle:
+                hybrid_retriever.load_index(index_bundle.chunks, index_bundle.bm25)
+                chunks = index_bundle.chunks
+            else:
+                # Index all chunks from vector DB
+                hybrid_retriever, chunks = self._build_hybrid_index(hybrid_retriever, vector_db)
+
+        header_index = HeaderIndex()
+        if index_bundle:
+            header_index.build_from_entries(index_bundle.header_entries)
+        elif chunks:
+            header_index.build_from_chunks(chunks)
+
+        self._indexes = IndexGeneration(
+            vector_db=vector_db,
+            keyword_extractor=keyword_extractor or KeywordExtractor(),
+            hybrid_retriever=hybrid_retriever,
+            chunks=chunks,
+            chunk_registry=ChunkRegistry(chunks),
+            header_index=header_index,
+            ingestion_state=ingestion_state,
+            index_key=index_key,
+        )
 
         # Initialize multi-hop retriever if enabled
         self.multi_hop_retriever = None
@@ -107,9 +240,15 @@ class RAGRetriever:
             self.multi_hop_retriever = MultiHopRetriever(base_retriever=self)
             logger.info("multi_hop_enabled", max_hops=RAG_MAX_HOPS)
 
+        # Per-query timings and hop errors from the last retrieve_many() call
+        self.last_batch_details: list[BatchRetrievalDetail] = []
+        # Stage timings of the last single-query initial retrieval
+        self.last_stage_timings: RetrievalStageTimings | None = None
+
         logger.info(
             "rag_retriever_initialized",
             hybrid_enabled=enable_hybrid,
+            index_bundle_loaded=index_bundle is not None,
             multi_hop_enabled=enable_multi_hop,
             rrf_k=rrf_k,
             bm25_k1=bm25_k1,
@@ -119,12 +258,49 @@ class RAGRetriever:
             synonyms_loaded=self.query_expander.get_stats()["total_synonyms"],
         )
 
+    @property
+    def vector_db(self) -> VectorDBService:
+        """Vector DB of the current index generation."""
+        return self._indexes.vector_db
+
+    @property
+    def keyword_extractor(self) -> KeywordExtractor:
+        """Keyword extractor of the current index generation."""
+        return self._indexes.keyword_extractor
+
+    @property
+    def hybrid_retriever(self) -> HybridRetriever | None:
+        """Hybrid (BM25 + vector) retriever of the current index generation."""
+        return self._indexes.hybrid_retriever
+
+    @property
+    def chunk_registry(self) -> ChunkRegistry:
+        """Chunk registry of the current index generation."""
+        return self._indexes.chunk_registry
+
+    @property
+    def header_index(self) -> HeaderIndex:
+        """Header index of the current index generation."""
+        return self._indexes.header_index
+
+    @property
+    def index_key(self) -> str | None:
+        """Ingestion state index key of the current index generation."""
+        return self._indexes.index_key
+
+    @property
+    def _all_chunks(self) -> list[DocumentChunk]:
+        """Loaded chunks of the current index generation."""
+        return self._indexes.chunks
+
     def retrieve(
         self, request: RetrieveRequest, query_id: UUID, verbose: bool = False
     ) -> tuple[RAGContext, list[Any], dict[UUID, int]]:
         """Retrieve relevant rule documents for a user query.
 
         Implements the RAG pipeline contract from contracts/rag-pipeline.md.
+        Blocking variant for sync callers (CLI, RAG tests); async code should
+        use retrieve_async() so the event loop is not stalled.
 
         Args:
             request: Retrieval request parameters
@@ -143,25 +319,330 @@ class RAGRetriever:
         """
         # Validate query
         self._validate_query(request.query)
+        start_time = time.perf_counter()
 
-        # Perform initial retrieval
+        # Perform initial retrieval (unless a near-duplicate query is cached)
+        cache_lookup = self._cache_lookup(request, verbose)
         try:
-            initial_chunks = self._perform_initial_retrieval(request)
+            initial_chunks = self._perform_initial_retrieval(request, cache_lookup)
+            if cache_lookup and cache_lookup.hit:
+                return _replay_cached(cache_lookup.hit, query_id)
         except Exception as e:
             logger.error("retrieval_failed", query_id=str(query_id), error=str(e))
             raise VectorDBUnavailableError(f"Vector DB query failed: {e}") from e
 
         # If multi-hop enabled, continue with additional retrieval hops
+        hop_errors: list[str] = []
         if request.use_multi_hop and self.multi_hop_retriever:
-            return self._perform_multi_hop_retrieval(request, query_id, initial_chunks, verbose)
+            result = self._perform_multi_hop_retrieval(
+                request, query_id, initial_chunks, verbose, hop_errors
+            )
+        else:
+            result = self._complete_single_hop(request, query_id, initial_chunks)
+
+        if cache_lookup:
+            self._cache_result(request, cache_lookup, result, start_time, hop_errors)
+        return result
+
+    async def retrieve_async(
+        self, request: RetrieveRequest, query_id: UUID, verbose: bool = False
+    ) -> tuple[RAGContext, list[Any], dict[UUID, int]]:
+        """Retrieve relevant rule documents without blocking the event loop.
+
+        Same contract as retrieve(). The query embedding uses the async OpenAI
+        client, Chroma and BM25 run in a worker thread, and multi-hop is awaited
+        directly instead of going through a helper thread.
+
+        Args:
+            request: Retrieval request parameters
+            query_id: Query UUID for tracking
+            verbose: If True, capture filled prompts in HopEvaluation objects
+
+        Returns:
+            Tuple of (RAGContext, hop_evaluations, chunk_hop_map)
+
+        Raises:
+            InvalidQueryError: If query is invalid
+            VectorDBUnavailableError: If vector DB is unavailable
+            TimeoutError: If multi-hop retrieval exceeds RAG_HOP_EVALUATION_TIMEOUT
+        """
+        self._validate_query(request.query)
+        start_time = time.perf_counter()
+
+        cache_lookup = self._cache_lookup(request, verbose)
+        try:
+            initial_chunks = await self._perform_initial_retrieval_async(request, cache_lookup)
+            if cache_lookup and cache_lookup.hit:
+                return _replay_cached(cache_lookup.hit, query_id)
+        except Exception as e:
+            logger.error("retrieval_failed", query_id=str(query_id), error=str(e))
+            raise VectorDBUnavailableError(f"Vector DB query failed: {e}") from e
+
+        hop_errors: list[str] = []
+        if request.use_multi_hop and self.multi_hop_retriever:
+            normalized_query, _ = self._normalize_and_expand_query(request.query)
+            try:
+                result = await asyncio.wait_for(
+                    self.multi_hop_retriever.retrieve_multi_hop(
+                        query=normalized_query,
+                        context_key=request.context_key,
+                        query_id=query_id,
+                        initial_chunks=initial_chunks,
+                        verbose=verbose,
+                        hop_errors=hop_errors,
+                    ),
+                    timeout=RAG_HOP_EVALUATION_TIMEOUT,
+                )
+            except TimeoutError as e:
+                raise TimeoutError(
+                    f"Multi-hop retrieval timed out after {RAG_HOP_EVALUATION_TIMEOUT} seconds"
+                ) from e
+
+            result = self._complete_multi_hop(request, query_id, result)
+        else:
+            result = self._complete_single_hop(request, query_id, initial_chunks)
+
+        if cache_lookup:
+            self._cache_result(request, cache_lookup, result, start_time, hop_errors)
+        return result
+
+    def retrieve_many(
+        self,
+        requests: list[RetrieveRequest],
+        query_ids: list[UUID] | None = None,
+        verbose: bool = False,
+        return_exceptions: bool = False,
+    ) -> list[tuple[RAGContext, list[Any], dict[UUID, int]] | Exception]:
+        """Retrieve for many queries at once (evaluation workloads).
+
+        Same per-query results as retrieve(), but all queries are embedded in
+        one API call and searched with one multi-embedding vector DB query;
+        BM25/RRF fusion then runs per query. Multi-hop evaluations run
+        concurrently on the hop executor loop (at most
+        RAG_BATCH_MULTI_HOP_CONCURRENCY at a time), each with the usual
+        RAG_HOP_EVALUATION_TIMEOUT. Per-query timings and hop errors are left
+        in last_batch_details.
+
+        Args:
+            requests: Retrieval requests
+            query_ids: Query UUIDs, one per request (generated if None)
+            verbose: If True, capture filled prompts in HopEvaluation objects
+            return_exceptions: If True, a failed query yields its exception in
+                place of a result instead of raising
+
+        Returns:
+            One (RAGContext, hop_evaluations, chunk_hop_map) tuple per request,
+            in request order (or the exception, with return_exceptions)
+
+        Raises:
+            ValueError: If query_ids does not match requests in length
+            InvalidQueryError: If a query is invalid (unless return_exceptions)
+            VectorDBUnavailableError: If vector DB is unavailable (unless return_exceptions)
+            TimeoutError: If a multi-hop retrieval times out (unless return_exceptions)
+        """
+        if query_ids is None:
+            query_ids = [uuid4() for _ in requests]
+        if len(query_ids) != len(requests):
+            raise ValueError("query_ids must have one entry per request")
+
+        start_time = time.perf_counter()
+        outcomes: list[Any] = [None] * len(requests)
+
+        valid: list[int] = []
+        for i, request in enumerate(requests):
+            try:
+                self._validate_query(request.query)
+                valid.append(i)
+            except InvalidQueryError as e:
+                outcomes[i] = e
+
+        initial_chunks: dict[int, list[DocumentChunk]] = {}
+        stage_timings: RetrievalStageTimings | None = None
+        if valid:
+            try:
+                batch_chunks, stage_timings = self._perform_initial_retrieval_many(
+                    [requests[i] for i in valid]
+                )
+                initial_chunks = dict(zip(valid, batch_chunks, strict=True))
+            except Exception as e:
+                logger.error("batch_retrieval_failed", queries=len(valid), error=str(e))
+                error = VectorDBUnavailableError(f"Vector DB query failed: {e}")
+                error.__cause__ = e
+                for i in valid:
+                    outcomes[i] = error
+
+        initial_time = time.perf_counter() - start_time
+        details = [
+            BatchRetrievalDetail(
+                retrieval_time_s=initial_time / len(requests), stage_timings=stage_timings
+            )
+            for _ in requests
+        ]
+
+        multi_hop: list[int] = []
+        for i, chunks in initial_chunks.items():
+            if requests[i].use_multi_hop and self.multi_hop_retriever:
+                multi_hop.append(i)
+            else:
+                outcomes[i] = self._complete_single_hop(requests[i], query_ids[i], chunks)
+
+        if multi_hop:
+            # Every wave of concurrent evaluations gets the usual per-query timeout
+            waves = math.ceil(len(multi_hop) / RAG_BATCH_MULTI_HOP_CONCURRENCY)
+            hop_results = get_hop_executor().run(
+                self._multi_hop_many(
+                    [requests[i] for i in multi_hop],
+                    [query_ids[i] for i in multi_hop],
+                    [initial_chunks[i] for i in multi_hop],
+                    verbose,
+                ),
+                timeout=RAG_HOP_EVALUATION_TIMEOUT * (waves + 1),
+            )
+            for i, (result, hop_errors, elapsed) in zip(multi_hop, hop_results, strict=True):
+                details[i].retrieval_time_s += elapsed
+                details[i].hop_errors = hop_errors
+                if isinstance(result, Exception):
+                    outcomes[i] = result
+                else:
+                    outcomes[i] = self._complete_multi_hop(requests[i], query_ids[i], result)
+
+        self.last_batch_details = details
+
+        logger.info(
+            "batch_retrieval_completed",
+            queries=len(requests),
+            multi_hop_queries=len(multi_hop),
+            failed=sum(isinstance(outcome, Exception) for outcome in outcomes),
+            initial_retrieval_ms=round(initial_time * 1000, 1),
+            total_ms=round((time.perf_counter() - start_time) * 1000, 1),
+        )
+
+        if not return_exceptions:
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+
+        return outcomes
+
+    async def _multi_hop_many(
+        self,
+        requests: list[RetrieveRequest],
+        query_ids: list[UUID],
+        initial_chunks: list[list[DocumentChunk]],
+        verbose: bool,
+    ) -> list[tuple[Any, list[str], float]]:
+        """Run multi-hop for several queries concurrently on the current loop.
 
-        # Single-hop: create context and return
-        context = self._create_rag_context(query_id, initial_chunks, request.min_relevance)
+        Args:
+            requests: Retrieval requests
+            query_ids: Query UUIDs
+            initial_chunks: Initial chunks per request
+            verbose: If True, capture filled prompts in HopEvaluation objects
+
+        Returns:
+            Per request: (raw multi-hop result or exception, hop errors, seconds)
+        """
+        semaphore = asyncio.Semaphore(RAG_BATCH_MULTI_HOP_CONCURRENCY)
+
+        async def _one(
+            request: RetrieveRequest, query_id: UUID, chunks: list[DocumentChunk]
+        ) -> tuple[Any, list[str], float]:
+            normalized_query, _ = self._normalize_and_expand_query(request.query)
+            async with semaphore:
+                started = time.perf_counter()
+                # Per-query list: the queries' hops run concurrently
+                hop_errors: list[str] = []
+                try:
+                    async with asyncio.timeout(RAG_HOP_EVALUATION_TIMEOUT):
+                        result = await self.multi_hop_retriever.retrieve_multi_hop(
+                            query=normalized_query,
+                            context_key=request.context_key,
+                            query_id=query_id,
+                            initial_chunks=chunks,
+                            verbose=verbose,
+                            hop_errors=hop_errors,
+                        )
+                except TimeoutError:
+                    result = TimeoutError(
+                        f"Multi-hop retrieval timed out after {RAG_HOP_EVALUATION_TIMEOUT} seconds"
+                    )
+                    hop_errors = []
+                except Exception as e:
+                    result = e
+                    hop_errors = []
+                return result, hop_errors, time.perf_counter() - started
+
+        return await asyncio.gather(
+            *(
+                _one(request, query_id, chunks)
+                for request, query_id, chunks in zip(requests, query_ids, initial_chunks, strict=True)
+            )
+        )
+
+    def _cache_lookup(self, request: RetrieveRequest, verbose: bool) -> _CacheLookup | None:
+        """Semantic cache lookup for a retrieval, or None when the cache is not used.
+
+        Args:
+            request: Retrieval request parameters
+            verbose: Verbose retrievals capture prompts, so they bypass the cache
+
+        Returns:
+            _CacheLookup for initial retrieval to run, or None
+        """
+        if not self.retrieval_cache or verbose:
+            return None
+        return _CacheLookup(self.retrieval_cache, _cache_params(request))
+
+    def _cache_result(
+        self,
+        request: RetrieveRequest,
+        cache_lookup: _CacheLookup,
+        result: tuple[RAGContext, list[Any], dict[UUID, int]],
+        start_time: float,
+        hop_errors: list[str],
+    ) -> None:
+        """Store a finished retrieval in the semantic retrieval cache.
+
+        Results whose multi-hop run reported errors (e.g. a truncated hop
+        evaluation) are not cached, so a degraded answer is not replayed.
+
+        Args:
+            request: Retrieval request parameters
+            cache_lookup: Lookup that missed (holds the query embedding)
+            result: (RAGContext, hop_evaluations, chunk_hop_map) returned for the request
+            start_time: perf_counter() value when the retrieval started
+            hop_errors: Non-fatal multi-hop errors of this retrieval
+        """
+        if hop_errors or cache_lookup.query_embedding is None:
+            return
+
+        self.retrieval_cache.put(
+            request.query,
+            cache_lookup.query_embedding,
+            cache_lookup.params,
+            result,
+            latency_s=time.perf_counter() - start_time,
+        )
+
+    def _complete_single_hop(
+        self, request: RetrieveRequest, query_id: UUID, chunks: list[DocumentChunk]
+    ) -> tuple[RAGContext, list[Any], dict[UUID, int]]:
+        """Build the single-hop result tuple.
+
+        Args:
+            request: Retrieval request parameters
+            query_id: Query UUID
+            chunks: Chunks from initial retrieval
+
+        Returns:
+            Tuple of (RAGContext, empty hop_evaluations, empty chunk_hop_map)
+        """
+        context = self._create_rag_context(query_id, chunks, request.min_relevance)
 
         logger.info(
             "retrieval_completed",
             query_id=str(query_id),
-            chunks_found=len(initial_chunks),
+            chunks_found=len(chunks),
             avg_relevance=context.avg_relevance,
             meets_threshold=context.meets_threshold,
         )
@@ -169,21 +650,41 @@ class RAGRetriever:
         # Return tuple for single-hop: context, empty hop_evaluations, empty chunk_hop_map
         return context, [], {}
 
-    def _perform_initial_retrieval(self, request: RetrieveRequest) -> list[DocumentChunk]:
+    def _perform_initial_retrieval(
+        self, request: RetrieveRequest, cache_lookup: _CacheLookup | None = None
+    ) -> list[DocumentChunk]:
         """Perform initial retrieval: normalize, embed, search, and apply hybrid if enabled.
 
+        BM25 only needs the expanded query text, so it is scored on a worker
+        thread while the embedding request and vector search are in flight;
+        the two result sets are fused once both are ready.
+
         Args:
             request: Retrieval request parameters
+            cache_lookup: Semantic cache lookup to run on the query embedding; on a
+                hit retrieval stops there and the BM25 result is discarded
 
         Returns:
-            List of retrieved DocumentChunk objects
+            List of retrieved DocumentChunk objects (empty on a cache hit)
         """
+        start = time.perf_counter()
+        timings = RetrievalStageTimings()
+
         # Normalize and expand query
         normalized_query, expanded_query = self._normalize_and_expand_query(request.query)
+        timings.normalize_ms = _elapsed_ms(start)
+
+        # Pin the index generation so a hot reload cannot split the stages
+        indexes = self._indexes
+        bm25_future = _get_stage_pool().submit(
+            self._search_bm25, indexes.hybrid_retriever, [request], [expanded_query], timings
+        )
 
         # Generate query embedding using normalized query (NOT expanded)
         # Vector search handles semantic synonyms naturally
+        stage_start = time.perf_counter()
         query_embedding = self.embedding_service.embed_text(normalized_query)
+        timings.embed_ms = _elapsed_ms(stage_start)
 
         logger.debug(
             "query_embedding_generated",
@@ -191,23 +692,264 @@ class RAGRetriever:
             context_key=request.context_key,
         )
 
-        # Query vector database
-        results = self.vector_db.query(
-            query_embeddings=[query_embedding], n_results=request.max_chunks
+        if cache_lookup and cache_lookup(query_embedding):
+            return []
+
+        stage_start = time.perf_counter()
+        results = indexes.vector_db.query(
+            query_embeddings=[query_embedding],
+            n_results=request.max_chunks,
+            include=self._vector_result_fields(indexes),
+        )
+        timings.vector_search_ms = _elapsed_ms(stage_start)
+
+        (bm25_results,) = bm25_future.result()
+        chunks = self._fuse_stage(
+            timings, request, results, expanded_query, indexes, bm25_results
+        )
+        self._finish_stage_timings(timings, start, queries=1)
+        return chunks
+
+    def _perform_initial_retrieval_many(
+        self, requests: list[RetrieveRequest]
+    ) -> tuple[list[list[DocumentChunk]], RetrievalStageTimings]:
+        """Batched _perform_initial_retrieval: one embedding call, one vector DB query.
+
+        BM25 for all queries is scored on a worker thread meanwhile.
+
+        Args:
+            requests: Retrieval requests (already validated)
+
+        Returns:
+            Tuple of (retrieved DocumentChunk lists, one per request; stage timings of the batch)
+        """
+        start = time.perf_counter()
+        timings = RetrievalStageTimings()
+
+        queries = [self._normalize_and_expand_query(request.query) for request in requests]
+        expanded_queries = [expanded_query for _, expanded_query in queries]
+        timings.normalize_ms = _elapsed_ms(start)
+
+        indexes = self._indexes
+        bm25_future = _get_stage_pool().submit(
+            self._search_bm25, indexes.hybrid_retriever, requests, expanded_queries, timings
+        )
+
+        stage_start = time.perf_counter()
+        query_embeddings = self.embedding_service.embed_many(
+            [normalized_query for normalized_query, _ in queries]
+        )
+        timings.embed_ms = _elapsed_ms(stage_start)
+
+        # One query for all embeddings at the largest max_chunks; each request
+        # then keeps its own top max_chunks (results are nearest first)
+        stage_start = time.perf_counter()
+        results = indexes.vector_db.query(
+            query_embeddings=query_embeddings,
+            n_results=max(request.max_chunks for request in requests),
+            include=self._vector_result_fields(indexes),
+        )
+        timings.vector_search_ms = _elapsed_ms(stage_start)
+
+        logger.debug("batch_vector_query_completed", queries=len(requests))
+
+        all_bm25_results = bm25_future.result()
+        stage_start = time.perf_counter()
+        chunks = [
+            self._chunks_from_vector_results(
+                request,
+                {
+                    key: [results[key][i][: request.max_chunks]] if results.get(key) else None
+                    for key in ("ids", "documents", "metadatas", "distances")
+                },
+                expanded_query,
+                indexes,
+                bm25_results,
+            )
+            for i, (request, expanded_query, bm25_results) in enumerate(
+                zip(requests, expanded_queries, all_bm25_results, strict=True)
+            )
+        ]
+        timings.fusion_ms = _elapsed_ms(stage_start)
+        self._finish_stage_timings(timings, start, queries=len(requests))
+        return chunks, timings
+
+    async def _perform_initial_retrieval_async(
+        self, request: RetrieveRequest, cache_lookup: _CacheLookup | None = None
+    ) -> list[DocumentChunk]:
+        """Async variant of _perform_initial_retrieval.
+
+        Args:
+            request: Retrieval request parameters
+            cache_lookup: Semantic cache lookup to run on the query embedding; on a
+                hit retrieval stops there and the BM25 result is discarded
+
+        Returns:
+            List of retrieved DocumentChunk objects (empty on a cache hit)
+        """
+        start = time.perf_counter()
+        timings = RetrievalStageTimings()
+
+        normalized_query, expanded_query = self._normalize_and_expand_query(request.query)
+        timings.normalize_ms = _elapsed_ms(start)
+
+        indexes = self._indexes
+
+        async def _embed_and_search() -> dict | None:
+            stage_start = time.perf_counter()
+            embedding = await self.embedding_service.embed_text_async(normalized_query)
+            timings.embed_ms = _elapsed_ms(stage_start)
+
+            logger.debug(
+                "query_embedding_generated",
+                query_length=len(request.query),
+                context_key=request.context_key,
+            )
+
+            if cache_lookup and cache_lookup(embedding):
+                return None
+
+            # Chroma is synchronous, keep it off the event loop
+            stage_start = time.perf_counter()
+            results = await asyncio.to_thread(
+                indexes.vector_db.query,
+                query_embeddings=[embedding],
+                n_results=request.max_chunks,
+                include=self._vector_result_fields(indexes),
+            )
+            timings.vector_search_ms = _elapsed_ms(stage_start)
+            return results
+
+        bm25_task = asyncio.ensure_future(
+            asyncio.to_thread(
+                self._search_bm25, indexes.hybrid_retriever, [request], [expanded_query], timings
+            )
         )
+        # Not awaited on a cache hit or embedding error: consume its outcome
+        bm25_task.add_done_callback(lambda task: task.cancelled() or task.exception())
 
-        # Convert results to DocumentChunk objects
-        chunks = self._results_to_chunks(results, request.min_relevance)
+        results = await _embed_and_search()
+        if results is None:
+            return []
+        (bm25_results,) = await bm25_task
+
+        chunks = await asyncio.to_thread(
+            self._fuse_stage, timings, request, results, expanded_query, indexes, bm25_results
+        )
+        self._finish_stage_timings(timings, start, queries=1)
+        return chunks
+
+    def _search_bm25(
+        self,
+        hybrid_retriever: HybridRetriever | None,
+        requests: list[RetrieveRequest],
+        expanded_queries: list[str],
+        timings: RetrievalStageTimings,
+    ) -> list[list[BM25Result] | None]:
+        """BM25 stage of initial retrieval (runs concurrently with embedding).
+
+        Args:
+            hybrid_retriever: Hybrid retriever of the pinned index generation
+            requests: Retrieval requests
+            expanded_queries: Synonym-expanded query per request
+            timings: Stage timings to record bm25_ms in
+
+        Returns:
+            BM25 results per request (None where hybrid search is not used)
+        """
+        start = time.perf_counter()
+        results = [
+            hybrid_retriever.search_bm25(expanded_query, top_k=request.max_chunks)
+            if request.use_hybrid and hybrid_retriever
+            else None
+            for request, expanded_query in zip(requests, expanded_queries, strict=True)
+        ]
+        timings.bm25_ms = _elapsed_ms(start)
+        return results
+
+    def _fuse_stage(
+        self,
+        timings: RetrievalStageTimings,
+        request: RetrieveRequest,
+        results: dict,
+        expanded_query: str,
+        indexes: IndexGeneration,
+        bm25_results: list[BM25Result] | None,
+    ) -> list[DocumentChunk]:
+        """Timed _chunks_from_vector_results for a single query.
+
+        Args:
+            timings: Stage timings to record fusion_ms in
+            request: Retrieval request parameters
+            results: Vector DB results for exactly one query embedding
+            expanded_query: Synonym-expanded query for BM25
+            indexes: Pinned index generation of the query
+            bm25_results: Precomputed BM25 results (None = no hybrid search)
+
+        Returns:
+            List of retrieved DocumentChunk objects
+        """
+        start = time.perf_counter()
+        chunks = self._chunks_from_vector_results(
+            request, results, expanded_query, indexes, bm25_results
+        )
+        timings.fusion_ms = _elapsed_ms(start)
+        return chunks
+
+    def _finish_stage_timings(
+        self, timings: RetrievalStageTimings, start: float, queries: int
+    ) -> None:
+        """Record total time and log the stage breakdown.
+
+        Args:
+            timings: Stage timings of this initial retrieval
+            start: perf_counter() value when the retrieval started
+            queries: Number of queries retrieved together
+        """
+        timings.total_ms = _elapsed_ms(start)
+        if queries == 1:
+            self.last_stage_timings = timings
+        logger.info("initial_retrieval_stages", queries=queries, **timings.to_dict())
+
+    def _chunks_from_vector_results(
+        self,
+        request: RetrieveRequest,
+        results: dict,
+        expanded_query: str,
+        indexes: IndexGeneration | None = None,
+        bm25_results: list[BM25Result] | None = None,
+    ) -> list[DocumentChunk]:
+        """Convert single-query vector results to chunks and fuse with BM25 if enabled.
+
+        Args:
+            request: Retrieval request parameters
+            results: Vector DB results for exactly one query embedding
+            expanded_query: Synonym-expanded query for BM25
+            indexes: Index generation the results came from (default: current one)
+            bm25_results: Precomputed BM25 results for expanded_query (None = search now)
+
+        Returns:
+            List of retrieved DocumentChunk objects
+        """
+        indexes = indexes or self._indexes
+        hybrid_retriever = indexes.hybrid_retriever
+
+        # Resolve vector hits against the chunk registry
+        hits = self._results_to_hits(results, request.min_relevance, indexes)
 
         # Apply hybrid search if enabled
         # Use EXPANDED query for BM25 to catch user-friendly synonyms
-        if request.use_hybrid and self.hybrid_retriever and chunks:
-            chunks = self.hybrid_retriever.retrieve_hybrid(
-                query=expanded_query, vector_chunks=chunks, top_k=request.max_chunks
+        if request.use_hybrid and hybrid_retriever and hits:
+            hits = hybrid_retriever.retrieve_hybrid(
+                query=expanded_query,
+                vector_hits=hits,
+                top_k=request.max_chunks,
+                bm25_results=bm25_results,
             )
-            logger.debug("hybrid_search_applied", final_chunks=len(chunks))
+            logger.debug("hybrid_search_applied", final_chunks=len(hits))
 
-        return chunks
+        # Only the chunks that leave retrieval are copied out of the registry
+        return [hit.materialize() for hit in hits]
 
     def _normalize_and_expand_query(self, query: str) -> tuple[str, str]:
         """Normalize and expand query for retrieval.
@@ -268,7 +1010,12 @@ class RAGRetriever:
         )
 
     def _perform_multi_hop_retrieval(
-        self, request: RetrieveRequest, query_id: UUID, initial_chunks: list[DocumentChunk], verbose: bool = False
+        self,
+        request: RetrieveRequest,
+        query_id: UUID,
+        initial_chunks: list[DocumentChunk],
+        verbose: bool = False,
+        hop_errors: list[str] | None = None,
     ) -> tuple[RAGContext, list[Any], dict[UUID, int]]:
         """Perform multi-hop retrieval starting from initial chunks.
 
@@ -277,6 +1024,7 @@ class RAGRetriever:
             query_id: Query UUID
             initial_chunks: Initial retrieved chunks from Hop 0
             verbose: If True, capture filled prompts in HopEvaluation objects
+            hop_errors: Receives the non-fatal multi-hop errors of this retrieval
 
         Returns:
             Tuple of (RAGContext, hop_evaluations, chunk_hop_map)
@@ -286,62 +1034,49 @@ class RAGRetriever:
         # matching the Available Rules Reference (e.g., "accurate 1" → "Accurate 1")
         normalized_query, _ = self._normalize_and_expand_query(request.query)
 
-        # Multi-hop retrieval is async, so we need to run it in a way that works
-        # both from sync contexts (CLI) and async contexts (Discord bot)
-        # Always use thread-based approach to avoid event loop conflicts
-        # This works whether called from sync or async context
-        result_container = []
-        exception_container = []
-
-        def run_in_thread() -> None:
-            try:
-                # Create a new event loop in this thread
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    result = new_loop.run_until_complete(
-                        self.multi_hop_retriever.retrieve_multi_hop(
-                            query=normalized_query,
-                            context_key=request.context_key,
-                            query_id=query_id,
-                            initial_chunks=initial_chunks,
-                            verbose=verbose,
-                        )
-                    )
-                    result_container.append(result)
-                finally:
-                    new_loop.close()
-            except Exception as e:
-                exception_container.append(e)
-
-        # Run in separate thread
-        thread = threading.Thread(target=run_in_thread, daemon=True)
-        thread.start()
-        thread.join(timeout=RAG_HOP_EVALUATION_TIMEOUT)
+        # Multi-hop retrieval is async. From sync callers (CLI, RAG tests) it runs on
+        # the shared long-lived hop executor loop, so LLM clients and their
+        # connection pools are reused across queries. Async callers use retrieve_async.
+        result = get_hop_executor().run(
+            self.multi_hop_retriever.retrieve_multi_hop(
+                query=normalized_query,
+                context_key=request.context_key,
+                query_id=query_id,
+                initial_chunks=initial_chunks,
+                verbose=verbose,
+                hop_errors=hop_errors,
+            ),
+            timeout=RAG_HOP_EVALUATION_TIMEOUT,
+        )
 
-        # Check for errors
-        if exception_container:
-            raise exception_container[0]
+        return self._complete_multi_hop(request, query_id, result)
 
-        # Check if thread finished
-        if thread.is_alive():
-            raise TimeoutError(f"Multi-hop retrieval timed out after {RAG_HOP_EVALUATION_TIMEOUT} seconds")
+    def _complete_multi_hop(
+        self,
+        request: RetrieveRequest,
+        query_id: UUID,
+        result: tuple[RAGContext, list[Any], dict[UUID, int]],
+    ) -> tuple[RAGContext, list[Any], dict[UUID, int]]:
+        """Apply final reranking and limiting to multi-hop accumulated chunks.
 
-        # Return result
-        if result_container:
-            context, hop_evaluations, chunk_hop_map = result_container[0]
+        Args:
+            request: Retrieval request parameters
+            query_id: Query UUID
+            result: Raw (context, hop_evaluations, chunk_hop_map) from MultiHopRetriever
 
-            # Apply final reranking and limiting to multi-hop accumulated chunks
-            reranked_context, updated_chunk_hop_map = self.rerank_and_limit_final_chunks(
-                _query=request.query,
-                chunks=context.document_chunks,
-                query_id=query_id,
-                chunk_hop_map=chunk_hop_map,
-            )
+        Returns:
+            Tuple of (RAGContext, hop_evaluations, chunk_hop_map)
+        """
+        context, hop_evaluations, chunk_hop_map = result
 
-            return reranked_context, hop_evaluations, updated_chunk_hop_map
+        reranked_context, updated_chunk_hop_map = self.rerank_and_limit_final_chunks(
+            _query=request.query,
+            chunks=context.document_chunks,
+            query_id=query_id,
+            chunk_hop_map=chunk_hop_map,
+        )
 
-        raise RuntimeError("Multi-hop retrieval completed but produced no result")
+        return reranked_context, hop_evaluations, updated_chunk_hop_map
 
     def _validate_query(self, query: str) -> None:
         """Validate query string.
@@ -358,57 +1093,100 @@ class RAGRetriever:
         if len(query) > 2000:
             raise InvalidQueryError("Query exceeds 2000 character limit")
 
-    def _results_to_chunks(self, results: dict, min_relevance: float) -> list[DocumentChunk]:
-        """Convert vector DB results to DocumentChunk objects.
+    def _vector_result_fields(self, indexes: IndexGeneration) -> list[str] | None:
+        """Vector DB result fields to fetch.
 
         Args:
-            results: Vector DB query results
-            min_relevance: Minimum relevance threshold
+            indexes: Pinned index generation of the query
 
         Returns:
-            List of DocumentChunk objects sorted by relevance DESC
+            Only distances once the chunk registry is loaded (hits are resolved
+            by id), otherwise None for the full results
         """
-        chunks: list[DocumentChunk] = []
+        return ["distances"] if len(indexes.chunk_registry) else None
+
+    def _results_to_hits(
+        self, results: dict, min_relevance: float, indexes: IndexGeneration
+    ) -> list[ScoredChunk]:
+        """Resolve vector DB results to registry chunks scored by similarity.
 
+        Args:
+            results: Vector DB query results for one query embedding
+            min_relevance: Minimum relevance threshold
+            indexes: Index generation the results came from
+
+        Returns:
+            List of ScoredChunk sorted by relevance DESC
+        """
         # Chroma returns results as lists in the first index
         if not results["ids"] or not results["ids"][0]:
-            return chunks
+            return []
 
-        ids = results["ids"][0]
-        documents = results["documents"][0]
-        metadatas = results["metadatas"][0]
-        distances = results["distances"][0]
-
-        for i, chunk_id_str in enumerate(ids):
+        scored: list[tuple[str, float]] = []
+        for chunk_id, l2_squared in zip(results["ids"][0], results["distances"][0], strict=True):
             # Convert L2 squared distance to cosine similarity
             # Chroma returns squared L2 distance for normalized embeddings
             # cosine_similarity = 1 - (L2_squared / 2)
-            l2_squared = distances[i]
             relevance_score = max(0.0, 1.0 - (l2_squared / 2.0))
 
             # Skip if below threshold
             if relevance_score < min_relevance:
                 continue
 
-            metadata = metadatas[i]
-
-            chunk = DocumentChunk(
-                chunk_id=UUID(chunk_id_str),
-                document_id=UUID(metadata.get("document_id", str(uuid4()))),
-                text=documents[i],
-                header=metadata.get("header", ""),
-                header_level=metadata.get("header_level", 0),
-                metadata=metadata,
-                relevance_score=relevance_score,
-                position_in_doc=metadata.get("position", 0),
-            )
+            scored.append((chunk_id, relevance_score))
+
+        registry = indexes.chunk_registry
+        unregistered = [chunk_id for chunk_id, _ in scored if chunk_id not in registry]
+        fetched = (
+            self._fetch_unregistered_chunks(results, unregistered, indexes.vector_db)
+            if unregistered
+            else {}
+        )
 
-            chunks.append(chunk)
+        hits: list[ScoredChunk] = []
+        for chunk_id, relevance_score in scored:
+            chunk = registry.get(chunk_id) or fetched.get(chunk_id)
+            if chunk is not None:
+                hits.append(ScoredChunk(chunk, relevance_score, vector_similarity=relevance_score))
 
         # Sort by relevance score DESC (contract requirement)
-        chunks.sort(key=lambda c: c.relevance_score, reverse=True)
+        hits.sort(key=lambda hit: hit.score, reverse=True)
 
-        return chunks
+        return hits
+
+    def _fetch_unregistered_chunks(
+        self, results: dict, chunk_ids: list[str], vector_db: VectorDBService
+    ) -> dict[str, DocumentChunk]:
+        """Build chunks for vector hits missing from the chunk registry.
+
+        Happens when there is no registry (hybrid search disabled) or between
+        an ingest and the next index reload.
+
+        Args:
+            results: Vector DB query results for one query embedding
+            chunk_ids: Ids of the unregistered hits
+            vector_db: Vector DB the results came from
+
+        Returns:
+            Chunk id -> DocumentChunk (hits deleted from the vector DB are missing)
+        """
+        if results.get("documents") and results.get("metadatas"):
+            rows = {chunk_id: row for row, chunk_id in enumerate(results["ids"][0])}
+            documents = [results["documents"][0][rows[chunk_id]] for chunk_id in chunk_ids]
+            metadatas = [results["metadatas"][0][rows[chunk_id]] for chunk_id in chunk_ids]
+        else:
+            records = vector_db.collection.get(
+                ids=chunk_ids, include=["documents", "metadatas"]
+            )
+            found = set(records["ids"])
+            chunk_ids = [chunk_id for chunk_id in chunk_ids if chunk_id in found]
+            rows = {chunk_id: row for row, chunk_id in enumerate(records["ids"])}
+            documents = [records["documents"][rows[chunk_id]] for chunk_id in chunk_ids]
+            metadatas = [records["metadatas"][rows[chunk_id]] for chunk_id in chunk_ids]
+            logger.debug("unregistered_chunks_fetched", count=len(chunk_ids))
+
+        chunks = chunks_from_records(chunk_ids, documents, metadatas)
+        return dict(zip(chunk_ids, chunks, strict=True))
 
     def rerank_and_limit_final_chunks(
         self, _query: str, chunks: list[DocumentChunk], query_id: UUID, chunk_hop_map: dict[UUID, int]
@@ -462,51 +1240,308 @@ class RAGRetriever:
 
         return reranked_context, updated_chunk_hop_map
 
-    def _build_hybrid_index(self) -> None:
-        """Build BM25 index from all chunks in vector database."""
-        if not self.hybrid_retriever:
-            return
+    def _build_hybrid_index(
+        self, hybrid_retriever: HybridRetriever, vector_db: VectorDBService
+    ) -> tuple[HybridRetriever | None, list[DocumentChunk]]:
+        """Build BM25 index from all chunks in vector database.
 
+        Args:
+            hybrid_retriever: Hybrid retriever to index the chunks in
+            vector_db: Vector DB to load the chunks from
+
+        Returns:
+            Tuple of (hybrid retriever, or None if indexing failed; indexed chunks)
+        """
         try:
             # Get all chunks from vector DB
-            all_results = self.vector_db.collection.get(include=["documents", "metadatas"])
+            chunks = load_collection_chunks(vector_db)
 
-            if not all_results["ids"]:
+            if not chunks:
                 logger.warning("hybrid_index_empty", message="No documents in vector DB")
-                return
-
-            # Convert to DocumentChunk objects
-            chunks: list[DocumentChunk] = []
-            for i, chunk_id_str in enumerate(all_results["ids"]):
-                metadata = all_results["metadatas"][i]
-                chunk = DocumentChunk(
-                    chunk_id=UUID(chunk_id_str),
-                    document_id=UUID(metadata.get("document_id", str(uuid4()))),
-                    text=all_results["documents"][i],
-                    header=metadata.get("header", ""),
-                    header_level=metadata.get("header_level", 0),
-                    metadata=metadata,
-                    relevance_score=1.0,  # Placeholder for indexing
-                    position_in_doc=metadata.get("position", 0),
-                )
-                chunks.append(chunk)
+                return hybrid_retriever, []
 
             # Build BM25 index
-            self.hybrid_retriever.index_chunks(chunks)
-
-            # Cache chunks for header index (built after this method returns)
-            self._all_chunks = chunks
+            hybrid_retriever.index_chunks(chunks)
 
             logger.info(
                 "hybrid_index_built",
                 chunk_count=len(chunks),
-                stats=self.hybrid_retriever.get_stats(),
+                stats=hybrid_retriever.get_stats(),
             )
+            return hybrid_retriever, chunks
 
         except Exception as e:
             logger.error("hybrid_index_build_failed", error=str(e))
             # Non-fatal: continue without hybrid search
-            self.hybrid_retriever = None
+            return None, []
+
+    def _load_ingestion_state(self) -> IngestionState | None:
+        """Load the ingestion state the indexes are keyed by.
+
+        Returns:
+            IngestionState, or None if it cannot be read
+        """
+        try:
+            return IngestionState.load()
+        except Exception as e:
+            logger.warning("ingestion_state_load_failed", error=str(e))
+            return None
+
+    def _load_index_bundle(
+        self, vector_db: VectorDBService, index_key: str | None, bm25_k1: float, bm25_b: float
+    ) -> IndexBundle | None:
+        """Load the index bundle written by the last ingest, if still valid.
+
+        Args:
+            vector_db: Vector DB the bundle must match (chunk count)
+            index_key: IngestionState.index_key() of the current corpus
+            bm25_k1: BM25 k1 this retriever uses
+            bm25_b: BM25 b this retriever uses
+
+        Returns:
+            IndexBundle, or None to rebuild indexes from the vector DB
+        """
+        if not self.index_bundle_path or not index_key:
+            return None
+
+        try:
+            chunk_count = vector_db.get_count()
+        except Exception as e:
+            logger.warning("index_bundle_check_failed", error=str(e))
+            return None
+
+        return load_index_bundle(
+            index_key,
+            k1=bm25_k1,
+            b=bm25_b,
+            expected_chunk_count=chunk_count,
+            path=self.index_bundle_path,
+        )
+
+    def reload_indexes(self, force: bool = False) -> bool:
+        """Swap in indexes for a new ingestion generation (hot reload after `ingest`).
+
+        The new vector DB view, keyword, BM25 and header indexes and chunk
+        registry are built aside as one IndexGeneration while queries keep using
+        the current one, then swapped in with a single assignment, so in-flight
+        queries finish on the generation they started with. The
+        indexes come from the new index bundle when ingest wrote one; otherwise
+        only documents whose content changed are pulled from the vector DB and
+        re-tokenized, and a full rebuild is the fallback.
+
+        Args:
+            force: Rebuild even if the ingestion generation is unchanged
+
+        Returns:
+            True if new indexes were swapped in
+        """
+        state = self._load_ingestion_state()
+        if state is None:
+            return False
+        index_key = state.index_key()
+        if index_key == self.index_key and not force:
+            return False
+
+        start_time = time.perf_counter()
+        current = self._indexes
+        try:
+            vector_db = current.vector_db.reloaded()
+
+            bundle = None
+            if self.enable_hybrid:
+                bundle = self._load_index_bundle(
+                    vector_db,
+                    index_key,
+                    self._hybrid_params["bm25_k1"],
+                    self._hybrid_params["bm25_b"],
+                )
+
+            hybrid_retriever: HybridRetriever | None = None
+            header_index = HeaderIndex()
+            chunks: list[DocumentChunk] = []
+            changed_documents: list[str] | None = None
+            if bundle:
+                mode = "bundle"
+                chunks = bundle.chunks
+                hybrid_retriever = HybridRetriever(**self._hybrid_params)
+                hybrid_retriever.load_index(chunks, bundle.bm25)
+                header_index.build_from_entries(bundle.header_entries)
+                keyword_extractor = KeywordExtractor(keywords=bundle.keywords)
+            else:
+                if self.enable_hybrid:
+                    chunks, changed_documents = self._reload_chunks(current, state, vector_db)
+                    hybrid_retriever = HybridRetriever(**self._hybrid_params)
+                    # Chunk ids derive from (document, position, header), not text, so
+                    # only chunks of unchanged documents may keep their old tokens
+                    known_tokens = {}
+                    if current.hybrid_retriever and changed_documents is not None:
+                        unchanged_ids = {
+                            chunk.chunk_id
+                            for chunk in chunks
+                            if str(chunk.document_id) not in changed_documents
+                        }
+                        known_tokens = {
+                            chunk_id: tokens
+                            for chunk_id, tokens in (
+                                current.hybrid_retriever.bm25_retriever.tokens_by_chunk().items()
+                            )
+                            if chunk_id in unchanged_ids
+                        }
+                    hybrid_retriever.index_chunks(chunks, known_tokens)
+                    header_index.build_from_chunks(chunks)
+                mode = "full" if changed_documents is None else "incremental"
+                keyword_extractor = KeywordExtractor(
+                    cache_path=current.keyword_extractor.cache_path
+                )
+            indexes = IndexGeneration(
+                vector_db=vector_db,
+                keyword_extractor=keyword_extractor,
+                hybrid_retriever=hybrid_retriever,
+                chunks=chunks,
+                chunk_registry=ChunkRegistry(chunks),
+                header_index=header_index,
+                ingestion_state=state,
+                index_key=index_key,
+            )
+        except Exception as e:
+            logger.error("rag_index_reload_failed", index_key=index_key[:16], error=str(e))
+            return False
+
+        # Swap: the whole generation is replaced by one reference assignment
+        self._indexes = indexes
+
+        if self.retrieval_cache:
+            self._invalidate_retrieval_cache(current.ingestion_state, state)
+
+        logger.info(
+            "rag_indexes_reloaded",
+            mode=mode,
+            index_key=index_key[:16],
+            chunk_count=len(chunks),
+            changed_documents=None if changed_documents is None else len(changed_documents),
+            duration_ms=round((time.perf_counter() - start_time) * 1000, 1),
+        )
+        return True
+
+    def _invalidate_retrieval_cache(
+        self, old_state: IngestionState | None, state: IngestionState
+    ) -> None:
+        """Drop cached retrieval results made stale by a new ingestion generation.
+
+        Results citing a changed or removed document are dropped. New documents
+        (or a changed ingest configuration) can outrank anything, so those
+        clear the whole cache.
+
+        Args:
+            old_state: Ingestion state the previous indexes were built from
+            state: Ingestion state of the new generation
+        """
+        if old_state is None or old_state.fingerprint != state.fingerprint:
+            self.retrieval_cache.invalidate()
+            return
+
+        old_versions = _document_versions(old_state)
+        new_versions = _document_versions(state)
+        if set(new_versions) - set(old_versions):
+            self.retrieval_cache.invalidate()
+            return
+
+        for document_id, content_hash in old_versions.items():
+            if new_versions.get(document_id) != content_hash:
+                self.retrieval_cache.invalidate(UUID(document_id))
+
+    def _reload_chunks(
+        self, current: IndexGeneration, state: IngestionState, vector_db: VectorDBService
+    ) -> tuple[list[DocumentChunk], list[str] | None]:
+        """Chunks of the new generation, fetching only documents that changed.
+
+        Args:
+            current: Index generation being replaced
+            state: Ingestion state of the new generation
+            vector_db: Vector DB view of the new generation
+
+        Returns:
+            Tuple of (all chunks, ids of the documents fetched); the ids are None
+            when everything had to be fetched (no previous chunks, config
+            fingerprint changed, or the vector DB disagrees with the state)
+        """
+        old_state = current.ingestion_state
+        if current.chunks and old_state and old_state.fingerprint == state.fingerprint:
+            old_versions = _document_versions(old_state)
+            new_versions = _document_versions(state)
+            unchanged = {
+                document_id for document_id, content_hash in new_versions.items()
+                if old_versions.get(document_id) == content_hash
+            }
+            changed = sorted(set(new_versions) - unchanged)
+
+            chunks = [chunk for chunk in current.chunks if str(chunk.document_id) in unchanged]
+            chunks += load_collection_chunks(vector_db, document_ids=changed)
+
+            # Ingests that bypass the state would make the incremental view wrong
+            if len(chunks) == vector_db.get_count():
+                return chunks, changed
+            logger.warning(
+                "rag_index_incremental_mismatch",
+                chunks=len(chunks),
+                vector_db_count=vector_db.get_count(),
+            )
+
+        return load_collection_chunks(vector_db), None
+
+    def retrieve_titles(
+        self, titles: list[str], context_key: str, max_chunks: int
+    ) -> list[list[DocumentChunk]]:
+        """Semantic retrieval for several hop titles in one round trip.
+
+        Each title is embedded separately in one batched embeddings request,
+        all titles are searched with one multi-embedding vector DB query and
+        BM25/RRF fusion runs per title against the shared index.
+
+        Args:
+            titles: Titles to retrieve for
+            context_key: Context key for tracking
+            max_chunks: Maximum chunks per title
+
+        Returns:
+            Retrieved chunks per title, in title order (empty where the
+            title is invalid or its chunks do not meet the relevance threshold)
+
+        Raises:
+            VectorDBUnavailableError: If vector DB is unavailable
+        """
+        # An invalid title (e.g. empty) only loses its own results
+        valid_titles: list[str] = []
+        for title in titles:
+            try:
+                self._validate_query(title)
+            except InvalidQueryError as e:
+                logger.warning("title_retrieval_skipped", title=title[:100], error=str(e))
+                continue
+            valid_titles.append(title)
+
+        requests = [
+            RetrieveRequest(
+                query=title, context_key=context_key, max_chunks=max_chunks, use_multi_hop=False
+            )
+            for title in valid_titles
+        ]
+        per_title: list[list[DocumentChunk]] = []
+        if requests:
+            try:
+                per_title, _ = self._perform_initial_retrieval_many(requests)
+            except Exception as e:
+                logger.error("title_retrieval_failed", titles=len(requests), error=str(e))
+                raise VectorDBUnavailableError(f"Vector DB query failed: {e}") from e
+
+        # Same relevance gate as retrieve() applies to a query's chunks
+        chunks_by_title = {
+            request.query: self._create_rag_context(
+                uuid4(), chunks, request.min_relevance
+            ).document_chunks
+            for request, chunks in zip(requests, per_title, strict=True)
+        }
+        return [chunks_by_title.get(title, []) for title in titles]
 
     def retrieve_by_header(
         self, header_query: str, threshold: float = HEADER_FUZZY_THRESHOLD
@@ -524,3 +1559,106 @@ class RAGRetriever:
             Tuple of (matching chunk or None, match score)
         """
         return self.header_index.fuzzy_search(header_query, threshold)
+
+    def retrieve_by_headers(
+        self, header_queries: list[str], threshold: float = HEADER_FUZZY_THRESHOLD
+    ) -> list[tuple[DocumentChunk | None, float]]:
+        """Retrieve one chunk per header query in a single batched lookup.
+
+        Args:
+            header_queries: Header texts to search for
+            threshold: Minimum similarity (0.0-1.0)
+
+        Returns:
+            (matching chunk or None, match score) per query, in query order
+        """
+        return self.header_index.resolve_many(header_queries, threshold)
+
+
+def _cache_params(request: RetrieveRequest) -> tuple:
+    """Request parameters a cached retrieval result must match to be reused.
+
+    Args:
+        request: Retrieval request
+
+    Returns:
+        Hashable parameter tuple
+    """
+    return (request.max_chunks, request.min_relevance, request.use_hybrid, request.use_multi_hop)
+
+
+def _replay_cached(
+    cached: CachedRetrieval, query_id: UUID
+) -> tuple[RAGContext, list[Any], dict[UUID, int]]:
+    """Build the retrieve() result for a semantic cache hit.
+
+    Hop evaluations are copied with zero cost and time: no LLM call was made.
+
+    Args:
+        cached: Cached retrieval
+        query_id: Query UUID of the new request
+
+    Returns:
+        Tuple of (RAGContext, hop_evaluations, chunk_hop_map)
+    """
+    context = replace(
+        cached.context,
+        context_id=uuid4(),
+        query_id=query_id,
+        document_chunks=list(cached.context.document_chunks),
+        relevance_scores=list(cached.context.relevance_scores),
+    )
+    hop_evaluations = []
+    for evaluation in cached.hop_evaluations:
+        evaluation = copy.copy(evaluation)
+        evaluation.cost_usd = 0.0
+        evaluation.cache_savings_usd = 0.0
+        evaluation.retrieval_time_s = 0.0
+        evaluation.evaluation_time_s = 0.0
+        hop_evaluations.append(evaluation)
+    return context, hop_evaluations, dict(cached.chunk_hop_map)
+
+
+_stage_pool: ThreadPoolExecutor | None = None
+
+
+def _get_stage_pool() -> ThreadPoolExecutor:
+    """Get the shared worker pool for stages that overlap the embedding round trip.
+
+    Returns:
+        ThreadPoolExecutor
+    """
+    global _stage_pool
+    if _stage_pool is None:
+        _stage_pool = ThreadPoolExecutor(
+            max_workers=RAG_PARALLEL_STAGE_WORKERS, thread_name_prefix="rag-stage"
+        )
+    return _stage_pool
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since a perf_counter() value.
+
+    Args:
+        start: perf_counter() value
+
+    Returns:
+        Elapsed milliseconds
+    """
+    return (time.perf_counter() - start) * 1000
+
+
+def _document_versions(state: IngestionState) -> dict[str, str]:
+    """Map each ingested document id to its content hash.
+
+    Args:
+        state: Ingestion state
+
+    Returns:
+        Dict of document_id to content hash
+    """
+    return {
+        entry["document_id"]: entry["hash"]
+        for entry in state.files.values()
+        if entry.get("document_id")
+    }
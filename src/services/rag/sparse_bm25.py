@@ -0,0 +1,207 @@
+"""Vectorized BM25 scoring over a sparse term-document matrix.
+
+Drop-in replacement for rank_bm25.BM25Okapi. BM25Okapi.get_scores loops over every
+document in Python for every query token. Here the per-(term, document) BM25
+weights are precomputed once into CSR arrays (one row per term), so scoring a
+query is a sparse dot product: gather the rows of the query terms and sum them
+per document with np.bincount.
+
+Scores are bit-for-bit identical to BM25Okapi for the same k1/b/epsilon: the
+weights use the same floating point expression, and contributions are summed
+per document in query token order, exactly as BM25Okapi accumulates them.
+"""
+
+import math
+from collections import Counter
+
+import numpy as np
+
+
+class SparseBM25:
+    """Okapi BM25 backed by CSR term-document weight arrays."""
+
+    def __init__(
+        self, corpus: list[list[str]], k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25
+    ):
+        """Build the index.
+
+        Args:
+            corpus: Tokenized documents
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+            epsilon: Floor for negative IDFs, as a fraction of the average IDF
+                (same semantics as BM25Okapi)
+        """
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.corpus_size = len(corpus)
+
+        doc_len = np.array([len(doc) for doc in corpus])
+        self.avgdl = int(doc_len.sum()) / self.corpus_size if self.corpus_size else 0.0
+        self.doc_len = doc_len
+
+        # Term -> list of (doc index, term frequency), in document order
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for doc_idx, doc in enumerate(corpus):
+            for term, freq in Counter(doc).items():
+                postings.setdefault(term, []).append((doc_idx, freq))
+
+        self.vocabulary: dict[str, int] = {term: i for i, term in enumerate(postings)}
+        self.idf = self._calc_idf({term: len(p) for term, p in postings.items()})
+
+        # CSR layout: row t spans indptr[t]:indptr[t+1] in indices/data
+        indptr = np.zeros(len(postings) + 1, dtype=np.int64)
+        indices: list[int] = []
+        freqs: list[int] = []
+        idfs = np.empty(len(postings), dtype=np.float64)
+        for term, row in self.vocabulary.items():
+            term_postings = postings[term]
+            indptr[row + 1] = indptr[row] + len(term_postings)
+            indices.extend(doc_idx for doc_idx, _ in term_postings)
+            freqs.extend(freq for _, freq in term_postings)
+            idfs[row] = self.idf[term]
+
+        self.indptr = indptr
+        self.indices = np.array(indices, dtype=np.int64)
+        tf = np.array(freqs)
+        row_of_entry = np.repeat(np.arange(len(postings)), np.diff(indptr))
+
+        # Same expression (and evaluation order) as BM25Okapi.get_scores
+        self.data = idfs[row_of_entry] * (
+            tf * (k1 + 1)
+            / (tf + k1 * (1 - b + b * self.doc_len[self.indices] / self.avgdl))
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        terms: list[str],
+        arrays: dict[str, np.ndarray],
+        k1: float,
+        b: float,
+        epsilon: float = 0.25,
+    ) -> "SparseBM25":
+        """Rebuild an index from arrays produced by to_arrays(), without rescoring.
+
+        The arrays may be read-only memory maps; scoring only reads them.
+
+        Args:
+            terms: Vocabulary in row order
+            arrays: Mapping with indptr, indices, data, doc_len and idf arrays
+            k1: Term frequency saturation parameter the weights were built with
+            b: Document length normalization parameter the weights were built with
+            epsilon: Negative IDF floor the weights were built with
+
+        Returns:
+            SparseBM25 instance
+        """
+        index = cls.__new__(cls)
+        index.k1 = k1
+        index.b = b
+        index.epsilon = epsilon
+        index.doc_len = arrays["doc_len"]
+        index.corpus_size = len(index.doc_len)
+        index.avgdl = int(index.doc_len.sum()) / index.corpus_size if index.corpus_size else 0.0
+        index.vocabulary = {term: i for i, term in enumerate(terms)}
+        index.idf = dict(zip(terms, arrays["idf"].tolist(), strict=True))
+        index.indptr = arrays["indptr"]
+        index.indices = arrays["indices"]
+        index.data = arrays["data"]
+        return index
+
+    def to_arrays(self) -> tuple[list[str], dict[str, np.ndarray]]:
+        """Export the index for persisting (see from_arrays).
+
+        Returns:
+            Tuple of (vocabulary in row order, name -> array)
+        """
+        terms = list(self.vocabulary)
+        return terms, {
+            "indptr": np.asarray(self.indptr),
+            "indices": np.asarray(self.indices),
+            "data": np.asarray(self.data),
+            "doc_len": np.asarray(self.doc_len),
+            "idf": np.array([self.idf[term] for term in terms], dtype=np.float64),
+        }
+
+    def _calc_idf(self, doc_freqs: dict[str, int]) -> dict[str, float]:
+        """Compute IDF per term with BM25Okapi's negative-IDF flooring.
+
+        Args:
+            doc_freqs: Number of documents containing each term
+
+        Returns:
+            Term -> IDF
+        """
+        idf: dict[str, float] = {}
+        idf_sum = 0.0
+        negative_idfs = []
+        for term, freq in doc_freqs.items():
+            value = math.log(self.corpus_size - freq + 0.5) - math.log(freq + 0.5)
+            idf[term] = value
+            idf_sum += value
+            if value < 0:
+                negative_idfs.append(term)
+
+        if idf:
+            eps = self.epsilon * (idf_sum / len(idf))
+            for term in negative_idfs:
+                idf[term] = eps
+
+        return idf
+
+    def get_scores(self, query: list[str]) -> np.ndarray:
+        """Score every document against a tokenized query.
+
+        Args:
+            query: Query tokens (repeated tokens count repeatedly, like BM25Okapi)
+
+        Returns:
+            Array of BM25 scores, one per document
+        """
+        rows = [self.vocabulary[token] for token in query if token in self.vocabulary]
+        if not rows:
+            return np.zeros(self.corpus_size)
+
+        starts = self.indptr[rows]
+        ends = self.indptr[np.array(rows) + 1]
+        entries = np.concatenate([np.arange(s, e) for s, e in zip(starts, ends, strict=True)])
+
+        return np.bincount(
+            self.indices[entries], weights=self.data[entries], minlength=self.corpus_size
+        )
+
+    def top_k(self, query: list[str], k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the k best-scoring documents with a positive score.
+
+        Ordering matches a stable descending sort of get_scores(): ties keep
+        ascending document order.
+
+        Args:
+            query: Query tokens
+            k: Maximum number of documents to return
+
+        Returns:
+            Tuple of (document indices, scores), best first
+        """
+        scores = self.get_scores(query)
+        candidates = np.flatnonzero(scores > 0)
+
+        if k <= 0:
+            candidates = candidates[:0]
+        elif len(candidates) > k:
+            candidate_scores = scores[candidates]
+            kth_score = candidate_scores[np.argpartition(-candidate_scores, k - 1)[k - 1]]
+            above = candidates[candidate_scores > kth_score]
+            ties = candidates[candidate_scores == kth_score][: k - len(above)]
+            candidates = np.concatenate([above, ties])
+
+        order = np.lexsort((candidates, -scores[candidates]))
+        top = candidates[order]
+        return top, scores[top]
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct indexed terms."""
+        return len(self.vocabulary)
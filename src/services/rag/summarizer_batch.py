@@ -15,7 +15,6 @@ interrupted mid-wait resumes with `ingest --batch-collect` instead of paying for
 the same batch twice.
 """
 
-import asyncio
 import json
 import time
 from dataclasses import dataclass, field
@@ -33,6 +32,7 @@ from src.lib.pricing import calculate_llm_cost
 from src.models.rule_document import RuleDocument
 from src.services.llm.batch.custom_id import safe_custom_id
 from src.services.llm.batch.errors import CLASS_TRANSIENT, classify_batch_error, extract_item_error
+from src.services.llm.http_clients import run_closing_http_clients
 from src.services.llm.schemas import ChunkSummaries
 from src.services.rag.chunker import MarkdownChunk, MarkdownChunker
 from src.services.rag.ingestion_state import IngestionState
@@ -513,7 +513,7 @@ class BatchSummarizer:
             cache_read_tokens,
             cache_creation_tokens,
             model,
-        ) = asyncio.run(self.summarizer.generate_summaries(chunks))
+        ) = run_closing_http_clients(self.summarizer.generate_summaries(chunks))
 
         if prompt_tokens <= 0:
             return BatchCosts()
@@ -8,7 +8,9 @@ This module implements the Strategy pattern for different team matching approach
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
 from src.lib.logging import get_logger
@@ -20,6 +22,7 @@ from .config import (
     TEAM_MATCH_THRESHOLD,
 )
 from .utils import words_adjacent_in_text
+from .word_index import WordIndex
 
 logger = get_logger(__name__)
 
@@ -48,7 +51,7 @@ class OperativeMatchingStrategy(MatchingStrategy):
     to reduce false positives.
     """
 
-    def __init__(self, operative_cache: dict[str, dict]):
+    def __init__(self, operative_cache: dict[str, dict], word_index: WordIndex | None = None):
         """Initialize with pre-built operative cache.
 
         Args:
@@ -58,14 +61,18 @@ class OperativeMatchingStrategy(MatchingStrategy):
                     'words': [word1, word2, ...],  # Stop words removed
                     'has_role_words': bool
                 }
+            word_index: Inverted word index over operative_cache (None = scan every entry)
         """
         self.operative_cache = operative_cache
+        self.word_index = word_index
 
     def match(self, query_lower: str, _: list[str]) -> set[str]:
         """Match operatives in query."""
         relevant_teams: set[str] = set()
 
-        for operative, cache_entry in self.operative_cache.items():
+        for operative, cache_entry in _candidate_entries(
+            self.operative_cache, self.word_index, query_lower
+        ):
             if len(operative) < MIN_WORD_LENGTH:
                 continue
 
@@ -144,7 +151,7 @@ class AbilityMatchingStrategy(MatchingStrategy):
     Requires more words to match to prevent false positives from generic ability names.
     """
 
-    def __init__(self, ability_cache: dict[str, dict]):
+    def __init__(self, ability_cache: dict[str, dict], word_index: WordIndex | None = None):
         """Initialize with pre-built ability cache.
 
         Args:
@@ -153,14 +160,18 @@ class AbilityMatchingStrategy(MatchingStrategy):
                     'teams': [team_name, ...],
                     'words': [word1, word2, ...]  # Stop words removed
                 }
+            word_index: Inverted word index over ability_cache (None = scan every entry)
         """
         self.ability_cache = ability_cache
+        self.word_index = word_index
 
     def match(self, query_lower: str, _: list[str]) -> set[str]:
         """Match abilities in query."""
         relevant_teams: set[str] = set()
 
-        for ability, cache_entry in self.ability_cache.items():
+        for ability, cache_entry in _candidate_entries(
+            self.ability_cache, self.word_index, query_lower
+        ):
             if len(ability) < MIN_WORD_LENGTH:
                 continue
 
@@ -221,41 +232,53 @@ class AliasMatchingStrategy(MatchingStrategy):
         """
         self.team_aliases = team_aliases
 
+        # Unique alias words eligible for fuzzy matching, and the aliases using each
+        self._alias_words: list[str] = []
+        self._word_aliases: list[list[str]] = []
+        word_positions: dict[str, int] = {}
+        for alias in team_aliases:
+            for alias_word in alias.split():
+                if len(alias_word) < MIN_WORD_LENGTH:
+                    continue
+                if alias_word not in word_positions:
+                    word_positions[alias_word] = len(self._alias_words)
+                    self._alias_words.append(alias_word)
+                    self._word_aliases.append([])
+                self._word_aliases[word_positions[alias_word]].append(alias)
+
     def match(self, query_lower: str, query_words: list[str]) -> set[str]:
         """Match aliases in query."""
         relevant_teams: set[str] = set()
 
-        for alias, teams in self.team_aliases.items():
-            # Check if alias is in query (exact substring match)
-            if alias in query_lower:
-                relevant_teams.update(teams)
-                continue
-
-            # Try fuzzy matching alias words against filtered query words
-            if self._fuzzy_match_alias(alias, query_words):
-                relevant_teams.update(teams)
+        # Exact substring match first, then fuzzy matching of alias words
+        # against filtered query words
+        matched_aliases = {alias for alias in self.team_aliases if alias in query_lower}
+        matched_aliases.update(self._fuzzy_match_aliases(query_words))
+        for alias in matched_aliases:
+            relevant_teams.update(self.team_aliases[alias])
 
         return relevant_teams
 
-    def _fuzzy_match_alias(self, alias: str, query_words: list[str]) -> bool:
-        """Fuzzy match alias against query words.
+    def _fuzzy_match_aliases(self, query_words: list[str]) -> set[str]:
+        """Fuzzy match every alias word against query words in one batch.
 
         Args:
-            alias: Alias string
             query_words: Query words with stop words filtered
 
         Returns:
-            True if fuzzy match found
+            Aliases with a word scoring >= TEAM_MATCH_THRESHOLD against a query word
         """
-        alias_words = alias.split()
-        for alias_word in alias_words:
-            if len(alias_word) >= MIN_WORD_LENGTH:
-                for query_word in query_words:
-                    if len(query_word) >= MIN_WORD_LENGTH:
-                        similarity = fuzz.ratio(alias_word, query_word)
-                        if similarity >= TEAM_MATCH_THRESHOLD:
-                            return True
-        return False
+        candidates = [word for word in query_words if len(word) >= MIN_WORD_LENGTH]
+        if not candidates or not self._alias_words:
+            return set()
+
+        scores = process.cdist(
+            candidates, self._alias_words, scorer=fuzz.ratio, score_cutoff=TEAM_MATCH_THRESHOLD
+        )
+        matched: set[str] = set()
+        for position in (scores >= TEAM_MATCH_THRESHOLD).any(axis=0).nonzero()[0]:
+            matched.update(self._word_aliases[position])
+        return matched
 
 
 class FuzzyTeamNameStrategy(MatchingStrategy):
@@ -276,17 +299,44 @@ class FuzzyTeamNameStrategy(MatchingStrategy):
         """Fuzzy match team names in query."""
         relevant_teams: set[str] = set()
 
-        for word in query_words:
-            if len(word) < MIN_WORD_LENGTH:  # Skip short words
-                continue
-
-            # Try fuzzy matching against team names
-            match = process.extractOne(
-                word, self.team_names, scorer=fuzz.ratio, score_cutoff=TEAM_MATCH_THRESHOLD
-            )
-            if match:
-                team_name, score, _ = match
+        # Skip short words
+        words = [word for word in query_words if len(word) >= MIN_WORD_LENGTH]
+        if not words or not self.team_names:
+            return relevant_teams
+
+        # Score every word against every team name in one batch; each word
+        # takes its best team (first on ties, as process.extractOne does)
+        scores = process.cdist(
+            words,
+            self.team_names,
+            scorer=fuzz.ratio,
+            score_cutoff=TEAM_MATCH_THRESHOLD,
+            dtype=np.float64,  # float32 could merge near-tied scores
+        )
+        for word, row in zip(words, scores, strict=True):
+            best = int(row.argmax())
+            score = row[best]
+            if score >= TEAM_MATCH_THRESHOLD:
+                team_name = self.team_names[best]
                 relevant_teams.add(team_name)
-                logger.debug("team_fuzzy_match", word=word, team=team_name, score=score)
+                logger.debug("team_fuzzy_match", word=word, team=team_name, score=float(score))
 
         return relevant_teams
+
+
+def _candidate_entries(
+    cache: dict[str, dict], word_index: WordIndex | None, query_lower: str
+) -> Iterable[tuple[str, dict]]:
+    """Cache entries that can match the query.
+
+    Args:
+        cache: Operative or ability cache
+        word_index: Inverted word index over cache (None = every entry)
+        query_lower: Lowercased query string
+
+    Returns:
+        (entry name, cache entry) pairs in cache order
+    """
+    if word_index is None:
+        return cache.items()
+    return ((entry, cache[entry]) for entry in word_index.candidates(query_lower))
@@ -16,6 +16,7 @@ from .strategies import (
     OperativeMatchingStrategy,
 )
 from .utils import extract_all_items, filter_stop_words, has_common_role_word
+from .word_index import WordIndex
 
 logger = get_logger(__name__)
 
@@ -35,11 +36,15 @@ class TeamFilter:
         # Build keyword caches with pre-filtered stop words
         self._operative_cache: dict[str, dict] = {}
         self._ability_cache: dict[str, dict] = {}
+        self._operative_index = WordIndex({})
+        self._ability_index = WordIndex({})
         self._build_keyword_cache()
 
         # Initialize matching strategies
-        self.operative_strategy = OperativeMatchingStrategy(self._operative_cache)
-        self.ability_strategy = AbilityMatchingStrategy(self._ability_cache)
+        self.operative_strategy = OperativeMatchingStrategy(
+            self._operative_cache, self._operative_index
+        )
+        self.ability_strategy = AbilityMatchingStrategy(self._ability_cache, self._ability_index)
         self.alias_strategy = AliasMatchingStrategy(TEAM_ALIASES)
         self.fuzzy_strategy = FuzzyTeamNameStrategy(self._team_names)
 
@@ -48,12 +53,15 @@ class TeamFilter:
             total_teams=len(self._team_names),
             total_operatives=len(self._operative_cache),
             total_abilities=len(self._ability_cache),
+            indexed_words=len(self._operative_index) + len(self._ability_index),
         )
 
     def _build_keyword_cache(self) -> None:
         """Build mapping from keywords (operatives, rules) to team names.
 
-        Pre-filters stop words during cache building for better performance.
+        Pre-filters stop words during cache building for better performance,
+        then indexes both caches by word so a query only evaluates entries
+        with a word occurring in it.
         """
         for team_name, team_data in self.teams_structure.items():
             if not isinstance(team_data, dict):
@@ -93,6 +101,9 @@ class TeamFilter:
                     }
                 self._ability_cache[ability_lower]["teams"].append(team_name)
 
+        self._operative_index = WordIndex(self._operative_cache)
+        self._ability_index = WordIndex(self._ability_cache)
+
     def extract_relevant_teams(self, query: str) -> list[str]:
         """Extract relevant team names from user query using fuzzy matching.
 
@@ -0,0 +1,58 @@
+"""Inverted word index over operative/ability cache entries.
+
+Operative and ability matching test each (stop-word-filtered) entry word as a
+substring of the lowercased query, and no entry can match unless at least one
+of its words occurs in the query. The index maps every entry word to the
+entries containing it, so only those entries need to be evaluated.
+
+An entry word has no whitespace, so it can only occur inside a single
+whitespace-separated query token. Candidates are found by looking up every
+substring of every query token (bounded by the longest indexed word), which
+keeps the substring semantics of the strategies exact: the pruned entry set
+always contains every entry that could match.
+"""
+
+
+class WordIndex:
+    """Word -> cache entries inverted index."""
+
+    def __init__(self, cache: dict[str, dict]):
+        """Build index from an operative or ability cache.
+
+        Args:
+            cache: Dict mapping entry names to cache entries with a 'words' list
+        """
+        # Entry names in cache order, so candidates are evaluated in the same order
+        self._entries = list(cache)
+        self._postings: dict[str, list[int]] = {}
+        for position, entry in enumerate(self._entries):
+            for word in set(cache[entry]["words"]):
+                self._postings.setdefault(word, []).append(position)
+
+        lengths = [len(word) for word in self._postings]
+        self._min_length = min(lengths, default=0)
+        self._max_length = max(lengths, default=0)
+
+    def __len__(self) -> int:
+        """Number of indexed words."""
+        return len(self._postings)
+
+    def candidates(self, query_lower: str) -> list[str]:
+        """Entries with at least one word occurring in the query.
+
+        Args:
+            query_lower: Lowercased query string
+
+        Returns:
+            Entry names in cache order
+        """
+        positions: set[int] = set()
+        for token in set(query_lower.split()):
+            for start in range(len(token) - self._min_length + 1):
+                longest = min(len(token) - start, self._max_length)
+                for length in range(max(self._min_length, 1), longest + 1):
+                    posting = self._postings.get(token[start : start + length])
+                    if posting:
+                        positions.update(posting)
+
+        return [self._entries[position] for position in sorted(positions)]
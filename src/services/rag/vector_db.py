@@ -114,6 +114,7 @@ class VectorDBService:
         query_embeddings: list[list[float]],
         n_results: int = 5,
         where: dict[str, Any] | None = None,
+        include: list[str] | None = None,
     ) -> dict[str, Any]:
         """Query the vector database for similar embeddings.
 
@@ -121,13 +122,19 @@ class VectorDBService:
             query_embeddings: Query embedding vectors
             n_results: Number of results to return per query
             where: Metadata filter (optional)
+            include: Result fields to fetch besides ids (default: documents,
+                metadatas and distances)
 
         Returns:
             Query results dictionary with ids, documents, metadatas, distances
+            (fields not included are None)
         """
         try:
+            kwargs: dict[str, Any] = {}
+            if include is not None:
+                kwargs["include"] = include
             results = self.collection.query(
-                query_embeddings=query_embeddings, n_results=n_results, where=where
+                query_embeddings=query_embeddings, n_results=n_results, where=where, **kwargs
             )
 
             logger.debug(
@@ -197,3 +204,37 @@ class VectorDBService:
         )
 
         logger.info("collection_reset", collection=self.collection.name)
+
+    def reloaded(self) -> "VectorDBService":
+        """View of the store that includes writes made by another process (e.g. `ingest`).
+
+        Chroma queries read the persistent store directly, so another process's
+        upserts are already visible and the same service is returned.
+        """
+        return self
+
+
+def create_vector_db_service(
+    collection_name: str = "kill_team_rules",
+    db_path: str | None = None,
+    backend: str | None = None,
+) -> "VectorDBService":
+    """Create the vector DB backend selected by config (VECTOR_DB_BACKEND).
+
+    Args:
+        collection_name: Name of the Chroma collection
+        db_path: Optional path to database (defaults to config path)
+        backend: "chroma" or "matrix" (defaults to config.vector_db_backend)
+
+    Returns:
+        VectorDBService, or MatrixVectorDBService (same interface)
+    """
+    backend = backend or get_config().vector_db_backend
+
+    if backend == "matrix":
+        # Imported lazily: matrix_vector_db wraps VectorDBService from this module
+        from src.services.rag.matrix_vector_db import MatrixVectorDBService
+
+        return MatrixVectorDBService(collection_name=collection_name, db_path=db_path)  # type: ignore[return-value]
+
+    return VectorDBService(collection_name=collection_name, db_path=db_path)
@@ -121,6 +121,7 @@ def mock_rag_retriever(sample_chunks):
         return rag_context, [], {}
 
     retriever.retrieve = Mock(side_effect=mock_retrieve)
+    retriever.retrieve_async = AsyncMock(side_effect=mock_retrieve)
     return retriever
 
 
@@ -167,4 +168,7 @@ def mock_rag_retriever_multihop(sample_chunks):
     }
 
     retriever.retrieve = Mock(return_value=(rag_context, hop_evaluations, chunk_hop_map))
+    retriever.retrieve_async = AsyncMock(
+        return_value=(rag_context, hop_evaluations, chunk_hop_map)
+    )
     return retriever
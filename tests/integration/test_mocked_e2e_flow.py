@@ -62,7 +62,11 @@ def mock_rag_retriever():
         # Return tuple: (rag_context, hop_evaluations, chunk_hop_map)
         return rag_context, [], {}
 
+    async def mock_retrieve_async(request: RetrieveRequest, query_id: UUID):
+        return mock_retrieve(request, query_id)
+
     retriever.retrieve = mock_retrieve
+    retriever.retrieve_async = mock_retrieve_async
     return retriever
 
 
@@ -0,0 +1,45 @@
+"""Calibration of the semantic retrieval cache threshold against real embeddings.
+
+Questions that differ by one rules term or a negation must not share a cached
+retrieval. If a pair below fails, tighten RAG_RETRIEVAL_CACHE_MAX_DISTANCE
+until it misses (the failure message shows the measured distance).
+"""
+
+import numpy as np
+import pytest
+
+from src.lib.constants import EMBEDDING_MODEL, RAG_RETRIEVAL_CACHE_MAX_DISTANCE
+from src.services.rag.embeddings import EmbeddingService
+
+MUST_MISS = [
+    ("Can I shoot while concealed?", "Can I shoot while engaged?"),
+    ("Can I shoot while concealed?", "Can't I shoot while concealed?"),
+    ("Can I fall back while engaged?", "Can I charge while engaged?"),
+    ("Can I charge after I Dash?", "Can I Dash after I charge?"),
+    ("Does obscured block shooting?", "Does cover block shooting?"),
+    ("Can an operative with a Conceal order shoot?", "Can an operative with an Engage order shoot?"),
+]
+
+
+def _cosine_distance(a: list[float], b: list[float]) -> float:
+    va, vb = np.asarray(a), np.asarray(b)
+    return 1.0 - float(va @ vb / (np.linalg.norm(va) * np.linalg.norm(vb)))
+
+
+@pytest.fixture(scope="module")
+def embedding_service():
+    return EmbeddingService(model=EMBEDDING_MODEL, use_cache=False)
+
+
+@pytest.mark.integration
+@pytest.mark.embedding
+@pytest.mark.parametrize(("cached_query", "new_query"), MUST_MISS)
+def test_different_questions_miss_the_cache(embedding_service, cached_query, new_query):
+    distance = _cosine_distance(
+        embedding_service.embed_text(cached_query), embedding_service.embed_text(new_query)
+    )
+
+    assert distance > RAG_RETRIEVAL_CACHE_MAX_DISTANCE, (
+        f"{cached_query!r} / {new_query!r}: distance {distance:.4f} "
+        f"<= RAG_RETRIEVAL_CACHE_MAX_DISTANCE {RAG_RETRIEVAL_CACHE_MAX_DISTANCE}"
+    )
@@ -40,7 +40,9 @@ class RAGEvaluator:
         retrieved_headers = [chunk.header or "" for chunk in retrieved_chunks]
         retrieved_texts = [chunk.text or "" for chunk in retrieved_chunks]
         retrieved_scores = [chunk.relevance_score for chunk in retrieved_chunks]
-        retrieved_metadata = [chunk.metadata for chunk in retrieved_chunks]
+        retrieved_metadata = [
+            {**chunk.metadata, **chunk.score_breakdown()} for chunk in retrieved_chunks
+        ]
 
         # Find which ground_truth_contexts were found
         # Use SUBSTRING matching: ground truth text must be CONTAINED in retrieved header or text (case-insensitive)
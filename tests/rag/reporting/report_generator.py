@@ -91,6 +91,14 @@ class RAGReportGenerator:
         if summary.test_set_codename:
             content.append(f"**Test Set**: {summary.test_set_codename}")
         content.append(f"**Avg Retrieval Time**: {summary.avg_retrieval_time_seconds:.3f}s")
+        if summary.avg_initial_retrieval_stages_ms:
+            stages = summary.avg_initial_retrieval_stages_ms
+            content.append(
+                f"**Initial Retrieval Stages**: normalize {stages['normalize_ms']:.1f}ms, "
+                f"embed {stages['embed_ms']:.1f}ms, vector search {stages['vector_search_ms']:.1f}ms, "
+                f"BM25 {stages['bm25_ms']:.1f}ms (overlapped), fusion {stages['fusion_ms']:.1f}ms, "
+                f"wall {stages['total_ms']:.1f}ms (saved {stages['overlap_saved_ms']:.1f}ms)"
+            )
         content.append(f"**Avg Retrieval Cost**: ¢{avg_retrieval_cost_cents:.3f}")
         content.append(f"**Runs per Test**: {summary.runs_per_test}")
         content.append(f"**Total Tests**: {summary.total_tests}")
@@ -119,6 +119,7 @@ class RAGTestResult:
     error_type: str | None = None  # Type of error that occurred (e.g., "TimeoutError", "ValueError")
     error_message: str | None = None  # Error message if test failed
     hop_errors: list[str] = None  # Non-fatal errors during hop evaluation (e.g., LLM truncation)
+    initial_retrieval_stages_ms: dict[str, float] | None = None  # Per-stage timings (see RetrievalStageTimings)
 
     # Retrieval Metrics (optional, calculated if ground_truth_contexts provided)
     context_precision: float | None = None  # context precision (0-1)
@@ -215,3 +216,6 @@ class RAGTestSummary:
     # Ground truth rank analysis (for MAXIMUM_FINAL_CHUNK_COUNT tuning)
     max_ground_truth_rank_found: int = 0  # Highest rank where any ground truth was found across all tests
     avg_max_ground_truth_rank: float = 0.0  # Average max rank per test
+
+    # Initial retrieval stage breakdown (ms, averaged; BM25 overlaps embedding + vector search)
+    avg_initial_retrieval_stages_ms: dict[str, float] | None = None
@@ -5,7 +5,8 @@ Loads test cases, runs retrieval, evaluates metrics, generates reports.
 
 import time
 from pathlib import Path
-from uuid import uuid4
+from typing import Any
+from uuid import UUID, uuid4
 
 from src.lib.constants import (
     BM25_B,
@@ -23,7 +24,7 @@ from src.lib.text_utils import ground_truth_matches_text
 from src.lib.tokens import estimate_embedding_cost
 from src.models.rag_request import RetrieveRequest
 from src.services.rag.embeddings import EmbeddingService
-from src.services.rag.retriever import RAGRetriever
+from src.services.rag.retriever import BatchRetrievalDetail, RAGRetriever
 from tests.rag.evaluator import RAGEvaluator
 from tests.rag.retrieval_evaluator import RetrievalEvaluator, add_retrieval_metrics_to_result
 from tests.rag.test_case_models import RAGTestCase, RAGTestResult, RAGTestSummary
@@ -176,9 +177,39 @@ class RAGTestRunner:
             min_relevance=min_relevance,
         )
 
-        # Create retrieval request
         query_id = uuid4()
-        request = RetrieveRequest(
+        request = self._build_request(test_case, max_chunks, min_relevance)
+
+        # Retrieve chunks (returns tuple: context, hop_evaluations, chunk_hop_map)
+        start_time = time.time()
+        hop_errors: list[str] = []
+        try:
+            outcome = self.retriever.retrieve(request, query_id)
+            if self.retriever.multi_hop_retriever is not None:
+                hop_errors = list(self.retriever.multi_hop_retriever.last_hop_errors)
+        except Exception as e:
+            outcome = e
+        retrieval_time = time.time() - start_time
+
+        result = self._evaluate_outcome(test_case, run_number, outcome, retrieval_time, hop_errors)
+        if self.retriever.last_stage_timings is not None and not isinstance(outcome, Exception):
+            result.initial_retrieval_stages_ms = self.retriever.last_stage_timings.to_dict()
+        return result
+
+    def _build_request(
+        self, test_case: RAGTestCase, max_chunks: int, min_relevance: float
+    ) -> RetrieveRequest:
+        """Build the retrieval request for a test case.
+
+        Args:
+            test_case: Test case to run
+            max_chunks: Maximum chunks to retrieve
+            min_relevance: Minimum relevance threshold
+
+        Returns:
+            RetrieveRequest
+        """
+        return RetrieveRequest(
             query=test_case.query,
             context_key="rag-test",
             max_chunks=max_chunks,
@@ -187,14 +218,33 @@ class RAGTestRunner:
             use_multi_hop=(RAG_MAX_HOPS > 0),  # Explicitly set based on current constant value
         )
 
+    def _evaluate_outcome(
+        self,
+        test_case: RAGTestCase,
+        run_number: int,
+        outcome: tuple[Any, list[Any], dict[UUID, int]] | Exception,
+        retrieval_time: float,
+        hop_errors: list[str],
+    ) -> RAGTestResult:
+        """Evaluate one retrieval outcome (result tuple or the exception it raised).
+
+        Args:
+            test_case: Test case that was run
+            run_number: Run number (for multi-run tests)
+            outcome: (context, hop_evaluations, chunk_hop_map) or the retrieval exception
+            retrieval_time: Retrieval time in seconds
+            hop_errors: Non-fatal hop evaluation errors from the retrieval
+
+        Returns:
+            RAGTestResult
+        """
         total_cost = 0.0
         retrieval_metrics = None
 
-        # Retrieve chunks (returns tuple: context, hop_evaluations, chunk_hop_map)
-        start_time = time.time()
         try:
-            rag_context, hop_evaluations, chunk_hop_map = self.retriever.retrieve(request, query_id)
-            retrieval_time = time.time() - start_time
+            if isinstance(outcome, Exception):
+                raise outcome
+            rag_context, hop_evaluations, chunk_hop_map = outcome
 
             # Calculate costs following Discord bot pattern
             # 1. Initial embedding cost
@@ -267,15 +317,11 @@ class RAGTestRunner:
             result = add_retrieval_metrics_to_result(result, retrieval_metrics)
 
             # Capture non-fatal hop evaluation errors (after metrics rebuild)
-            if (
-                self.retriever.multi_hop_retriever is not None
-                and self.retriever.multi_hop_retriever.last_hop_errors
-            ):
-                result.hop_errors = list(self.retriever.multi_hop_retriever.last_hop_errors)
+            if hop_errors:
+                result.hop_errors = list(hop_errors)
 
         except TimeoutError as e:
             # Handle timeout gracefully - create failed result and continue
-            retrieval_time = time.time() - start_time
             error_type = "TimeoutError"
             error_message = str(e)
 
@@ -305,7 +351,6 @@ class RAGTestRunner:
 
         except Exception as e:
             # Handle other exceptions gracefully
-            retrieval_time = time.time() - start_time
             error_type = type(e).__name__
             error_message = str(e)
 
@@ -372,32 +417,54 @@ class RAGTestRunner:
             Tuple of (list of all test results, total time in seconds)
         """
         test_cases = self.load_test_cases(test_id)
+        runs_to_do = [
+            (test_case, run_num) for test_case in test_cases for run_num in range(1, runs + 1)
+        ]
 
         all_results = []
         total_start_time = time.time()
 
-        for test_case in test_cases:
-            for run_num in range(1, runs + 1):
-                try:
-                    result = self.run_test(
-                        test_case=test_case,
-                        max_chunks=max_chunks,
-                        min_relevance=min_relevance,
-                        run_number=run_num,
-                    )
-                    all_results.append(result)
-                except Exception as e:
-                    # Defense-in-depth: Catch any unexpected errors in test execution
-                    # (run_test should handle most errors internally, but this ensures robustness)
-                    logger.error(
-                        "rag_test_runner_error",
-                        test_id=test_case.test_id,
-                        run=run_num,
-                        error_type=type(e).__name__,
-                        error=str(e),
-                    )
-                    # Continue with next test despite error
-                    continue
+        # All queries go through one batched retrieval: one embedding call, one
+        # vector DB query, concurrent multi-hop evaluations
+        logger.info(
+            "running_rag_tests",
+            tests=len(test_cases),
+            runs=runs,
+            max_chunks=max_chunks,
+            min_relevance=min_relevance,
+        )
+        requests = [
+            self._build_request(test_case, max_chunks, min_relevance) for test_case, _ in runs_to_do
+        ]
+        try:
+            outcomes = self.retriever.retrieve_many(requests, return_exceptions=True)
+            details = self.retriever.last_batch_details
+        except Exception as e:
+            logger.error("rag_test_batch_failed", error_type=type(e).__name__, error=str(e))
+            elapsed = (time.time() - total_start_time) / max(len(requests), 1)
+            outcomes = [e] * len(requests)
+            details = [BatchRetrievalDetail(retrieval_time_s=elapsed) for _ in requests]
+
+        for (test_case, run_num), outcome, detail in zip(runs_to_do, outcomes, details, strict=True):
+            try:
+                result = self._evaluate_outcome(
+                    test_case, run_num, outcome, detail.retrieval_time_s, detail.hop_errors
+                )
+                if detail.stage_timings is not None:
+                    result.initial_retrieval_stages_ms = detail.stage_timings.to_dict()
+                all_results.append(result)
+            except Exception as e:
+                # Defense-in-depth: Catch any unexpected errors in test execution
+                # (_evaluate_outcome should handle most errors internally, but this ensures robustness)
+                logger.error(
+                    "rag_test_runner_error",
+                    test_id=test_case.test_id,
+                    run=run_num,
+                    error_type=type(e).__name__,
+                    error=str(e),
+                )
+                # Continue with next test despite error
+                continue
 
         total_time = time.time() - total_start_time
 
@@ -590,6 +657,17 @@ class RAGTestRunner:
         # Calculate performance metrics
         avg_retrieval_time = sum(r.retrieval_time_seconds for r in results) / len(results)
 
+        # Average initial retrieval stage timings (shows the time saved by overlapping BM25)
+        stage_timings = [r.initial_retrieval_stages_ms for r in results if r.initial_retrieval_stages_ms]
+        avg_stage_timings = (
+            {
+                stage: sum(timings[stage] for timings in stage_timings) / len(stage_timings)
+                for stage in stage_timings[0]
+            }
+            if stage_timings
+            else None
+        )
+
         # Calculate actual hop evaluation cost and cache savings from stored hop evaluation data
         hop_evaluation_cost = 0.0
         hop_cache_savings = 0.0
@@ -814,4 +892,5 @@ class RAGTestRunner:
             hop_can_answer_precision=hop_can_answer_precision,
             max_ground_truth_rank_found=max_ground_truth_rank_found,
             avg_max_ground_truth_rank=avg_max_ground_truth_rank,
+            avg_initial_retrieval_stages_ms=avg_stage_timings,
         )
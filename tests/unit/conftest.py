@@ -0,0 +1,21 @@
+"""Unit-suite fixtures: keep persistent caches out of the working tree."""
+
+import pytest
+
+from src.services.rag import embedding_cache, hop_evaluation_cache
+from src.services.rag.embedding_cache import EmbeddingCache
+from src.services.rag.hop_evaluation_cache import HopEvaluationCache
+
+
+@pytest.fixture(autouse=True)
+def _memory_only_embedding_cache(monkeypatch):
+    """Give EmbeddingServices built with the default cache a memory-only one."""
+    monkeypatch.setattr(embedding_cache, "_embedding_cache", EmbeddingCache(db_path=None))
+
+
+@pytest.fixture(autouse=True)
+def _memory_only_hop_evaluation_cache(monkeypatch):
+    """Give code that falls back to the global hop evaluation cache a memory-only one."""
+    monkeypatch.setattr(
+        hop_evaluation_cache, "_hop_evaluation_cache", HopEvaluationCache(db_path=None)
+    )
@@ -0,0 +1,107 @@
+"""Tests for progressive Discord message updates while an answer streams."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+
+from src.services.discord.stream_editor import StreamingResponseEditor
+
+ANSWER = json.dumps(
+    {
+        "smalltalk": False,
+        "short_answer": "Yes.",
+        "persona_short_answer": "Obviously.",
+        "quotes": [{"quote_title": "Core Rules: Dash", "quote_text": "Move 3\".", "chunk_id": "a1b2"}],
+        "explanation": "Dash is a separate action.",
+        "persona_afterword": "Elementary.",
+    }
+)
+
+
+@pytest.fixture
+def ack_message():
+    message = Mock(spec=discord.Message)
+    message.content = "Consulting the codex..."
+    message.edit = AsyncMock()
+    return message
+
+
+async def stream(editor: StreamingResponseEditor, text: str, chunk_size: int = 5) -> None:
+    for start in range(0, len(text), chunk_size):
+        await editor.on_text(text[start : start + chunk_size])
+        await asyncio.sleep(0)  # Let scheduled edits run, as a network stream would
+
+
+@pytest.mark.asyncio
+async def test_edits_are_rate_limited(ack_message):
+    editor = StreamingResponseEditor(ack_message, min_interval_s=60)
+
+    await stream(editor, ANSWER)
+    await editor.finish(embeds=[], view=None)
+
+    # One preview edit (first visible text) plus the final edit
+    assert ack_message.edit.await_count == 2
+    first_preview = ack_message.edit.await_args_list[0].kwargs["content"]
+    assert first_preview.startswith("**")
+    assert editor.first_content_at is not None
+
+
+@pytest.mark.asyncio
+async def test_preview_grows_in_answer_order(ack_message):
+    editor = StreamingResponseEditor(ack_message, min_interval_s=0)
+
+    await stream(editor, ANSWER)
+    await editor._wait_for_pending_edit()
+
+    previews = [call.kwargs["content"] for call in ack_message.edit.await_args_list]
+    assert len(previews) > 3
+    final_preview = previews[-1]
+    assert final_preview.index("**Yes.**") < final_preview.index("Core Rules: Dash")
+    assert final_preview.index("Core Rules: Dash") < final_preview.index("**Explanation**")
+    assert final_preview.endswith("*Elementary.*")
+
+
+@pytest.mark.asyncio
+async def test_finish_replaces_preview_with_embeds(ack_message):
+    editor = StreamingResponseEditor(ack_message, min_interval_s=0)
+    embeds = [discord.Embed(description="final")]
+    view = Mock(spec=discord.ui.View)
+
+    await stream(editor, ANSWER)
+    assert await editor.finish(embeds, view) is True
+
+    ack_message.edit.assert_awaited_with(content=None, embeds=embeds, view=view)
+
+
+@pytest.mark.asyncio
+async def test_finish_reports_failed_edit(ack_message):
+    ack_message.edit.side_effect = discord.HTTPException(Mock(status=404), "Unknown Message")
+    editor = StreamingResponseEditor(ack_message, min_interval_s=0)
+
+    await stream(editor, ANSWER)
+
+    assert await editor.finish([], None) is False
+    assert editor.first_content_at is None  # No preview was ever visible
+
+
+@pytest.mark.asyncio
+async def test_abandon_restores_acknowledgement(ack_message):
+    editor = StreamingResponseEditor(ack_message, min_interval_s=0)
+
+    await stream(editor, ANSWER[:80])
+    await editor.abandon()
+
+    ack_message.edit.assert_awaited_with(content="Consulting the codex...")
+
+
+@pytest.mark.asyncio
+async def test_abandon_without_preview_leaves_message_alone(ack_message):
+    editor = StreamingResponseEditor(ack_message)
+
+    await editor.on_text('{"smalltalk": false, ')
+    await editor.abandon()
+
+    ack_message.edit.assert_not_awaited()
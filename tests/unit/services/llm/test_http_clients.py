@@ -0,0 +1,75 @@
+"""Tests for the shared keep-alive HTTP clients of the raw-httpx adapters."""
+
+import asyncio
+
+import pytest
+
+from src.lib.constants import LLM_HTTP_MAX_CONNECTIONS
+from src.services.llm import http_clients
+from src.services.llm.http_clients import (
+    close_shared_http_clients,
+    get_shared_http_client,
+    run_closing_http_clients,
+)
+
+GROK_URL = "https://api.x.ai/v1"
+MISTRAL_URL = "https://api.mistral.ai/v1"
+
+
+@pytest.mark.asyncio
+async def test_one_client_per_base_url():
+    grok = get_shared_http_client(GROK_URL)
+
+    assert get_shared_http_client(GROK_URL) is grok
+    assert get_shared_http_client(MISTRAL_URL) is not grok
+    assert grok._transport._pool._max_connections == LLM_HTTP_MAX_CONNECTIONS
+
+    await close_shared_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_close_hook_closes_clients_and_next_call_reopens():
+    client = get_shared_http_client(GROK_URL)
+
+    await close_shared_http_clients()
+
+    assert client.is_closed
+    assert get_shared_http_client(GROK_URL) is not client
+    await close_shared_http_clients()
+
+
+def test_each_event_loop_gets_its_own_client():
+    """Connections belong to one loop; CLI runs use several loops in turn."""
+
+    async def lookup():
+        client = get_shared_http_client(GROK_URL)
+        await close_shared_http_clients()
+        return client
+
+    assert asyncio.run(lookup()) is not asyncio.run(lookup())
+
+
+def test_run_closing_http_clients_leaves_nothing_behind():
+    async def lookup():
+        return get_shared_http_client(GROK_URL)
+
+    clients = [run_closing_http_clients(lookup()) for _ in range(3)]
+
+    assert all(client.is_closed for client in clients)
+    assert not http_clients._clients
+
+
+def test_clients_of_closed_loops_are_dropped():
+    async def lookup():
+        return get_shared_http_client(GROK_URL)
+
+    asyncio.run(lookup())  # Loop ends without the close hook
+    asyncio.run(lookup())
+
+    async def remaining():
+        get_shared_http_client(GROK_URL)
+        count = len(http_clients._clients)
+        await close_shared_http_clients()
+        return count
+
+    assert asyncio.run(remaining()) == 1
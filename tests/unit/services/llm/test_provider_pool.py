@@ -0,0 +1,130 @@
+"""Tests for the pooled LLM provider adapters."""
+
+import asyncio
+import os
+
+import pytest
+
+from src.lib.server_config import MultiServerConfig
+from src.services.llm.provider_pool import LLMProviderPool
+
+
+class FakeAdapter:
+    """Adapter stand-in that records how often it was built and closed."""
+
+    instances: list["FakeAdapter"] = []
+
+    def __init__(self, api_key: str, model: str):
+        self.api_key = api_key
+        self.model = model
+        self.reasoning_effort = None
+        self.closed = False
+        FakeAdapter.instances.append(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _reset_instances():
+    FakeAdapter.instances = []
+
+
+def test_same_model_key_and_effort_share_one_adapter():
+    pool = LLMProviderPool()
+
+    first = pool.acquire(FakeAdapter, "model-a", "key-1", None, slot=("guild-1", "a"))
+    second = pool.acquire(FakeAdapter, "model-a", "key-1", None, slot=("guild-2", "a"))
+    high = pool.acquire(FakeAdapter, "model-a", "key-1", "high", slot=("guild-3", "a#high"))
+
+    assert first is second
+    assert high is not first
+    assert high.reasoning_effort == "high"
+    assert len(FakeAdapter.instances) == 2
+    assert pool.get_stats()["reused"] == 1
+    assert pool.get_stats()["reuse_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_rotated_key_retires_old_adapter_after_grace():
+    pool = LLMProviderPool(retire_grace_s=0.05)
+
+    old = pool.acquire(FakeAdapter, "model-a", "key-1", None, slot=("guild-1", "a"))
+    new = pool.acquire(FakeAdapter, "model-a", "key-2", None, slot=("guild-1", "a"))
+
+    assert new is not old
+    assert not old.closed  # Requests in flight on it can still finish
+    await asyncio.sleep(0.1)
+    assert old.closed
+    assert not new.closed
+    assert pool.get_stats()["rotated"] == 1
+
+
+def test_rotation_keeps_adapter_used_by_another_slot():
+    pool = LLMProviderPool()
+
+    shared = pool.acquire(FakeAdapter, "model-a", "key-1", None, slot=("guild-1", "a"))
+    pool.acquire(FakeAdapter, "model-a", "key-1", None, slot=("guild-2", "a"))
+    pool.acquire(FakeAdapter, "model-a", "key-2", None, slot=("guild-1", "a"))
+
+    assert pool.acquire(FakeAdapter, "model-a", "key-1", None, slot=("guild-2", "a")) is shared
+    assert pool.get_stats()["rotated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_adapter_is_evicted():
+    pool = LLMProviderPool(max_size=2, retire_grace_s=0)
+
+    a = pool.acquire(FakeAdapter, "model-a", "key", None, slot="a")
+    b = pool.acquire(FakeAdapter, "model-b", "key", None, slot="b")
+    pool.acquire(FakeAdapter, "model-a", "key", None, slot="a")  # b is now least recent
+    pool.acquire(FakeAdapter, "model-c", "key", None, slot="c")
+    await asyncio.sleep(0.01)
+
+    assert b.closed
+    assert not a.closed
+    assert pool.get_stats()["pooled"] == 2
+    assert pool.get_stats()["evicted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_pooled_and_retiring_adapters():
+    pool = LLMProviderPool(retire_grace_s=60)
+
+    retiring = pool.acquire(FakeAdapter, "model-a", "key-1", None, slot="a")
+    pooled = pool.acquire(FakeAdapter, "model-a", "key-2", None, slot="a")
+    await pool.aclose()
+
+    assert retiring.closed and pooled.closed
+    assert pool.get_stats()["closed"] == 2
+    assert pool.get_stats()["pooled"] == 0
+
+
+def test_server_config_reload_if_changed(tmp_path):
+    path = tmp_path / "servers.yaml"
+    path.write_text("servers:\n  '1':\n    llm_provider: gpt-5\n    openai_api_key: key-1\n")
+    config = MultiServerConfig(str(path))
+
+    assert config.reload_if_changed() is False
+
+    path.write_text("servers:\n  '1':\n    llm_provider: gpt-5\n    openai_api_key: key-2\n")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+    assert config.reload_if_changed() is True
+    assert config.get_server_config("1").openai_api_key == "key-2"
+
+
+def test_server_config_reload_keeps_config_when_file_is_broken(tmp_path):
+    path = tmp_path / "servers.yaml"
+    path.write_text("servers:\n  '1':\n    llm_provider: gpt-5\n    openai_api_key: key-1\n")
+    config = MultiServerConfig(str(path))
+    servers = config.servers
+
+    path.write_text("servers:\n  '1': [unclosed\n")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+    assert config.reload_if_changed() is False
+    assert config.servers is servers
+    assert config.get_server_config("1").openai_api_key == "key-1"
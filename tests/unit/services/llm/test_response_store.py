@@ -0,0 +1,242 @@
+"""Tests for the record/replay LLM response store."""
+
+import asyncio
+import json
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.services.llm import factory as fac
+from src.services.llm import response_store
+from src.services.llm.base import GenerationConfig, GenerationRequest, LLMProvider, LLMResponse
+from src.services.llm.gemini import GeminiAdapter
+from src.services.llm.grok import GrokAdapter
+from src.services.llm.response_store import (
+    LLMResponseStore,
+    ResponseStoreMissError,
+    configure_llm_response_store,
+    make_response_key,
+)
+
+
+class FakeProvider(LLMProvider):
+    """Provider that numbers its answers and counts calls."""
+
+    def __init__(self, api_key: str = "key", model: str = "fake-model"):
+        super().__init__(api_key, model)
+        self.calls = 0
+
+    async def generate(self, _request: GenerationRequest) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            response_id=uuid4(),
+            answer_text=json.dumps({"answer": self.calls}),
+            confidence_score=0.9,
+            token_count=150,
+            latency_ms=1200,
+            provider="fake",
+            model_version=self.model,
+            citations_included=True,
+            prompt_tokens=100,
+            completion_tokens=50,
+            cache_read_tokens=20,
+            structured_output={"answer": self.calls},
+        )
+
+    async def extract_pdf(self, request):
+        raise NotImplementedError
+
+
+def make_request(query: str = "Can I Dash twice?", **config) -> GenerationRequest:
+    return GenerationRequest(
+        prompt=query,
+        context=["Dash: move 3 inches."],
+        config=GenerationConfig(system_prompt="You are a rules judge.", **config),
+        chunk_ids=["11111111-2222-3333-4444-555566667777"],
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_store(monkeypatch):
+    monkeypatch.setattr(response_store, "_store", False)
+    monkeypatch.delenv(response_store.MODE_ENV_VAR, raising=False)
+
+
+@pytest.mark.asyncio
+async def test_record_missing_then_replay_offline(tmp_path):
+    provider = LLMResponseStore("record-missing", tmp_path).attach(FakeProvider())
+    recorded = await provider.generate(make_request())
+    assert provider.calls == 1
+
+    offline = LLMResponseStore("replay", tmp_path).attach(FakeProvider())
+    replayed = await offline.generate(make_request())
+
+    assert offline.calls == 0
+    assert replayed.answer_text == recorded.answer_text
+    assert replayed.structured_output == {"answer": 1}
+    assert (replayed.prompt_tokens, replayed.completion_tokens, replayed.cache_read_tokens) == (100, 50, 20)
+    assert replayed.response_id != recorded.response_id
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_raises_without_calling_provider(tmp_path):
+    store = LLMResponseStore("replay", tmp_path)
+    provider = store.attach(FakeProvider())
+
+    with pytest.raises(ResponseStoreMissError):
+        await provider.generate(make_request())
+    assert provider.calls == 0
+    assert store.stats["missed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_record_mode_always_calls_and_overwrites(tmp_path):
+    first = LLMResponseStore("record", tmp_path).attach(FakeProvider())
+    await first.generate(make_request())
+    second = LLMResponseStore("record", tmp_path).attach(FakeProvider())
+    second.calls = 1  # Answers {"answer": 2}
+    await second.generate(make_request())
+
+    assert second.calls == 2
+
+    replayed = await LLMResponseStore("replay", tmp_path).attach(FakeProvider()).generate(make_request())
+    assert replayed.structured_output == {"answer": 2}
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        make_request("Can I Dash three times?"),
+        make_request(temperature=0.7),
+        make_request(max_tokens=123),
+        make_request(structured_output_schema="hop_evaluation"),
+        GenerationRequest(
+            prompt="Can I Dash twice?",
+            context=["Dash: move 2 inches."],
+            config=GenerationConfig(system_prompt="You are a rules judge."),
+            chunk_ids=["11111111-2222-3333-4444-555566667777"],
+        ),
+    ],
+)
+def test_key_covers_prompt_and_generation_settings(other):
+    provider = FakeProvider()
+    key, _fields = make_response_key(provider, make_request())
+
+    assert make_response_key(provider, make_request())[0] == key
+    assert make_response_key(provider, other)[0] != key
+
+
+def test_key_covers_model_and_effort():
+    key, _fields = make_response_key(FakeProvider(), make_request())
+    effort_provider = FakeProvider()
+    effort_provider.reasoning_effort = "high"
+
+    assert make_response_key(FakeProvider(model="other-model"), make_request())[0] != key
+    assert make_response_key(effort_provider, make_request())[0] != key
+
+
+def test_key_follows_the_adapters_own_system_prompt():
+    gemini = GeminiAdapter(api_key="key", model="gemini-2.5-pro")
+    other_config = GenerationRequest(
+        prompt="Can I Dash twice?",
+        context=["Dash: move 3 inches."],
+        config=GenerationConfig(system_prompt="Ignored by Gemini."),
+        chunk_ids=["11111111-2222-3333-4444-555566667777"],
+    )
+
+    with patch("src.services.llm.gemini.build_system_prompt", return_value="Gemini prompt"):
+        key, _fields = make_response_key(gemini, make_request())
+        assert make_response_key(gemini, other_config)[0] == key
+    with patch("src.services.llm.gemini.build_system_prompt", return_value="Edited Gemini prompt"):
+        assert make_response_key(gemini, make_request())[0] != key
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_replay_takes_in_order(tmp_path):
+    provider = LLMResponseStore("record-missing", tmp_path).attach(FakeProvider())
+    for _ in range(2):
+        await provider.generate(make_request())
+
+    store = LLMResponseStore("replay", tmp_path)
+    offline = store.attach(FakeProvider())
+    answers = [(await offline.generate(make_request())).structured_output["answer"] for _ in range(3)]
+    assert answers == [1, 2, 1]  # More requests than takes: cycle
+
+    with store.begin_run():
+        assert (await offline.generate(make_request())).structured_output == {"answer": 1}
+    assert (await offline.generate(make_request())).structured_output == {"answer": 2}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_count_their_own_takes(tmp_path):
+    provider = LLMResponseStore("record-missing", tmp_path).attach(FakeProvider())
+    for _ in range(2):
+        await provider.generate(make_request())
+    store = LLMResponseStore("replay", tmp_path)
+    offline = store.attach(FakeProvider())
+
+    async def rerun() -> list[int]:
+        with store.begin_run():
+            answers = []
+            for _ in range(2):
+                answers.append((await offline.generate(make_request())).structured_output["answer"])
+                await asyncio.sleep(0)  # Interleave with the other run
+            return answers
+
+    assert await asyncio.gather(rerun(), rerun()) == [[1, 2], [1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_replay_delivers_answer_once(tmp_path):
+    await LLMResponseStore("record", tmp_path).attach(FakeProvider()).generate(make_request())
+    provider = LLMResponseStore("replay", tmp_path).attach(FakeProvider())
+    chunks: list[str] = []
+
+    async def on_text(delta: str) -> None:
+        chunks.append(delta)
+
+    response = await provider.generate_stream(make_request(), on_text)
+
+    assert chunks == [response.answer_text]
+    assert provider.calls == 0
+
+
+def test_factory_attaches_store_and_replays_without_api_key(monkeypatch, tmp_path):
+    class _Cfg:
+        default_llm_provider = "grok-4.3"
+        anthropic_api_key = openai_api_key = google_api_key = x_api_key = None
+        deepseek_api_key = mistral_api_key = moonshot_api_key = alibaba_api_key = None
+
+    class _MSC:
+        def get_server_config(self, _gid):
+            return None
+
+    monkeypatch.setattr(fac, "get_config", lambda: _Cfg())
+    monkeypatch.setattr(fac, "get_multi_server_config", lambda: _MSC())
+
+    assert fac.LLMProviderFactory.create("grok-4.3") is None
+
+    configure_llm_response_store("replay", tmp_path)
+    provider = fac.LLMProviderFactory.create("grok-4.3")
+
+    assert isinstance(provider, GrokAdapter)
+    assert provider.api_key == response_store.REPLAY_PLACEHOLDER_API_KEY
+    assert "generate" in vars(provider)
+
+
+def test_mode_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(response_store.MODE_ENV_VAR, "record-missing")
+    monkeypatch.setenv(response_store.PATH_ENV_VAR, str(tmp_path))
+
+    store = response_store.get_llm_response_store()
+
+    assert store.mode == "record-missing"
+    assert store.path == tmp_path
+    assert response_store.get_llm_response_store() is store
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        configure_llm_response_store("playback")
+    assert configure_llm_response_store("off") is None
@@ -0,0 +1,74 @@
+"""Tests for the incremental parser of streamed structured answers."""
+
+import json
+
+import pytest
+
+from src.models.structured_response import StructuredLLMResponse
+from src.services.llm.structured_stream import (
+    PartialStructuredResponse,
+    StructuredResponseStreamParser,
+    parse_partial_json,
+)
+
+ANSWER = {
+    "smalltalk": False,
+    "short_answer": 'Yes, with "Dash".',
+    "persona_short_answer": "Naturally – obviously.",
+    "quotes": [
+        {"quote_title": "Core Rules: Dash", "quote_text": "Move 3\\\"\nthen stop.", "chunk_id": "a1b2c3d4"},
+        {"quote_title": "[FAQ] Dash", "quote_text": "Yes.", "chunk_id": "e5f6a7b8"},
+    ],
+    "explanation": "Dash is a 1AP action (see \\u0041 above).",
+    "persona_afterword": "Elementary.",
+}
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_every_prefix_parses_to_a_prefix_of_the_answer(ensure_ascii):
+    text = json.dumps(ANSWER, ensure_ascii=ensure_ascii)
+
+    for end in range(len(text) + 1):
+        partial = PartialStructuredResponse.from_partial_dict(parse_partial_json(text[:end]))
+
+        assert ANSWER["short_answer"].startswith(partial.short_answer)
+        assert ANSWER["explanation"].startswith(partial.explanation)
+        for quote, expected in zip(partial.quotes, ANSWER["quotes"], strict=False):
+            assert expected["quote_title"].startswith(quote.quote_title)
+            assert expected["quote_text"].startswith(quote.quote_text)
+
+    assert parse_partial_json(text) == ANSWER
+
+
+def test_unfinished_values_are_left_out():
+    assert parse_partial_json('{"smalltalk": fal') == {}
+    assert parse_partial_json('{"smalltalk": false, "short_ans') == {"smalltalk": False}
+    assert parse_partial_json('{"n": 12') == {}
+    assert parse_partial_json('{"n": 12, "quotes": [{"quote_title": "Co') == {
+        "n": 12,
+        "quotes": [{"quote_title": "Co"}],
+    }
+
+
+def test_leading_code_fence_and_garbage():
+    assert parse_partial_json('```json\n{"short_answer": "Ye') == {"short_answer": "Ye"}
+    assert parse_partial_json("Sure! Here is") is None
+    assert parse_partial_json('{"short_answer": "Yes", oops') is None
+
+
+def test_stream_parser_snapshots_and_reset():
+    parser = StructuredResponseStreamParser()
+    text = json.dumps(ANSWER)
+    for start in range(0, len(text), 7):
+        parser.feed(text[start : start + 7])
+
+    snapshot = parser.snapshot()
+    assert snapshot is parser.snapshot()  # Cached until new text arrives
+    final = StructuredLLMResponse.from_json(parser.text)
+    assert snapshot.short_answer == final.short_answer
+    assert snapshot.quotes == final.quotes
+    assert snapshot.persona_afterword == final.persona_afterword
+
+    parser.reset()
+    assert parser.snapshot() == PartialStructuredResponse()
+    assert not parser.snapshot().has_content
@@ -0,0 +1,101 @@
+"""Tests for the operative/ability inverted word index."""
+
+import pytest
+
+from src.services.rag.team_filtering import TeamFilter
+from src.services.rag.team_filtering.strategies import (
+    AbilityMatchingStrategy,
+    OperativeMatchingStrategy,
+)
+from src.services.rag.team_filtering.utils import filter_stop_words
+from src.services.rag.team_filtering.word_index import WordIndex
+
+
+@pytest.fixture
+def cache():
+    """Operative-style cache."""
+    return {
+        "guardsman gunner": {"teams": ["Death Korps"], "words": ["guardsman", "gunner"]},
+        "kroot warrior": {"teams": ["Farstalker Kinband"], "words": ["kroot", "warrior"]},
+        "guard": {"teams": ["Imperial Navy Breachers"], "words": ["guard"]},
+    }
+
+
+def test_candidates_share_a_word(cache):
+    index = WordIndex(cache)
+
+    assert index.candidates("can a kroot warrior charge") == ["kroot warrior"]
+    assert index.candidates("generic question") == []
+
+
+def test_candidates_keep_substring_semantics(cache):
+    """Entry words match inside longer query words, as the strategies test them."""
+    index = WordIndex(cache)
+
+    assert index.candidates("guardsmen abilities?") == ["guard"]
+    assert index.candidates("my gunner's overwatch") == ["guardsman gunner"]
+
+
+def test_candidates_in_cache_order(cache):
+    index = WordIndex(cache)
+
+    assert index.candidates("guard kroot guardsman") == list(cache)
+
+
+def test_empty_cache():
+    index = WordIndex({})
+
+    assert len(index) == 0
+    assert index.candidates("anything at all") == []
+
+
+QUERIES = [
+    "Can the ork boy fighter charge?",
+    "how do markerlights work",
+    "Does Blood For The Blood God stack?",
+    "Can a guardsman gunner fix bayonets?",
+    "kroot carnivores and ritual blades",
+    "What does shaper do",
+    "Can I use get stuck in twice?",
+    "gunner overwatch rules",
+    "generic question about cover",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_strategies_match_full_scan(query):
+    """The index only prunes entries that cannot match."""
+    structure = {
+        "Kommandos": {
+            "Operatives": ["Ork Boy Fighter", "Ork Boy Gunner", "Burna Boy"],
+            "Faction Rules": ["Ere We Go", "Dakka Dakka Dakka"],
+            "Firefight Ploys": ["Get Stuck In"],
+        },
+        "Pathfinders": {
+            "Operatives": ["Pathfinder Warrior", "Pathfinder Gunner", "Drone"],
+            "Faction Rules": ["For The Greater Good", "Markerlights"],
+        },
+        "Death Korps": {
+            "Operatives": ["Guardsman Fighter", "Guardsman Gunner", "Sergeant"],
+            "Strategy Ploys": ["Fix Bayonets"],
+        },
+        "Blooded": {
+            "Operatives": ["Traitor Trooper", "Gunner", "Butcher"],
+            "Strategy Ploys": ["Blood For The Blood God"],
+        },
+        "Farstalker Kinband": {
+            "Operatives": ["Kroot Warrior", {"Kroot Carnivore": ["Ritual Blade"]}, "Shaper"],
+        },
+    }
+    team_filter = TeamFilter(structure)
+    query_lower = query.lower()
+    query_words = filter_stop_words(query_lower)
+
+    full_scan = OperativeMatchingStrategy(team_filter._operative_cache).match(
+        query_lower, query_words
+    ) | AbilityMatchingStrategy(team_filter._ability_cache).match(query_lower, query_words)
+    indexed = team_filter.operative_strategy.match(
+        query_lower, query_words
+    ) | team_filter.ability_strategy.match(query_lower, query_words)
+
+    assert indexed == full_scan
@@ -0,0 +1,137 @@
+"""Unit tests for the chunk registry and registry-backed vector hit resolution."""
+
+import hashlib
+from dataclasses import replace
+from unittest.mock import Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.models.rag_request import RetrieveRequest
+from src.services.rag.bm25_retriever import BM25Result
+from src.services.rag.chunk_registry import ChunkRegistry, ScoredChunk
+from src.services.rag.hybrid_retriever import HybridRetriever
+from src.services.rag.index_bundle import chunks_from_records
+from src.services.rag.matrix_vector_db import MatrixVectorDBService
+from src.services.rag.retriever import RAGRetriever
+
+DIM = 8
+TEXTS = [
+    "An operative can counteract when the enemy activates.",
+    "A target is obscured if intervening terrain blocks the line of fire.",
+    "Conceal orders stop an operative being selected as a valid target.",
+    "Heavy terrain blocks movement and provides cover.",
+]
+
+
+def _vector(text: str) -> list[float]:
+    """Deterministic pseudo-embedding."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "big")
+    return np.random.default_rng(seed).normal(size=DIM).astype(np.float32).tolist()
+
+
+def _records() -> dict:
+    document_id = str(uuid4())
+    return {
+        "ids": [str(uuid4()) for _ in TEXTS],
+        "documents": TEXTS,
+        "metadatas": [
+            {"document_id": document_id, "header": f"Rule {i}", "header_level": 2, "position": i}
+            for i in range(len(TEXTS))
+        ],
+        "embeddings": np.array([_vector(text) for text in TEXTS], dtype=np.float32),
+    }
+
+
+@pytest.fixture
+def retriever():
+    """Hybrid RAGRetriever over an exact in-memory vector DB."""
+    chroma = Mock()
+    chroma.collection.get.return_value = _records()
+    chroma.get_count.return_value = len(TEXTS)
+    vector_db = MatrixVectorDBService(chroma=chroma, bundle_path=None)
+    vector_db.query = Mock(wraps=vector_db.query)
+
+    keyword_extractor = Mock(get_keyword_count=Mock(return_value=0))
+    keyword_extractor.normalize_query = Mock(side_effect=lambda q: q)
+    query_expander = Mock(get_stats=Mock(return_value={"total_synonyms": 0}))
+    query_expander.expand_query = Mock(side_effect=lambda q: q)
+
+    return RAGRetriever(
+        embedding_service=Mock(embed_text=Mock(side_effect=_vector)),
+        vector_db_service=vector_db,
+        keyword_extractor=keyword_extractor,
+        query_expander=query_expander,
+        enable_multi_hop=False,
+        index_bundle_path=None,
+    )
+
+
+def _request(query: str, use_hybrid: bool = True) -> RetrieveRequest:
+    return RetrieveRequest(
+        query=query, context_key="test", max_chunks=3, min_relevance=0.0, use_hybrid=use_hybrid
+    )
+
+
+def test_materialize_leaves_registry_chunk_untouched():
+    chunk_id = str(uuid4())
+    (chunk,) = chunks_from_records([chunk_id], ["text"], [{"header": "Rule"}])
+    registry = ChunkRegistry([chunk])
+
+    materialized = ScoredChunk(chunk, 0.7, bm25_score=3.5, rrf_score=0.01).materialize()
+
+    assert registry.get(chunk_id) is chunk
+    assert materialized.relevance_score == 0.7
+    assert materialized.score_breakdown() == {"bm25_score": 3.5, "rrf_score": 0.01}
+    assert materialized.metadata is chunk.metadata
+    assert chunk.relevance_score == 1.0
+    assert chunk.score_breakdown() == {}
+
+
+def test_fusion_keeps_score_breakdown():
+    chunks = chunks_from_records(
+        [str(uuid4()), str(uuid4())], ["vector text", "keyword text"], [{}, {}]
+    )
+    hybrid = HybridRetriever()
+
+    fused = hybrid.fuse_results(
+        [ScoredChunk(chunks[0], 0.8, vector_similarity=0.8)],
+        [BM25Result(chunk=chunks[1], score=4.0), BM25Result(chunk=chunks[0], score=2.0)],
+    )
+
+    by_text = {hit.chunk.text: hit for hit in fused}
+    assert by_text["vector text"].vector_similarity == 0.8
+    assert by_text["vector text"].bm25_score == 2.0
+    assert by_text["keyword text"].vector_similarity is None
+    assert fused[0].rrf_score > fused[1].rrf_score
+
+
+@pytest.mark.parametrize("use_hybrid", [True, False])
+def test_vector_hits_resolve_to_registry_chunks(retriever, use_hybrid):
+    context, _, _ = retriever.retrieve(_request("Is my target obscured?", use_hybrid), uuid4())
+
+    assert retriever.vector_db.query.call_args.kwargs["include"] == ["distances"]
+    assert context.document_chunks
+    for chunk in context.document_chunks:
+        registered = retriever.chunk_registry.get(str(chunk.chunk_id))
+        assert chunk.text is registered.text
+        assert registered.relevance_score == 1.0  # Scores live on the materialized copy
+        assert registered.score_breakdown() == {}
+        assert chunk.vector_similarity is not None
+        assert (chunk.rrf_score is not None) == use_hybrid
+
+
+def test_unregistered_hits_are_fetched(retriever):
+    retriever._indexes = replace(
+        retriever._indexes, chunk_registry=ChunkRegistry(retriever._all_chunks[1:])
+    )  # Stale generation
+    missing = retriever._all_chunks[0]
+    collection = retriever.vector_db.collection
+    collection.get.reset_mock()
+
+    context, _, _ = retriever.retrieve(_request(TEXTS[0], use_hybrid=False), uuid4())
+
+    collection.get.assert_called_once()
+    assert collection.get.call_args.kwargs["ids"] == [str(missing.chunk_id)]
+    assert missing.chunk_id in {chunk.chunk_id for chunk in context.document_chunks}
@@ -0,0 +1,170 @@
+"""Unit tests for the two-tier query embedding cache."""
+
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.services.rag.embedding_cache import EmbeddingCache
+from src.services.rag.embeddings import EmbeddingService
+
+VECTOR = [0.25, -0.5, 0.125]  # Exactly representable in float32
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "embedding_cache.db")
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_miss_then_memory_hit(self, cache_path):
+        cache = EmbeddingCache(db_path=cache_path)
+
+        assert cache.get("model-a", "can I shoot while concealed") is None
+        cache.put("model-a", "can I shoot while concealed", VECTOR)
+
+        assert cache.get("model-a", "can I shoot while concealed") == VECTOR
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_persists_across_instances(self, cache_path):
+        EmbeddingCache(db_path=cache_path).put("model-a", "obscured", VECTOR)
+
+        reopened = EmbeddingCache(db_path=cache_path)
+        assert reopened.get("model-a", "obscured") == VECTOR
+        assert reopened.get_stats()["disk_hits"] == 1
+
+    def test_models_never_mix(self, cache_path):
+        cache = EmbeddingCache(db_path=cache_path)
+        cache.put("text-embedding-ada-002", "obscured", VECTOR)
+
+        assert cache.get("text-embedding-3-small", "obscured") is None
+
+    def test_whitespace_is_normalized(self, cache_path):
+        cache = EmbeddingCache(db_path=cache_path)
+        cache.put("model-a", "  can I   shoot\n", VECTOR)
+
+        assert cache.get("model-a", "can I shoot") == VECTOR
+
+    def test_case_is_preserved(self, cache_path):
+        cache = EmbeddingCache(db_path=cache_path)
+        cache.put("model-a", "Accurate", VECTOR)
+
+        assert cache.get("model-a", "accurate") is None
+
+    def test_memory_tier_is_bounded(self):
+        cache = EmbeddingCache(db_path=None, memory_size=2)
+        for i in range(3):
+            cache.put("model-a", f"query {i}", VECTOR)
+
+        assert cache.get_stats()["memory_entries"] == 2
+        assert cache.get("model-a", "query 0") is None  # Evicted (LRU)
+        assert cache.get("model-a", "query 2") == VECTOR
+
+    def test_disk_tier_is_bounded(self, cache_path):
+        cache = EmbeddingCache(db_path=cache_path, memory_size=1, max_entries=2)
+        for i in range(4):
+            cache.put("model-a", f"query {i}", VECTOR)
+
+        assert cache.get_stats()["disk_entries"] == 2
+        reopened = EmbeddingCache(db_path=cache_path)
+        assert reopened.get_stats()["disk_entries"] == 2
+        assert reopened.get("model-a", "query 0") is None
+        assert reopened.get("model-a", "query 3") == VECTOR
+
+    def test_clear(self, cache_path):
+        cache = EmbeddingCache(db_path=cache_path)
+        cache.put("model-a", "obscured", VECTOR)
+        cache.clear()
+
+        assert cache.get("model-a", "obscured") is None
+        assert cache.get_stats()["disk_entries"] == 0
+
+
+@pytest.fixture
+def embedding_service(cache_path):
+    """EmbeddingService with mocked OpenAI clients and a temp cache."""
+    config = Mock(openai_api_key="sk-test")
+    with (
+        patch("src.services.rag.embeddings.get_config", return_value=config),
+        patch("src.services.rag.embeddings.OpenAI") as mock_openai,
+        patch("src.services.rag.embeddings.AsyncOpenAI") as mock_async_openai,
+    ):
+        response = Mock()
+        response.data = [Mock(embedding=VECTOR)]
+        mock_openai.return_value.embeddings.create.return_value = response
+        mock_async_openai.return_value.embeddings.create = AsyncMock(return_value=response)
+
+        service = EmbeddingService(
+            model="text-embedding-3-small", cache=EmbeddingCache(db_path=cache_path)
+        )
+        yield service
+
+
+class TestEmbeddingServiceCaching:
+    """EmbeddingService only calls the API on cache misses."""
+
+    def test_repeat_query_skips_api(self, embedding_service):
+        assert embedding_service.embed_text("can I shoot") == VECTOR
+        assert embedding_service.embed_text("can I shoot") == VECTOR
+
+        assert embedding_service.client.embeddings.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_shares_cache_with_sync(self, embedding_service):
+        embedding_service.embed_text("can I shoot")
+
+        assert await embedding_service.embed_text_async("can I shoot") == VECTOR
+        assert embedding_service._async_client is None  # Never needed the API
+
+    @pytest.mark.asyncio
+    async def test_async_keeps_disk_tier_off_the_loop(self, embedding_service, cache_path):
+        cache = embedding_service.cache
+        disk_threads = []
+        for name in ("_disk_get", "_disk_put"):
+            original = getattr(cache, name)
+
+            def record(*args, _original=original):
+                disk_threads.append(threading.current_thread())
+                return _original(*args)
+
+            setattr(cache, name, record)
+
+        assert await embedding_service.embed_text_async("can I shoot") == VECTOR
+        assert await embedding_service.embed_text_async("can I shoot") == VECTOR  # Memory hit
+        cache.flush()
+
+        assert len(disk_threads) == 2  # One lookup, one write
+        assert threading.current_thread() not in disk_threads
+        assert cache.get_stats()["memory_hits"] == 1
+        assert EmbeddingCache(db_path=cache_path).get("text-embedding-3-small", "can I shoot") == VECTOR
+
+    def test_cache_can_be_disabled(self):
+        with (
+            patch(
+                "src.services.rag.embeddings.get_config",
+                return_value=Mock(openai_api_key="sk-test"),
+            ),
+            patch("src.services.rag.embeddings.OpenAI"),
+        ):
+            service = EmbeddingService(use_cache=False)
+
+        assert service.cache is None
+
+    def test_embed_many_sends_distinct_misses_once(self, embedding_service):
+        create = embedding_service.client.embeddings.create
+        other = [0.5] * 3
+        embedding_service.embed_text("cached query")
+        create.reset_mock()
+        create.return_value.data = [Mock(embedding=other), Mock(embedding=VECTOR)]
+
+        embeddings = embedding_service.embed_many(["new a", "cached query", "new b", "new a"])
+
+        create.assert_called_once_with(model="text-embedding-3-small", input=["new a", "new b"])
+        assert embeddings == [other, VECTOR, VECTOR, other]
+        assert embedding_service.embed_many(["new b"]) == [VECTOR]
+        assert create.call_count == 1
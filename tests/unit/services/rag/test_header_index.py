@@ -1,8 +1,10 @@
 """Unit tests for HeaderIndex fuzzy header lookup."""
 
+import random
 from uuid import uuid4
 
 import pytest
+from rapidfuzz import fuzz, process
 
 from src.models.rag_context import DocumentChunk
 from src.services.rag.header_index import HeaderIndex
@@ -209,6 +211,77 @@ class TestHeaderIndexFuzzySearch:
         assert "Movement" in chunk.header
 
 
+class TestHeaderIndexResolveMany:
+    """Tests for HeaderIndex.resolve_many()."""
+
+    @staticmethod
+    def _chunk(header: str) -> DocumentChunk:
+        return DocumentChunk(
+            chunk_id=uuid4(),
+            document_id=uuid4(),
+            text=f"## {header}\nContent.",
+            header=header,
+            header_level=2,
+            metadata={"source": "core-rules.md", "doc_type": "core-rules", "publication_date": "2024-01-01"},
+            relevance_score=0.5,
+            position_in_doc=1,
+        )
+
+    def test_resolves_in_query_order(self, sample_chunks):
+        """Exact, fuzzy, unmatched and empty titles each get their own result."""
+        index = HeaderIndex()
+        index.build_from_chunks(sample_chunks)
+
+        results = index.resolve_many(["Counteract", "COUNTERCT", "XYZ123", " ", "counteract "], 0.8)
+
+        assert [chunk.header if chunk else None for chunk, _ in results] == [
+            "COUNTERACT", "COUNTERACT", None, None, "COUNTERACT",
+        ]
+        assert results[0][1] == 1.0
+        assert 0.8 <= results[1][1] < 1.0
+        assert results[2] == (None, 0.0)
+
+    def test_matches_extract_one(self):
+        """Matches and scores agree with a per-query extractOne scan."""
+        rng = random.Random(0)
+        words = ["seek", "light", "shoot", "twice", "conceal", "order", "phase", "ploy", "a", "-"]
+        headers = list(dict.fromkeys(
+            " ".join(rng.choices(words, k=rng.randint(1, 4))) for _ in range(300)
+        ))
+        index = HeaderIndex()
+        index.build_from_chunks([self._chunk(header) for header in headers])
+
+        queries = [
+            "".join(c for c in rng.choice(headers) if rng.random() > 0.1) for _ in range(200)
+        ] + rng.sample(headers, 20)
+        for threshold in (0.0, 0.6, 0.85):
+            results = index.resolve_many(queries, threshold)
+            for query, (chunk, score) in zip(queries, results, strict=True):
+                expected = process.extractOne(
+                    query.strip().lower(), headers, scorer=fuzz.ratio,
+                    score_cutoff=threshold * 100,
+                ) if query.strip() else None
+                if expected is None:
+                    assert (chunk, score) == (None, 0.0)
+                else:
+                    assert chunk.header == expected[0]
+                    assert score == expected[1] / 100.0
+
+    def test_exact_match_skips_fuzzy_scoring(self, sample_chunks, monkeypatch):
+        """Verbatim headers are resolved without calling cdist."""
+        index = HeaderIndex()
+        index.build_from_chunks(sample_chunks)
+        monkeypatch.setattr(process, "cdist", lambda *_args, **_kwargs: pytest.fail("cdist called"))
+
+        results = index.resolve_many(["COUNTERACT", "movement: minimum move stat"])
+
+        assert [score for _, score in results] == [1.0, 1.0]
+
+    def test_resolve_before_build(self):
+        """Resolving before building returns no matches."""
+        assert HeaderIndex().resolve_many(["COUNTERACT", "Movement"]) == [(None, 0.0)] * 2
+
+
 class TestCleanMissingQuery:
     """Tests for MultiHopRetriever._clean_missing_query()."""
 
@@ -267,3 +340,13 @@ class TestCleanMissingQuery:
         result = retriever._clean_missing_query("Title A,, Title B,")
 
         assert result == ["Title A", "Title B"]
+
+    def test_ignores_quote_only_parts(self):
+        """Parts that are empty once their quotes are stripped are ignored."""
+        from src.services.rag.multi_hop_retriever import MultiHopRetriever
+
+        retriever = MultiHopRetriever.__new__(MultiHopRetriever)
+
+        result = retriever._clean_missing_query("'', Title A, \"\", ' '")
+
+        assert result == ["Title A"]
@@ -0,0 +1,175 @@
+"""Unit tests for the persistent hop evaluation cache."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.rag_context import DocumentChunk
+from src.services.rag.hop_evaluation_cache import HopEvaluationCache, make_evaluation_key
+from src.services.rag.multi_hop_retriever import MultiHopRetriever
+
+VERDICT = {
+    "can_answer": True,
+    "reasoning": "Enough",
+    "missing_query": None,
+    "cost_usd": 0.002,
+    "evaluation_time_s": 1.25,
+    "served_model": "gpt-4.1-mini",
+    "filtered_teams_count": 1,
+}
+
+
+def test_key_normalizes_whitespace_but_not_chunk_order():
+    a, b = uuid4(), uuid4()
+    key = make_evaluation_key("Can I  shoot?", [a, b], "prompt", "model")
+
+    assert make_evaluation_key(" Can I shoot? ", [a, b], "prompt", "model") == key
+    assert make_evaluation_key("Can I shoot?", [b, a], "prompt", "model") != key
+    assert make_evaluation_key("Can I shoot?", [a, b], "prompt", "other-model") != key
+    assert make_evaluation_key("Can I shoot?", [a, b], "prompt-v2", "model") != key
+
+
+def test_verdicts_persist_across_instances(tmp_path):
+    db_path = str(tmp_path / "hop.db")
+    HopEvaluationCache(db_path=db_path).put("k", "gen-1", VERDICT)
+
+    cache = HopEvaluationCache(db_path=db_path)
+
+    assert cache.get("k", "gen-1") == VERDICT
+    assert cache.get("k", "gen-1") == VERDICT
+    stats = cache.get_stats()
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+    assert stats["saved_cost_usd"] == pytest.approx(0.004)
+    assert stats["saved_time_s"] == pytest.approx(2.5)
+
+
+def test_new_generation_invalidates_verdicts(tmp_path):
+    db_path = str(tmp_path / "hop.db")
+    cache = HopEvaluationCache(db_path=db_path)
+    cache.put("k", "gen-1", VERDICT)
+
+    assert cache.get("k", "gen-2") is None
+    assert cache.get_stats()["disk_entries"] == 0
+    assert HopEvaluationCache(db_path=db_path).get("k", "gen-1") is None
+
+
+def test_expired_verdicts_are_misses(tmp_path):
+    cache = HopEvaluationCache(db_path=str(tmp_path / "hop.db"), ttl_seconds=0)
+    cache.put("k", "gen-1", VERDICT)
+
+    assert cache.get("k", "gen-1") is None
+
+
+def test_disk_tier_is_lru_pruned(tmp_path):
+    cache = HopEvaluationCache(db_path=str(tmp_path / "hop.db"), memory_size=1, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, "gen-1", VERDICT)
+
+    assert cache.get_stats()["disk_entries"] == 2
+    assert cache.get("a", "gen-1") is None
+    assert cache.get("b", "gen-1") == VERDICT
+
+
+def test_sqlite_file_is_created_on_first_use(tmp_path):
+    db_path = tmp_path / "hop.db"
+    cache = HopEvaluationCache(db_path=str(db_path))
+    cache.get_stats()
+
+    assert not db_path.exists()
+    cache.put("k", "gen-1", VERDICT)
+    assert db_path.exists()
+
+
+def test_disk_hit_touch_is_written_with_next_put(tmp_path):
+    cache = HopEvaluationCache(db_path=str(tmp_path / "hop.db"), memory_size=1, max_entries=2)
+    cache.put("a", "gen-1", VERDICT)
+    cache.put("b", "gen-1", VERDICT)
+    changes = cache._conn.total_changes
+
+    assert cache.get("a", "gen-1") == VERDICT  # Disk hit
+    assert cache._conn.total_changes == changes  # No write on the read path
+
+    cache.put("c", "gen-1", VERDICT)
+
+    assert cache.get("b", "gen-1") is None  # Least recently used once a's touch landed
+    assert cache.get("a", "gen-1") == VERDICT
+
+
+def _chunk(header: str) -> DocumentChunk:
+    return DocumentChunk(
+        chunk_id=uuid4(), document_id=uuid4(), text=f"## {header}\nRule text.", header=header,
+        header_level=2, metadata={}, relevance_score=0.9, position_in_doc=0,
+    )
+
+
+@pytest.fixture
+def judge():
+    """Evaluation LLM answering 'can answer' for a fixed cost."""
+    response = Mock(
+        answer_text=json.dumps({"can_answer": True, "reasoning": "Enough", "missing_query": None}),
+        token_count=100, model_version="gpt-4.1-mini", prompt_tokens=90, completion_tokens=10,
+        cache_read_tokens=0, cache_creation_tokens=0,
+    )
+    return Mock(generate=AsyncMock(return_value=response))
+
+
+@pytest.fixture
+def make_retriever(judge, tmp_path):
+    """MultiHopRetriever factory sharing one hop evaluation cache."""
+    cache = HopEvaluationCache(db_path=str(tmp_path / "hop.db"))
+
+    def make(index_key):
+        with (
+            patch("src.services.rag.multi_hop_retriever.LLMProviderFactory.create", return_value=judge),
+            patch("src.services.rag.multi_hop_retriever.open", create=True) as mock_open,
+            patch("src.services.rag.multi_hop_retriever.yaml.safe_load", return_value={}),
+        ):
+            mock_open.return_value.__enter__.return_value.read.return_value = (
+                "{rule_structure} {team_structure} {user_query} {retrieved_chunks}"
+            )
+            return MultiHopRetriever(Mock(index_key=index_key), evaluation_cache=cache)
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_repeated_evaluation_reuses_verdict(make_retriever, judge):
+    retriever = make_retriever("gen-1")
+    chunks = [_chunk("Shoot"), _chunk("Conceal")]
+
+    first = await retriever._evaluate_context("Can I shoot?", chunks)
+    second = await retriever._evaluate_context("Can I shoot?", chunks)
+
+    assert judge.generate.await_count == 1
+    assert not first.from_cache
+    assert second.from_cache
+    assert (second.can_answer, second.reasoning) == (first.can_answer, first.reasoning)
+    assert second.cost_usd == 0.0
+    assert second.saved_cost_usd == first.cost_usd
+    assert second.saved_time_s == first.evaluation_time_s
+    assert second.to_dict()["from_cache"] is True
+
+
+@pytest.mark.asyncio
+async def test_evaluation_is_redone_for_other_chunks_or_generation(make_retriever, judge):
+    chunks = [_chunk("Shoot")]
+    await make_retriever("gen-1")._evaluate_context("Can I shoot?", chunks)
+
+    await make_retriever("gen-1")._evaluate_context("Can I shoot?", [*chunks, _chunk("Conceal")])
+    await make_retriever("gen-2")._evaluate_context("Can I shoot?", chunks)
+
+    assert judge.generate.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_verbose_evaluation_bypasses_cache(make_retriever, judge):
+    retriever = make_retriever("gen-1")
+    chunks = [_chunk("Shoot")]
+    await retriever._evaluate_context("Can I shoot?", chunks)
+
+    evaluation = await retriever._evaluate_context("Can I shoot?", chunks, verbose=True)
+
+    assert judge.generate.await_count == 2
+    assert evaluation.filled_prompt is not None
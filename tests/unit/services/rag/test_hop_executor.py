@@ -0,0 +1,91 @@
+"""Unit tests for HopExecutor persistent event loop."""
+
+import asyncio
+
+import pytest
+
+from src.services.rag.hop_executor import HopExecutor
+
+
+@pytest.fixture
+def executor():
+    """Fresh executor, shut down after the test."""
+    hop_executor = HopExecutor(thread_name="test-hop-executor")
+    yield hop_executor
+    hop_executor.shutdown()
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_run_returns_result(executor):
+    """Coroutine result is returned to the sync caller."""
+
+    async def answer():
+        await asyncio.sleep(0)
+        return 42
+
+    assert executor.run(answer(), timeout=5) == 42
+
+
+def test_loop_is_reused_across_queries(executor):
+    """All queries run on the same long-lived loop."""
+    first = executor.run(_current_loop(), timeout=5)
+    second = executor.run(_current_loop(), timeout=5)
+
+    assert first is second
+    assert executor.get_stats()["queries_run"] == 2
+
+
+def test_exception_propagates(executor):
+    """Errors raised by the coroutine reach the caller unchanged."""
+
+    async def fail():
+        raise ValueError("bad hop")
+
+    with pytest.raises(ValueError, match="bad hop"):
+        executor.run(fail(), timeout=5)
+
+
+def test_timeout_cancels_coroutine(executor):
+    """Slow coroutine raises TimeoutError and is cancelled on the loop."""
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError, match="timed out after 0.1 seconds"):
+        executor.run(slow(), timeout=0.1)
+
+    # Loop is still usable afterwards and saw the cancellation
+    assert executor.run(_wait(cancelled), timeout=5) is True
+
+
+async def _wait(event: asyncio.Event) -> bool:
+    await asyncio.wait_for(event.wait(), timeout=5)
+    return event.is_set()
+
+
+def test_stats_report_dispatch_overhead(executor):
+    """Per-query dispatch overhead is recorded."""
+    executor.run(_current_loop(), timeout=5)
+    stats = executor.get_stats()
+
+    assert stats["running"] is True
+    assert stats["avg_dispatch_ms"] >= 0.0
+    assert stats["loop_startup_ms"] > 0.0
+
+
+def test_shutdown_restarts_lazily(executor):
+    """A shut-down executor starts a new loop on next use."""
+    first = executor.run(_current_loop(), timeout=5)
+    executor.shutdown()
+    assert executor.get_stats()["running"] is False
+
+    second = executor.run(_current_loop(), timeout=5)
+    assert second is not first
@@ -0,0 +1,217 @@
+"""Unit tests for speculative hop title prefetch."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.rag_context import DocumentChunk
+from src.services.rag.hop_prefetch import HopPrefetcher, extract_rule_candidates
+from src.services.rag.multi_hop_retriever import MultiHopRetriever
+
+
+def _chunk(header: str, text: str = "", summary: str | None = None) -> DocumentChunk:
+    metadata = {"summary": summary} if summary else {}
+    return DocumentChunk(
+        chunk_id=uuid4(), document_id=uuid4(), text=text or f"## {header}\nRule text.",
+        header=header, header_level=2, metadata=metadata, relevance_score=0.9, position_in_doc=0,
+    )
+
+
+class FakeHeaderIndex:
+    """retrieve_by_headers stand-in: verbatim (case-insensitive) header matches."""
+
+    def __init__(self, chunks: list[DocumentChunk]):
+        self.chunks = {chunk.header.lower(): chunk for chunk in chunks}
+        self.calls: list[list[str]] = []
+        self.threads: set[int] = set()
+
+    def __call__(self, titles: list[str]) -> list[tuple[DocumentChunk | None, float]]:
+        self.calls.append(list(titles))
+        self.threads.add(threading.get_ident())
+        matches = []
+        for title in titles:
+            chunk = self.chunks.get(title.strip().lower())
+            matches.append((chunk, 1.0) if chunk else (None, 0.0))
+        return matches
+
+
+def test_extract_rule_candidates():
+    chunks = [
+        _chunk("Shoot", text="## Shoot\nThe target cannot have a Conceal order."),
+        _chunk("Charge", summary="While it has an Engage order, it can Fall Back."),
+    ]
+
+    candidates = extract_rule_candidates(chunks)
+
+    assert "Conceal" in candidates
+    assert "Engage" in candidates
+    assert "Fall Back" in candidates
+    assert "Shoot" in candidates
+    # Sentence starters and short words are not rule names
+    assert "The" not in candidates
+    assert "While" not in candidates
+    # Summary replaces the text, as in the hop evaluation prompt
+    assert "Charge" not in candidates
+
+
+def test_extract_rule_candidates_dedupes_case_insensitively():
+    chunks = [_chunk("A", text="Conceal order. CONCEAL order. Conceal again.")]
+
+    assert [c for c in extract_rule_candidates(chunks) if c.lower() == "conceal"] == ["Conceal"]
+
+
+@pytest.mark.asyncio
+async def test_prefetched_titles_resolve_without_lookup():
+    conceal, engage = _chunk("Conceal"), _chunk("Engage")
+    index = FakeHeaderIndex([conceal, engage])
+    prefetcher = HopPrefetcher(index)
+
+    prefetcher.start([_chunk("Shoot", text="Needs a Conceal or Engage order.")])
+    await asyncio.sleep(0)
+    matches = await prefetcher.resolve(["conceal", " Engage "])
+
+    assert matches == [(conceal, 1.0), (engage, 1.0)]
+    assert len(index.calls) == 1  # The prefetch only
+    assert threading.get_ident() not in index.threads  # Resolved off the event loop
+    assert (prefetcher.hits, prefetcher.misses) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_unprefetched_titles_are_looked_up():
+    conceal, obscured = _chunk("Conceal"), _chunk("Obscured")
+    index = FakeHeaderIndex([conceal, obscured])
+    prefetcher = HopPrefetcher(index)
+
+    prefetcher.start([_chunk("Shoot", text="Needs a Conceal order.")])
+    matches = await prefetcher.resolve(["Conceal", "Obscured", "Unknown Rule"])
+
+    assert matches == [(conceal, 1.0), (obscured, 1.0), (None, 0.0)]
+    assert index.calls[-1] == ["Obscured", "Unknown Rule"]
+    assert (prefetcher.hits, prefetcher.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_scanned_once():
+    index = FakeHeaderIndex([_chunk("Conceal")])
+    prefetcher = HopPrefetcher(index)
+    chunks = [_chunk("Shoot", text="Needs a Conceal order.")]
+
+    prefetcher.start(chunks)
+    prefetcher.start(chunks)
+    await prefetcher.resolve([])
+
+    assert len(index.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_candidate_budget():
+    index = FakeHeaderIndex([])
+    prefetcher = HopPrefetcher(index, max_candidates=2)
+
+    prefetcher.start([_chunk("Shoot", text="Conceal Engage Obscured Counteract")])
+    prefetcher.start([_chunk("Fight", text="Guard Overwatch")])
+    await prefetcher.resolve([])
+
+    assert [len(call) for call in index.calls] == [2]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_failure_falls_back_to_lookup():
+    conceal = _chunk("Conceal")
+    index = FakeHeaderIndex([conceal])
+    calls = 0
+
+    def flaky(titles):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("index swapped")
+        return index(titles)
+
+    prefetcher = HopPrefetcher(flaky)
+    prefetcher.start([_chunk("Shoot", text="Needs a Conceal order.")])
+
+    assert await prefetcher.resolve(["Conceal"]) == [(conceal, 1.0)]
+
+
+@pytest.mark.asyncio
+@patch("src.services.rag.multi_hop_retriever.LLMProviderFactory.create")
+@patch("builtins.open", create=True)
+@patch("src.services.rag.multi_hop_retriever.yaml.safe_load")
+async def test_multi_hop_prefetches_during_evaluation(mock_yaml_load, mock_open, mock_create):
+    evaluation_s = 0.2
+    responses = iter([
+        {"can_answer": False, "reasoning": "Need it", "missing_query": "Conceal"},
+        {"can_answer": True, "reasoning": "Enough", "missing_query": None},
+    ])
+
+    async def slow_judge(_request):
+        await asyncio.sleep(evaluation_s)
+        response = Mock(token_count=10, model_version=None, prompt_tokens=7, completion_tokens=3)
+        response.cache_read_tokens = response.cache_creation_tokens = 0
+        response.answer_text = json.dumps(next(responses))
+        return response
+
+    mock_create.return_value = Mock(generate=AsyncMock(side_effect=slow_judge))
+    mock_yaml_load.return_value = {}
+    mock_open.return_value.__enter__.return_value.read.return_value = (
+        "{user_query} {retrieved_chunks} {rule_structure} {team_structure}"
+    )
+
+    conceal = _chunk("Conceal")
+    index = FakeHeaderIndex([conceal])
+
+    def slow_index(titles):
+        time.sleep(evaluation_s / 2)
+        return index(titles)
+
+    base_retriever = Mock(retrieve_by_headers=slow_index)
+    retriever = MultiHopRetriever(base_retriever, max_hops=2)
+
+    context, hop_evals, chunk_map = await retriever.retrieve_multi_hop(
+        "Can I shoot it?", "context_key", uuid4(),
+        initial_chunks=[_chunk("Shoot", text="The target cannot have a Conceal order.")],
+    )
+
+    assert conceal.chunk_id in chunk_map
+    assert chunk_map[conceal.chunk_id] == 1
+    assert len(context.document_chunks) == 2
+    # The header lookup ran during the evaluation call, not after it
+    assert hop_evals[0].retrieval_time_s < evaluation_s / 4
+    base_retriever.retrieve.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("src.services.rag.multi_hop_retriever.LLMProviderFactory.create")
+@patch("builtins.open", create=True)
+@patch("src.services.rag.multi_hop_retriever.yaml.safe_load")
+async def test_prefetcher_is_closed_when_multi_hop_is_cancelled(mock_yaml_load, mock_open, mock_create):
+    async def hanging_judge(_request):
+        await asyncio.sleep(10)
+
+    mock_create.return_value = Mock(generate=AsyncMock(side_effect=hanging_judge))
+    mock_yaml_load.return_value = {}
+    mock_open.return_value.__enter__.return_value.read.return_value = (
+        "{user_query} {retrieved_chunks} {rule_structure} {team_structure}"
+    )
+    retriever = MultiHopRetriever(Mock(retrieve_by_headers=FakeHeaderIndex([])), max_hops=2)
+
+    with (
+        patch.object(HopPrefetcher, "close", autospec=True, side_effect=HopPrefetcher.close) as close,
+        pytest.raises(TimeoutError),
+    ):
+        await asyncio.wait_for(
+            retriever.retrieve_multi_hop(
+                "Can I shoot it?", "context_key", uuid4(),
+                initial_chunks=[_chunk("Shoot", text="The target cannot have a Conceal order.")],
+            ),
+            timeout=0.1,
+        )
+
+    close.assert_called_once()
+    assert close.call_args.args[0]._tasks == []
@@ -0,0 +1,83 @@
+"""Unit tests for the pre-built hop evaluation prompt."""
+
+from pathlib import Path
+
+import pytest
+
+from src.services.llm.prompt_builder import split_user_prompt_for_cache
+from src.services.rag.hop_prompt import HopPromptBuilder, dump_structure
+
+PROMPTS_DIR = Path(__file__).parents[4] / "prompts"
+
+RULES = {
+    "Core Rules": {
+        "Actions": ["Reposition", "Dash", "Fall Back", "Charge", "Shoot", "Fight"],
+        "Terrain": {"Light": "Provides cover", "Heavy": "Blocks visibility " * 12},
+    },
+    "Killzones": ["Volkus", "Tomb World", "Gallowdark"],
+}
+TEAMS = {
+    "Kommandos": {"operatives": ["Boss Nob", "Slasha"], "abilities": ["Sneaky Gits"]},
+    "Angels of Death": {"operatives": ["Captain", "Intercessor"], "faction": "Space Marines"},
+    "Veteran Guardsmen": {"operatives": ["Sergeant", "Trooper"], "note": "Ünïcode – ok"},
+    "Hunter Clade": {},
+}
+VALUES = {"user_query": "Can a {Kommando} shoot?", "retrieved_chunks": "1. ## Shoot\nText"}
+
+
+def _templates() -> list[str]:
+    templates = [path.read_text() for path in sorted(PROMPTS_DIR.glob("hop-evaluation-prompt*.md"))]
+    templates.append(
+        "Intro\n<!--CACHE_BREAK-->\n{rule_structure}\n<!--CACHE_BREAK-->\nTeams {{literal}}\n"
+        "{team_structure}\n<!--CACHE_BREAK-->\nQ: {user_query}\n{retrieved_chunks}\n"
+    )
+    templates.append("{user_query}<!--CACHE_BREAK-->{retrieved_chunks}{team_structure}")
+    return templates
+
+
+@pytest.mark.parametrize(
+    "teams",
+    [
+        None,
+        [],
+        ["Kommandos"],
+        ["Veteran Guardsmen", "Angels of Death"],
+        ["Hunter Clade", "Kommandos", "Unknown"],
+        list(TEAMS),
+    ],
+)
+def test_team_structure_matches_yaml_dump(teams):
+    builder = HopPromptBuilder("{team_structure}", RULES, TEAMS)
+    filtered = TEAMS if teams is None else {team: TEAMS[team] for team in teams if team in TEAMS}
+
+    assert builder.team_structure_text(teams) == dump_structure(filtered)
+
+
+@pytest.mark.parametrize("template", _templates())
+def test_fill_matches_format(template):
+    builder = HopPromptBuilder(template, RULES, TEAMS)
+    team_structure = builder.team_structure_text(["Kommandos"])
+
+    expected = template.format(
+        rule_structure=dump_structure(RULES), team_structure=team_structure, **VALUES
+    )
+
+    assert builder.fill(team_structure=team_structure, **VALUES) == expected
+
+
+@pytest.mark.parametrize("template", _templates())
+def test_claude_blocks_match_split(template):
+    builder = HopPromptBuilder(template, RULES, TEAMS)
+    team_structure = builder.team_structure_text([])
+    filled = builder.fill(team_structure=team_structure, **VALUES)
+
+    blocks = builder.build_for_claude(team_structure=team_structure, **VALUES)
+
+    assert blocks == split_user_prompt_for_cache(filled)
+
+
+def test_rules_structure_is_serialized_once():
+    template = "{rule_structure}\n{team_structure}\n{user_query}\n{retrieved_chunks}"
+    builder = HopPromptBuilder(template, RULES, TEAMS)
+
+    assert builder.static_prefix == dump_structure(RULES) + "\n"
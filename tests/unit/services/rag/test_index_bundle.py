@@ -0,0 +1,177 @@
+"""Unit tests for the on-disk retrieval index bundle."""
+
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.services.rag import index_bundle
+from src.services.rag.bm25_retriever import BM25Retriever
+from src.services.rag.index_bundle import (
+    BUNDLE_VERSION,
+    build_index_bundle,
+    current_bundle_key,
+    load_index_bundle,
+    verify_index_bundle,
+)
+from src.services.rag.ingestion_state import IngestionState
+from src.services.rag.retriever import RAGRetriever
+
+KEY = "a" * 64
+TEXTS = {
+    "COUNTERACT": "An operative can counteract when the enemy activates.",
+    "Obscured": "A target is obscured if intervening terrain blocks the line of fire.",
+    "Accurate x": "You can retain x attack dice as normal successes.",
+}
+
+
+@pytest.fixture
+def vector_db():
+    """Vector DB mock whose collection holds three chunks."""
+    document_id = str(uuid4())
+    ids = [str(uuid4()) for _ in TEXTS]
+    db = Mock()
+    db.collection.get.return_value = {
+        "ids": ids,
+        "documents": list(TEXTS.values()),
+        "metadatas": [
+            {"document_id": document_id, "header": header, "header_level": 2, "position": i}
+            for i, header in enumerate(TEXTS)
+        ],
+    }
+    db.get_count.return_value = len(ids)
+    return db
+
+
+@pytest.fixture
+def bundle_path(tmp_path, vector_db):
+    path = tmp_path / "index_bundle"
+    build_index_bundle(vector_db, KEY, {"Obscured", "Accurate"}, k1=1.6, b=0.8, path=path)
+    return path
+
+
+def test_roundtrip(bundle_path, vector_db):
+    bundle = load_index_bundle(KEY, k1=1.6, b=0.8, expected_chunk_count=3, path=bundle_path)
+
+    assert bundle is not None
+    assert [c.header for c in bundle.chunks] == list(TEXTS)
+    assert [str(c.chunk_id) for c in bundle.chunks] == vector_db.collection.get()["ids"]
+    assert bundle.keywords == {"Obscured", "Accurate"}
+    assert [header for header, _ in bundle.header_entries] == [h.lower() for h in TEXTS]
+    assert bundle.header_entries[1][1] is bundle.chunks[1]
+
+
+def test_loaded_bm25_scores_match_fresh_index(bundle_path):
+    fresh = BM25Retriever(k1=1.6, b=0.8)
+    bundle = load_index_bundle(KEY, k1=1.6, b=0.8, path=bundle_path)
+    fresh.index_chunks(bundle.chunks)
+
+    query = fresh._tokenize("is the target obscured by terrain")
+    np.testing.assert_array_equal(bundle.bm25.get_scores(query), fresh.bm25.get_scores(query))
+    assert isinstance(bundle.bm25.data, np.memmap)
+
+
+@pytest.mark.parametrize(
+    ("key", "k1", "count"),
+    [("b" * 64, 1.6, 3), (KEY, 1.2, 3), (KEY, 1.6, 4)],
+    ids=["index_key", "bm25_params", "chunk_count"],
+)
+def test_mismatch_returns_none(bundle_path, key, k1, count):
+    assert load_index_bundle(key, k1=k1, b=0.8, expected_chunk_count=count, path=bundle_path) is None
+
+
+def test_corrupt_file_returns_none(bundle_path):
+    bundle_dir = bundle_path / (bundle_path / "CURRENT").read_text()
+    (bundle_dir / "chunks.json").write_text('{"ids": []}', encoding="utf-8")
+
+    assert load_index_bundle(KEY, k1=1.6, b=0.8, path=bundle_path) is None
+
+
+def test_load_checks_sizes_without_hashing(bundle_path):
+    with patch.object(index_bundle, "_sha256", side_effect=AssertionError("hashed on load")):
+        assert load_index_bundle(KEY, k1=1.6, b=0.8, path=bundle_path) is not None
+
+
+def test_verify_catches_same_size_corruption(bundle_path):
+    assert verify_index_bundle(bundle_path) == []
+    bundle_dir = bundle_path / (bundle_path / "CURRENT").read_text()
+    keywords = bundle_dir / "keywords.json"
+    keywords.write_bytes(keywords.read_bytes().replace(b"]", b" "))
+
+    assert verify_index_bundle(bundle_path) == ["checksum mismatch: keywords.json"]
+
+
+def test_missing_bundle_returns_none(tmp_path):
+    assert load_index_bundle(KEY, path=tmp_path / "nothing") is None
+    assert current_bundle_key(tmp_path / "nothing") is None
+
+
+def test_new_bundle_replaces_old(bundle_path, vector_db):
+    new_key = "c" * 64
+    build_index_bundle(vector_db, new_key, set(), k1=1.6, b=0.8, path=bundle_path)
+
+    assert current_bundle_key(bundle_path) == new_key
+    assert [p.name for p in bundle_path.glob("v*-*")] == [f"v{BUNDLE_VERSION}-{new_key[:16]}"]
+
+
+def test_empty_collection_writes_nothing(tmp_path):
+    db = Mock()
+    db.collection.get.return_value = {"ids": [], "documents": [], "metadatas": []}
+
+    assert build_index_bundle(db, KEY, set(), path=tmp_path / "bundle") is None
+    assert current_bundle_key(tmp_path / "bundle") is None
+
+
+def test_index_key_tracks_corpus(tmp_path):
+    state = IngestionState(path=tmp_path / "state.json")
+    state.reset_for_rebuild(tmp_path)
+    empty_key = state.index_key()
+
+    state.record("core.md", "hash-1", "doc-1", chunks=3)
+    first_key = state.index_key()
+    state.record("core.md", "hash-2", "doc-1", chunks=3)
+
+    assert len({empty_key, first_key, state.index_key()}) == 3
+
+
+def test_retriever_loads_bundle_instead_of_collection(bundle_path, vector_db):
+    """With a matching bundle, startup never pulls the collection out of Chroma."""
+    vector_db.collection.get.reset_mock()
+    state = Mock()
+    state.index_key.return_value = KEY
+
+    with patch("src.services.rag.retriever.IngestionState.load", return_value=state):
+        retriever = RAGRetriever(
+            embedding_service=Mock(),
+            vector_db_service=vector_db,
+            query_expander=Mock(get_stats=Mock(return_value={"total_synonyms": 0})),
+            enable_multi_hop=False,
+            bm25_k1=1.6,
+            bm25_b=0.8,
+            index_bundle_path=str(bundle_path),
+        )
+
+    vector_db.collection.get.assert_not_called()
+    assert retriever.keyword_extractor.get_keywords() == {"Obscured", "Accurate"}
+    assert retriever.header_index.header_count == 3
+    results = retriever.hybrid_retriever.bm25_retriever.search("obscured terrain", top_k=2)
+    assert results[0].chunk.header == "Obscured"
+
+
+def test_retriever_rebuilds_on_stale_bundle(bundle_path, vector_db):
+    state = Mock()
+    state.index_key.return_value = "d" * 64
+
+    with patch("src.services.rag.retriever.IngestionState.load", return_value=state):
+        retriever = RAGRetriever(
+            embedding_service=Mock(),
+            vector_db_service=vector_db,
+            keyword_extractor=Mock(get_keyword_count=Mock(return_value=0)),
+            query_expander=Mock(get_stats=Mock(return_value={"total_synonyms": 0})),
+            enable_multi_hop=False,
+            index_bundle_path=str(bundle_path),
+        )
+
+    vector_db.collection.get.assert_called()
+    assert retriever.header_index.header_count == 3
@@ -0,0 +1,263 @@
+"""Unit tests for hot-reloading retrieval indexes after an ingest."""
+
+from unittest.mock import Mock, patch
+from uuid import UUID, uuid4, uuid5
+
+import pytest
+
+from src.services.rag.index_bundle import build_index_bundle
+from src.services.rag.index_reloader import IndexReloadWatcher
+from src.services.rag.ingestion_state import IngestionState
+from src.services.rag.keyword_extractor import KeywordExtractor
+from src.services.rag.retrieval_cache import SemanticRetrievalCache
+from src.services.rag.retriever import RAGRetriever
+
+pytestmark = pytest.mark.usefixtures("load_state")
+
+
+class FakeCollection:
+    """Chroma collection stand-in supporting `get` with a document_id $in filter."""
+
+    def __init__(self):
+        self.records: dict[str, tuple[str, dict]] = {}
+        self.get_calls: list[dict | None] = []
+
+    def set_document(self, document_id: str, sections: dict[str, str]) -> None:
+        self.records = {
+            chunk_id: record
+            for chunk_id, record in self.records.items()
+            if record[1]["document_id"] != document_id
+        }
+        for position, (header, text) in enumerate(sections.items()):
+            metadata = {
+                "document_id": document_id, "header": header, "header_level": 2,
+                "position": position,
+            }
+            # Same content-independent ids as RAGIngestor.assign_chunk_ids
+            chunk_id = uuid5(UUID(document_id), f"{position}:{header}")
+            self.records[str(chunk_id)] = (text, metadata)
+
+    def get(self, where=None, include=None):  # noqa: ARG002
+        self.get_calls.append(where)
+        wanted = where["document_id"]["$in"] if where else None
+        items = [
+            (chunk_id, text, metadata)
+            for chunk_id, (text, metadata) in self.records.items()
+            if wanted is None or metadata["document_id"] in wanted
+        ]
+        return {
+            "ids": [item[0] for item in items],
+            "documents": [item[1] for item in items],
+            "metadatas": [item[2] for item in items],
+            "embeddings": [[float(i), 1.0] for i in range(len(items))],
+        }
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Vector DB with two ingested documents and the matching ingestion state."""
+    collection = FakeCollection()
+    vector_db = Mock(collection=collection)
+    vector_db.get_count.side_effect = lambda: len(collection.records)
+    vector_db.reloaded.return_value = vector_db
+
+    doc_a, doc_b = str(uuid4()), str(uuid4())
+    collection.set_document(doc_a, {"Obscured": "Intervening terrain blocks the line of fire."})
+    collection.set_document(doc_b, {"Conceal": "A concealed operative cannot be targeted."})
+
+    state = IngestionState(path=tmp_path / "state.json")
+    state.reset_for_rebuild(tmp_path)
+    state.record("a.md", "hash-a", doc_a, chunks=1)
+    state.record("b.md", "hash-b", doc_b, chunks=1)
+
+    return {"collection": collection, "vector_db": vector_db, "state": state, "docs": (doc_a, doc_b)}
+
+
+@pytest.fixture
+def load_state(corpus):
+    """Make IngestionState.load() return corpus["state"]."""
+    with patch(
+        "src.services.rag.retriever.IngestionState.load", side_effect=lambda: corpus["state"]
+    ):
+        yield
+
+
+def _retriever(corpus, tmp_path, index_bundle_path=None) -> RAGRetriever:
+    return RAGRetriever(
+        embedding_service=Mock(),
+        vector_db_service=corpus["vector_db"],
+        keyword_extractor=KeywordExtractor(cache_path=str(tmp_path / "keywords.json")),
+        query_expander=Mock(get_stats=Mock(return_value={"total_synonyms": 0})),
+        enable_multi_hop=False,
+        index_bundle_path=index_bundle_path,
+    )
+
+
+def _ingest_change(corpus, tmp_path) -> None:
+    """Re-ingest document B with new content and add document C."""
+    doc_a, doc_b = corpus["docs"]
+    doc_c = str(uuid4())
+    corpus["collection"].set_document(doc_b, {"Conceal": "Conceal orders hide an operative."})
+    corpus["collection"].set_document(doc_c, {"Counteract": "Counteract after the enemy activates."})
+
+    state = IngestionState(path=tmp_path / "state.json")
+    state.fingerprint = corpus["state"].fingerprint
+    state.record("a.md", "hash-a", doc_a, chunks=1)
+    state.record("b.md", "hash-b2", doc_b, chunks=1)
+    state.record("c.md", "hash-c", doc_c, chunks=1)
+    corpus["state"] = state
+
+
+def _bm25_headers(retriever: RAGRetriever, query: str) -> list[str]:
+    results = retriever.hybrid_retriever.bm25_retriever.search(query, top_k=5)
+    return [result.chunk.header for result in results]
+
+
+def test_no_new_generation_is_a_noop(corpus, tmp_path):
+    retriever = _retriever(corpus, tmp_path)
+    hybrid_retriever = retriever.hybrid_retriever
+
+    assert retriever.reload_indexes() is False
+    assert retriever.hybrid_retriever is hybrid_retriever
+
+
+def test_incremental_reload_fetches_only_changed_documents(corpus, tmp_path):
+    retriever = _retriever(corpus, tmp_path)
+    unchanged_chunk = next(c for c in retriever._all_chunks if c.header == "Obscured")
+    old_hybrid = retriever.hybrid_retriever
+    _ingest_change(corpus, tmp_path)
+    corpus["collection"].get_calls.clear()
+
+    assert retriever.reload_indexes() is True
+
+    doc_a, doc_b = corpus["docs"]
+    (where,) = corpus["collection"].get_calls
+    assert doc_b in where["document_id"]["$in"]
+    assert doc_a not in where["document_id"]["$in"]
+    assert len(retriever._all_chunks) == 3
+    assert any(chunk is unchanged_chunk for chunk in retriever._all_chunks)
+    assert _bm25_headers(retriever, "counteract enemy") == ["Counteract"]
+    assert _bm25_headers(retriever, "conceal orders")[0] == "Conceal"
+    assert retriever.retrieve_by_header("Counteract")[0].header == "Counteract"
+    assert retriever.index_key == corpus["state"].index_key()
+    corpus["vector_db"].reloaded.assert_called_once()
+    # Queries already holding the old generation keep working on it
+    assert old_hybrid.bm25_retriever.search("counteract", top_k=5) == []
+
+
+def test_reload_retokenizes_edited_sections_that_keep_their_ids(corpus, tmp_path):
+    retriever = _retriever(corpus, tmp_path)
+    conceal_id = next(c.chunk_id for c in retriever._all_chunks if c.header == "Conceal")
+    doc_a, doc_b = corpus["docs"]
+    doc_c = str(uuid4())
+    corpus["collection"].set_document(doc_b, {"Conceal": "Zebra giraffe walrus."})
+    # A third document keeps BM25 idf positive for terms found in one chunk
+    corpus["collection"].set_document(doc_c, {"Counteract": "Counteract after the enemy activates."})
+    state = IngestionState(path=tmp_path / "state.json")
+    state.fingerprint = corpus["state"].fingerprint
+    state.record("a.md", "hash-a", doc_a, chunks=1)
+    state.record("b.md", "hash-b2", doc_b, chunks=1)
+    state.record("c.md", "hash-c", doc_c, chunks=1)
+    corpus["state"] = state
+
+    assert retriever.reload_indexes() is True
+
+    assert any(chunk.chunk_id == conceal_id for chunk in retriever._all_chunks)
+    assert _bm25_headers(retriever, "zebra giraffe") == ["Conceal"]
+    assert _bm25_headers(retriever, "concealed targeted") == []
+
+
+def test_reload_swaps_one_generation_and_leaves_the_old_one_intact(corpus, tmp_path):
+    retriever = _retriever(corpus, tmp_path)
+    old = retriever._indexes
+    old_chunks = list(old.chunks)
+    _ingest_change(corpus, tmp_path)
+
+    assert retriever.reload_indexes() is True
+
+    new = retriever._indexes
+    assert new is not old
+    assert retriever.chunk_registry is new.chunk_registry
+    assert retriever.header_index is new.header_index
+    assert new.index_key == corpus["state"].index_key() != old.index_key
+    # A query pinned to the old generation sees its own chunks and indexes
+    assert old.chunks == old_chunks
+    assert old.header_index.header_count == 2
+    assert new.header_index.header_count == 3
+    assert all(str(chunk.chunk_id) in old.chunk_registry for chunk in old_chunks)
+
+
+def test_reload_invalidates_cached_retrievals_of_changed_documents(corpus, tmp_path):
+    retriever = _retriever(corpus, tmp_path)
+    retriever.retrieval_cache = SemanticRetrievalCache()
+    chunks = {chunk.header: chunk for chunk in retriever._all_chunks}
+    for header, embedding in (("Obscured", [1.0, 0.0]), ("Conceal", [0.0, 1.0])):
+        context = Mock(document_chunks=[chunks[header]])
+        retriever.retrieval_cache.put(header, embedding, (), (context, [], {}), latency_s=1.0)
+
+    doc_a, doc_b = corpus["docs"]
+    corpus["collection"].set_document(doc_b, {"Conceal": "Conceal orders hide an operative."})
+    state = IngestionState(path=tmp_path / "state.json")
+    state.fingerprint = corpus["state"].fingerprint
+    state.record("a.md", "hash-a", doc_a, chunks=1)
+    state.record("b.md", "hash-b2", doc_b, chunks=1)
+    corpus["state"] = state
+
+    assert retriever.reload_indexes() is True
+
+    assert retriever.retrieval_cache.get([1.0, 0.0], ()) is not None
+    assert retriever.retrieval_cache.get([0.0, 1.0], ()) is None
+
+
+def test_reload_falls_back_to_full_rebuild_on_count_mismatch(corpus, tmp_path):
+    retriever = _retriever(corpus, tmp_path)
+    _ingest_change(corpus, tmp_path)
+    # A chunk written without going through the ingestion state
+    corpus["collection"].records[str(uuid4())] = (
+        "Stray text.", {"document_id": str(uuid4()), "header": "Stray", "position": 0}
+    )
+    corpus["collection"].get_calls.clear()
+
+    assert retriever.reload_indexes() is True
+
+    assert corpus["collection"].get_calls[-1] is None  # Full collection pull
+    assert len(retriever._all_chunks) == 4
+
+
+def test_reload_uses_new_index_bundle(corpus, tmp_path):
+    bundle_path = tmp_path / "bundle"
+    retriever = _retriever(corpus, tmp_path, index_bundle_path=str(bundle_path))
+    _ingest_change(corpus, tmp_path)
+    build_index_bundle(
+        corpus["vector_db"], corpus["state"].index_key(), {"Counteract"}, path=bundle_path
+    )
+    corpus["collection"].get_calls.clear()
+
+    assert retriever.reload_indexes() is True
+
+    assert corpus["collection"].get_calls == []
+    assert retriever.keyword_extractor.get_keywords() == {"Counteract"}
+    assert _bm25_headers(retriever, "counteract enemy") == ["Counteract"]
+
+
+@pytest.mark.asyncio
+async def test_watcher_waits_for_generation_to_settle(corpus, tmp_path):
+    retriever = _retriever(corpus, tmp_path)
+    watcher = IndexReloadWatcher(retriever, interval_s=0.01)
+    _ingest_change(corpus, tmp_path)
+
+    assert await watcher.check() is False  # Seen once: ingest may still be running
+    assert await watcher.check() is True  # Unchanged since: settled
+    assert await watcher.check() is False
+    assert watcher.reloads == 1
+
+
+@pytest.mark.asyncio
+async def test_watcher_reloads_immediately_when_bundle_written(corpus, tmp_path):
+    bundle_path = tmp_path / "bundle"
+    retriever = _retriever(corpus, tmp_path, index_bundle_path=str(bundle_path))
+    watcher = IndexReloadWatcher(retriever)
+    _ingest_change(corpus, tmp_path)
+    build_index_bundle(corpus["vector_db"], corpus["state"].index_key(), set(), path=bundle_path)
+
+    assert await watcher.check() is True
@@ -0,0 +1,80 @@
+"""Unit tests for KeywordExtractor query normalization."""
+
+import random
+from uuid import uuid4
+
+import pytest
+
+from src.services.rag.chunker import MarkdownChunk
+from src.services.rag.keyword_extractor import KeywordExtractor
+
+KEYWORDS = {"Accurate", "Balanced", "Counteract", "Seek", "Seek Light", "Shoot Twice", "Lethal"}
+
+
+def _word_by_word(keywords: set[str], query: str) -> str:
+    """Reference: the previous single-word normalization."""
+    keyword_map = {kw.lower(): kw for kw in keywords}
+    normalized = []
+    for word in query.split():
+        clean_word = word.strip(".,!?;:()[]{}\"'-")
+        if clean_word.lower() in keyword_map:
+            normalized.append(word.replace(clean_word, keyword_map[clean_word.lower()]))
+        else:
+            normalized.append(word)
+    return " ".join(normalized)
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    return KeywordExtractor(cache_path=str(tmp_path / "keywords.json"), keywords=KEYWORDS)
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("can I seek light twice?", "can I Seek Light twice?"),
+        ("(seek light) and accurate", "(Seek Light) and Accurate"),
+        ("seek the light", "Seek the light"),
+        ("seek, light", "Seek, light"),
+        ("does shoot twice work with lethal 5+?", "does Shoot Twice work with Lethal 5+?"),
+        ("'counteract'  then   balanced.", "'Counteract' then Balanced."),
+        ("nothing here", "nothing here"),
+    ],
+)
+def test_normalize_query(extractor, query, expected):
+    assert extractor.normalize_query(query) == expected
+
+
+def test_single_word_keywords_match_previous_behaviour(tmp_path):
+    keywords = {"Accurate", "Balanced", "Counteract", "Obscured", "Pre-Emptive", "VESPID"}
+    extractor = KeywordExtractor(cache_path=str(tmp_path / "keywords.json"), keywords=keywords)
+    rng = random.Random(0)
+    words = [kw.lower() for kw in keywords] + ["the", "is", "target", "x", "-", "5+", "?"]
+    for _ in range(300):
+        query = " ".join(
+            rng.choice(["", "(", "'", "\""]) + rng.choice(words) + rng.choice(["", ",", "?", ")."])
+            for _ in range(rng.randint(1, 8))
+        )
+        assert extractor.normalize_query(query) == _word_by_word(keywords, query)
+
+
+def test_add_and_clear_recompile(extractor):
+    assert extractor.normalize_query("hidden supplies") == "hidden supplies"
+
+    extractor.add_keywords({"Hidden Supplies"})
+    assert extractor.normalize_query("hidden supplies") == "Hidden Supplies"
+
+    extractor.clear_keywords()
+    assert extractor.normalize_query("seek light") == "seek light"
+
+
+def test_extracts_multi_word_rule_names(tmp_path):
+    extractor = KeywordExtractor(cache_path=str(tmp_path / "keywords.json"), keywords=set())
+    chunk = MarkdownChunk(
+        chunk_id=uuid4(), text="## Seek Light\nRules text", header="Seek Light", header_level=2,
+        position=0, token_count=5,
+    )
+
+    keywords = extractor.extract_from_chunks([chunk])
+
+    assert {"Seek Light", "Seek", "Light"} <= keywords
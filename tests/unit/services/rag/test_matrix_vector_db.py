@@ -0,0 +1,167 @@
+"""Unit tests for the in-process exact vector search backend."""
+
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.services.rag.index_bundle import build_index_bundle
+from src.services.rag.matrix_vector_db import MatrixVectorDBService
+from src.services.rag.vector_db import VectorDBService
+
+DIM = 8
+
+
+def _corpus(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    document_ids = [str(uuid4()) for _ in range(3)]
+    return {
+        "ids": [str(uuid4()) for _ in range(n)],
+        "documents": [f"chunk {i}" for i in range(n)],
+        "metadatas": [
+            {"document_id": document_ids[i % 3], "header": f"Header {i}", "position": i}
+            for i in range(n)
+        ],
+        "embeddings": vectors,
+    }
+
+
+@pytest.fixture
+def corpus():
+    return _corpus(50)
+
+
+@pytest.fixture
+def chroma(corpus):
+    """Chroma service mock holding `corpus`."""
+    service = Mock()
+    service.collection.get.return_value = corpus
+    service.get_count.return_value = len(corpus["ids"])
+    service.delete_by_document_id.return_value = 1
+    return service
+
+
+@pytest.fixture
+def matrix_db(chroma):
+    return MatrixVectorDBService(chroma=chroma, bundle_path=None)
+
+
+def _brute_force(corpus, query, k):
+    distances = ((corpus["embeddings"] - query) ** 2).sum(axis=1)
+    order = np.argsort(distances, kind="stable")[:k]
+    return [corpus["ids"][i] for i in order], distances[order]
+
+
+def test_query_returns_exact_top_k(matrix_db, corpus):
+    query = corpus["embeddings"][7] + 0.05
+
+    results = matrix_db.query(query_embeddings=[query.tolist()], n_results=5)
+
+    expected_ids, expected_distances = _brute_force(corpus, query, 5)
+    assert results["ids"][0] == expected_ids
+    np.testing.assert_allclose(results["distances"][0], expected_distances, atol=1e-5)
+    row = corpus["ids"].index(results["ids"][0][0])
+    assert results["documents"][0][0] == corpus["documents"][row]
+    assert results["metadatas"][0][0] == corpus["metadatas"][row]
+
+
+def test_query_batches_multiple_embeddings(matrix_db, corpus):
+    queries = corpus["embeddings"][:3].tolist()
+
+    results = matrix_db.query(query_embeddings=queries, n_results=2)
+
+    assert [ids[0] for ids in results["ids"]] == corpus["ids"][:3]
+    assert all(len(ids) == 2 for ids in results["ids"])
+
+
+def test_where_filter(matrix_db, corpus):
+    document_id = corpus["metadatas"][0]["document_id"]
+
+    results = matrix_db.query(
+        query_embeddings=[corpus["embeddings"][1].tolist()],
+        n_results=100,
+        where={"document_id": document_id},
+    )
+
+    assert len(results["ids"][0]) == 17  # Every third chunk of 50
+    assert all(m["document_id"] == document_id for m in results["metadatas"][0])
+
+
+def test_upsert_replaces_and_appends(matrix_db, chroma, corpus):
+    replacement = np.zeros(DIM, dtype=np.float32)
+    replacement[0] = 1.0
+    new_id = str(uuid4())
+
+    matrix_db.upsert_embeddings(
+        ids=[corpus["ids"][0], new_id],
+        embeddings=[replacement.tolist(), (-replacement).tolist()],
+        documents=["updated", "new"],
+        metadatas=[{"document_id": "x"}, {"document_id": "y"}],
+    )
+
+    chroma.upsert_embeddings.assert_called_once()
+    assert matrix_db.get_count() == 51
+    hit = matrix_db.query(query_embeddings=[replacement.tolist()], n_results=1)
+    assert hit["ids"][0] == [corpus["ids"][0]]
+    assert hit["documents"][0] == ["updated"]
+    assert hit["distances"][0][0] == pytest.approx(0.0, abs=1e-6)
+    opposite = matrix_db.query(query_embeddings=[(-replacement).tolist()], n_results=1)
+    assert opposite["ids"][0] == [new_id]
+
+
+def test_delete_by_document_id(matrix_db, chroma, corpus):
+    document_id = corpus["metadatas"][0]["document_id"]
+
+    matrix_db.delete_by_document_id(document_id)
+
+    chroma.delete_by_document_id.assert_called_once_with(document_id)
+    assert matrix_db.get_count() == 33
+    results = matrix_db.query(query_embeddings=[corpus["embeddings"][0].tolist()], n_results=50)
+    assert corpus["ids"][0] not in results["ids"][0]
+
+
+def test_reset_empties_matrix(matrix_db):
+    matrix_db.reset()
+
+    assert matrix_db.get_count() == 0
+    assert matrix_db.query(query_embeddings=[[0.0] * DIM], n_results=3)["ids"] == [[]]
+
+
+def test_loads_memory_mapped_matrix_from_bundle(tmp_path, chroma, corpus):
+    bundle_path = tmp_path / "bundle"
+    build_index_bundle(chroma, "k" * 64, set(), path=bundle_path)
+    chroma.collection.get.reset_mock()
+    state = Mock()
+    state.index_key.return_value = "k" * 64
+
+    with patch("src.services.rag.matrix_vector_db.IngestionState.load", return_value=state):
+        matrix_db = MatrixVectorDBService(chroma=chroma, bundle_path=str(bundle_path))
+
+    chroma.collection.get.assert_not_called()
+    assert isinstance(matrix_db._table.matrix, np.memmap)
+    results = matrix_db.query(query_embeddings=[corpus["embeddings"][4].tolist()], n_results=1)
+    assert results["ids"][0] == [corpus["ids"][4]]
+
+
+def test_matches_chroma_ranking(tmp_path, corpus):
+    """Same ids, order and (squared L2) distances as a real Chroma collection."""
+    with patch("src.services.rag.vector_db.get_config") as get_config:
+        get_config.return_value.vector_db_path = str(tmp_path / "chroma")
+        chroma = VectorDBService(collection_name="matrix_test")
+    chroma.add_embeddings(
+        ids=corpus["ids"],
+        embeddings=corpus["embeddings"].tolist(),
+        documents=corpus["documents"],
+        metadatas=corpus["metadatas"],
+    )
+    matrix_db = MatrixVectorDBService(chroma=chroma, bundle_path=None)
+    query = [(corpus["embeddings"][11] * 0.9 + corpus["embeddings"][12] * 0.1).tolist()]
+
+    expected = chroma.query(query_embeddings=query, n_results=5)
+    actual = matrix_db.query(query_embeddings=query, n_results=5)
+
+    assert actual["ids"] == expected["ids"]
+    np.testing.assert_allclose(actual["distances"][0], expected["distances"][0], atol=1e-4)
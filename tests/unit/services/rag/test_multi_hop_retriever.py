@@ -1,6 +1,7 @@
 """Tests for multi-hop retrieval functionality."""
 
 import json
+from dataclasses import replace
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
@@ -8,7 +9,11 @@ import pytest
 
 from src.models.rag_context import DocumentChunk, RAGContext
 from src.services.llm.base import GenerationRequest
-from src.services.rag.multi_hop_retriever import HopEvaluation, MultiHopRetriever
+from src.services.rag.multi_hop_retriever import (
+    HopEvaluation,
+    MultiHopRetriever,
+    _merge_title_rankings,
+)
 
 
 def _make_can_answer_response(
@@ -507,11 +512,12 @@ class TestRetrieveMultiHop:
         initial_context = RAGContext.from_retrieval(uuid4(), sample_chunks[:1])
         hop_context = RAGContext.from_retrieval(uuid4(), sample_chunks[1:])
 
-        base_retriever.retrieve = Mock(
-            side_effect=[(initial_context, [], {}), (hop_context, [], {})]
+        base_retriever.retrieve = Mock(return_value=(initial_context, [], {}))
+        base_retriever.retrieve_titles = Mock(return_value=[hop_context.document_chunks])
+        # Mock retrieve_by_headers - returns (None, 0.0) to trigger semantic fallback
+        base_retriever.retrieve_by_headers = Mock(
+            side_effect=lambda titles: [(None, 0.0)] * len(titles)
         )
-        # Mock retrieve_by_header - returns (None, 0.0) to trigger semantic fallback
-        base_retriever.retrieve_by_header = Mock(return_value=(None, 0.0))
 
         retriever = MultiHopRetriever(base_retriever, max_hops=2)
 
@@ -523,6 +529,58 @@ class TestRetrieveMultiHop:
         assert hop_evals[0].can_answer is False
         assert hop_evals[1].can_answer is True
         assert len(context.document_chunks) == 2
+        base_retriever.retrieve_titles.assert_called_once_with(
+            ["Additional query"], "context_key", retriever.chunks_per_hop
+        )
+        assert hop_evals[0].title_chunk_ids == {
+            "Additional query": [str(sample_chunks[1].chunk_id)]
+        }
+
+    @pytest.mark.asyncio
+    @patch("src.services.rag.multi_hop_retriever.LLMProviderFactory.create")
+    @patch("builtins.open", create=True)
+    @patch("src.services.rag.multi_hop_retriever.yaml.safe_load")
+    async def test_joined_fallback_mode(
+        self, mock_yaml_load, mock_open, mock_create, sample_chunks
+    ):
+        """Test joined fallback sends unmatched titles as one retrieve() query."""
+        mock_llm = Mock()
+        mock_llm.generate = AsyncMock(side_effect=[
+            _make_can_answer_response(
+                can_answer=False, reasoning="Need more", missing_query="Overwatch, Charge"
+            ),
+            _make_can_answer_response(reasoning="Now sufficient"),
+        ])
+        mock_create.return_value = mock_llm
+
+        mock_yaml_load.return_value = {}
+        mock_open.return_value.__enter__.return_value.read.return_value = (
+            "{user_query} {retrieved_chunks} {rule_structure} {team_structure}"
+        )
+
+        base_retriever = Mock()
+        initial_context = RAGContext.from_retrieval(uuid4(), sample_chunks[:1])
+        hop_context = RAGContext.from_retrieval(uuid4(), sample_chunks[1:])
+        base_retriever.retrieve = Mock(
+            side_effect=[(initial_context, [], {}), (hop_context, [], {})]
+        )
+        base_retriever.retrieve_by_headers = Mock(
+            side_effect=lambda titles: [(None, 0.0)] * len(titles)
+        )
+
+        retriever = MultiHopRetriever(base_retriever, max_hops=2, fallback_mode="joined")
+
+        context, hop_evals, _ = await retriever.retrieve_multi_hop(
+            "test query", "context_key", uuid4()
+        )
+
+        assert len(context.document_chunks) == 2
+        assert base_retriever.retrieve.call_args_list[1].args[0].query == "Overwatch, Charge"
+        base_retriever.retrieve_titles.assert_not_called()
+        assert hop_evals[0].title_chunk_ids == {
+            "Overwatch": [str(sample_chunks[1].chunk_id)],
+            "Charge": [str(sample_chunks[1].chunk_id)],
+        }
 
     @pytest.mark.asyncio
     @patch("src.services.rag.multi_hop_retriever.LLMProviderFactory.create")
@@ -549,10 +607,12 @@ class TestRetrieveMultiHop:
         base_retriever = Mock()
         context = RAGContext.from_retrieval(uuid4(), sample_chunks[:1])
         base_retriever.retrieve = Mock(return_value=(context, [], {}))
-        # Mock retrieve_by_header - returns (None, 0.0) to trigger semantic fallback
-        base_retriever.retrieve_by_header = Mock(return_value=(None, 0.0))
+        # Mock retrieve_by_headers - returns (None, 0.0) to trigger semantic fallback
+        base_retriever.retrieve_by_headers = Mock(
+            side_effect=lambda titles: [(None, 0.0)] * len(titles)
+        )
 
-        retriever = MultiHopRetriever(base_retriever, max_hops=1)
+        retriever = MultiHopRetriever(base_retriever, max_hops=1, fallback_mode="joined")
 
         context, hop_evals, chunk_map = await retriever.retrieve_multi_hop(
             "test query", "context_key", uuid4()
@@ -590,8 +650,11 @@ class TestRetrieveMultiHop:
         base_retriever = Mock()
         context = RAGContext.from_retrieval(uuid4(), sample_chunks)
         base_retriever.retrieve = Mock(return_value=(context, [], {}))
-        # Mock retrieve_by_header - returns (None, 0.0) to trigger semantic fallback
-        base_retriever.retrieve_by_header = Mock(return_value=(None, 0.0))
+        base_retriever.retrieve_titles = Mock(return_value=[sample_chunks])
+        # Mock retrieve_by_headers - returns (None, 0.0) to trigger semantic fallback
+        base_retriever.retrieve_by_headers = Mock(
+            side_effect=lambda titles: [(None, 0.0)] * len(titles)
+        )
 
         retriever = MultiHopRetriever(base_retriever, max_hops=2)
 
@@ -673,3 +736,21 @@ class TestHopEvaluatorCachingBehavior:
         req: GenerationRequest = captured_requests[0]
         assert isinstance(req.prompt, str), "Non-Claude path should use plain str"
         assert "<!--CACHE_BREAK-->" not in req.prompt
+
+
+def _ranked(chunks: list[DocumentChunk], scores: list[float]) -> list[DocumentChunk]:
+    return [replace(chunk, relevance_score=s) for chunk, s in zip(chunks, scores, strict=True)]
+
+
+def test_merge_title_rankings_fuses_with_rrf(sample_chunks):
+    overwatch, charge = sample_chunks
+    extra = replace(overwatch, chunk_id=uuid4(), header="Guard")
+
+    merged = _merge_title_rankings(
+        [_ranked([overwatch, extra], [0.9, 0.6]), _ranked([charge, overwatch], [0.8, 0.7])],
+        top_k=2,
+    )
+
+    # Retrieved for both titles, so it fuses above each title's other chunks
+    assert [c.chunk_id for c in merged] == [overwatch.chunk_id, charge.chunk_id]
+    assert merged[0].relevance_score == 0.9
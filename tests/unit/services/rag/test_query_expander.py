@@ -1,6 +1,8 @@
 """Unit tests for QueryExpander service."""
 
 import json
+import random
+import re
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -258,3 +260,56 @@ class TestRealWorldQueries:
         expanded = expander.expand_query(query)
 
         assert "Shoot action" in expanded
+
+
+def _regex_expand(synonym_to_official: dict[str, str], query: str) -> str:
+    """Reference: the previous implementation, one regex search per synonym."""
+    query_lower = query.lower()
+    matched = {
+        official
+        for synonym, official in synonym_to_official.items()
+        if re.search(r"\b" + re.escape(synonym) + r"\b", query_lower)
+    }
+    return query + " " + " ".join(sorted(matched)) if matched else query
+
+
+class TestCompiledMatching:
+    """The compiled trie produces exactly what per-synonym regex searches did."""
+
+    SYNONYMS = {
+        "regain wounds": ["heal", "heal up", "healing", "up"],
+        "action point": ["ap", "+1 apl", "a.p.", "apl"],
+        "control range": ["melee range", "range", "1\"", "in_range"],
+        "Épée": ["épée", "ÉPÉE fight"],
+    }
+
+    @pytest.fixture
+    def compiled(self, tmp_path):
+        path = tmp_path / "synonyms.json"
+        path.write_text(json.dumps(self.SYNONYMS), encoding="utf-8")
+        return QueryExpander(str(path))
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "Can I heal up in melee range?",
+            "Does +1 APL stack with a.p. bonuses?",
+            "apl+1 or ap-1, within 1\" of in_range",
+            "HEALING,heal;up(range)",
+            "épée fight! ÉPÉE",
+            "nothing to see here",
+            "",
+        ],
+    )
+    def test_matches_regex_reference(self, compiled, query):
+        assert compiled.expand_query(query) == _regex_expand(compiled.synonym_to_official, query)
+
+    def test_matches_regex_reference_on_random_queries(self, compiled):
+        rng = random.Random(0)
+        words = [s for synonyms in self.SYNONYMS.values() for s in synonyms]
+        words += ["the", "a", "healer", "rangers", "_", "+", ".", "1", " ", "\"", "x"]
+        for _ in range(500):
+            query = "".join(rng.choice(words) + rng.choice(["", " ", ",", "-"]) for _ in range(6))
+            assert compiled.expand_query(query) == _regex_expand(
+                compiled.synonym_to_official, query
+            )
@@ -0,0 +1,254 @@
+"""Unit tests for the semantic near-duplicate retrieval cache."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.models.rag_context import DocumentChunk, RAGContext
+from src.models.rag_request import RetrieveRequest
+from src.services.rag.ingestor import RAGIngestor
+from src.services.rag.multi_hop_retriever import HopEvaluation
+from src.services.rag.retrieval_cache import SemanticRetrievalCache
+from src.services.rag.retriever import RAGRetriever
+
+PARAMS = (5, 0.45, True, True)
+OBSCURED = [1.0, 0.0, 0.0, 0.0]
+OBSCURED_REPHRASED = [0.99, 0.1, 0.0, 0.0]  # cosine distance ~0.005
+CONCEAL = [0.0, 1.0, 0.0, 0.0]
+
+
+def _chunk(document_id=None) -> DocumentChunk:
+    return DocumentChunk(
+        chunk_id=uuid4(),
+        document_id=document_id or uuid4(),
+        text="## Obscured\nIntervening terrain blocks the line of fire.",
+        header="Obscured",
+        header_level=2,
+        metadata={"source": "core-rules.md", "doc_type": "core-rules", "publication_date": "2024-01-01"},
+        relevance_score=0.8,
+        position_in_doc=1,
+    )
+
+
+def _result(*chunks: DocumentChunk) -> tuple[RAGContext, list, dict]:
+    chunks = list(chunks) or [_chunk()]
+    context = RAGContext.from_retrieval(query_id=uuid4(), chunks=chunks)
+    hop = HopEvaluation(can_answer=True, reasoning="ok", cost_usd=0.002, evaluation_time_s=1.5)
+    return context, [hop], {chunk.chunk_id: 0 for chunk in chunks}
+
+
+class TestSemanticRetrievalCache:
+    """Tests for SemanticRetrievalCache."""
+
+    def test_near_duplicate_hits_and_far_query_misses(self):
+        cache = SemanticRetrievalCache(max_distance=0.05)
+        result = _result()
+        cache.put("what does obscured do", OBSCURED, PARAMS, result, latency_s=2.0)
+
+        entry = cache.get(OBSCURED_REPHRASED, PARAMS)
+
+        assert entry.context is result[0]
+        assert cache.get(CONCEAL, PARAMS) is None
+        assert cache.get(OBSCURED, (10, 0.45, True, True)) is None  # Different parameters
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+        assert stats["saved_latency_s"] == 2.0
+
+    def test_closest_entry_wins(self):
+        cache = SemanticRetrievalCache(max_distance=0.1)
+        near, nearer = _result(), _result()
+        cache.put("a", [0.95, 0.3, 0.0, 0.0], PARAMS, near, latency_s=1.0)
+        cache.put("b", [0.99, 0.1, 0.0, 0.0], PARAMS, nearer, latency_s=1.0)
+
+        assert cache.get(OBSCURED, PARAMS).context is nearer[0]
+
+    def test_expired_entries_are_dropped(self):
+        cache = SemanticRetrievalCache(ttl_seconds=-1)
+        cache.put("q", OBSCURED, PARAMS, _result(), latency_s=1.0)
+
+        assert cache.get(OBSCURED, PARAMS) is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = SemanticRetrievalCache(max_entries=2)
+        vectors = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]
+        cache.put("a", vectors[0], PARAMS, _result(), latency_s=1.0)
+        cache.put("b", vectors[1], PARAMS, _result(), latency_s=1.0)
+        cache.get(vectors[0], PARAMS)  # "a" is now most recently used
+
+        cache.put("c", vectors[2], PARAMS, _result(), latency_s=1.0)
+
+        assert cache.get(vectors[0], PARAMS) is not None
+        assert cache.get(vectors[1], PARAMS) is None
+        assert cache.get(vectors[2], PARAMS) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidate_by_document(self):
+        cache = SemanticRetrievalCache()
+        document_id = uuid4()
+        cache.put("a", OBSCURED, PARAMS, _result(_chunk(document_id)), latency_s=1.0)
+        cache.put("b", CONCEAL, PARAMS, _result(), latency_s=1.0)
+
+        assert cache.invalidate(document_id) == 1
+        assert cache.get(OBSCURED, PARAMS) is None
+        assert cache.get(CONCEAL, PARAMS) is not None
+        assert cache.invalidate() == 1
+
+    def test_ingestor_invalidates_deleted_document(self):
+        cache = SemanticRetrievalCache()
+        document_id = uuid4()
+        cache.put("a", OBSCURED, PARAMS, _result(_chunk(document_id)), latency_s=1.0)
+        ingestor = RAGIngestor(
+            chunker=Mock(), embedding_service=Mock(), vector_db_service=Mock(),
+            keyword_extractor=Mock(), summarizer=Mock(), retrieval_cache=cache,
+        )
+
+        ingestor.delete_document(str(document_id))
+
+        assert cache.get(OBSCURED, PARAMS) is None
+
+
+class FakeMultiHop:
+    """Multi-hop stand-in counting hop evaluation runs."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failing_queries: set[str] = set()  # Queries whose hop reports an error
+        self.delays: dict[str, float] = {}
+
+    async def retrieve_multi_hop(self, query, query_id, initial_chunks, hop_errors=None, **_kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delays.get(query, 0))
+        if query in self.failing_queries and hop_errors is not None:
+            hop_errors.append("hop 1: truncated")
+        context = RAGContext.from_retrieval(query_id=query_id, chunks=initial_chunks)
+        hop = HopEvaluation(can_answer=True, reasoning="ok", cost_usd=0.002)
+        return context, [hop], {chunk.chunk_id: 0 for chunk in initial_chunks}
+
+
+@pytest.fixture
+def cached_retriever():
+    """Single-chunk corpus retriever with a retrieval cache and a fake multi-hop."""
+    embeddings = {"what does obscured do": OBSCURED, "how does obscured work": OBSCURED_REPHRASED}
+    embedding_service = Mock()
+    embedding_service.embed_text = Mock(side_effect=lambda q: embeddings.get(q, CONCEAL))
+    embedding_service.embed_text_async = AsyncMock(side_effect=lambda q: embeddings.get(q, CONCEAL))
+
+    vector_db = Mock()
+    vector_db.query = Mock(return_value={
+        "ids": [[str(uuid4())]],
+        "documents": [["Intervening terrain blocks the line of fire."]],
+        "metadatas": [[{"document_id": str(uuid4()), "header": "Obscured", "header_level": 2}]],
+        "distances": [[0.3]],
+    })
+
+    keyword_extractor = Mock(get_keyword_count=Mock(return_value=0))
+    keyword_extractor.normalize_query = Mock(side_effect=lambda q: q)
+    query_expander = Mock(get_stats=Mock(return_value={"total_synonyms": 0}))
+    query_expander.expand_query = Mock(side_effect=lambda q: q)
+
+    retriever = RAGRetriever(
+        embedding_service=embedding_service,
+        vector_db_service=vector_db,
+        keyword_extractor=keyword_extractor,
+        query_expander=query_expander,
+        enable_hybrid=False,
+        enable_multi_hop=False,
+        retrieval_cache=SemanticRetrievalCache(),
+    )
+    retriever.multi_hop_retriever = FakeMultiHop()
+    return retriever
+
+
+def _request(query: str) -> RetrieveRequest:
+    return RetrieveRequest(query=query, context_key="test:1", use_multi_hop=True)
+
+
+def test_rephrased_question_skips_search_and_hop_evaluation(cached_retriever):
+    first, _, _ = cached_retriever.retrieve(_request("what does obscured do"), uuid4())
+    query_id = uuid4()
+
+    context, hop_evaluations, chunk_hop_map = cached_retriever.retrieve(
+        _request("how does obscured work"), query_id
+    )
+
+    cached_retriever.vector_db.query.assert_called_once()
+    assert cached_retriever.multi_hop_retriever.calls == 1
+    assert [c.chunk_id for c in context.document_chunks] == [
+        c.chunk_id for c in first.document_chunks
+    ]
+    assert context.query_id == query_id
+    assert context.context_id != first.context_id
+    assert [hop.cost_usd for hop in hop_evaluations] == [0.0]
+    assert set(chunk_hop_map) == {c.chunk_id for c in context.document_chunks}
+    # Embedded once per query: the cache probe's embedding is reused on a miss
+    assert cached_retriever.embedding_service.embed_text.call_count == 2
+
+
+def test_hop_errors_are_not_cached(cached_retriever):
+    cached_retriever.multi_hop_retriever.failing_queries.add("what does obscured do")
+    cached_retriever.retrieve(_request("what does obscured do"), uuid4())
+
+    cached_retriever.retrieve(_request("what does obscured do"), uuid4())
+
+    assert cached_retriever.multi_hop_retriever.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_cache_by_their_own_hop_errors(cached_retriever):
+    multi_hop = cached_retriever.multi_hop_retriever
+    multi_hop.failing_queries.add("what does obscured do")
+    # The failing query finishes first; the good one is still hopping
+    multi_hop.delays = {"what does obscured do": 0.0, "conceal order": 0.05}
+
+    await asyncio.gather(
+        cached_retriever.retrieve_async(_request("what does obscured do"), uuid4()),
+        cached_retriever.retrieve_async(_request("conceal order"), uuid4()),
+    )
+    await cached_retriever.retrieve_async(_request("conceal order"), uuid4())
+    await cached_retriever.retrieve_async(_request("what does obscured do"), uuid4())
+
+    # Good result replayed, degraded one re-run
+    assert multi_hop.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_async_retrieval_uses_cache(cached_retriever):
+    await cached_retriever.retrieve_async(_request("what does obscured do"), uuid4())
+    context, _, _ = await cached_retriever.retrieve_async(_request("how does obscured work"), uuid4())
+
+    assert context.total_chunks == 1
+    cached_retriever.vector_db.query.assert_called_once()
+    assert cached_retriever.retrieval_cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bm25_runs_while_the_query_is_embedded(cached_retriever):
+    bm25_started = threading.Event()
+    cached_retriever._search_bm25 = Mock(side_effect=lambda *_args: bm25_started.set() or [None])
+    embed = cached_retriever.embedding_service.embed_text_async.side_effect
+
+    async def embed_once_bm25_started(query):
+        assert await asyncio.to_thread(bm25_started.wait, 5)
+        return embed(query)
+
+    cached_retriever.embedding_service.embed_text_async.side_effect = embed_once_bm25_started
+
+    await cached_retriever.retrieve_async(_request("what does obscured do"), uuid4())
+    context, _, _ = await cached_retriever.retrieve_async(_request("how does obscured work"), uuid4())
+
+    assert context.total_chunks == 1
+    assert cached_retriever._search_bm25.call_count == 2  # Discarded on the hit
+    cached_retriever.vector_db.query.assert_called_once()
+
+
+def test_unit_vectors_make_distance_scale_free():
+    cache = SemanticRetrievalCache(max_distance=0.01)
+    cache.put("q", list(np.array(OBSCURED) * 7.5), PARAMS, _result(), latency_s=1.0)
+
+    assert cache.get(OBSCURED, PARAMS) is not None
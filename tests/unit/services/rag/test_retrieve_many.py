@@ -0,0 +1,183 @@
+"""Tests for RAGRetriever.retrieve_many (batched retrieval for evaluation runs)."""
+
+import asyncio
+import hashlib
+import time
+from unittest.mock import Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.models.rag_context import RAGContext
+from src.models.rag_request import RetrieveRequest
+from src.services.rag.matrix_vector_db import MatrixVectorDBService
+from src.services.rag.retriever import InvalidQueryError, RAGRetriever
+
+DIM = 8
+HOP_DELAY_S = 0.2  # Simulated hop evaluation LLM call
+TEXTS = [
+    "An operative can counteract when the enemy activates.",
+    "A target is obscured if intervening terrain blocks the line of fire.",
+    "You can retain x attack dice as normal successes.",
+    "Conceal orders stop an operative being selected as a valid target.",
+    "Heavy terrain blocks movement and provides cover.",
+    "An operative that is engaged cannot perform the shoot action.",
+]
+QUERIES = [
+    "Can I counteract after the enemy activates?",
+    "Is my target obscured by heavy terrain?",
+    "What does accurate do with attack dice?",
+]
+
+
+def _vector(text: str) -> list[float]:
+    """Deterministic pseudo-embedding."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "big")
+    return np.random.default_rng(seed).normal(size=DIM).astype(np.float32).tolist()
+
+
+class FakeMultiHop:
+    """Multi-hop stand-in: slow, and reports one hop error per query."""
+
+    async def retrieve_multi_hop(self, query, query_id, initial_chunks, hop_errors, **_kwargs):
+        await asyncio.sleep(HOP_DELAY_S)
+        hop_errors.append(f"hop 1: {query}")
+        context = RAGContext.from_retrieval(query_id=query_id, chunks=initial_chunks)
+        return context, [], {chunk.chunk_id: 0 for chunk in initial_chunks}
+
+
+@pytest.fixture
+def retriever():
+    """Hybrid RAGRetriever over an exact in-memory vector DB."""
+    document_id = str(uuid4())
+    chroma = Mock()
+    chroma.collection.get.return_value = {
+        "ids": [str(uuid4()) for _ in TEXTS],
+        "documents": TEXTS,
+        "metadatas": [
+            {"document_id": document_id, "header": f"Rule {i}", "header_level": 2, "position": i}
+            for i in range(len(TEXTS))
+        ],
+        "embeddings": np.array([_vector(text) for text in TEXTS], dtype=np.float32),
+    }
+    chroma.get_count.return_value = len(TEXTS)
+    vector_db = MatrixVectorDBService(chroma=chroma, bundle_path=None)
+    vector_db.query = Mock(wraps=vector_db.query)
+
+    embedding_service = Mock()
+    embedding_service.embed_text = Mock(side_effect=_vector)
+    embedding_service.embed_many = Mock(side_effect=lambda texts: [_vector(t) for t in texts])
+
+    keyword_extractor = Mock(get_keyword_count=Mock(return_value=0))
+    keyword_extractor.normalize_query = Mock(side_effect=lambda q: q)
+    query_expander = Mock(get_stats=Mock(return_value={"total_synonyms": 0}))
+    query_expander.expand_query = Mock(side_effect=lambda q: q)
+
+    return RAGRetriever(
+        embedding_service=embedding_service,
+        vector_db_service=vector_db,
+        keyword_extractor=keyword_extractor,
+        query_expander=query_expander,
+        enable_multi_hop=False,
+        index_bundle_path=None,
+    )
+
+
+def _request(query: str, max_chunks: int = 4, use_multi_hop: bool = False) -> RetrieveRequest:
+    return RetrieveRequest(
+        query=query,
+        context_key="rag-test",
+        max_chunks=max_chunks,
+        min_relevance=0.0,
+        use_multi_hop=use_multi_hop,
+    )
+
+
+def _chunk_ids(context: RAGContext) -> list:
+    return [chunk.chunk_id for chunk in context.document_chunks]
+
+
+def test_matches_retrieve_with_one_embed_and_one_query(retriever):
+    requests = [_request(q, max_chunks=n) for q, n in zip(QUERIES, [2, 4, 3], strict=True)]
+    expected = [retriever.retrieve(request, uuid4())[0] for request in requests]
+    retriever.vector_db.query.reset_mock()
+
+    results = retriever.retrieve_many(requests)
+
+    retriever.embedding_service.embed_many.assert_called_once_with(QUERIES)
+    retriever.vector_db.query.assert_called_once()
+    assert retriever.vector_db.query.call_args.kwargs["n_results"] == 4
+    for (context, hop_evaluations, chunk_hop_map), reference in zip(results, expected, strict=True):
+        assert _chunk_ids(context) == _chunk_ids(reference)
+        assert context.relevance_scores == reference.relevance_scores
+        assert hop_evaluations == []
+        assert chunk_hop_map == {}
+    assert [len(ctx.document_chunks) for ctx, _, _ in results] == [2, 4, 3]
+
+
+def test_invalid_query_fails_alone(retriever):
+    requests = [_request(QUERIES[0]), _request("   "), _request(QUERIES[1])]
+
+    results = retriever.retrieve_many(requests, return_exceptions=True)
+
+    assert isinstance(results[1], InvalidQueryError)
+    assert all(isinstance(results[i], tuple) for i in (0, 2))
+    retriever.embedding_service.embed_many.assert_called_once_with([QUERIES[0], QUERIES[1]])
+    with pytest.raises(InvalidQueryError):
+        retriever.retrieve_many(requests)
+
+
+def test_multi_hop_runs_concurrently_with_per_query_errors(retriever):
+    retriever.multi_hop_retriever = FakeMultiHop()
+    requests = [_request(q, use_multi_hop=True) for q in QUERIES]
+
+    start = time.perf_counter()
+    results = retriever.retrieve_many(requests)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < len(QUERIES) * HOP_DELAY_S / 2
+    assert all(context.document_chunks for context, _, _ in results)
+    assert [d.hop_errors for d in retriever.last_batch_details] == [
+        [f"hop 1: {q}"] for q in QUERIES
+    ]
+    assert all(d.retrieval_time_s >= HOP_DELAY_S for d in retriever.last_batch_details)
+
+
+def test_vector_db_failure_is_reported_per_query(retriever):
+    retriever.vector_db.query.side_effect = RuntimeError("db down")
+
+    results = retriever.retrieve_many([_request(q) for q in QUERIES], return_exceptions=True)
+
+    assert all(type(r).__name__ == "VectorDBUnavailableError" for r in results)
+
+
+def test_retrieve_titles_with_one_embed_and_one_query(retriever):
+    titles = ["Counteract", "Obscured", "Accurate"]
+    expected = [
+        retriever.retrieve(
+            RetrieveRequest(query=t, context_key="rag-test", max_chunks=3, use_multi_hop=False),
+            uuid4(),
+        )[0]
+        for t in titles
+    ]
+    retriever.vector_db.query.reset_mock()
+    retriever.embedding_service.embed_many.reset_mock()
+
+    per_title = retriever.retrieve_titles(titles, "rag-test", max_chunks=3)
+
+    retriever.embedding_service.embed_many.assert_called_once_with(titles)
+    retriever.vector_db.query.assert_called_once()
+    assert [[c.chunk_id for c in chunks] for chunks in per_title] == [
+        _chunk_ids(context) for context in expected
+    ]
+
+
+def test_invalid_title_is_skipped_alone(retriever):
+    expected = retriever.retrieve_titles(["Obscured"], "rag-test", max_chunks=3)
+    retriever.embedding_service.embed_many.reset_mock()
+
+    per_title = retriever.retrieve_titles([" ", "Obscured", "x" * 2001], "rag-test", max_chunks=3)
+
+    retriever.embedding_service.embed_many.assert_called_once_with(["Obscured"])
+    assert per_title == [[], expected[0], []]
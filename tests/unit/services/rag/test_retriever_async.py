@@ -0,0 +1,186 @@
+"""Tests for RAGRetriever.retrieve_async.
+
+Covers the async retrieval path used by the Discord bot: results must match the
+sync path, and concurrent queries must overlap instead of serializing on the
+event loop.
+"""
+
+import asyncio
+import time
+from dataclasses import replace
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.models.rag_request import RetrieveRequest
+from src.services.rag.retriever import RAGRetriever
+
+EMBEDDING_DELAY_S = 0.2  # Simulated OpenAI round trip
+VECTOR_DB_DELAY_S = 0.1  # Simulated blocking Chroma query
+BM25_DELAY_S = 0.2  # Simulated BM25 scoring over a large corpus
+
+
+def _make_results(n: int = 3) -> dict:
+    """Build a Chroma-style query result with n hits."""
+    return {
+        "ids": [[str(uuid4()) for _ in range(n)]],
+        "documents": [[f"Rule text {i}" for i in range(n)]],
+        "metadatas": [
+            [
+                {"document_id": str(uuid4()), "header": f"Rule {i}", "header_level": 2}
+                for i in range(n)
+            ]
+        ],
+        "distances": [[0.2 + i * 0.1 for i in range(n)]],
+    }
+
+
+@pytest.fixture
+def slow_retriever():
+    """RAGRetriever whose embedding and vector DB calls take real wall time."""
+    results = _make_results()
+
+    async def embed_text_async(_text):
+        await asyncio.sleep(EMBEDDING_DELAY_S)
+        return [0.1] * 8
+
+    def embed_text(_text):
+        time.sleep(EMBEDDING_DELAY_S)
+        return [0.1] * 8
+
+    def query(**_kwargs):
+        time.sleep(VECTOR_DB_DELAY_S)
+        return results
+
+    embedding_service = Mock()
+    embedding_service.embed_text_async = embed_text_async
+    embedding_service.embed_text = embed_text
+
+    vector_db = Mock()
+    vector_db.query = Mock(side_effect=query)
+
+    keyword_extractor = Mock()
+    keyword_extractor.normalize_query = Mock(side_effect=lambda q: q)
+    keyword_extractor.get_keyword_count = Mock(return_value=0)
+
+    query_expander = Mock()
+    query_expander.expand_query = Mock(side_effect=lambda q: q)
+    query_expander.get_stats = Mock(return_value={"total_synonyms": 0})
+
+    return RAGRetriever(
+        embedding_service=embedding_service,
+        vector_db_service=vector_db,
+        keyword_extractor=keyword_extractor,
+        query_expander=query_expander,
+        enable_hybrid=False,
+        enable_multi_hop=False,
+    )
+
+
+def _request(query: str = "Can I shoot while concealed?") -> RetrieveRequest:
+    return RetrieveRequest(query=query, context_key="test:1", use_multi_hop=False)
+
+
+@pytest.mark.asyncio
+async def test_retrieve_async_matches_sync(slow_retriever):
+    """Async path returns the same chunks as the sync wrapper."""
+    sync_context, _, _ = slow_retriever.retrieve(_request(), query_id=uuid4())
+    async_context, hop_evals, chunk_hop_map = await slow_retriever.retrieve_async(
+        _request(), query_id=uuid4()
+    )
+
+    assert [c.chunk_id for c in async_context.document_chunks] == [
+        c.chunk_id for c in sync_context.document_chunks
+    ]
+    assert async_context.avg_relevance == sync_context.avg_relevance
+    assert hop_evals == []
+    assert chunk_hop_map == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_overlap(slow_retriever):
+    """N concurrent retrievals finish in roughly the time of one, not N."""
+    n_queries = 5
+    serialized_s = n_queries * (EMBEDDING_DELAY_S + VECTOR_DB_DELAY_S)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(slow_retriever.retrieve_async(_request(f"query {i}"), uuid4()) for i in range(n_queries))
+    )
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == n_queries
+    assert all(ctx.total_chunks > 0 for ctx, _, _ in results)
+    assert elapsed < serialized_s / 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_not_blocked_during_retrieval(slow_retriever):
+    """Other coroutines (Discord heartbeats) keep running during retrieval."""
+    ticks = 0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    await slow_retriever.retrieve_async(_request(), uuid4())
+    done.set()
+    await heartbeat_task
+
+    # ~0.3s of retrieval at 10ms per tick; a blocked loop would tick once or twice
+    assert ticks >= 10
+
+
+@pytest.fixture
+def hybrid_retriever(slow_retriever):
+    """slow_retriever with a slow BM25 stage."""
+    bm25_results = [Mock(name="bm25_result")]
+
+    def search_bm25(_query, top_k):  # noqa: ARG001
+        time.sleep(BM25_DELAY_S)
+        return bm25_results
+
+    hybrid = Mock(bm25_results=bm25_results)
+    hybrid.search_bm25 = Mock(side_effect=search_bm25)
+    hybrid.retrieve_hybrid = Mock(side_effect=lambda **kwargs: kwargs["vector_hits"])
+    slow_retriever._indexes = replace(slow_retriever._indexes, hybrid_retriever=hybrid)
+    return slow_retriever
+
+
+def _assert_overlapped(retriever, elapsed: float) -> None:
+    """BM25 ran alongside embedding + vector search and its results were fused."""
+    hybrid = retriever.hybrid_retriever
+    assert hybrid.retrieve_hybrid.call_args.kwargs["bm25_results"] is hybrid.bm25_results
+    assert elapsed < EMBEDDING_DELAY_S + VECTOR_DB_DELAY_S + BM25_DELAY_S * 0.75
+
+    timings = retriever.last_stage_timings
+    assert timings.embed_ms >= EMBEDDING_DELAY_S * 1000 * 0.9
+    assert timings.bm25_ms >= BM25_DELAY_S * 1000 * 0.9
+    assert timings.overlap_saved_ms >= BM25_DELAY_S * 1000 * 0.75
+    assert timings.to_dict()["overlap_saved_ms"] == round(timings.overlap_saved_ms, 2)
+
+
+def test_bm25_overlaps_embedding_sync(hybrid_retriever):
+    """The sync path scores BM25 on a worker thread during the embedding call."""
+    start = time.perf_counter()
+    context, _, _ = hybrid_retriever.retrieve(_request(), uuid4())
+    elapsed = time.perf_counter() - start
+
+    assert context.total_chunks == 3
+    _assert_overlapped(hybrid_retriever, elapsed)
+
+
+@pytest.mark.asyncio
+async def test_bm25_overlaps_embedding_async(hybrid_retriever):
+    """The async path scores BM25 concurrently with the embedding call."""
+    start = time.perf_counter()
+    context, _, _ = await hybrid_retriever.retrieve_async(_request(), uuid4())
+    elapsed = time.perf_counter() - start
+
+    assert context.total_chunks == 3
+    _assert_overlapped(hybrid_retriever, elapsed)
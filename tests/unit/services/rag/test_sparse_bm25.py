@@ -0,0 +1,82 @@
+"""Equivalence tests for SparseBM25 against rank_bm25.BM25Okapi."""
+
+import random
+
+import numpy as np
+import pytest
+from rank_bm25 import BM25Okapi
+
+from src.services.rag.sparse_bm25 import SparseBM25
+
+VOCAB = [f"term{i}" for i in range(60)] + ["obscured", "conceal", "counteract", "the", "a"]
+
+
+def _random_corpus(seed: int, n_docs: int = 80) -> list[list[str]]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n_docs):
+        length = rng.randint(1, 40)
+        # Common words appear in most docs, producing negative IDFs
+        doc = rng.choices(VOCAB, k=length) + ["the"] * rng.randint(0, 3)
+        corpus.append(doc)
+    return corpus
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+@pytest.mark.parametrize(("k1", "b"), [(1.6, 0.8), (1.2, 0.0), (2.0, 1.0)])
+def test_scores_identical_to_bm25okapi(seed, k1, b):
+    corpus = _random_corpus(seed)
+    reference = BM25Okapi(corpus, k1=k1, b=b)
+    sparse = SparseBM25(corpus, k1=k1, b=b)
+
+    rng = random.Random(seed + 100)
+    for _ in range(20):
+        query = rng.choices(VOCAB + ["unknown", "missing"], k=rng.randint(1, 8))
+        np.testing.assert_array_equal(sparse.get_scores(query), reference.get_scores(query))
+
+
+def test_repeated_query_tokens_count_repeatedly():
+    corpus = [["conceal", "order"], ["engage", "order"], ["obscured"]]
+    reference = BM25Okapi(corpus)
+    sparse = SparseBM25(corpus)
+
+    query = ["conceal", "conceal", "order"]
+    np.testing.assert_array_equal(sparse.get_scores(query), reference.get_scores(query))
+
+
+def test_unknown_query_scores_zero():
+    sparse = SparseBM25([["conceal"], ["engage"]])
+
+    np.testing.assert_array_equal(sparse.get_scores(["nothing"]), np.zeros(2))
+    indices, scores = sparse.top_k(["nothing"], 5)
+    assert len(indices) == 0
+    assert len(scores) == 0
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("k", [1, 5, 15, 200])
+def test_top_k_matches_stable_sort(seed, k):
+    """top_k equals the old sorted(range(n), reverse=True)[:k] + score > 0 filter."""
+    corpus = _random_corpus(seed)
+    reference = BM25Okapi(corpus, k1=1.6, b=0.8)
+    sparse = SparseBM25(corpus, k1=1.6, b=0.8)
+
+    query = ["term1", "term2", "obscured"]
+    scores = reference.get_scores(query)
+    expected = [
+        i for i in sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+        if scores[i] > 0
+    ]
+
+    indices, top_scores = sparse.top_k(query, k)
+    assert indices.tolist() == expected
+    assert top_scores.tolist() == [scores[i] for i in expected]
+
+
+def test_top_k_tie_break_uses_document_order():
+    # Identical documents produce identical scores
+    corpus = [["conceal"], ["other"], ["conceal"], ["conceal"], ["filler"]]
+    sparse = SparseBM25(corpus)
+
+    indices, _ = sparse.top_k(["conceal"], 2)
+    assert indices.tolist() == [0, 2]
@@ -75,8 +75,8 @@ class TestRetrieveRag:
         )
 
         # Verify RAG service was called
-        mock_rag_retriever.retrieve.assert_called_once()
-        call_args = mock_rag_retriever.retrieve.call_args
+        mock_rag_retriever.retrieve_async.assert_called_once()
+        call_args = mock_rag_retriever.retrieve_async.call_args
 
         # Check request parameters
         request = call_args[0][0]
@@ -151,7 +151,7 @@ class TestRetrieveRag:
         )
 
         # Verify context_key passed to RAG service
-        call_args = mock_rag_retriever.retrieve.call_args
+        call_args = mock_rag_retriever.retrieve_async.call_args
         request = call_args[0][0]
         assert request.context_key == "guild:user:123"
 
@@ -326,6 +326,34 @@ class TestGenerateWithContext:
         request = call_args[0][0]
         assert request.config.timeout_seconds == 60
 
+    @pytest.mark.asyncio
+    async def test_generate_with_on_text_streams(
+        self, mock_llm_provider, mock_llm_response, sample_rag_context, mock_llm_factory
+    ):
+        """Test an on_text callback routes generation through generate_stream."""
+        orchestrator = QueryOrchestrator(
+            rag_retriever=Mock(),
+            llm_factory=mock_llm_factory,
+            enable_quote_validation=False,
+        )
+        mock_llm_provider.generate_stream = AsyncMock(return_value=mock_llm_response)
+        on_text = AsyncMock()
+
+        llm_response, _ = await orchestrator.generate_with_context(
+            query="Test",
+            query_id=uuid4(),
+            model="test",
+            rag_context=sample_rag_context,
+            llm_provider=mock_llm_provider,
+            on_text=on_text,
+        )
+
+        assert llm_response is mock_llm_response
+        mock_llm_provider.generate.assert_not_called()
+        request, callback = mock_llm_provider.generate_stream.call_args.args
+        assert request.prompt == "Test"
+        assert callback is on_text
+
     @pytest.mark.asyncio
     async def test_generate_with_empty_context(self, mock_llm_provider, mock_llm_factory):
         """Test generation handles empty RAG context."""
@@ -371,7 +399,7 @@ class TestProcessQuery:
         assert rag_context.total_chunks > 0  # RAG retrieved
         assert llm_response.answer_text  # LLM generated
 
-        mock_rag_retriever.retrieve.assert_called_once()
+        mock_rag_retriever.retrieve_async.assert_called_once()
         mock_llm_provider.generate.assert_called_once()
 
     @pytest.mark.asyncio
@@ -0,0 +1,113 @@
+"""Unit tests for the LRU/TTL cache engine."""
+
+from src.lib.cache_engine import LRUTTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = LRUTTLCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_ttl_expiry_with_per_entry_override():
+    clock = FakeClock()
+    cache = LRUTTLCache(ttl_seconds=10, clock=clock)
+    cache.put("short", 1, ttl_seconds=1)
+    cache.put("default", 2)
+    cache.put("forever", 3, ttl_seconds=float("inf"))
+
+    clock.now = 5
+    assert cache.get("short") is None
+    assert cache.get("default") == 2
+
+    clock.now = 11
+    assert cache.purge_expired() == 1
+    assert cache.get("forever") == 3
+    assert cache.expirations == 2
+
+
+def test_byte_budget_evicts_and_rejects_oversized_values():
+    cache = LRUTTLCache(max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    cache.put("c", "xxxx")
+
+    assert cache.get("a") is None
+    assert cache.total_bytes == 8
+
+    assert cache.put("huge", "x" * 11) is False
+    assert cache.get("huge") is None
+    assert cache.total_bytes == 8
+
+
+def test_invalidate_tag_removes_only_tagged_entries():
+    cache = LRUTTLCache()
+    cache.put("q1", 1, tags={"doc-a"})
+    cache.put("q2", 2, tags={"doc-a", "doc-b"})
+    cache.put("q3", 3, tags={"doc-b"})
+
+    assert cache.invalidate_tag("doc-a") == 2
+
+    assert cache.get("q1") is None
+    assert cache.get("q2") is None
+    assert cache.get("q3") == 3
+    assert cache.invalidate_tag("doc-a") == 0
+    # q2's removal dropped it from doc-b's keys as well
+    assert cache.invalidate_tag("doc-b") == 1
+
+
+def test_replacing_an_entry_updates_size_tags_and_expiry():
+    clock = FakeClock()
+    cache = LRUTTLCache(ttl_seconds=10, sizeof=len, clock=clock)
+    cache.put("k", "xx", tags={"old"})
+    clock.now = 5
+    cache.put("k", "xxxx", tags={"new"})
+
+    assert cache.total_bytes == 4
+    assert cache.invalidate_tag("old") == 0
+
+    clock.now = 12  # The first put's heap item is due but stale
+    assert cache.purge_expired() == 0
+    assert cache.get("k") == "xxxx"
+
+
+def test_stale_heap_items_are_compacted():
+    cache = LRUTTLCache(ttl_seconds=60)
+    for _ in range(500):
+        cache.put("k", 1)
+
+    assert len(cache._expiry_heap) <= 2 * len(cache) + 64
+
+
+def test_stats():
+    cache = LRUTTLCache(max_entries=1)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache.put("b", 2)
+    cache.clear()
+
+    stats = cache.get_stats()
+
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["evictions"] == 1
+    assert stats["invalidations"] == 1
+    assert stats["entries"] == 0
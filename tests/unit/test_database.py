@@ -70,6 +70,29 @@ def test_insert_query(temp_db):
     assert query["upvotes"] == 0
     assert query["downvotes"] == 0
     assert query["admin_status"] == "pending"
+    assert query["time_to_first_content_ms"] is None
+
+
+def test_insert_query_time_to_first_content(temp_db):
+    """Streamed queries store when the first answer text became visible."""
+    temp_db.insert_query(
+        {
+            "query_id": "streamed-query",
+            "discord_server_id": "server-456",
+            "channel_id": "channel-789",
+            "username": "testuser",
+            "query_text": "Can I charge through terrain?",
+            "response_text": "{}",
+            "llm_model": "gpt-4.1",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "total_latency_ms": 9000,
+            "time_to_first_content_ms": 2400,
+        }
+    )
+
+    query = temp_db.get_query_by_id("streamed-query")
+    assert query["total_latency_ms"] == 9000
+    assert query["time_to_first_content_ms"] == 2400
 
 
 def test_insert_chunks(temp_db):
@@ -411,3 +434,24 @@ def test_search_filter(temp_db):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_insert_hop_evaluations_records_cache_savings(temp_db):
+    """Test hop evaluations keep whether the verdict came from the hop evaluation cache."""
+    evaluations = [
+        {"can_answer": False, "reasoning": "Need Conceal", "missing_query": "Conceal"},
+        {
+            "can_answer": True,
+            "reasoning": "Enough",
+            "missing_query": None,
+            "from_cache": True,
+            "saved_cost_usd": 0.0012,
+            "saved_time_s": 1.5,
+        },
+    ]
+
+    temp_db.insert_hop_evaluations("query-1", evaluations, evaluation_model="gpt-4.1-mini")
+
+    first, second = temp_db.get_hop_evaluations_for_query("query-1")
+    assert (first["from_cache"], first["saved_cost_usd"], first["saved_time_s"]) == (0, 0.0, 0.0)
+    assert (second["from_cache"], second["saved_cost_usd"], second["saved_time_s"]) == (1, 0.0012, 1.5)
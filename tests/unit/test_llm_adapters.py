@@ -10,6 +10,7 @@ from uuid import uuid4
 import anthropic
 import pytest
 
+from src.lib.constants import LLM_HTTP_CONNECT_TIMEOUT_S
 from src.models.rag_context import DocumentChunk, RAGContext
 from src.services.llm.base import (
     AuthenticationError,
@@ -196,6 +197,54 @@ class TestChatGPTAdapter:
 
         assert 0.7 <= confidence <= 0.8  # Average should be around 0.75
 
+    async def test_generate_stream_passes_content_deltas(self, chatgpt_adapter):
+        """Test streamed generation forwards deltas and returns the parsed answer."""
+        parsed = Mock()
+        parsed.model_dump_json.return_value = '{"short_answer": "Yes."}'
+        parsed.model_dump.return_value = {"short_answer": "Yes."}
+        completion = Mock()
+        completion.choices = [Mock(message=Mock(parsed=parsed))]
+        completion.usage = Mock(
+            prompt_tokens=100, completion_tokens=20, total_tokens=120, prompt_tokens_details=None
+        )
+        events = [
+            Mock(type="chunk"),
+            Mock(type="content.delta", delta='{"short_answer": '),
+            Mock(type="content.delta", delta='"Yes."}'),
+            Mock(type="content.done"),
+        ]
+
+        class FakeStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def __aiter__(self):
+                for event in events:
+                    yield event
+
+            async def get_final_completion(self):
+                return completion
+
+        chatgpt_adapter.client.chat.completions.stream = Mock(return_value=FakeStream())
+        deltas = []
+
+        async def on_text(delta):
+            deltas.append(delta)
+
+        request = GenerationRequest(
+            prompt="Test", context=["Context"], config=GenerationConfig(), chunk_ids=["test-chunk-1"]
+        )
+        response = await chatgpt_adapter.generate_stream(request, on_text)
+
+        assert deltas == ['{"short_answer": ', '"Yes."}']
+        assert response.answer_text == '{"short_answer": "Yes."}'
+        assert response.token_count == 120
+        stream_kwargs = chatgpt_adapter.client.chat.completions.stream.call_args.kwargs
+        assert stream_kwargs["stream_options"] == {"include_usage": True}
+
 
 class TestGeminiAdapter:
     """Test Gemini LLM adapter."""
@@ -237,6 +286,12 @@ class TestGrokAdapter:
         with patch("src.services.llm.grok.httpx") as mock:
             yield mock
 
+    @pytest.fixture
+    def mock_shared_client(self):
+        """Mock shared keep-alive HTTP client lookup."""
+        with patch("src.services.llm.grok.get_shared_http_client") as mock:
+            yield mock
+
     @pytest.fixture
     def grok_adapter(self, mock_httpx):
         """Create Grok adapter with mocked client."""
@@ -244,22 +299,17 @@ class TestGrokAdapter:
             adapter = GrokAdapter(api_key="test-key", model="grok-3")
             return adapter
 
-    async def test_generate_rate_limit(self, grok_adapter, mock_httpx):
+    async def test_generate_rate_limit(self, grok_adapter, mock_shared_client):
         """Test rate limit error handling."""
         # Mock 429 response
         mock_response = Mock()
         mock_response.status_code = 429
         mock_response.text = "Rate limit exceeded"
 
-        # Mock the AsyncClient context manager properly
+        # Mock the shared keep-alive client
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-
-        mock_httpx.AsyncClient.return_value = mock_context_manager
+        mock_shared_client.return_value = mock_client
 
         request = GenerationRequest(
             prompt="Test query", context=[], config=GenerationConfig(), chunk_ids=[]
@@ -268,22 +318,22 @@ class TestGrokAdapter:
         with pytest.raises(RateLimitError, match="Grok rate limit"):
             await grok_adapter.generate(request)
 
-    async def test_generate_auth_error(self, grok_adapter, mock_httpx):
+        # Per-request timeout keeps the shared client's connect timeout
+        timeout = mock_client.post.await_args.kwargs["timeout"]
+        assert timeout.connect == LLM_HTTP_CONNECT_TIMEOUT_S
+        assert timeout.read == request.config.timeout_seconds
+
+    async def test_generate_auth_error(self, grok_adapter, mock_shared_client):
         """Test authentication error handling."""
         # Mock 401 response
         mock_response = Mock()
         mock_response.status_code = 401
         mock_response.text = "Unauthorized"
 
-        # Mock the AsyncClient context manager properly
+        # Mock the shared keep-alive client
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-
-        mock_httpx.AsyncClient.return_value = mock_context_manager
+        mock_shared_client.return_value = mock_client
 
         request = GenerationRequest(
             prompt="Test query", context=[], config=GenerationConfig(), chunk_ids=[]
@@ -177,6 +177,17 @@ class TestRAGCache:
         assert cache.get("query1", "channel:user") is None
         assert cache.get("query2", "channel:user") is None
 
+    def test_cache_invalidate_by_document(self, sample_chunks):
+        """Invalidating a document should drop only results citing it."""
+        cache = RAGCache()
+        first, second = sample_chunks
+        cache.set("query1", "channel:user", RAGContext.from_retrieval(uuid4(), [first]))
+        cache.set("query2", "channel:user", RAGContext.from_retrieval(uuid4(), [second]))
+
+        assert cache.invalidate(first.document_id) == 1
+        assert cache.get("query1", "channel:user") is None
+        assert cache.get("query2", "channel:user") is not None
+
 
 @pytest.fixture
 def sample_markdown():